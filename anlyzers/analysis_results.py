@@ -0,0 +1,179 @@
+"""
+@brief Result types of the analysis modules
+Every analyzer run by the orchestrator returns one of these slotted,
+immutable dataclasses. Tables are ColumnTable / SkillMatrix objects and
+distributions are summaries, so a result never references the source
+DataFrames and serializes (dumps_result) or pickles in kilobytes.
+Fields keep the names of the former result dictionary keys.
+"""
+
+from dataclasses import dataclass
+
+from utils.columnar import ColumnTable, SkillMatrix
+from utils.distribution_sketch import DistributionSummary
+from utils.result_codec import register_result_type
+from utils.skill_coverage import SkillCoverageMatrix
+
+
+register_result_type(DistributionSummary)
+register_result_type(SkillCoverageMatrix)
+
+
+@register_result_type
+@dataclass(slots=True, frozen=True)
+class BasicStatisticsResult:
+    """
+    @brief Result of BasicStaticAnalayzer
+    """
+
+    total_employee_count: int
+    average_parameters: dict
+    distribution_position: ColumnTable
+    high_performers: ColumnTable
+    distributions: dict
+
+
+@register_result_type
+@dataclass(slots=True, frozen=True)
+class FinanceResult:
+    """
+    @brief Result of FinanceAnalayzer
+    distribution_position holds total_fot, department_budget and
+    budget_utilization_percent.
+    """
+
+    total_employees: int
+    fot_table: ColumnTable
+    distribution_position: dict
+    top_salary: ColumnTable
+
+
+@register_result_type
+@dataclass(slots=True, frozen=True)
+class ProjectResult:
+    """
+    @brief Result of ProjectAnalayzer
+    top_project is a dictionary of the most profitable project's fields
+    (None when the PO department has no projects).
+    """
+
+    total_projects: int
+    status_project: ColumnTable
+    average_ROI_project: float
+    top_project: dict
+    roi_distribution: DistributionSummary
+    department_project_metrics: ColumnTable
+
+
+@register_result_type
+@dataclass(slots=True, frozen=True)
+class SkillsResult:
+    """
+    @brief Result of SkillsAnalayzer
+    """
+
+    total_employees: int
+    skill_matrix: SkillMatrix
+    skill_statistics: dict
+    department_skill_coverage: SkillCoverageMatrix
+    critical_skill_deficits: ColumnTable
+    python_docker_experts: ColumnTable
+
+
+@register_result_type
+@dataclass(slots=True, frozen=True)
+class ProductivityImpact:
+    """
+    @brief Simulated effect of a productivity increase
+    All fields are None when the inputs were insufficient.
+    """
+
+    fot_savings_potential: float = None
+    fot_savings_interval: tuple = None
+    productivity_increase: int = None
+    scenario_count: int = None
+    confidence: float = None
+    scenario_summary: ColumnTable = None
+    uplift_sweep: ColumnTable = None
+    assumption: str = None
+
+    @property
+    def available(self):
+        """
+        @brief Whether the impact could be calculated
+        """
+        return self.fot_savings_potential is not None
+
+
+@register_result_type
+@dataclass(slots=True, frozen=True)
+class RecommendationResult:
+    """
+    @brief Result of RecommendationsAnalayzer
+    """
+
+    efficiency_measures: list
+    training_needs: list
+    productivity_impact: ProductivityImpact
+    department_metrics: ColumnTable
+    department_recommendations: ColumnTable
+
+
+@register_result_type
+@dataclass(slots=True, frozen=True)
+class SalaryPercentileResult:
+    """
+    @brief Result of SalaryPercentileAnalayzer
+    employee_percentiles has one row per company employee in file order;
+    category_summary is indexed by position category.
+    """
+
+    total_employees: int
+    group_count: int
+    employee_percentiles: ColumnTable
+    category_summary: ColumnTable
+    outliers: ColumnTable
+    outlier_threshold: float
+
+
+@register_result_type
+@dataclass(slots=True, frozen=True)
+class PayrollProjectionResult:
+    """
+    @brief Result of PayrollProjectionAnalayzer
+    Month labels are "YYYY-MM". department_payroll is indexed by
+    department_id with one column per month; the employees x months
+    matrix itself is not kept.
+    """
+
+    months: tuple
+    employee_count: int
+    planned_hire_count: int
+    raise_count: int
+    department_payroll: ColumnTable
+    budget_table: ColumnTable
+    po_monthly: ColumnTable
+
+
+@register_result_type
+@dataclass(slots=True, frozen=True)
+class EquipmentResult:
+    """
+    @brief Result of EquipmentAnalayzer
+    Dates are checked against as_of (the data's generation date).
+    department_equipment is indexed by department_id, type_summary by
+    equipment type; overdue_maintenance lists every overdue item, most
+    overdue first.
+    """
+
+    total_equipment: int
+    as_of: str
+    average_utilization: float
+    monthly_maintenance_cost: float
+    overdue_count: int
+    warranty_expired_count: int
+    warranty_expiring_count: int
+    warranty_horizon_days: int
+    department_equipment: ColumnTable
+    type_summary: ColumnTable
+    overdue_maintenance: ColumnTable
@@ -4,9 +4,12 @@ Provides common functionality and interface for all analyzers
 """
 
 import pandas as pd
-import json
-from utils.logger import analysis_logger
 from config.messages import LogMessages
+from config.settings import DepartmentSettings
+from utils.binary_snapshot import BinarySnapshot, is_binary_snapshot
+from utils.data_loader import ChunkedCompanyData, load_company_data
+from utils.sqlite_store import SQLiteStore, is_sqlite_store
+from utils.run_context import default_run_context
 
 class BaseAnalyzer:
     """
@@ -14,22 +17,38 @@ class BaseAnalyzer:
     Implements common data loading and processing functionality
     """
 
-    def __init__(self, json_file_path, analysis_name):
+    # Record sections the analyzer never reads; a fresh load of the file leaves them out
+    SKIPPED_SECTIONS = ()
+
+    def __init__(self, json_file_path, analysis_name, chunked=False, memory_budget_mb=None, run_context=None,
+                 chunked_data=None):
         """
         @brief Initialize base analyzer with data source
         Sets up data loading and logger configuretion
 
         @param json_file_path: Path to JSON data file
         @param analysis_name: Name of the analysis for logging
+        @param chunked: Stream employees in chunks instead of building po_employee_dataframe
+        @param memory_budget_mb: Memory budget of one chunk (chunked mode only)
+        @param run_context: RunContext the analyzer logs to (default layout if None)
+        @param chunked_data: ChunkedCompanyData of the file to reuse in chunked mode (loaded if None)
         """
 
         self.json_file_path = json_file_path
         self.analysis_name = analysis_name
-        self.logger = analysis_logger.get_analysis_logger(analysis_name)
+        self.chunked = chunked
+        self.memory_budget_mb = memory_budget_mb
+        self.run_context = run_context or default_run_context
+        self.logger = self.run_context.get_logger(analysis_name)
         self.data = None
+        self.company_data = chunked_data
+        self.binary_snapshot = None
+        self.sqlite_store = None
         self.po_department_dataframe = None
         self.po_employee_dataframe = None
         self.po_project_dataframe = None
+        self.project_dataframe = None
+        self.project_department_dataframe = None
         self.data_create = None
 
         self.logger.info(LogMessages.SYSTEM_START)
@@ -39,13 +58,36 @@ class BaseAnalyzer:
     def _load_data(self):
         """
         @brief Load JSON data from specified file path
-        Handles file reading and JSON parsing with error handling
+        Handles file reading and JSON parsing with error handling.
+        Analyzers of the same file share one parsed and validated copy;
+        invalid records are quarantined instead of failing the load.
+        A binary snapshot directory is memory-mapped instead of parsed and
+        an SQLite store is queried. In chunked mode employees are left to
+        po_employee_chunks.
         """
         self.logger.info(LogMessages.DATA_LOAD_START)
         try:
-            with open(self.json_file_path, "r", encoding='utf-8') as json_file:
-                self.data = json.load(json_file)
-            self.logger.info(LogMessages.DATA_LOAD_SUCCESS)
+            if is_binary_snapshot(self.json_file_path):
+                self.binary_snapshot = BinarySnapshot(self.json_file_path)
+                # The memory-mapped snapshot decodes only PO rows, no chunking needed
+                self.chunked = False
+                self.logger.info(LogMessages.BINARY_SNAPSHOT_MAPPED.format(self.json_file_path))
+                return
+
+            if is_sqlite_store(self.json_file_path):
+                self.sqlite_store = SQLiteStore(self.json_file_path)
+                # Filters run on the store's indexes, no chunking needed
+                self.chunked = False
+                self.logger.info(LogMessages.SQLITE_STORE_OPENED.format(self.json_file_path))
+                return
+
+            if self.chunked:
+                if self.company_data is None:
+                    self.company_data = ChunkedCompanyData(self.json_file_path, self.memory_budget_mb, self.run_context)
+            else:
+                self.company_data = load_company_data(self.json_file_path, self.run_context, self.SKIPPED_SECTIONS)
+            self.data = self.company_data.data
+            self.logger.info(LogMessages.DATA_LOAD_SUCCESS.format(self.json_file_path))
         except Exception as loading_error:
             error_message = LogMessages.DATA_LOAD_ERROR.format(self.json_file_path, str(loading_error))
             self.logger.error(error_message)
@@ -55,28 +97,28 @@ class BaseAnalyzer:
     def _setup_dataframes(self):
         """
         @brief Create pandas DataFrames from loaded JSON data
-        Processes equipment, departments, and employees data
+        Processes departments, employees and projects data
         """
         self.logger.info(LogMessages.DATA_PROCESSING_START.format(self.analysis_name))
 
+        if self.binary_snapshot is not None:
+            self._setup_dataframes_from_snapshot(self.binary_snapshot, "binary snapshot")
+            return
+
+        if self.sqlite_store is not None:
+            self._setup_dataframes_from_snapshot(self.sqlite_store, "SQLite store")
+            return
+
         if not self.data:
             return
         
+        frames = self.company_data.frames
         try:
             self.logger.info(LogMessages.START_CREATE_DATAFRAME.format("department PO"))
-            department_records = []
-            for department in self.data.get("departments", []):
-                department_record = {
-                    "id":       department["id"],
-                    "name":     department["name"],
-                    "type":     department["type"],
-                    "budget":   department["budget"]
-                }
-                if department_record['id'] == 1:
-                    department_records.append(department_record)
-                    break
-
-            self.po_department_dataframe = pd.DataFrame(department_records)
+            departments = frames["departments"]
+            self.po_department_dataframe = departments[
+                departments['id'] == DepartmentSettings.PO_DEPARTMENT_ID
+            ].head(1).reset_index(drop=True)
             self.data_create = pd.to_datetime(self.data['metadata']['generation_date'])
             
         except Exception as dataframe_error:
@@ -85,36 +127,9 @@ class BaseAnalyzer:
             raise dataframe_error
         
         try:
-            self.logger.info(LogMessages.START_CREATE_DATAFRAME.format("employees PO"))
-            employee_records = []
-            for employee in self.data.get("employees", []):
-                employee_record = {
-                    "employee_id":          employee["employee_id"],
-                    "full_name":            employee["personal_info"]["full_name"],
-                    "gender":               employee["personal_info"]["gender"],
-                    "birth_date":           employee['personal_info']['birth_date'],
-                    "email":                employee['personal_info']['email'],
-                    "phone":                employee['personal_info']['phone'],
-                    "address":              employee['personal_info']['address'],
-                    "department_id":        employee['work_info']['department_id'],
-                    "department_name":      employee['work_info']['department_name'],
-                    "position":             employee['work_info']['position'],
-                    'salary':               employee['work_info']['salary'],
-                    'hire_date':            employee['work_info']['hire_date'],
-                    'experience_years':     employee['work_info']['experience_years'],
-                    'performance_score':    employee['work_info']['performance_score'],
-                    "skills":               employee['work_info']["skills"],
-                    "is_team_lead":         employee['work_info']['is_team_lead']
-                }
-                if employee_record['department_id'] == 1:
-                    employee_records.append(employee_record)
-
-            employee_dataframe = pd.DataFrame(employee_records)
-
-            employee_dataframe['hire_date'] = pd.to_datetime(employee_dataframe['hire_date'])
-            employee_dataframe['birth_date'] = pd.to_datetime(employee_dataframe['birth_date'])
-
-            self.po_employee_dataframe = pd.DataFrame(employee_dataframe)
+            if not self.chunked and "employees" not in self.SKIPPED_SECTIONS:
+                self.logger.info(LogMessages.START_CREATE_DATAFRAME.format("employees PO"))
+                self.po_employee_dataframe = self._select_po_employees(frames["employees"])
         except Exception as dataframe_error:
             error_message = LogMessages.DATA_LOAD_ERROR.format("employee", str(dataframe_error))
             self.logger.error(error_message)
@@ -122,30 +137,98 @@ class BaseAnalyzer:
         
         try:
             self.logger.info(LogMessages.START_CREATE_DATAFRAME.format("project PO"))
-            project_records = []
-            for project in self.data.get("projects", []):
-
-                dept_ids = [d['department_id'] for d in project['participating_departments']]
-
-                if 1 in dept_ids:
-                    project_record = {
-                        "project_id":       project['project_id'],
-                        "department_id":    dept_ids,
-                        "name":             project['name'],
-                        "description":      project['description'],
-                        "status":           project['status'],
-                        "budget":           project['financials']['budget'],
-                        "profit":           project['financials']['profit'],
-                        "roi_percentage":   project['financials']['roi_percentage']
-                    }
-                    project_records.append(project_record)
-
-            self.po_project_dataframe = pd.DataFrame(project_records)
+            self.project_dataframe = frames["projects"].drop(columns=["participating_departments"])
+            self.project_department_dataframe = self._build_project_department_links(self.data.get("projects", []))
+            self.po_project_dataframe = self._select_po_projects()
 
         except Exception as dataframe_error:
             error_message = LogMessages.DATA_LOAD_ERROR.format("project", str(dataframe_error))
             self.logger.error(error_message)
             raise dataframe_error
+
+    def _setup_dataframes_from_snapshot(self, snapshot, source_name):
+        """
+        @brief Create pandas DataFrames from a binary snapshot or SQLite store
+        Produces the same frames as the JSON path; only PO employee rows are read.
+
+        @param snapshot: BinarySnapshot or SQLiteStore
+        @param source_name: Source description for logs
+        """
+        try:
+            self.logger.info(LogMessages.START_CREATE_DATAFRAME.format(f"from {source_name}"))
+            departments = snapshot.department_dataframe()
+            self.po_department_dataframe = departments[
+                departments['id'] == DepartmentSettings.PO_DEPARTMENT_ID
+            ].head(1).reset_index(drop=True)
+            self.data_create = pd.to_datetime(snapshot.metadata['generation_date'])
+
+            if "employees" not in self.SKIPPED_SECTIONS:
+                self.po_employee_dataframe = snapshot.employee_dataframe(DepartmentSettings.PO_DEPARTMENT_ID)
+
+            self.project_dataframe = snapshot.project_dataframe()
+            self.project_department_dataframe = snapshot.project_department_links()
+            self.po_project_dataframe = self._select_po_projects()
+        except Exception as dataframe_error:
+            error_message = LogMessages.DATA_LOAD_ERROR.format(source_name, str(dataframe_error))
+            self.logger.error(error_message)
+            raise dataframe_error
+
+    @staticmethod
+    def _select_po_employees(employees):
+        """
+        @brief PO department rows of an employee DataFrame
+        """
+        return employees[
+            employees['department_id'] == DepartmentSettings.PO_DEPARTMENT_ID
+        ].reset_index(drop=True)
+
+    def po_employee_chunks(self):
+        """
+        @brief PO employees chunk by chunk (chunked mode)
+        Chunks keep file order, so concatenating them yields po_employee_dataframe.
+
+        @return Generator of DataFrames
+        """
+        for employees in self.company_data.employee_chunks():
+            yield self._select_po_employees(employees)
+
+    def _select_po_projects(self):
+        """
+        @brief Select PO projects through the department index of the link table
+
+        @return DataFrame of projects the PO department participates in
+        """
+        po_project_ids = self.project_department_dataframe.loc[
+            self.project_department_dataframe.index == DepartmentSettings.PO_DEPARTMENT_ID, 'project_id'
+        ]
+        return self.project_dataframe[
+            self.project_dataframe['project_id'].isin(po_project_ids)
+        ].reset_index(drop=True)
+
+    def _build_project_department_links(self, projects):
+        """
+        @brief Explode participating departments into a link table
+        One row per (project, department) pair with the department's
+        budget allocation, indexed and sorted by department_id.
+
+        @param projects: List of raw project records
+        @return DataFrame indexed by department_id with columns project_id, budget_allocation
+        """
+        self.logger.info(LogMessages.START_CREATE_DATAFRAME.format("project-department links"))
+
+        link_columns = ["project_id", "department_id", "budget_allocation"]
+        if not projects:
+            return pd.DataFrame(columns=link_columns).set_index("department_id")
+
+        links = pd.json_normalize(
+            projects,
+            record_path="participating_departments",
+            meta=["project_id"]
+        )
+        links = links.reindex(columns=link_columns)
+        links["budget_allocation"] = pd.to_numeric(links["budget_allocation"]).fillna(0)
+
+        return links.set_index("department_id").sort_index(kind="stable")
     
 
     def execute_analysis(self):
@@ -3,9 +3,14 @@
 Generates basic employee statistics for salary, experience, etc.
 """
 
+import numpy as np
 import pandas as pd
+from anlyzers.analysis_results import BasicStatisticsResult
 from anlyzers.base_analyzer import BaseAnalyzer
 from config.messages import LogMessages, ReportMessages
+from config.settings import DepartmentSettings
+from utils.columnar import ColumnTable
+from utils.distribution_sketch import build_distribution_summaries
 
 
 class BasicStaticAnalayzer(BaseAnalyzer):
@@ -14,23 +19,47 @@ class BasicStaticAnalayzer(BaseAnalyzer):
     Implements common data loading and processing
     """
 
-    def __init__(self, json_file_path):
+    # Result key -> averaged column
+    AVERAGED_COLUMNS = {
+        "avarage_salary":       "salary",
+        "avarage_perfomance":   "performance_score",
+        "avarage_experience":   "experience_years"
+    }
+
+    HIGH_PERFORMER_COLUMNS = ['full_name', 'gender', 'birth_date', 'phone', 'email', 'position']
+
+    HIGH_PERFORMANCE_SCORE = 90
+
+    DISTRIBUTION_COLUMNS = ["experience_years", "performance_score", "salary"]
+
+    def __init__(self, json_file_path, chunked=False, memory_budget_mb=None, run_context=None, chunked_data=None):
         """
         @brief Initialize Basic Statisrics Analyzer
         Sets up specific parametr configuration
+
+        @param chunked: Aggregate employees chunk by chunk (out-of-core)
+        @param memory_budget_mb: Memory budget of one chunk
+        @param run_context: RunContext the analyzer logs to (default layout if None)
+        @param chunked_data: ChunkedCompanyData shared with other chunked analyzers (loaded if None)
         """
-        super().__init__(json_file_path, "Basic Statistics")
+        super().__init__(json_file_path, "Basic Statistics", chunked, memory_budget_mb, run_context, chunked_data)
 
     def execute_analysis(self):
         """
         @brief Execute Basic Statistics Analyze
         Check avarage salary, perfomance, experience, work level, employees with perfomance > 90
 
-        @return Dictionary basic statistics
+        @return BasicStatisticsResult
         """
         self.logger.info(LogMessages.ANALYSIS_START.format("Basic statics"))
 
         try:
+            if self.chunked:
+                analysis_result = self._chunked_statistics()
+                self._generate_statistics_report(analysis_result)
+                self.logger.info(LogMessages.ANALYSIS_COMPLETE.format("Basic Statistics"))
+                return analysis_result
+
             # parametrs: salary, perfomance, experience employees
             avarage_parametrs = self._avarage_parametrs_analysis()
 
@@ -40,13 +69,17 @@ class BasicStaticAnalayzer(BaseAnalyzer):
             # Check employees with performance > 90
             high_performers = self._analyze_high_performers()
 
+            # Mergeable histograms and quantile sketches for charts
+            distributions = self._build_distributions()
+
             # Return all statistics
-            analysis_result = {
-                "average_parameters": avarage_parametrs,
-                "distribution_position": destribution_position,
-                "high_performers": high_performers,
-                "total_employee_count": len(self.po_employee_dataframe)
-            }
+            analysis_result = BasicStatisticsResult(
+                total_employee_count=len(self.po_employee_dataframe),
+                average_parameters=avarage_parametrs,
+                distribution_position=ColumnTable.from_frame(destribution_position),
+                high_performers=ColumnTable.from_frame(high_performers),
+                distributions=distributions
+            )
 
             self._generate_statistics_report(analysis_result)
             self.logger.info(LogMessages.ANALYSIS_COMPLETE.format("Basic Statistics"))
@@ -59,7 +92,8 @@ class BasicStaticAnalayzer(BaseAnalyzer):
             raise e
         
 
-    def map_to_category(self, pos):
+    @staticmethod
+    def map_to_category(pos):
         """
         @brief Alghoritm for definition cetegory position
         Position have different title, but for analisys required category
@@ -100,17 +134,10 @@ class BasicStaticAnalayzer(BaseAnalyzer):
 
         self.logger.info(LogMessages.EMPLOYEE_PARAMETR_CALCULATION)
 
-        avarage_salary = self.po_employee_dataframe["salary"].mean()
-        avarage_perfomance = self.po_employee_dataframe["performance_score"].mean()
-        avarage_experience = self.po_employee_dataframe["experience_years"].mean()
-
-        avarage_parametrs = {
-            "avarage_salary":       avarage_salary,
-            "avarage_perfomance":   avarage_perfomance,
-            "avarage_experience":   avarage_experience
+        return {
+            key: float(self.po_employee_dataframe[column].mean())
+            for key, column in self.AVERAGED_COLUMNS.items()
         }
-
-        return avarage_parametrs
     
     def _analize_distribution_position(self):
         """
@@ -125,10 +152,22 @@ class BasicStaticAnalayzer(BaseAnalyzer):
 
         self.po_employee_dataframe['category'] = self.po_employee_dataframe['position'].apply(self.map_to_category)
 
-        distribution_position = self.po_employee_dataframe['category'].value_counts().reset_index()
+        return self._distribution_position_table(
+            self.po_employee_dataframe['category'].value_counts(), len(self.po_employee_dataframe))
+
+    @staticmethod
+    def _distribution_position_table(category_counts, employee_count):
+        """
+        @brief Category table from category counts sorted by count
+
+        @param category_counts: Series category -> count
+        @param employee_count: Number of employees the counts refer to
+        @return Dataframe with columns Category, Count, Percentage
+        """
+        distribution_position = category_counts.reset_index()
         distribution_position.columns = ['Category', 'Count']
-        distribution_position['Percentage'] = (distribution_position['Count']/len(self.po_employee_dataframe)*100).round(2)
-        
+        distribution_position['Percentage'] = (distribution_position['Count']/employee_count*100).round(2)
+
         return distribution_position
     
 
@@ -142,44 +181,108 @@ class BasicStaticAnalayzer(BaseAnalyzer):
 
         self.logger.info(LogMessages.EMPLOYEE_PERFOMANCE)
 
-        return self.po_employee_dataframe[self.po_employee_dataframe['performance_score']>90
-                                        ][[
-                                            'full_name',
-                                            'gender',
-                                            'birth_date',
-                                            'phone',
-                                            'email',
-                                            'position'
-                                            ]]
+        if self.sqlite_store is not None:
+            return self.sqlite_store.high_performers(
+                DepartmentSettings.PO_DEPARTMENT_ID, self.HIGH_PERFORMANCE_SCORE, self.HIGH_PERFORMER_COLUMNS)
 
+        return self._high_performer_rows(self.po_employee_dataframe)
+
+    def _high_performer_rows(self, employees):
+        """
+        @brief Personal information of employees with performance_score > 90
+        """
+        return employees[employees['performance_score'] > self.HIGH_PERFORMANCE_SCORE][self.HIGH_PERFORMER_COLUMNS]
+
+    def _build_distributions(self):
+        """
+        @brief Build mergeable distribution summaries for employee parameters
+        Histograms and quantile sketches replace raw columns in the report
+
+        @return Dictionary column -> DistributionSummary
+        """
+
+        self.logger.info(LogMessages.DISTRIBUTION_SUMMARY_BUILDING.format("employees"))
+
+        return build_distribution_summaries(self.po_employee_dataframe, self.DISTRIBUTION_COLUMNS)
+
+    def _chunked_statistics(self):
+        """
+        @brief Compute the statistics from PO employee chunks
+        Only partial aggregates are kept between chunks: sums and counts
+        for averages, category tallies, high performer rows and the
+        mergeable distribution summaries.
+
+        @return BasicStatisticsResult (same values as the in-memory path)
+        """
+        self.logger.info(LogMessages.EMPLOYEE_PARAMETR_CALCULATION)
+
+        sums = dict.fromkeys(self.AVERAGED_COLUMNS, 0.0)
+        counts = dict.fromkeys(self.AVERAGED_COLUMNS, 0)
+        category_counts = {}
+        high_performers = []
+        distributions = build_distribution_summaries(pd.DataFrame(), self.DISTRIBUTION_COLUMNS)
+        employee_count = 0
+
+        for employees in self.po_employee_chunks():
+            employee_count += len(employees)
+            for key, column in self.AVERAGED_COLUMNS.items():
+                sums[key] += employees[column].sum()
+                counts[key] += int(employees[column].count())
+            # Dictionary order is first appearance, which value_counts keeps for equal counts
+            for category, count in employees['position'].map(self.map_to_category).value_counts(sort=False).items():
+                category_counts[category] = category_counts.get(category, 0) + int(count)
+            high_performers.append(self._high_performer_rows(employees))
+            for column, summary in distributions.items():
+                summary.update(employees[column].to_numpy(dtype=np.float64, na_value=np.nan))
+
+        self.logger.info(LogMessages.EMPLOYEE_WORK_LEVEL)
+        category_series = pd.Series(category_counts, dtype=np.int64, name='count').sort_values(ascending=False)
+
+        return BasicStatisticsResult(
+            total_employee_count=employee_count,
+            average_parameters={
+                key: float(sums[key] / counts[key]) if counts[key] else np.nan for key in self.AVERAGED_COLUMNS
+            },
+            distribution_position=ColumnTable.from_frame(
+                self._distribution_position_table(category_series, employee_count)),
+            high_performers=ColumnTable.from_frame(
+                pd.concat(high_performers, ignore_index=True) if high_performers
+                else pd.DataFrame(columns=self.HIGH_PERFORMER_COLUMNS)),
+            distributions=distributions
+        )
 
     def _generate_statistics_report(self, analysis_results):
         """
         @brief Generate formatted inventory analysis report
         Outputs analysis results to console and log
 
-        @param analysis_results: Dictionary containing analysis results
+        @param analysis_results: BasicStatisticsResult
         """
         print("=" * 70)
         print(ReportMessages.STATIC_HEADER)
         print("=" * 70)
 
-        total_employee_count = analysis_results['total_employee_count']
-        total_employee_top = len(analysis_results['high_performers'])
+        total_employee_count = analysis_results.total_employee_count
+        total_employee_top = len(analysis_results.high_performers)
 
         print(f"\n{ReportMessages.TOTAL_EMPLOYEES.format(total_employee_count)}")
         print(f"{ReportMessages.TOP_EMPLOYEE_COUNT.format(total_employee_top)}")
 
         print("\nAverage Parameters Employee:")
-        avg = analysis_results['average_parameters']
+        avg = analysis_results.average_parameters
         for key, value in avg.items():
             print(f'  {key}\t:\t{value:.2f}')
 
+        for column, summary in analysis_results.distributions.items():
+            print(f"\n{ReportMessages.PERCENTILES_HEADER.format(column)}")
+            for fraction, value in summary.percentiles().items():
+                print(f'  p{fraction * 100:.0f}\t:\t{value:.2f}')
+
         print("\nDepartment Distribution Position Category:")
-        department_position = analysis_results['distribution_position']
+        department_position = analysis_results.distribution_position.to_frame()
         print(department_position.to_string(index=False))
 
         print("\nPersonal info employees with performance > 90:")
-        personal_info = analysis_results['high_performers']
+        personal_info = analysis_results.high_performers.to_frame()
         print(personal_info.to_string(index = False))
 
@@ -0,0 +1,197 @@
+"""
+@brief Equipment analysis module
+Analyzes company equipment: utilization, monthly maintenance costs,
+overdue maintenance and warranty expiry per department and equipment
+type. Everything is computed with column operations on the validated
+equipment frame; the employee section is never loaded for it.
+"""
+
+import numpy as np
+import pandas as pd
+from anlyzers.analysis_results import EquipmentResult
+from anlyzers.base_analyzer import BaseAnalyzer
+from config.messages import LogMessages, ReportMessages
+from config.settings import EquipmentSettings
+from utils.columnar import ColumnTable
+
+
+class EquipmentAnalayzer(BaseAnalyzer):
+    """
+    @brief Analyzer for equipment utilization, maintenance and warranties
+    Maintenance and warranty dates are checked against the data's
+    generation date, so results do not depend on when the report runs.
+    """
+
+    SKIPPED_SECTIONS = ("employees",)
+
+    OVERDUE_COLUMNS = ['equipment_id', 'name', 'type', 'department_name', 'next_maintenance_date',
+                       'days_overdue', 'maintenance_cost_per_month']
+
+    def __init__(self, json_file_path, run_context=None):
+        """
+        @brief Initialize Equipment Analyzer
+
+        @param run_context: RunContext the analyzer logs to (default layout if None)
+        """
+        super().__init__(json_file_path, "Equipment", run_context=run_context)
+
+    def execute_analysis(self):
+        """
+        @brief Execute equipment analysis for all departments
+
+        @return EquipmentResult
+        """
+        self.logger.info(LogMessages.ANALYSIS_START.format("Equipment"))
+
+        try:
+            equipment = self._company_equipment()
+
+            self.logger.info(LogMessages.EQUIPMENT_DATE_CHECK.format(self.data_create.date()))
+            equipment = self._flag_dates(equipment)
+
+            self.logger.info(LogMessages.EQUIPMENT_UTILIZATION_ANALYSIS.format(len(equipment)))
+            department_equipment = self._department_equipment(equipment)
+            type_summary = self._type_summary(equipment)
+
+            analysis_result = EquipmentResult(
+                total_equipment=len(equipment),
+                as_of=str(self.data_create.date()),
+                average_utilization=float(equipment['utilization_rate'].mean()) if len(equipment) else 0.0,
+                monthly_maintenance_cost=float(equipment['maintenance_cost_per_month'].sum()),
+                overdue_count=int(equipment['is_overdue'].sum()),
+                warranty_expired_count=int(equipment['is_warranty_expired'].sum()),
+                warranty_expiring_count=int(equipment['is_warranty_expiring'].sum()),
+                warranty_horizon_days=EquipmentSettings.WARRANTY_HORIZON_DAYS,
+                department_equipment=ColumnTable.from_frame(department_equipment, keep_index=True),
+                type_summary=ColumnTable.from_frame(type_summary, keep_index=True),
+                overdue_maintenance=ColumnTable.from_frame(self._overdue_maintenance(equipment))
+            )
+
+            self._generate_statistics_report(analysis_result)
+            self.logger.info(LogMessages.ANALYSIS_COMPLETE.format("Equipment"))
+
+            return analysis_result
+
+        except Exception as e:
+            error_message = LogMessages.ANALYSIS_ERROR.format("Equipment", str(e))
+            self.logger.error(error_message)
+            raise e
+
+    def _company_equipment(self):
+        """
+        @brief Validated equipment frame of the data source
+        """
+        if self.binary_snapshot is not None:
+            return self.binary_snapshot.equipment_dataframe()
+        if self.sqlite_store is not None:
+            return self.sqlite_store.equipment_dataframe()
+
+        return self.company_data.frames["equipment"]
+
+    def _flag_dates(self, equipment):
+        """
+        @brief Add maintenance and warranty flags relative to the generation date
+
+        @param equipment: Equipment frame
+        @return Frame with days_overdue, is_overdue, is_warranty_expired and
+                is_warranty_expiring columns
+        """
+        as_of = np.datetime64(self.data_create.tz_localize(None), "us")
+        day = np.timedelta64(1, "D")
+        days_overdue = (as_of - equipment['next_maintenance_date'].to_numpy(dtype="datetime64[us]")) // day
+        warranty_days_left = (equipment['warranty_end_date'].to_numpy(dtype="datetime64[us]") - as_of) // day
+
+        return equipment.assign(
+            days_overdue=days_overdue,
+            is_overdue=days_overdue > 0,
+            is_warranty_expired=warranty_days_left < 0,
+            is_warranty_expiring=(warranty_days_left >= 0) & (warranty_days_left <= EquipmentSettings.WARRANTY_HORIZON_DAYS)
+        )
+
+    @staticmethod
+    def _department_equipment(equipment):
+        """
+        @brief Utilization, maintenance and warranty figures per department
+
+        @return DataFrame indexed by department_id with columns: department_name,
+                equipment_count, average_utilization, average_hours_daily,
+                maintenance_cost_per_month, overdue_maintenance,
+                warranty_expired, warranty_expiring
+        """
+        return equipment.groupby('department_id').agg(
+            department_name=('department_name', 'first'),
+            equipment_count=('equipment_id', 'size'),
+            average_utilization=('utilization_rate', 'mean'),
+            average_hours_daily=('hours_used_daily', 'mean'),
+            maintenance_cost_per_month=('maintenance_cost_per_month', 'sum'),
+            overdue_maintenance=('is_overdue', 'sum'),
+            warranty_expired=('is_warranty_expired', 'sum'),
+            warranty_expiring=('is_warranty_expiring', 'sum')
+        )
+
+    @staticmethod
+    def _type_summary(equipment):
+        """
+        @brief Utilization and maintenance costs per equipment type, costliest first
+
+        @return DataFrame indexed by type with columns: equipment_count,
+                average_utilization, average_efficiency, maintenance_cost_per_month
+        """
+        summary = equipment.groupby('type').agg(
+            equipment_count=('equipment_id', 'size'),
+            average_utilization=('utilization_rate', 'mean'),
+            average_efficiency=('efficiency_percentage', 'mean'),
+            maintenance_cost_per_month=('maintenance_cost_per_month', 'sum')
+        )
+        return summary.sort_values('maintenance_cost_per_month', ascending=False, kind='stable')
+
+    def _overdue_maintenance(self, equipment):
+        """
+        @brief Equipment past its next maintenance date, most overdue first
+
+        @return DataFrame with OVERDUE_COLUMNS
+        """
+        overdue = equipment[equipment['is_overdue']]
+        return overdue.sort_values('days_overdue', ascending=False, kind='stable')[self.OVERDUE_COLUMNS].reset_index(drop=True)
+
+    def _generate_statistics_report(self, analysis_results):
+        """
+        @brief Generate formatted equipment report
+
+        @param analysis_results: EquipmentResult
+        """
+        print("=" * 70)
+        print(ReportMessages.EQUIPMENT_HEADER)
+        print("=" * 70)
+
+        department_equipment = analysis_results.department_equipment.to_frame()
+        print(f"\n{ReportMessages.EQUIPMENT_TOTAL.format(analysis_results.total_equipment, len(department_equipment))}")
+        print(ReportMessages.AVERAGE_UTILIZATION.format(analysis_results.average_utilization))
+        print(f"{ReportMessages.MONTHLY_MAINTENANCE_COST.format(analysis_results.monthly_maintenance_cost)} RUB")
+        print(f"{ReportMessages.ANNUAL_MAINTENANCE_COST.format(analysis_results.monthly_maintenance_cost * 12)} RUB")
+
+        print(f"\n{ReportMessages.EQUIPMENT_OVERDUE.format(analysis_results.as_of, analysis_results.overdue_count)}")
+        print(ReportMessages.EQUIPMENT_WARRANTY.format(analysis_results.warranty_expired_count,
+                                                       analysis_results.warranty_horizon_days,
+                                                       analysis_results.warranty_expiring_count))
+
+        print(f"\n{ReportMessages.EQUIPMENT_BY_DEPARTMENT}")
+        print(department_equipment.to_string(formatters={
+            'average_utilization': '{:.1f}'.format,
+            'average_hours_daily': '{:.1f}'.format,
+            'maintenance_cost_per_month': '{:,.0f}'.format
+        }))
+
+        print(f"\n{ReportMessages.EQUIPMENT_BY_TYPE}")
+        print(analysis_results.type_summary.to_frame().to_string(formatters={
+            'average_utilization': '{:.1f}'.format,
+            'average_efficiency': '{:.1f}'.format,
+            'maintenance_cost_per_month': '{:,.0f}'.format
+        }))
+
+        overdue = analysis_results.overdue_maintenance.to_frame()
+        if len(overdue):
+            print(f"\n{ReportMessages.EQUIPMENT_TOP_OVERDUE.format(EquipmentSettings.REPORT_OVERDUE_COUNT)}")
+            top_overdue = overdue.head(EquipmentSettings.REPORT_OVERDUE_COUNT).assign(
+                next_maintenance_date=lambda frame: pd.to_datetime(frame['next_maintenance_date']).dt.date)
+            print(top_overdue.to_string(index=False))
@@ -5,8 +5,12 @@ budget utilization, and top salary identification.
 """
 
 import pandas as pd
+from anlyzers.analysis_results import FinanceResult
 from anlyzers.base_analyzer import BaseAnalyzer
 from config.messages import LogMessages, ReportMessages
+from config.settings import DepartmentSettings
+from utils.columnar import ColumnTable
+from utils.payroll import vectorized_fot
 
 
 class FinanceAnalayzer(BaseAnalyzer):
@@ -16,12 +20,21 @@ class FinanceAnalayzer(BaseAnalyzer):
     and identifies top-paid employees.
     """
 
-    def __init__(self, json_file_path):
+    FOT_TABLE_COLUMNS = ["full_name", "position", "salary", "FOT"]
+
+    TOP_SALARY_COUNT = 5
+
+    def __init__(self, json_file_path, chunked=False, memory_budget_mb=None, run_context=None, chunked_data=None):
         """
         @brief Initialize Finance Analyzer
         Sets up data source and logger for financial analysis.
+
+        @param chunked: Compute payroll chunk by chunk (out-of-core)
+        @param memory_budget_mb: Memory budget of one chunk
+        @param run_context: RunContext the analyzer logs to (default layout if None)
+        @param chunked_data: ChunkedCompanyData shared with other chunked analyzers (loaded if None)
         """
-        super().__init__(json_file_path, "Finance Departament")
+        super().__init__(json_file_path, "Finance Departament", chunked, memory_budget_mb, run_context, chunked_data)
 
     def execute_analysis(self):
         """
@@ -29,27 +42,32 @@ class FinanceAnalayzer(BaseAnalyzer):
         Computes total payroll (FOT), compares it with budget,
         and retrieves top 5 highest salaries.
 
-        @return Dictionary containing financial statistics
+        @return FinanceResult
         """
         self.logger.info(LogMessages.ANALYSIS_START.format("Finance Departament"))
 
         try:
-            # calculate FOT for evrything employee
-            FOT = self._FOT_departaments()
+            if self.chunked:
+                # FOT table and top salary candidates per chunk
+                fot_table, top_salary = self._chunked_payroll()
+            else:
+                # calculate FOT for evrything employee
+                self._FOT_departaments()
+                fot_table = self.po_employee_dataframe
 
-            #comparison Fot and budget
-            comparison_FOT_budget = self._comparison_FOT_budget_departament()
+                # search 5 employee with more salary
+                top_salary = self._top_five_salary(self.po_employee_dataframe)
 
-            # search 5 employee with more salary
-            top_salary = self._top_five_salary()
+            #comparison Fot and budget
+            comparison_FOT_budget = self._comparison_FOT_budget_departament(fot_table['FOT'])
 
             # Return all statistics
-            analysis_result = {
-                "total_employees":  len(self.po_employee_dataframe),
-                "FOT": FOT,
-                "distribution_position": comparison_FOT_budget,
-                "top_salary": top_salary,
-            }
+            analysis_result = FinanceResult(
+                total_employees=len(fot_table),
+                fot_table=ColumnTable.from_frame(fot_table, self.FOT_TABLE_COLUMNS),
+                distribution_position=comparison_FOT_budget,
+                top_salary=ColumnTable.from_frame(top_salary)
+            )
 
             self._generate_statistics_report(analysis_result)
             self.logger.info(LogMessages.ANALYSIS_COMPLETE.format("Finance analyze"))
@@ -63,29 +81,21 @@ class FinanceAnalayzer(BaseAnalyzer):
         
 
 
-    def _payroll_calculation(self, employee):
+    def _payroll_calculation(self, employees):
         """
-        @brief Calculate individual payroll contribution (FOT) for reporting period
+        @brief Calculate payroll contribution (FOT) for reporting period
         If employee worked more than 1 year, FOT = 12 * salary.
         Otherwise, FOT = salary * full months worked.
 
-        @param employee: Series containing employee data
-        @return: Calculated FOT value (float)
+        @param employees: DataFrame with salary and hire_date columns
+        @return: numpy array of FOT values (integer for integer salaries)
         """
-        hire = employee['hire_date']
-        report = self.data_create
-
-        if (report - hire).days > 365:
-            return employee['salary'] * 12
-
-        months = (report.year - hire.year) * 12 + (report.month - hire.month)
-        if report.day < hire.day:
-            months -= 1
-        months = max(0, months)
-
-        months = max(0, months)
-
-        return employee['salary'] * months
+        fot = vectorized_fot(
+            employees['salary'].to_numpy(),
+            employees['hire_date'].to_numpy(dtype="datetime64[s]"),
+            self.data_create.to_datetime64()
+        )
+        return fot.astype(employees['salary'].dtype) if employees['salary'].dtype.kind in "iu" else fot
 
 
     def _FOT_departaments(self):
@@ -98,21 +108,48 @@ class FinanceAnalayzer(BaseAnalyzer):
 
         self.logger.info(LogMessages.EMPLOYEE_PARAMETR_CALCULATION)
 
-        self.po_employee_dataframe['FOT'] = self.po_employee_dataframe.apply(self._payroll_calculation, axis= 1)
+        self.po_employee_dataframe['FOT'] = self._payroll_calculation(self.po_employee_dataframe)
         return self.po_employee_dataframe['FOT']
+
+    def _chunked_payroll(self):
+        """
+        @brief Payroll of PO employee chunks
+        Each chunk contributes its FOT table rows and its top salaries;
+        the overall top is selected from the per-chunk tops, which
+        keeps the in-memory tie order (earlier employees first).
+
+        @return Tuple (FOT table DataFrame, top salary DataFrame)
+        """
+        self.logger.info(LogMessages.EMPLOYEE_PARAMETR_CALCULATION)
+
+        fot_tables = []
+        top_candidates = []
+        for employees in self.po_employee_chunks():
+            employees['FOT'] = self._payroll_calculation(employees)
+            fot_tables.append(employees[self.FOT_TABLE_COLUMNS])
+            top_candidates.append(employees.nlargest(self.TOP_SALARY_COUNT, 'salary'))
+
+        if not fot_tables:
+            empty_table = pd.DataFrame({column: pd.Series(dtype=float if column in ("salary", "FOT") else object)
+                                        for column in self.FOT_TABLE_COLUMNS})
+            fot_tables, top_candidates = [empty_table], [empty_table]
+        fot_table = pd.concat(fot_tables, ignore_index=True)
+        top_salary = self._top_five_salary(pd.concat(top_candidates, ignore_index=True))
+        return fot_table, top_salary
     
-    def _comparison_FOT_budget_departament(self):
+    def _comparison_FOT_budget_departament(self, fot):
         """
         @brief Compare total FOT with department budget
         Calculates absolute and percentage usage of allocated budget.
 
+        @param fot: Series of per-employee FOT
         @return Dictionary with FOT, budget, and utilization percentage
         """
 
         self.logger.info(LogMessages.BUDGET_COMPARISON_START)
 
         budget = self.po_department_dataframe['budget'].iloc[0]
-        total_fot = self.po_employee_dataframe['FOT'].sum()
+        total_fot = fot.sum()
         percent_used = round((total_fot / budget) * 100, 2) if budget > 0 else 0.0
 
         return {
@@ -122,18 +159,23 @@ class FinanceAnalayzer(BaseAnalyzer):
         }
     
 
-    def _top_five_salary(self):
+    def _top_five_salary(self, employees):
         """
         @brief Retrieve top 5 employees by salary
         Returns a DataFrame with key personal and position info.
 
+        @param employees: DataFrame with full_name, position and salary columns
         @return DataFrame with top 5 highest-paid employees
         """
 
         self.logger.info(LogMessages.TOP_SALARIES_RETRIEVAL)
 
-        top_5 = self.po_employee_dataframe.nlargest(5, 'salary')
-        return top_5[['full_name', 'position', 'salary']].copy()
+        if self.sqlite_store is not None:
+            return self.sqlite_store.top_salaries(
+                DepartmentSettings.PO_DEPARTMENT_ID, self.TOP_SALARY_COUNT, ['full_name', 'position', 'salary'])
+
+        top_5 = employees.nlargest(self.TOP_SALARY_COUNT, 'salary')
+        return top_5[['full_name', 'position', 'salary']]
 
 
     def _generate_statistics_report(self, analysis_results):
@@ -141,18 +183,19 @@ class FinanceAnalayzer(BaseAnalyzer):
         @brief Generate formatted financial analysis report
         Outputs key metrics to console.
 
-        @param analysis_results: Dictionary containing financial analysis results
+        @param analysis_results: FinanceResult
         """
         print("=" * 70)
         print(ReportMessages.FINANCE_HEADER)
         print("=" * 70)
 
-        print(f"\n{ReportMessages.TOTAL_EMPLOYEES.format(analysis_results['total_employees'])}")
-        print(f"{ReportMessages.FOT_TOTAL.format(analysis_results['distribution_position']['total_fot'])} RUB")
-        print(f"{ReportMessages.BUDGET_ALLOCATED.format(analysis_results['distribution_position']["department_budget"])} RUB")
-        print(f"{ReportMessages.BUDGET_UTILIZATION.format(analysis_results['distribution_position']["budget_utilization_percent"])}")
-        print(self.po_employee_dataframe[["full_name", "position", "salary", "FOT"]].to_string(index=False))
+        budget_info = analysis_results.distribution_position
+        print(f"\n{ReportMessages.TOTAL_EMPLOYEES.format(analysis_results.total_employees)}")
+        print(f"{ReportMessages.FOT_TOTAL.format(budget_info['total_fot'])} RUB")
+        print(f"{ReportMessages.BUDGET_ALLOCATED.format(budget_info['department_budget'])} RUB")
+        print(f"{ReportMessages.BUDGET_UTILIZATION.format(budget_info['budget_utilization_percent'])}")
+        print(analysis_results.fot_table.to_frame().to_string(index=False))
 
         print("\n" + ReportMessages.TOP_SALARIES_HEADER)
-        print(analysis_results['top_salary'].to_string(index=False))
+        print(analysis_results.top_salary.to_frame().to_string(index=False))
 
@@ -5,12 +5,22 @@ Contains all analysis modules for comprehensive infrastructure assessment
 
 from .basic_statistics import BasicStaticAnalayzer
 from .finance_analize import FinanceAnalayzer
+from .salary_analyze import SalaryPercentileAnalayzer
+from .payroll_projection_analyze import PayrollProjectionAnalayzer
 from .project_analyze import ProjectAnalayzer
 from .skills_analyzer import SkillsAnalayzer
+from .equipment_analyze import EquipmentAnalayzer
+from .kpi_fast_path_analyze import KPIFastPathAnalayzer
+from .trend_analyze import SnapshotTrendAnalayzer
 
 __all__ = [
     "BasicStaticAnalayzer",
     "FinanceAnalayzer",
+    "SalaryPercentileAnalayzer",
+    "PayrollProjectionAnalayzer",
     "ProjectAnalayzer",
-    "SkillsAnalayzer"
-]
\ No newline at end of file
+    "SkillsAnalayzer",
+    "EquipmentAnalayzer",
+    "KPIFastPathAnalayzer",
+    "SnapshotTrendAnalayzer"
+]
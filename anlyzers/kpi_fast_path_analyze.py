@@ -0,0 +1,269 @@
+"""
+@brief KPI fast path module
+Answers headline metrics straight from the precomputed kpi_metrics and
+company_overview blocks, with an optional sampled verification pass that
+recomputes a few departments from the validated frames and reports drift.
+"""
+
+import numpy as np
+import pandas as pd
+from anlyzers.base_analyzer import BaseAnalyzer
+from config.messages import LogMessages, ReportMessages
+from config.settings import DepartmentSettings, KPIFastPathSettings
+from utils.input_formats import is_plain_json
+from utils.json_sections import read_top_level_sections
+
+
+class KPIFastPathAnalayzer(BaseAnalyzer):
+    """
+    @brief Analyzer for headline metrics from precomputed KPI blocks
+    Reads only metadata, kpi_metrics and company_overview; employees and
+    projects are decoded only when verification is enabled.
+    """
+
+    KPI_SECTIONS = ["metadata", "kpi_metrics", "company_overview"]
+
+    # Precomputed KPI column -> recomputed metric name
+    VERIFIED_METRICS = {
+        "employee_metrics.employee_count":      "employee_count",
+        "employee_metrics.average_salary":      "average_salary",
+        "employee_metrics.average_performance": "average_performance",
+        "employee_metrics.average_experience":  "average_experience",
+        "project_metrics.active_projects":      "active_projects",
+        "project_metrics.completed_projects":   "completed_projects",
+        "project_metrics.total_profit":         "total_profit",
+        "project_metrics.average_roi":          "average_roi",
+    }
+
+    def __init__(self, json_file_path, verification_sample_size=None, drift_tolerance_percent=None):
+        """
+        @brief Initialize KPI Fast Path Analyzer
+
+        @param json_file_path: Path to JSON data file
+        @param verification_sample_size: Departments to recompute (0 disables, default from settings)
+        @param drift_tolerance_percent: Allowed relative drift in percent (default from settings)
+        """
+        self.verification_sample_size = (KPIFastPathSettings.VERIFICATION_SAMPLE_SIZE
+                                         if verification_sample_size is None else verification_sample_size)
+        self.drift_tolerance_percent = (KPIFastPathSettings.DRIFT_TOLERANCE_PERCENT
+                                        if drift_tolerance_percent is None else drift_tolerance_percent)
+        self.kpi_dataframe = None
+        self.company_overview = None
+        self.raw_data_loaded = False
+        super().__init__(json_file_path, "KPI Fast Path")
+
+    def _load_data(self):
+        """
+        @brief Load only the precomputed KPI sections
+        Falls back to the full JSON load when a section cannot be located
+        or the input is compressed / newline-delimited.
+        """
+        self.logger.info(LogMessages.DATA_LOAD_START)
+        if not is_plain_json(self.json_file_path):
+            self._load_raw_data()
+            return
+        try:
+            sections = read_top_level_sections(self.json_file_path, self.KPI_SECTIONS)
+        except Exception as loading_error:
+            error_message = LogMessages.DATA_LOAD_ERROR.format(self.json_file_path, str(loading_error))
+            self.logger.error(error_message)
+            raise loading_error
+
+        missing = [name for name, value in sections.items() if value is None]
+        if missing:
+            self.logger.warning(LogMessages.KPI_SECTIONS_MISSING.format(", ".join(missing)))
+            self._load_raw_data()
+            return
+
+        self.data = sections
+        self.logger.info(LogMessages.KPI_SECTIONS_READ)
+
+    def _load_raw_data(self):
+        """
+        @brief Load the whole JSON document (used for fallback and verification)
+        """
+        if not self.raw_data_loaded:
+            super()._load_data()
+            self.raw_data_loaded = True
+
+    def _setup_dataframes(self):
+        """
+        @brief Flatten kpi_metrics into a DataFrame indexed by department_id
+        """
+        self.logger.info(LogMessages.DATA_PROCESSING_START.format(self.analysis_name))
+
+        if not self.data:
+            return
+
+        try:
+            self.logger.info(LogMessages.START_CREATE_DATAFRAME.format("KPI metrics"))
+            self.kpi_dataframe = pd.json_normalize(self.data.get("kpi_metrics") or []).set_index("department_id")
+            self.company_overview = self.data.get("company_overview") or {}
+            self.data_create = pd.to_datetime(self.data['metadata']['generation_date'])
+        except Exception as dataframe_error:
+            error_message = LogMessages.DATA_LOAD_ERROR.format("KPI metrics", str(dataframe_error))
+            self.logger.error(error_message)
+            raise dataframe_error
+
+    def execute_analysis(self):
+        """
+        @brief Execute headline KPI analysis
+        Collects company overview and PO department KPI, then runs
+        sampled verification if enabled.
+
+        @return Dictionary with headline metrics and verification report
+        """
+        self.logger.info(LogMessages.ANALYSIS_START.format("KPI Fast Path"))
+
+        try:
+            department_kpi = self._department_headline(DepartmentSettings.PO_DEPARTMENT_ID)
+
+            verification = self._verify_sample()
+
+            analysis_result = {
+                "company_overview": self.company_overview,
+                "department_kpi": department_kpi,
+                "kpi_table": self.kpi_dataframe,
+                "verification": verification,
+                "report_date": self.data_create
+            }
+
+            self._generate_statistics_report(analysis_result)
+            self.logger.info(LogMessages.ANALYSIS_COMPLETE.format("KPI Fast Path"))
+
+            return analysis_result
+
+        except Exception as e:
+            error_message = LogMessages.ANALYSIS_ERROR.format("KPI Fast Path", str(e))
+            self.logger.error(error_message)
+            raise e
+
+    def _department_headline(self, department_id):
+        """
+        @brief Headline KPI of a single department
+
+        @param department_id: Department identifier
+        @return Dictionary of flattened KPI values (empty if department is unknown)
+        """
+        if department_id not in self.kpi_dataframe.index:
+            return {}
+        return self.kpi_dataframe.loc[department_id].to_dict()
+
+    def _verify_sample(self):
+        """
+        @brief Recompute KPI for a random sample of departments from validated rows
+        Compares each recomputed value with the precomputed one.
+
+        @return DataFrame with columns: scope, metric, reported, recomputed,
+                drift_percent, within_tolerance (None when disabled)
+        """
+        if self.verification_sample_size <= 0 or self.kpi_dataframe.empty:
+            self.logger.info(LogMessages.KPI_VERIFICATION_SKIPPED)
+            return None
+
+        rng = np.random.default_rng(KPIFastPathSettings.VERIFICATION_SEED)
+        department_ids = self.kpi_dataframe.index.to_numpy()
+        sample_size = min(self.verification_sample_size, len(department_ids))
+        sample_ids = np.sort(rng.choice(department_ids, size=sample_size, replace=False))
+        self.logger.info(LogMessages.KPI_VERIFICATION_START.format(sample_ids.tolist()))
+
+        self._load_raw_data()
+        recomputed = self._recompute_department_metrics(set(sample_ids.tolist()))
+
+        reported = self.kpi_dataframe.loc[sample_ids, list(self.VERIFIED_METRICS)]
+        reported = reported.rename(columns=self.VERIFIED_METRICS)
+        recomputed = recomputed.reindex(index=sample_ids, columns=reported.columns).fillna(0)
+
+        comparison = pd.DataFrame({
+            "scope": np.repeat(sample_ids.astype(str), len(reported.columns)),
+            "metric": np.tile(reported.columns.to_numpy(), len(sample_ids)),
+            "reported": reported.to_numpy(dtype=float).ravel(),
+            "recomputed": recomputed.to_numpy(dtype=float).ravel()
+        })
+
+        company_rows = pd.DataFrame({
+            "scope": "company",
+            "metric": ["total_employees", "total_projects"],
+            "reported": [self.company_overview.get("total_employees", np.nan),
+                         self.company_overview.get("total_projects", np.nan)],
+            "recomputed": [len(self.company_data.frames["employees"]), len(self.company_data.frames["projects"])]
+        })
+        comparison = pd.concat([comparison, company_rows], ignore_index=True)
+
+        difference = (comparison["recomputed"] - comparison["reported"]).abs()
+        scale = comparison["reported"].abs().where(comparison["reported"] != 0, 1.0)
+        comparison["drift_percent"] = (difference / scale * 100).round(3)
+        comparison["within_tolerance"] = comparison["drift_percent"] <= self.drift_tolerance_percent
+
+        drifted = int((~comparison["within_tolerance"]).sum())
+        if drifted:
+            self.logger.warning(LogMessages.KPI_DRIFT_DETECTED.format(self.drift_tolerance_percent, drifted))
+
+        return comparison
+
+    def _recompute_department_metrics(self, department_ids):
+        """
+        @brief Recompute verified KPI from the validated employees and projects
+        Uses the frames of the validating loader, so quarantined records are
+        left out here exactly as they are in the rest of the analysis.
+
+        @param department_ids: Set of department identifiers to recompute
+        @return DataFrame indexed by department_id with recomputed metrics
+        """
+        frames = self.company_data.frames
+        employees = frames["employees"]
+        employee_metrics = employees[employees["department_id"].isin(department_ids)].groupby("department_id").agg(
+            employee_count=("salary", "size"),
+            average_salary=("salary", "mean"),
+            average_performance=("performance_score", "mean"),
+            average_experience=("experience_years", "mean")
+        )
+
+        projects = frames["projects"][["status", "profit", "roi_percentage", "participating_departments"]]
+        projects = projects.explode("participating_departments", ignore_index=True).dropna(
+            subset=["participating_departments"])
+        projects = projects.assign(
+            department_id=projects["participating_departments"].str.get("department_id"),
+            is_active=projects["status"].eq("active"),
+            is_completed=projects["status"].eq("completed")
+        )
+        project_metrics = projects[projects["department_id"].isin(department_ids)].groupby("department_id").agg(
+            active_projects=("is_active", "sum"),
+            completed_projects=("is_completed", "sum"),
+            total_profit=("profit", "sum"),
+            average_roi=("roi_percentage", "mean")
+        )
+
+        return employee_metrics.join(project_metrics, how="outer")
+
+    def _generate_statistics_report(self, analysis_results):
+        """
+        @brief Generate formatted headline KPI report
+
+        @param analysis_results: Dictionary containing KPI fast path results
+        """
+        print("=" * 70)
+        print(ReportMessages.KPI_HEADER)
+        print("=" * 70)
+
+        print(f"\n{ReportMessages.KPI_COMPANY_OVERVIEW}")
+        for key, value in analysis_results['company_overview'].items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                print(f"  {key}\t:\t{value:,}")
+            elif not isinstance(value, dict):
+                print(f"  {key}\t:\t{value}")
+
+        print(f"\n{ReportMessages.KPI_DEPARTMENT.format(DepartmentSettings.PO_DEPARTMENT_ID)}")
+        for key, value in analysis_results['department_kpi'].items():
+            if not isinstance(value, (dict, list)):
+                print(f"  {key}\t:\t{value}")
+
+        verification = analysis_results['verification']
+        if verification is None:
+            print(f"\n{ReportMessages.KPI_VERIFICATION_SKIPPED}")
+            return
+
+        print(f"\n{ReportMessages.KPI_VERIFICATION_HEADER.format(self.drift_tolerance_percent)}")
+        print(verification.to_string(index=False))
+        drifted = int((~verification['within_tolerance']).sum())
+        print(ReportMessages.KPI_DRIFT_SUMMARY.format(drifted, len(verification)))
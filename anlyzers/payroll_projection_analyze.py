@@ -0,0 +1,218 @@
+"""
+@brief Monthly payroll projection module
+Projects month-by-month payroll of every department over the fiscal
+year, including planned hires and raises, and flags the month in which
+each department's annual budget runs out. The employees x months payroll
+is built with NumPy date arithmetic (utils.payroll), so all departments
+are projected at once without Python loops over employees.
+"""
+
+import numpy as np
+import pandas as pd
+from anlyzers.analysis_results import PayrollProjectionResult
+from anlyzers.base_analyzer import BaseAnalyzer
+from config.messages import LogMessages, ReportMessages
+from config.settings import DepartmentSettings, PayrollProjectionSettings
+from utils.columnar import ColumnTable
+from utils.payroll import budget_exhaustion, department_payroll, projection_months, salary_index
+
+
+class PayrollProjectionAnalayzer(BaseAnalyzer):
+    """
+    @brief Analyzer for projected monthly payroll against department budgets
+    Planned hires and raises come from PayrollProjectionSettings.
+    """
+
+    EMPLOYEE_COLUMNS = ['department_id', 'salary', 'hire_date']
+
+    BUDGET_COLUMNS = ['name', 'budget', 'first_year_payroll', 'utilization_percent', 'exhaustion_month']
+
+    def __init__(self, json_file_path, run_context=None):
+        """
+        @brief Initialize Payroll Projection Analyzer
+
+        @param run_context: RunContext the analyzer logs to (default layout if None)
+        """
+        super().__init__(json_file_path, "Payroll Projection", run_context=run_context)
+
+    def execute_analysis(self):
+        """
+        @brief Execute payroll projection for all departments
+
+        @return PayrollProjectionResult
+        """
+        self.logger.info(LogMessages.ANALYSIS_START.format("Payroll Projection"))
+
+        try:
+            employees = self._company_employees()
+            salary, hire_dates, department_ids, planned_hire_count = self._with_planned_hires(employees)
+
+            months = projection_months(self._fiscal_year_start(), PayrollProjectionSettings.HORIZON_MONTHS)
+            month_labels = months.astype(str)
+            self.logger.info(LogMessages.PAYROLL_PROJECTION.format(
+                len(salary), planned_hire_count, len(months), month_labels[0] if len(months) else "-"))
+
+            # Departments x months payroll
+            payroll_ids, payroll = department_payroll(
+                salary, hire_dates, department_ids, months, salary_index(months, PayrollProjectionSettings.RAISES))
+
+            # Every department with a budget or employees
+            departments = self._departments().drop_duplicates('id').set_index('id')
+            department_index = np.union1d(payroll_ids, departments.index.to_numpy())
+            all_payroll = np.zeros((len(department_index), len(months)))
+            all_payroll[np.searchsorted(department_index, payroll_ids)] = payroll
+            departments = departments.reindex(department_index)
+
+            self.logger.info(LogMessages.BUDGET_EXHAUSTION_CHECK.format(len(department_index)))
+            cumulative, first_exceeded = budget_exhaustion(all_payroll, departments['budget'].to_numpy(dtype=float))
+
+            department_payroll_table = pd.DataFrame(all_payroll, columns=list(month_labels),
+                                                    index=pd.Index(department_index, name='department_id'))
+            budget_table = self._budget_table(departments, all_payroll, first_exceeded, month_labels)
+
+            analysis_result = PayrollProjectionResult(
+                months=tuple(month_labels.tolist()),
+                employee_count=len(employees),
+                planned_hire_count=planned_hire_count,
+                raise_count=len(PayrollProjectionSettings.RAISES),
+                department_payroll=ColumnTable.from_frame(department_payroll_table, keep_index=True),
+                budget_table=ColumnTable.from_frame(budget_table, keep_index=True),
+                po_monthly=ColumnTable.from_frame(
+                    self._po_monthly(department_index, all_payroll, cumulative, departments, month_labels))
+            )
+
+            self._generate_statistics_report(analysis_result)
+            self.logger.info(LogMessages.ANALYSIS_COMPLETE.format("Payroll Projection"))
+
+            return analysis_result
+
+        except Exception as e:
+            error_message = LogMessages.ANALYSIS_ERROR.format("Payroll Projection", str(e))
+            self.logger.error(error_message)
+            raise e
+
+    def _company_employees(self):
+        """
+        @brief EMPLOYEE_COLUMNS of all employees
+        """
+        if self.binary_snapshot is not None:
+            return self.binary_snapshot.employee_dataframe()[self.EMPLOYEE_COLUMNS]
+        if self.sqlite_store is not None:
+            return self.sqlite_store.employee_dataframe(columns=self.EMPLOYEE_COLUMNS)
+
+        return self.company_data.frames["employees"][self.EMPLOYEE_COLUMNS]
+
+    def _departments(self):
+        """
+        @brief id, name and budget of all departments
+        """
+        if self.binary_snapshot is not None:
+            departments = self.binary_snapshot.department_dataframe()
+        elif self.sqlite_store is not None:
+            departments = self.sqlite_store.department_dataframe()
+        else:
+            departments = self.company_data.frames["departments"]
+        return departments[['id', 'name', 'budget']]
+
+    def _fiscal_year_start(self):
+        """
+        @brief First month of the fiscal year containing the generation date
+        """
+        start_month = PayrollProjectionSettings.FISCAL_YEAR_START_MONTH
+        year = self.data_create.year if self.data_create.month >= start_month else self.data_create.year - 1
+        return f"{year:04d}-{start_month:02d}"
+
+    @staticmethod
+    def _with_planned_hires(employees):
+        """
+        @brief Salary, hire date and department arrays including planned hires
+
+        @param employees: DataFrame with EMPLOYEE_COLUMNS
+        @return Tuple (salaries, hire dates, department ids, number of planned hires)
+        """
+        planned = PayrollProjectionSettings.PLANNED_HIRES
+        counts = [hire.get("count", 1) for hire in planned]
+        planned_salary = np.repeat(np.array([hire["salary"] for hire in planned], dtype=np.float64), counts)
+        planned_start = np.repeat(np.array([hire["start"] for hire in planned], dtype="datetime64[D]"), counts)
+        planned_department = np.repeat(np.array([hire["department_id"] for hire in planned], dtype=np.int64), counts)
+
+        salary = np.concatenate([employees['salary'].to_numpy(dtype=np.float64), planned_salary])
+        hire_dates = np.concatenate([employees['hire_date'].to_numpy(dtype="datetime64[D]"), planned_start])
+        department_ids = np.concatenate([employees['department_id'].to_numpy(dtype=np.int64), planned_department])
+        return salary, hire_dates, department_ids, len(planned_salary)
+
+    @staticmethod
+    def _budget_table(departments, payroll, first_exceeded, month_labels):
+        """
+        @brief Budget comparison per department for the first fiscal year
+
+        @return DataFrame indexed by department_id with BUDGET_COLUMNS;
+                exhaustion_month is empty when the budget lasts
+        """
+        first_year_payroll = payroll[:, :12].sum(axis=1)
+        budget = departments['budget'].to_numpy(dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            utilization = np.where(budget > 0, np.round(first_year_payroll / budget * 100, 2), np.nan)
+
+        exhaustion_month = np.full(len(departments), "", dtype=object)
+        exhausted = first_exceeded >= 0
+        exhaustion_month[exhausted] = month_labels[first_exceeded[exhausted]]
+
+        table = departments.assign(
+            first_year_payroll=first_year_payroll,
+            utilization_percent=utilization,
+            exhaustion_month=exhaustion_month
+        )
+        table.index.name = 'department_id'
+        return table[PayrollProjectionAnalayzer.BUDGET_COLUMNS]
+
+    @staticmethod
+    def _po_monthly(department_index, payroll, cumulative, departments, month_labels):
+        """
+        @brief Month-by-month payroll of the PO department
+
+        @return DataFrame with columns: month, payroll, cumulative, budget_remaining
+        """
+        columns = ['month', 'payroll', 'cumulative', 'budget_remaining']
+        position = np.searchsorted(department_index, DepartmentSettings.PO_DEPARTMENT_ID)
+        if position == len(department_index) or department_index[position] != DepartmentSettings.PO_DEPARTMENT_ID:
+            return pd.DataFrame({column: pd.Series(dtype=object if column == 'month' else float) for column in columns})
+
+        budget = float(departments['budget'].iloc[position])
+        return pd.DataFrame({
+            'month': month_labels,
+            'payroll': payroll[position],
+            'cumulative': cumulative[position],
+            'budget_remaining': budget - cumulative[position]
+        }, columns=columns)
+
+    def _generate_statistics_report(self, analysis_results):
+        """
+        @brief Generate formatted payroll projection report
+
+        @param analysis_results: PayrollProjectionResult
+        """
+        print("=" * 70)
+        print(ReportMessages.PAYROLL_PROJECTION_HEADER)
+        print("=" * 70)
+
+        months = analysis_results.months
+        print(f"\n{ReportMessages.PAYROLL_PROJECTION_PERIOD.format(months[0] if months else '-', months[-1] if months else '-', analysis_results.employee_count, analysis_results.planned_hire_count, analysis_results.raise_count)}")
+
+        po_monthly = analysis_results.po_monthly.to_frame()
+        print(f"\n{ReportMessages.PAYROLL_PO_MONTHLY}")
+        print(po_monthly.to_string(index=False, float_format=lambda value: f"{value:,.0f}"))
+
+        budget_table = analysis_results.budget_table.to_frame()
+        if DepartmentSettings.PO_DEPARTMENT_ID in budget_table.index:
+            po_exhaustion = budget_table.loc[DepartmentSettings.PO_DEPARTMENT_ID, 'exhaustion_month']
+            print(f"\n{ReportMessages.PAYROLL_PO_EXHAUSTED.format(po_exhaustion) if po_exhaustion else ReportMessages.PAYROLL_PO_WITHIN_BUDGET}")
+
+        exhausted = budget_table[budget_table['exhaustion_month'] != ""]
+        print(f"\n{ReportMessages.PAYROLL_DEPARTMENTS_EXHAUSTED.format(len(exhausted), len(budget_table))}")
+        if len(exhausted):
+            print(exhausted.to_string(formatters={
+                'budget': '{:,.0f}'.format,
+                'first_year_payroll': '{:,.0f}'.format,
+                'utilization_percent': '{:.2f}'.format
+            }))
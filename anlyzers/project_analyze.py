@@ -4,9 +4,14 @@ Analyzes PO department projects by status, ROI, and profitability.
 Identifies the most profitable project and provides key metrics.
 """
 
+import numpy as np
 import pandas as pd
+from anlyzers.analysis_results import ProjectResult
 from anlyzers.base_analyzer import BaseAnalyzer
 from config.messages import LogMessages, ReportMessages
+from config.settings import DepartmentSettings
+from utils.columnar import ColumnTable
+from utils.distribution_sketch import build_distribution_summaries
 
 
 class ProjectAnalayzer(BaseAnalyzer):
@@ -15,12 +20,16 @@ class ProjectAnalayzer(BaseAnalyzer):
     Evaluates project statuses, average ROI, and identifies the top-profit project.
     """
 
-    def __init__(self, json_file_path):
+    SKIPPED_SECTIONS = ("employees",)
+
+    def __init__(self, json_file_path, run_context=None):
         """
         @brief Initialize Project Analyzer
         Sets up data source and logger for project analysis.
+
+        @param run_context: RunContext the analyzer logs to (default layout if None)
         """
-        super().__init__(json_file_path, "Project")
+        super().__init__(json_file_path, "Project", run_context=run_context)
 
     def execute_analysis(self):
         """
@@ -28,7 +37,7 @@ class ProjectAnalayzer(BaseAnalyzer):
         Computes project status distribution, average ROI,
         and identifies the most profitable project.
 
-        @return Dictionary containing project analysis results
+        @return ProjectResult
         """
         self.logger.info(LogMessages.ANALYSIS_START.format("Project"))
 
@@ -42,13 +51,21 @@ class ProjectAnalayzer(BaseAnalyzer):
             # Search top project: max profit
             top_project = self._search_top_benefit_project()
 
+            # ROI histogram and quantile sketch for charts
+            roi_distribution = self._build_roi_distribution()
+
+            # Allocation-weighted ROI and profit for every department
+            department_project_metrics = self._department_project_metrics()
+
             # Return all statistics
-            analysis_result = {
-                "total_projects":  len(self.po_project_dataframe),
-                "status_project": status_project,
-                "average_ROI_project": average_ROI_project,
-                "top_project": top_project,
-            }
+            analysis_result = ProjectResult(
+                total_projects=len(self.po_project_dataframe),
+                status_project=ColumnTable.from_frame(status_project),
+                average_ROI_project=float(average_ROI_project),
+                top_project=top_project,
+                roi_distribution=roi_distribution,
+                department_project_metrics=ColumnTable.from_frame(department_project_metrics, keep_index=True)
+            )
 
             self._generate_statistics_report(analysis_result)
             self.logger.info(LogMessages.ANALYSIS_COMPLETE.format("Project"))
@@ -70,7 +87,11 @@ class ProjectAnalayzer(BaseAnalyzer):
         """
         self.logger.info(LogMessages.PROJECT_STATUS_ANALYSIS)
 
-        stat_projects = self.po_project_dataframe['status'].value_counts().reset_index()
+        if self.sqlite_store is not None:
+            status_counts = self.sqlite_store.project_status_counts(DepartmentSettings.PO_DEPARTMENT_ID)
+        else:
+            status_counts = self.po_project_dataframe['status'].value_counts()
+        stat_projects = status_counts.reset_index()
         stat_projects.columns = ['Status', 'Count']
         stat_projects = stat_projects[stat_projects['Status'] != 'planning']
         return stat_projects
@@ -84,6 +105,9 @@ class ProjectAnalayzer(BaseAnalyzer):
         """
         self.logger.info(LogMessages.PROJECT_ROI_CALCULATION)
 
+        if self.sqlite_store is not None:
+            return self.sqlite_store.average_roi(DepartmentSettings.PO_DEPARTMENT_ID)
+
         return self.po_project_dataframe['roi_percentage'].mean()
     
 
@@ -92,14 +116,77 @@ class ProjectAnalayzer(BaseAnalyzer):
         @brief Identify the project with the highest absolute profit
         Returns key details of the top-profit project.
 
-        @return Series with fields: project_id, name, description, profit, status
+        @return Dictionary with fields: project_id, name, description, profit, status
+                (None when the PO department has no projects)
         """
         self.logger.info(LogMessages.TOP_PROFIT_PROJECT_IDENTIFICATION)
 
+        if self.po_project_dataframe.empty:
+            return None
+
         idx_max = self.po_project_dataframe['profit'].idxmax()
 
         top_profit_project = self.po_project_dataframe.loc[idx_max, ['project_id', 'name', 'description', 'profit', 'status']]
-        return top_profit_project
+        return top_profit_project.to_dict()
+
+    def _department_project_metrics(self):
+        """
+        @brief Aggregate allocation-weighted project metrics for all departments
+        Joins the project-department link table with project financials and
+        groups once by department. A department's share of a project is its
+        budget_allocation over the project's total allocation.
+
+        @return DataFrame indexed by department_id with columns: project_count,
+                active_projects, completed_projects, total_allocation,
+                weighted_roi, attributed_profit
+        """
+        self.logger.info(LogMessages.DEPARTMENT_PROJECT_METRICS)
+
+        links = self.project_department_dataframe.reset_index()
+        links = links.merge(
+            self.project_dataframe[['project_id', 'status', 'profit', 'roi_percentage']],
+            on='project_id',
+            how='inner'
+        )
+
+        by_project = links.groupby('project_id')['budget_allocation']
+        project_allocation = by_project.transform('sum').to_numpy(dtype=float)
+        project_size = by_project.transform('size').to_numpy(dtype=float)
+        allocation = links['budget_allocation'].to_numpy(dtype=float)
+
+        # Projects without allocations are split evenly between participants
+        share = np.divide(allocation, project_allocation,
+                          out=1.0 / np.maximum(project_size, 1.0),
+                          where=project_allocation > 0)
+
+        links = links.assign(
+            is_active=links['status'].eq('active'),
+            is_completed=links['status'].eq('completed'),
+            weighted_roi_sum=allocation * links['roi_percentage'].to_numpy(dtype=float),
+            attributed_profit=share * links['profit'].to_numpy(dtype=float)
+        )
+
+        metrics = links.groupby('department_id').agg(
+            project_count=('project_id', 'size'),
+            active_projects=('is_active', 'sum'),
+            completed_projects=('is_completed', 'sum'),
+            total_allocation=('budget_allocation', 'sum'),
+            weighted_roi_sum=('weighted_roi_sum', 'sum'),
+            attributed_profit=('attributed_profit', 'sum')
+        )
+        metrics['weighted_roi'] = metrics['weighted_roi_sum'] / metrics['total_allocation'].where(metrics['total_allocation'] > 0)
+        return metrics.drop(columns='weighted_roi_sum')
+
+    def _build_roi_distribution(self):
+        """
+        @brief Build mergeable ROI distribution summary
+        Histogram and quantile sketch replace the raw ROI column in the report
+
+        @return DistributionSummary for roi_percentage
+        """
+        self.logger.info(LogMessages.DISTRIBUTION_SUMMARY_BUILDING.format("projects"))
+
+        return build_distribution_summaries(self.po_project_dataframe, ["roi_percentage"])["roi_percentage"]
 
 
     def _generate_statistics_report(self, analysis_results):
@@ -107,21 +194,31 @@ class ProjectAnalayzer(BaseAnalyzer):
         @brief Generate formatted project analysis report
         Outputs key project metrics to console.
 
-        @param analysis_results: Dictionary containing project analysis results
+        @param analysis_results: ProjectResult
         """
         print("=" * 70)
         print(ReportMessages.PROJECT_HEADER)
         print("=" * 70)
 
-        print(f"\n{ReportMessages.TOTAL_PROJECTS.format(analysis_results['total_projects'])}")
+        print(f"\n{ReportMessages.TOTAL_PROJECTS.format(analysis_results.total_projects)}")
+
+        print(f"\n{ReportMessages.AVERAGE_ROI.format(analysis_results.average_ROI_project)}%")
+
+        department_metrics = analysis_results.department_project_metrics.to_frame()
+        if DepartmentSettings.PO_DEPARTMENT_ID in department_metrics.index:
+            po_metrics = department_metrics.loc[DepartmentSettings.PO_DEPARTMENT_ID]
+            print(ReportMessages.WEIGHTED_ROI.format(po_metrics['weighted_roi']))
+            print(f"{ReportMessages.ATTRIBUTED_PROFIT.format(po_metrics['attributed_profit'])} RUB")
 
-        print(f"\n{ReportMessages.AVERAGE_ROI.format(analysis_results['average_ROI_project'])}%")
+        print(f"\n{ReportMessages.PERCENTILES_HEADER.format('roi_percentage')}")
+        for fraction, value in analysis_results.roi_distribution.percentiles().items():
+            print(f"  p{fraction * 100:.0f}\t:\t{value:.2f}")
 
         print(f"\n{ReportMessages.PROJECT_STATUS_DISTRIBUTION}")
-        print(analysis_results['status_project'].to_string(index=False))
+        print(analysis_results.status_project.to_frame().to_string(index=False))
 
         print(f"\n{ReportMessages.TOP_PROFIT_PROJECT}")
-        top_proj = analysis_results['top_project']
+        top_proj = analysis_results.top_project
         if top_proj is not None:
             print(f"  ID: {top_proj['project_id']}")
             print(f"  Name: {top_proj['name']}")
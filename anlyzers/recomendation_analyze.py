@@ -5,9 +5,17 @@ identifies training needs, and estimates financial impact of
 productivity improvements.
 """
 
+import numpy as np
 import pandas as pd
+from anlyzers.analysis_results import RecommendationResult, ProductivityImpact
 from anlyzers.base_analyzer import BaseAnalyzer
+from anlyzers.basic_statistics import BasicStaticAnalayzer
 from config.messages import LogMessages, ReportMessages
+from config.settings import DepartmentSettings, ScenarioSettings, RecommendationSettings
+from utils.columnar import ColumnTable
+from utils.rule_engine import RuleSet
+from utils.scenario_simulation import ProductivityScenarioEngine
+from utils.skill_similarity import skill_lists_to_csr, normalize_skill
 
 
 class RecommendationsAnalayzer(BaseAnalyzer):
@@ -15,15 +23,26 @@ class RecommendationsAnalayzer(BaseAnalyzer):
     @brief Analyzer for strategic recommendations
     Leverages employee, finance, and skills data to propose
     efficiency improvements, training programs, and ROI estimates.
+    Recommendation rules (RecommendationSettings.RULES) are evaluated for
+    all departments at once over a per-department metrics table.
     """
 
-    def __init__(self, json_file_path):
+    # Metric columns the recommendation rules can reference
+    METRIC_COLUMNS = [
+        "headcount", "average_performance", "high_performer_ratio", "junior_ratio",
+        "senior_ratio", "python_docker_experts", "critical_deficits", "critical_deficit_skills"
+    ]
+
+    def __init__(self, json_file_path, run_context=None):
         """
         @brief Initialize Recommendations Analyzer
+
+        @param run_context: RunContext the analyzer logs to (default layout if None)
         """
-        super().__init__(json_file_path, "Recommendations")
+        super().__init__(json_file_path, "Recommendations", run_context=run_context)
+        self.rule_set = RuleSet(RecommendationSettings.RULES, self.METRIC_COLUMNS)
 
-    def execute_analysis(self, employee_data=None, finance_data=None, skills_data=None):
+    def execute_analysis(self, employee_data=None, finance_data=None, skills_data=None, project_data=None):
         """
         @brief Execute recommendations analysis using external data
         Requires results from other analyzers for comprehensive insights.
@@ -31,22 +50,30 @@ class RecommendationsAnalayzer(BaseAnalyzer):
         @param employee_data: Result from BasicStaticAnalyzer
         @param finance_data: Result from FinanceAnalyzer
         @param skills_data: Result from SkillsAnalyzer
-        @return Dictionary with recommendations
+        @param project_data: Result from ProjectAnalyzer (baseline profit of the simulation)
+        @return RecommendationResult
         """
         self.logger.info(LogMessages.ANALYSIS_START.format("Recommendations"))
 
         try:
-            efficiency_measures = self._generate_efficiency_recommendations(employee_data)
+            department_metrics = self._build_department_metrics(skills_data)
+
+            self.logger.info(LogMessages.RULES_EVALUATION.format(len(self.rule_set.rules), len(department_metrics)))
+            fired = self.rule_set.evaluate(department_metrics)
+
+            efficiency_measures = self._generate_efficiency_recommendations(employee_data, fired, department_metrics)
 
-            training_needs = self._identify_training_needs(skills_data)
+            training_needs = self._identify_training_needs(skills_data, fired, department_metrics)
 
-            productivity_impact = self._calculate_productivity_impact(finance_data, employee_data)
+            productivity_impact = self._calculate_productivity_impact(finance_data, employee_data, project_data)
 
-            analysis_result = {
-                "efficiency_measures": efficiency_measures,
-                "training_needs": training_needs,
-                "productivity_impact": productivity_impact
-            }
+            analysis_result = RecommendationResult(
+                efficiency_measures=efficiency_measures,
+                training_needs=training_needs,
+                productivity_impact=productivity_impact,
+                department_metrics=ColumnTable.from_frame(department_metrics, keep_index=True),
+                department_recommendations=ColumnTable.from_frame(self.rule_set.fired_rules(fired))
+            )
 
             self._generate_statistics_report(analysis_result)
             self.logger.info(LogMessages.ANALYSIS_COMPLETE.format("Recommendations"))
@@ -58,84 +85,152 @@ class RecommendationsAnalayzer(BaseAnalyzer):
             self.logger.error(error_message)
             raise e
 
-    def _generate_efficiency_recommendations(self, employee_data):
+    def _company_employees(self):
         """
-        @brief Generate efficiency improvement measures
-        Based on performance distribution and role balance.
+        @brief department_id, position, performance_score and skills of all employees
         """
-        self.logger.info(LogMessages.EFFICIENCY_RECOMMENDATIONS)
+        columns = ['department_id', 'position', 'performance_score', 'skills']
+        if self.binary_snapshot is not None:
+            return self.binary_snapshot.employee_dataframe()[columns]
+        if self.sqlite_store is not None:
+            return self.sqlite_store.employee_dataframe(columns=columns)
 
-        measures = []
+        return self.company_data.frames["employees"][columns]
 
-        if employee_data:
-            perf_avg = employee_data['average_parameters']['avarage_perfomance']
-            high_performers_ratio = len(employee_data['high_performers']) / employee_data['total_employee_count']
+    def _build_department_metrics(self, skills_data):
+        """
+        @brief Metrics table the recommendation rules run on, one row per department
+        Same definitions as the PO results: high performers have
+        performance_score > 90, junior/senior ratios use the position categories.
 
-            # average < 85 %
-            if perf_avg < 85:
-                measures.append("Повысить среднюю производительность через менторство и оптимизацию процессов")
+        @param skills_data: Result from SkillsAnalyzer (critical skill deficits)
+        @return DataFrame indexed by department_id with METRIC_COLUMNS
+        """
+        self.logger.info(LogMessages.DEPARTMENT_METRICS_BUILDING)
+
+        employees = self._company_employees()
+        positions = employees['position'].unique()
+        category_by_position = dict(zip(positions, map(BasicStaticAnalayzer.map_to_category, positions)))
+        category = employees['position'].map(category_by_position)
+
+        offsets, codes, vocabulary = skill_lists_to_csr(employees['skills'].tolist())
+        code_by_skill = {normalize_skill(skill): code for code, skill in enumerate(vocabulary)}
+        entry_employee = np.repeat(np.arange(len(employees)), np.diff(offsets))
+
+        def has_skill(name):
+            code = code_by_skill.get(name, -1)
+            return np.bincount(entry_employee[codes == code], minlength=len(employees)) > 0
+
+        metrics = employees.assign(
+            is_high_performer=employees['performance_score'] > 90,
+            is_junior=category == 'junior',
+            is_senior=category == 'senior',
+            is_python_docker=has_skill('python') & has_skill('docker')
+        ).groupby('department_id').agg(
+            headcount=('position', 'size'),
+            average_performance=('performance_score', 'mean'),
+            high_performer_ratio=('is_high_performer', 'mean'),
+            junior_ratio=('is_junior', 'mean'),
+            senior_ratio=('is_senior', 'mean'),
+            python_docker_experts=('is_python_docker', 'sum')
+        )
+
+        metrics['critical_deficits'] = 0
+        metrics['critical_deficit_skills'] = ""
+        if skills_data:
+            deficits = skills_data.critical_skill_deficits.to_frame().groupby('department_id')['skill']
+            metrics['critical_deficits'] = deficits.size().reindex(metrics.index, fill_value=0)
+            metrics['critical_deficit_skills'] = deficits.agg(', '.join).reindex(metrics.index, fill_value="")
 
-            # Smoll count high performance
-            if high_performers_ratio < 0.2:
-                measures.append("Разработать программу по выявлению и удержанию талантов")
+        return metrics[self.METRIC_COLUMNS]
 
-            # Disbalance level work
-            pos_dist = employee_data['distribution_position']
-            junior_ratio = pos_dist[pos_dist['Category'] == 'junior']['Count'].sum() / employee_data['total_employee_count']
-            senior_ratio = pos_dist[pos_dist['Category'] == 'senior']['Count'].sum() / employee_data['total_employee_count']
+    def _generate_efficiency_recommendations(self, employee_data, fired, department_metrics):
+        """
+        @brief Generate efficiency improvement measures
+        Based on performance distribution and role balance (efficiency rules).
+        """
+        self.logger.info(LogMessages.EFFICIENCY_RECOMMENDATIONS)
 
-            if junior_ratio > 0.4 and senior_ratio < 0.2:
-                measures.append("Усилить наставничество: назначить менторов для стажёров и junior-специалистов")
+        measures = []
+        if employee_data:
+            measures = self.rule_set.messages(fired, department_metrics, DepartmentSettings.PO_DEPARTMENT_ID, "efficiency")
 
         if not measures:
-            measures.append("Текущая структура отдела сбалансирована. Рекомендуется поддерживать достигнутый уровень.")
+            measures.append(RecommendationSettings.FALLBACK_MESSAGES["efficiency"])
 
         return measures
 
-    def _identify_training_needs(self, skills_data):
+    def _identify_training_needs(self, skills_data, fired, department_metrics):
         """
         @brief Identify training needs based on rare/missing critical skills
+        Critical skills and the required headcount come from SkillSettings;
+        deficits are read from the skills coverage matrix (training rules).
         """
         self.logger.info(LogMessages.TRAINING_NEEDS_IDENTIFICATION)
 
         needs = []
-
         if skills_data:
-            rare_skills = skills_data['skill_statistics']['rare_skills']
-            critical_skills = {'Docker', 'Kubernetes', 'Python', 'CI/CD', 'Cloud (AWS/Azure/GCP)'}
-
-            missing_critical = [skill for skill in rare_skills if skill in critical_skills]
-            if missing_critical:
-                needs.append(f"Организовать обучение по дефицитным критическим навыкам: {', '.join(missing_critical)}")
-
-            if len(skills_data['python_docker_experts']) == 0:
-                needs.append("Провести кросс-обучение: Python-разработчикам — Docker, DevOps — Python")
+            needs = self.rule_set.messages(fired, department_metrics, DepartmentSettings.PO_DEPARTMENT_ID, "training")
 
         if not needs:
-            needs.append("Потребность в массовом обучении не выявлена. Рекомендуется индивидуальное развитие.")
+            needs.append(RecommendationSettings.FALLBACK_MESSAGES["training"])
 
         return needs
 
-    def _calculate_productivity_impact(self, finance_data, employee_data):
+    def _baseline_profit(self, project_data):
+        """
+        @brief Annual PO profit the scenarios start from
+        Allocation-attributed profit from project results when available,
+        otherwise the profit of all PO projects.
+        """
+        if project_data is not None:
+            metrics = project_data.department_project_metrics.to_frame()
+            if DepartmentSettings.PO_DEPARTMENT_ID in metrics.index:
+                return float(metrics.loc[DepartmentSettings.PO_DEPARTMENT_ID, 'attributed_profit'])
+        return float(self.po_project_dataframe['profit'].sum())
+
+    def _calculate_productivity_impact(self, finance_data, employee_data, project_data=None):
         """
-        @brief Calculate financial impact of 10% productivity increase
-        Assumption: higher productivity → higher project profit margin
+        @brief Simulate financial impact of a productivity increase
+        Monte Carlo over uplift, attrition, salary indexation and hiring
+        (ScenarioSettings); reports medians with confidence intervals and
+        an optional sweep over the mean uplift.
         """
         self.logger.info(LogMessages.PRODUCTIVITY_IMPACT_CALCULATION)
 
         if not finance_data or not employee_data:
-            return {"additional_profit": 0, "roi_improvement": 0.0}
-
-
-        total_fot = finance_data['distribution_position']['total_fot']
-
-        fot_savings = total_fot * 0.09
-
-        return {
-            "fot_savings_potential": round(fot_savings, 0),
-            "productivity_increase": 10,
-            "assumption": "10% рост производительности позволяет снизить фонд оплаты труда на 9% при сохранении объёма работ"
-        }
+            return ProductivityImpact()
+
+        assumptions = ScenarioSettings.ASSUMPTIONS
+        self.logger.info(LogMessages.SCENARIO_SIMULATION.format(ScenarioSettings.SCENARIO_COUNT,
+                                                                len(self.po_employee_dataframe)))
+        engine = ProductivityScenarioEngine(
+            self.po_employee_dataframe['salary'].to_numpy(),
+            self.po_employee_dataframe['position'].to_numpy(),
+            baseline_profit=self._baseline_profit(project_data),
+            seed=ScenarioSettings.SEED
+        )
+        scenarios = engine.simulate(ScenarioSettings.SCENARIO_COUNT, **assumptions)
+        summary = engine.summarize(scenarios, ScenarioSettings.CONFIDENCE)
+
+        uplift_sweep = None
+        if ScenarioSettings.UPLIFT_SWEEP:
+            other_assumptions = {name: value for name, value in assumptions.items() if name != "uplift_mean"}
+            uplift_sweep = engine.sweep("uplift_mean", ScenarioSettings.UPLIFT_SWEEP, ScenarioSettings.SCENARIO_COUNT,
+                                        ScenarioSettings.CONFIDENCE, **other_assumptions)
+
+        savings = summary.loc['fot_savings']
+        return ProductivityImpact(
+            fot_savings_potential=round(float(savings['median']), 0),
+            fot_savings_interval=(round(float(savings['ci_low']), 0), round(float(savings['ci_high']), 0)),
+            productivity_increase=round(assumptions['uplift_mean'] * 100),
+            scenario_count=ScenarioSettings.SCENARIO_COUNT,
+            confidence=ScenarioSettings.CONFIDENCE,
+            scenario_summary=ColumnTable.from_frame(summary, keep_index=True),
+            uplift_sweep=None if uplift_sweep is None else ColumnTable.from_frame(uplift_sweep, keep_index=True),
+            assumption=("рост производительности позволяет сохранить объём работ при меньшем ФОТ; "
+                        "учтены текучесть, индексация зарплат и найм (медиана по сценариям)")
+        )
 
     def _generate_statistics_report(self, analysis_results):
         """
@@ -147,20 +242,34 @@ class RecommendationsAnalayzer(BaseAnalyzer):
 
         # Efficiency Measures
         print(f"\n{ReportMessages.EFFICIENCY_MEASURES_HEADER}")
-        for i, measure in enumerate(analysis_results['efficiency_measures'], 1):
+        for i, measure in enumerate(analysis_results.efficiency_measures, 1):
             print(f"  {i}. {measure}")
 
         # Training Needs
         print(f"\n{ReportMessages.TRAINING_NEEDS_HEADER}")
-        for i, need in enumerate(analysis_results['training_needs'], 1):
+        for i, need in enumerate(analysis_results.training_needs, 1):
             print(f"  {i}. {need}")
 
+        department_recommendations = analysis_results.department_recommendations.to_frame()
+        print(f"\n{ReportMessages.RULES_FIRED_HEADER.format(len(analysis_results.department_metrics))}")
+        rule_ids = [rule["id"] for rule in self.rule_set.rules]
+        for rule_id, departments in department_recommendations['rule_id'].value_counts().reindex(rule_ids, fill_value=0).items():
+            print(f"  • {rule_id}: {departments}")
+
         # Productivity Impact
-        impact = analysis_results['productivity_impact']
+        impact = analysis_results.productivity_impact
         print(f"\n{ReportMessages.PRODUCTIVITY_IMPACT_HEADER}")
-        if 'fot_savings_potential' in impact:
-            print(f"  • Потенциальная экономия ФОТ при росте производительности на {impact['productivity_increase']}%: "
-                f"{impact['fot_savings_potential']:,.0f} RUB")
-            print(f"  • Допущение: {impact['assumption']}")
+        if impact.available:
+            print(f"  • Потенциальная экономия ФОТ при росте производительности на {impact.productivity_increase}%: "
+                f"{impact.fot_savings_potential:,.0f} RUB")
+            low, high = impact.fot_savings_interval
+            print(f"  • {ReportMessages.FOT_SAVINGS_RANGE.format(impact.confidence, low, high)}")
+            print(f"  • Допущение: {impact.assumption}")
+
+            print(f"\n{ReportMessages.SCENARIO_SUMMARY_HEADER.format(impact.scenario_count, impact.confidence)}")
+            print(impact.scenario_summary.to_frame().to_string(float_format=lambda value: f"{value:,.0f}"))
+            if impact.uplift_sweep is not None:
+                print(f"\n{ReportMessages.SCENARIO_SWEEP_HEADER}")
+                print(impact.uplift_sweep.to_frame().to_string(float_format=lambda value: f"{value:,.0f}"))
         else:
             print("  • Недостаточно данных для расчёта эффекта.")
\ No newline at end of file
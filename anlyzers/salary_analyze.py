@@ -0,0 +1,215 @@
+"""
+@brief Company-wide salary percentile analysis module
+Ranks every employee's salary within its position category and
+department and flags outliers by robust z-score within the category.
+Ranking, medians and deviations are grouped vectorized operations over
+the whole employee set, so the module scales to millions of rows.
+"""
+
+import numpy as np
+import pandas as pd
+from anlyzers.analysis_results import SalaryPercentileResult
+from anlyzers.base_analyzer import BaseAnalyzer
+from anlyzers.basic_statistics import BasicStaticAnalayzer
+from config.messages import LogMessages, ReportMessages
+from config.settings import SalarySettings
+from utils.columnar import ColumnTable
+
+
+class SalaryPercentileAnalayzer(BaseAnalyzer):
+    """
+    @brief Analyzer for salary percentiles and outliers of all employees
+    Position categories come from BasicStaticAnalayzer.map_to_category.
+    """
+
+    EMPLOYEE_COLUMNS = ['employee_id', 'full_name', 'department_id', 'position', 'salary']
+
+    PERCENTILE_COLUMNS = ['employee_id', 'department_id', 'category', 'salary', 'salary_percentile', 'robust_z',
+                          'is_outlier']
+
+    OUTLIER_COLUMNS = ['employee_id', 'full_name', 'department_id', 'position', 'category', 'salary',
+                       'salary_percentile', 'robust_z']
+
+    def __init__(self, json_file_path, run_context=None):
+        """
+        @brief Initialize Salary Percentile Analyzer
+
+        @param run_context: RunContext the analyzer logs to (default layout if None)
+        """
+        super().__init__(json_file_path, "Salary Percentiles", run_context=run_context)
+
+    def execute_analysis(self):
+        """
+        @brief Execute company-wide salary percentile analysis
+        Percentiles are the share of the category/department group earning
+        at most the employee's salary; outliers exceed
+        SalarySettings.OUTLIER_Z_THRESHOLD in absolute robust z-score.
+
+        @return SalaryPercentileResult
+        """
+        self.logger.info(LogMessages.ANALYSIS_START.format("Salary Percentiles"))
+
+        try:
+            employees = self._company_employees()
+            category_codes, categories = self._position_categories(employees['position'])
+            salary = pd.Series(employees['salary'].to_numpy(dtype=float))
+            category = pd.Categorical.from_codes(category_codes, categories=categories)
+
+            # Percentile within position category and department
+            percentile, group_count = self._salary_percentiles(salary, category_codes, employees['department_id'])
+
+            # Robust z-score within position category
+            robust_z, median, mad = self._robust_z_scores(salary, category_codes)
+            is_outlier = np.abs(robust_z) > SalarySettings.OUTLIER_Z_THRESHOLD
+
+            percentiles = pd.DataFrame({
+                'employee_id': employees['employee_id'].to_numpy(),
+                'department_id': employees['department_id'].to_numpy(),
+                'category': category,
+                'salary': salary.to_numpy(),
+                'salary_percentile': percentile,
+                'robust_z': robust_z,
+                'is_outlier': is_outlier
+            })
+
+            analysis_result = SalaryPercentileResult(
+                total_employees=len(employees),
+                group_count=group_count,
+                employee_percentiles=ColumnTable.from_frame(percentiles, self.PERCENTILE_COLUMNS),
+                category_summary=ColumnTable.from_frame(
+                    self._category_summary(percentiles, median, mad), keep_index=True),
+                outliers=ColumnTable.from_frame(self._outlier_table(employees, percentiles), self.OUTLIER_COLUMNS),
+                outlier_threshold=SalarySettings.OUTLIER_Z_THRESHOLD
+            )
+
+            self._generate_statistics_report(analysis_result)
+            self.logger.info(LogMessages.ANALYSIS_COMPLETE.format("Salary Percentiles"))
+
+            return analysis_result
+
+        except Exception as e:
+            error_message = LogMessages.ANALYSIS_ERROR.format("Salary Percentiles", str(e))
+            self.logger.error(error_message)
+            raise e
+
+    def _company_employees(self):
+        """
+        @brief EMPLOYEE_COLUMNS of all employees
+        """
+        if self.binary_snapshot is not None:
+            return self.binary_snapshot.employee_dataframe()[self.EMPLOYEE_COLUMNS]
+        if self.sqlite_store is not None:
+            return self.sqlite_store.employee_dataframe(columns=self.EMPLOYEE_COLUMNS)
+
+        return self.company_data.frames["employees"][self.EMPLOYEE_COLUMNS]
+
+    @staticmethod
+    def _position_categories(positions):
+        """
+        @brief Category code of every employee
+        map_to_category runs once per distinct position title.
+
+        @param positions: Series of position titles
+        @return Tuple (category code per employee, category names)
+        """
+        position_codes, titles = pd.factorize(positions)
+        title_categories, categories = pd.factorize(
+            pd.Series([BasicStaticAnalayzer.map_to_category(title) for title in titles], dtype=object))
+        return title_categories[position_codes], categories
+
+    def _salary_percentiles(self, salary, category_codes, department_ids):
+        """
+        @brief Salary percentile of every employee within category and department
+
+        @param salary: Series of salaries (float)
+        @param category_codes: Category code per employee
+        @param department_ids: Series of department ids
+        @return Tuple (percentile array 0-100, number of groups)
+        """
+        self.logger.info(LogMessages.SALARY_PERCENTILE_RANKING.format(len(salary)))
+
+        groups = salary.groupby([category_codes, department_ids.to_numpy()], sort=False)
+        return groups.rank(method='max', pct=True).to_numpy() * 100, groups.ngroups
+
+    def _robust_z_scores(self, salary, category_codes):
+        """
+        @brief Modified z-score of every salary within its category
+        Salaries of a category without spread (MAD of 0) get 0.
+
+        @param salary: Series of salaries (float)
+        @param category_codes: Category code per employee
+        @return Tuple (robust z array, category median per employee, category MAD per employee)
+        """
+        self.logger.info(LogMessages.SALARY_OUTLIER_DETECTION)
+
+        median = salary.groupby(category_codes, sort=False).transform('median').to_numpy()
+        deviation = salary.to_numpy() - median
+        mad = pd.Series(np.abs(deviation)).groupby(category_codes, sort=False).transform('median').to_numpy()
+        robust_z = np.divide(SalarySettings.MAD_SCALE * deviation, mad, out=np.zeros_like(deviation), where=mad > 0)
+        return robust_z, median, mad
+
+    @staticmethod
+    def _category_summary(percentiles, median, mad):
+        """
+        @brief Salary statistics per category, highest median first
+
+        @return DataFrame indexed by category with columns: headcount,
+                median_salary, mad, p10, p90, outliers_above, outliers_below
+        """
+        table = percentiles.assign(
+            median=median,
+            mad=mad,
+            outlier_above=percentiles['is_outlier'] & (percentiles['robust_z'] > 0),
+            outlier_below=percentiles['is_outlier'] & (percentiles['robust_z'] < 0)
+        )
+        summary = table.groupby('category', observed=True).agg(
+            headcount=('salary', 'size'),
+            median_salary=('median', 'first'),
+            mad=('mad', 'first'),
+            p10=('salary', lambda values: values.quantile(0.1)),
+            p90=('salary', lambda values: values.quantile(0.9)),
+            outliers_above=('outlier_above', 'sum'),
+            outliers_below=('outlier_below', 'sum')
+        )
+        summary.index = summary.index.astype(object)
+        return summary.sort_values('median_salary', ascending=False, kind='stable')
+
+    @staticmethod
+    def _outlier_table(employees, percentiles):
+        """
+        @brief Outlier employees, largest absolute deviation first
+        """
+        outliers = percentiles['is_outlier'].to_numpy()
+        table = employees[outliers].reset_index(drop=True).assign(
+            category=percentiles['category'][outliers].to_numpy(),
+            salary_percentile=percentiles['salary_percentile'].to_numpy()[outliers],
+            robust_z=percentiles['robust_z'].to_numpy()[outliers]
+        )
+        order = np.argsort(-np.abs(table['robust_z'].to_numpy()), kind='stable')
+        return table.iloc[order].reset_index(drop=True)
+
+    def _generate_statistics_report(self, analysis_results):
+        """
+        @brief Generate formatted salary percentile report
+
+        @param analysis_results: SalaryPercentileResult
+        """
+        print("=" * 70)
+        print(ReportMessages.SALARY_HEADER)
+        print("=" * 70)
+
+        print(f"\n{ReportMessages.SALARY_EMPLOYEES_RANKED.format(analysis_results.total_employees, analysis_results.group_count)}")
+
+        category_summary = analysis_results.category_summary.to_frame()
+        print(f"\n{ReportMessages.SALARY_CATEGORY_SUMMARY}")
+        print(category_summary.to_string(float_format=lambda value: f"{value:,.0f}"))
+
+        print(f"\n{ReportMessages.SALARY_OUTLIERS_FOUND.format(analysis_results.outlier_threshold, len(analysis_results.outliers), category_summary['outliers_above'].sum(), category_summary['outliers_below'].sum())}")
+        if len(analysis_results.outliers):
+            top_outliers = analysis_results.outliers.to_frame().head(SalarySettings.REPORT_OUTLIER_COUNT)
+            print(f"\n{ReportMessages.SALARY_TOP_OUTLIERS.format(len(top_outliers))}")
+            print(top_outliers.to_string(index=False, formatters={
+                'salary': '{:,.0f}'.format,
+                'salary_percentile': '{:.1f}'.format,
+                'robust_z': '{:+.2f}'.format
+            }))
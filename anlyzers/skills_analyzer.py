@@ -4,24 +4,39 @@ Analyzes employee skill sets to identify technology coverage,
 most in-demand and rare skills, and employees with specific tech combinations.
 """
 
+import numpy as np
 import pandas as pd
+from anlyzers.analysis_results import SkillsResult
 from anlyzers.base_analyzer import BaseAnalyzer
-from config.messages import LogMessages, ReportMessages
+from config.messages import LogMessages, ReportMessages, ErrorMessages
+from config.settings import DepartmentSettings, SkillSettings, StaffingSettings, SimilaritySettings
+from utils.columnar import ColumnTable, SkillMatrix
+from utils.skill_coverage import SkillCoverageMatrix
+from utils.skill_similarity import SkillSimilarityIndex, skill_lists_to_csr, normalize_skill_codes
+from utils.staffing import SkillIndex, solve_staffing
 
 
 class SkillsAnalayzer(BaseAnalyzer):
     """
     @brief Analyzer for employee technical skills in PO department
-    Builds skill matrix, identifies key competencies, and finds specialists
-    with specific technology combinations (e.g., Python + Docker).
+    Builds skill matrix, identifies key competencies, finds specialists
+    with specific technology combinations (e.g., Python + Docker) and
+    staffs teams covering a required skill set and finds employees with
+    similar skill profiles.
     """
 
-    def __init__(self, json_file_path):
+    def __init__(self, json_file_path, run_context=None):
         """
         @brief Initialize Skills Analyzer
         Sets up data source and logger for skills analysis.
+
+        @param run_context: RunContext the analyzer logs to (default layout if None)
         """
-        super().__init__(json_file_path, "Skills")
+        self.similarity_index = None
+        self.company_employee_ids = None
+        self.company_department_ids = None
+        self.company_skills = None
+        super().__init__(json_file_path, "Skills", run_context=run_context)
 
     def execute_analysis(self):
         """
@@ -29,23 +44,30 @@ class SkillsAnalayzer(BaseAnalyzer):
         Generates skill matrix, identifies top/rare skills,
         and finds employees with Python + Docker.
 
-        @return Dictionary containing skills analysis results
+        @return SkillsResult
         """
         self.logger.info(LogMessages.ANALYSIS_START.format("Skills"))
 
         try:
             skill_matrix = self._build_skill_matrix()
 
-            skill_stats = self._analyze_skill_demand()
+            skill_coverage = self._build_department_skill_coverage()
+
+            skill_stats = self._analyze_skill_demand(skill_coverage)
+
+            skill_deficits = skill_coverage.deficits(SkillSettings.CRITICAL_SKILLS,
+                                                     SkillSettings.CRITICAL_SKILL_MIN_EMPLOYEES)
 
             python_docker_experts = self._find_python_docker_experts()
 
-            analysis_result = {
-                "total_employees": len(self.po_employee_dataframe),
-                "skill_matrix": skill_matrix,
-                "skill_statistics": skill_stats,
-                "python_docker_experts": python_docker_experts
-            }
+            analysis_result = SkillsResult(
+                total_employees=len(self.po_employee_dataframe),
+                skill_matrix=skill_matrix,
+                skill_statistics=skill_stats,
+                department_skill_coverage=skill_coverage,
+                critical_skill_deficits=ColumnTable.from_frame(skill_deficits),
+                python_docker_experts=ColumnTable.from_frame(python_docker_experts)
+            )
 
             self._generate_statistics_report(analysis_result)
             self.logger.info(LogMessages.ANALYSIS_COMPLETE.format("Skills"))
@@ -59,56 +81,74 @@ class SkillsAnalayzer(BaseAnalyzer):
 
     def _build_skill_matrix(self):
         """
-        @brief Build a human-readable skill matrix: employees vs technologies
-        Uses '+' for skill present, '-' for absent.
-        
-        @return DataFrame with 'full_name' as first column, then skill columns with '+'/'-'
+        @brief Build the skill matrix: employees vs technologies
+        Stored sparsely; SkillMatrix.to_frame() renders '+' for skill
+        present, '-' for absent.
+
+        @return SkillMatrix with employees in department order and sorted skills
         """
         self.logger.info(LogMessages.SKILL_MATRIX_BUILDING)
 
-        if self.po_employee_dataframe.empty:
-            return pd.DataFrame()
-
-        all_skills = set()
-        for skills in self.po_employee_dataframe['skills']:
-            if isinstance(skills, list):
-                all_skills.update(skills)
-        
-        if not all_skills:
-            return pd.DataFrame()
+        return SkillMatrix.build(self.po_employee_dataframe['full_name'].to_numpy(),
+                                 self.po_employee_dataframe['skills'].tolist())
 
-        all_skills = sorted(all_skills)
+    def _load_company_skills(self):
+        """
+        @brief Interned skills of all company employees
+        Uses the skill CSR arrays of a binary snapshot directly when available.
+        Sets company_employee_ids, company_department_ids and company_skills
+        (offsets, codes, vocabulary) once per analyzer.
+        """
+        if self.company_skills is not None:
+            return
+
+        if self.binary_snapshot is not None:
+            employees = self.binary_snapshot.tables["employees"]
+            self.company_employee_ids = np.asarray(employees["employee_id"])
+            self.company_department_ids = np.asarray(employees["department_id"])
+            offsets, dictionary_codes, dictionary = self.binary_snapshot.employee_skill_csr()
+            codes, vocabulary = normalize_skill_codes(dictionary_codes, dictionary)
+        elif self.sqlite_store is not None:
+            employees = self.sqlite_store.employee_dataframe(columns=['employee_id', 'department_id'])
+            self.company_employee_ids = employees['employee_id'].to_numpy()
+            self.company_department_ids = employees['department_id'].to_numpy()
+            offsets, dictionary_codes, dictionary = self.sqlite_store.employee_skill_csr()
+            codes, vocabulary = normalize_skill_codes(dictionary_codes, dictionary)
+        else:
+            employees = self.company_data.frames["employees"]
+            self.company_employee_ids = employees['employee_id'].to_numpy()
+            self.company_department_ids = employees['department_id'].to_numpy()
+            offsets, codes, vocabulary = skill_lists_to_csr(employees['skills'].tolist())
 
-        matrix_rows = []
-        for _, emp in self.po_employee_dataframe.iterrows():
-            full_name = emp['full_name']
-            skill_set = set(emp['skills']) if isinstance(emp['skills'], list) else set()
-            row = {'ФИО': full_name}
-            for skill in all_skills:
-                row[skill] = '+' if skill in skill_set else '-'
-            matrix_rows.append(row)
+        self.company_skills = (offsets, codes, vocabulary)
 
-        return pd.DataFrame(matrix_rows)
+    def _build_department_skill_coverage(self):
+        """
+        @brief Build company-wide departments x skills coverage matrix
 
-    def _analyze_skill_demand(self):
+        @return SkillCoverageMatrix
+        """
+        self.logger.info(LogMessages.SKILL_COVERAGE_BUILDING)
+        self._load_company_skills()
+        offsets, codes, vocabulary = self.company_skills
+        coverage = SkillCoverageMatrix.build(self.company_department_ids, offsets, codes, vocabulary)
+        self.logger.info(LogMessages.SKILL_COVERAGE_BUILT.format(*coverage.shape, coverage.nnz))
+        return coverage
+
+    def _analyze_skill_demand(self, skill_coverage):
         """
         @brief Analyze skill popularity: most common and rarest skills
-        Counts how many employees have each skill.
+        Reads the PO row of the coverage matrix (employees per skill).
 
+        @param skill_coverage: SkillCoverageMatrix of the company
         @return Dictionary with 'most_in_demand' and 'rare_skills' lists
         """
         self.logger.info(LogMessages.SKILL_DEMAND_ANALYSIS)
 
-        if self.po_employee_dataframe.empty:
+        skill_counts = skill_coverage.department(DepartmentSettings.PO_DEPARTMENT_ID)
+        if skill_counts.empty:
             return {"most_in_demand": [], "rare_skills": []}
 
-        all_skills = []
-        for skills in self.po_employee_dataframe['skills']:
-            if isinstance(skills, list):
-                all_skills.extend(skills)
-
-        skill_counts = pd.Series(all_skills).value_counts()
-
         most_in_demand = skill_counts.head(5).index.tolist()
 
         rare_skills = skill_counts[skill_counts <= 1].index.tolist()
@@ -131,7 +171,12 @@ class SkillsAnalayzer(BaseAnalyzer):
         required = {'python', 'docker'}
         experts = []
 
-        for _, emp in self.po_employee_dataframe.iterrows():
+        employees = self.po_employee_dataframe
+        if self.sqlite_store is not None:
+            employees = self.sqlite_store.employees_with_skills(
+                DepartmentSettings.PO_DEPARTMENT_ID, required, ['employee_id', 'full_name', 'position', 'skills'])
+
+        for _, emp in employees.iterrows():
             skills = emp['skills']
             if not isinstance(skills, list):
                 continue
@@ -146,6 +191,153 @@ class SkillsAnalayzer(BaseAnalyzer):
 
         return pd.DataFrame(experts) if experts else pd.DataFrame()
 
+    def find_staffing_team(self, required_skills, max_salary_sum=None, min_performance=None, objective=None):
+        """
+        @brief Find a department team covering all required skills
+        Exact for small skill sets, bitset greedy cover otherwise.
+
+        @param required_skills: Skill names the team must cover (case-insensitive)
+        @param max_salary_sum: Optional limit for the salary sum of the team
+        @param min_performance: Optional minimal performance_score of members
+        @param objective: "size" (fewest members) or "cost" (lowest salary sum)
+        @return Dictionary with team DataFrame, salary sum, missing skills and search method
+        """
+        objective = objective or StaffingSettings.DEFAULT_OBJECTIVE
+        candidates = self.po_employee_dataframe
+        if min_performance is not None:
+            candidates = candidates[candidates['performance_score'] >= min_performance]
+        candidates = candidates.reset_index(drop=True)
+
+        skill_index = SkillIndex(required_skills)
+        self.logger.info(LogMessages.STAFFING_SEARCH.format(objective, ", ".join(skill_index.skills), len(candidates)))
+
+        solution = solve_staffing(
+            skill_index,
+            candidates['skills'].tolist(),
+            candidates['salary'].to_numpy(),
+            objective=objective,
+            max_cost=max_salary_sum,
+            exact_work_limit=StaffingSettings.EXACT_WORK_LIMIT
+        )
+        team = candidates.loc[solution['rows'], ['employee_id', 'full_name', 'position', 'salary',
+                                                 'performance_score', 'skills']]
+        self.logger.info(LogMessages.STAFFING_RESULT.format(solution['method'], len(team)))
+
+        return {
+            "required_skills": skill_index.skills,
+            "objective": objective,
+            "team": team,
+            "team_size": len(team),
+            "salary_sum": float(team['salary'].sum()),
+            "covered": len(team) > 0 or skill_index.size == 0,
+            "missing_skills": solution['missing_skills'],
+            "method": solution['method']
+        }
+
+    def print_staffing_team(self, staffing_result):
+        """
+        @brief Print team found by find_staffing_team
+        """
+        print("=" * 70)
+        print(ReportMessages.STAFFING_HEADER.format(", ".join(staffing_result['required_skills'])))
+        print("=" * 70)
+
+        if staffing_result['missing_skills']:
+            print(ReportMessages.STAFFING_MISSING_SKILLS.format(", ".join(staffing_result['missing_skills'])))
+        elif not staffing_result['covered']:
+            print(ReportMessages.STAFFING_NOT_FOUND)
+        else:
+            print(ReportMessages.STAFFING_TEAM.format(staffing_result['team_size'], staffing_result['salary_sum'],
+                                                      staffing_result['method'], staffing_result['objective']))
+            team = staffing_result['team'].assign(skills=staffing_result['team']['skills'].str.join(", "))
+            print(team[['full_name', 'position', 'salary', 'performance_score', 'skills']].to_string(index=False))
+
+    def _build_similarity_index(self):
+        """
+        @brief Build MinHash/LSH index over skills of all company employees
+        """
+        self._load_company_skills()
+        offsets, codes, vocabulary = self.company_skills
+
+        self.logger.info(LogMessages.SIMILARITY_INDEX_BUILDING.format(len(self.company_employee_ids)))
+        self.similarity_index = SkillSimilarityIndex(
+            offsets, codes, len(vocabulary),
+            num_perm=SimilaritySettings.NUM_PERM,
+            bands=SimilaritySettings.BANDS,
+            seed=SimilaritySettings.SEED
+        )
+        self.logger.info(LogMessages.SIMILARITY_INDEX_BUILT.format(self.similarity_index.distinct_sets))
+
+    def _company_employee_frame(self, rows):
+        """
+        @brief Employee id, name, department, position and skills of company rows
+        """
+        columns = ['employee_id', 'full_name', 'department_id', 'position', 'skills']
+        if self.binary_snapshot is not None:
+            return self.binary_snapshot.employee_dataframe(rows=rows)[columns]
+        if self.sqlite_store is not None:
+            return self.sqlite_store.employee_dataframe(rows=rows, columns=columns)
+
+        return self.company_data.frames["employees"].iloc[rows][columns].reset_index(drop=True)
+
+    def find_similar_employees(self, employee_id, top_k=None, scope="department", exact=False):
+        """
+        @brief Find employees whose skill sets are most similar (Jaccard) to an employee
+        The index is built on first use and reused by later queries.
+
+        @param employee_id: Employee to find replacements or peers for
+        @param top_k: Number of employees to return (settings default if None)
+        @param scope: "department" (same department as the employee) or "company"
+        @param exact: Scan every skill set instead of LSH candidates (validation)
+        @return Dictionary with the employee, similar employees DataFrame and search mode
+        """
+        if scope not in ("department", "company"):
+            raise ValueError(f"Unknown similarity scope: {scope}")
+        top_k = top_k or SimilaritySettings.TOP_K
+        if self.similarity_index is None:
+            self._build_similarity_index()
+
+        matches = np.flatnonzero(self.company_employee_ids == employee_id)
+        if not len(matches):
+            raise ValueError(ErrorMessages.EMPLOYEE_NOT_FOUND.format(employee_id))
+        employee_row = int(matches[0])
+
+        method = "exact" if exact else "lsh"
+        self.logger.info(LogMessages.SIMILARITY_SEARCH.format(employee_id, scope, method))
+        eligible = None
+        if scope == "department":
+            eligible = self.company_department_ids == self.company_department_ids[employee_row]
+        rows, scores = self.similarity_index.query(employee_row, top_k, eligible, exact=exact)
+
+        similar = self._company_employee_frame(rows)
+        similar.insert(4, 'similarity', np.round(scores, 4))
+        employee = self._company_employee_frame([employee_row]).iloc[0].to_dict()
+
+        return {
+            "employee": employee,
+            "scope": scope,
+            "method": method,
+            "similar": similar
+        }
+
+    def print_similar_employees(self, similarity_result):
+        """
+        @brief Print employees found by find_similar_employees
+        """
+        employee = similarity_result['employee']
+        print("=" * 70)
+        print(ReportMessages.SIMILAR_HEADER.format(employee['full_name'], employee['position']))
+        print("=" * 70)
+        print(ReportMessages.SIMILAR_SKILLS.format(", ".join(employee['skills'] or [])))
+        print(ReportMessages.SIMILAR_SEARCH_SCOPE.format(similarity_result['scope'], similarity_result['method']))
+
+        similar = similarity_result['similar']
+        if similar.empty:
+            print(ReportMessages.SIMILAR_NOT_FOUND)
+        else:
+            similar = similar.assign(skills=similar['skills'].str.join(", "))
+            print(similar.to_string(index=False))
+
     def _generate_statistics_report(self, analysis_results):
         """
         @brief Generate formatted skills analysis report with skill matrix
@@ -154,9 +346,9 @@ class SkillsAnalayzer(BaseAnalyzer):
         print(ReportMessages.SKILLS_HEADER)
         print("=" * 70)
 
-        print(f"\n{ReportMessages.TOTAL_EMPLOYEES_SKILLS.format(analysis_results['total_employees'])}")
+        print(f"\n{ReportMessages.TOTAL_EMPLOYEES_SKILLS.format(analysis_results.total_employees)}")
 
-        skill_matrix = analysis_results['skill_matrix']
+        skill_matrix = analysis_results.skill_matrix.to_frame()
         if not skill_matrix.empty:
             print(f"\n{ReportMessages.SKILL_MATRIX_HEADER}")
             print(skill_matrix.to_string(index=False))
@@ -164,18 +356,27 @@ class SkillsAnalayzer(BaseAnalyzer):
             print("\nNo skill data available.")
 
         print(f"\n{ReportMessages.MOST_IN_DEMAND_SKILLS}")
-        for i, skill in enumerate(analysis_results['skill_statistics']['most_in_demand'], 1):
+        for i, skill in enumerate(analysis_results.skill_statistics['most_in_demand'], 1):
             print(f"  {i}. {skill}")
 
         print(f"\n{ReportMessages.RARE_SKILLS}")
-        rare = analysis_results['skill_statistics']['rare_skills']
+        rare = analysis_results.skill_statistics['rare_skills']
         if rare:
             for skill in rare:
                 print(f"  • {skill}")
         else:
             print("  No rare skills found.")
 
-        experts = analysis_results['python_docker_experts']
+        deficits = analysis_results.critical_skill_deficits.to_frame()
+        coverage = analysis_results.department_skill_coverage
+        print(f"\n{ReportMessages.SKILL_COVERAGE_SUMMARY.format(*coverage.shape, coverage.nnz)}")
+        print(ReportMessages.CRITICAL_DEFICITS_HEADER.format(SkillSettings.CRITICAL_SKILL_MIN_EMPLOYEES,
+                                                             deficits['department_id'].nunique()))
+        po_deficits = deficits[deficits['department_id'] == DepartmentSettings.PO_DEPARTMENT_ID]
+        for _, deficit in po_deficits.iterrows():
+            print(f"  • {deficit['skill']}: {deficit['employees']} (-{deficit['shortfall']})")
+
+        experts = analysis_results.python_docker_experts.to_frame()
         print(f"\n{ReportMessages.PYTHON_DOCKER_EXPERTS_COUNT.format(len(experts))}")
         if not experts.empty:
             print(experts[['full_name', 'position']].to_string(index=False))
@@ -0,0 +1,310 @@
+"""
+@brief Snapshot trend analysis module
+Ingests a directory of daily company.json snapshots into one
+de-duplicated, time-indexed store and computes basic, finance, project
+and skills metrics of the PO department as time series.
+"""
+
+import glob
+import os
+import numpy as np
+import pandas as pd
+from anlyzers.base_analyzer import BaseAnalyzer
+from anlyzers.basic_statistics import BasicStaticAnalayzer
+from config.messages import LogMessages, ReportMessages
+from config.settings import DepartmentSettings, IngestionSettings
+from utils.data_loader import validate_company_data, write_run_quarantine
+from utils.json_decoder import JSONDecoder
+from utils.json_sections import read_top_level_sections
+from utils.payroll import vectorized_fot
+from utils.snapshot_store import SnapshotStore, interval_sum
+
+
+class SnapshotTrendAnalayzer(BaseAnalyzer):
+    """
+    @brief Analyzer for metric trends across historical snapshots
+    Every metric is evaluated for all snapshots at once from record
+    versions, instead of re-running the pipeline per file.
+    """
+
+    # Rows of the versions matrix processed at once when computing FOT
+    FOT_CHUNK_ROWS = 4096
+
+    def __init__(self, snapshot_directory):
+        """
+        @brief Initialize Snapshot Trend Analyzer
+
+        @param snapshot_directory: Directory with company.json snapshots (*.json)
+        """
+        self.snapshot_directory = snapshot_directory
+        self.snapshot_store = None
+        self.snapshot_dates = None
+        self.employee_versions = None
+        self.project_versions = None
+        self.department_versions = None
+        super().__init__(snapshot_directory, "Snapshot Trend")
+
+    def _discover_snapshots(self):
+        """
+        @brief List snapshot files ordered by metadata.generation_date
+        Only the metadata block of each file is decoded for ordering;
+        files sharing a generation date are ingested once.
+
+        @return List of file paths in time order
+        """
+        dated_paths = {}
+        for path in sorted(glob.glob(os.path.join(self.snapshot_directory, "*.json"))):
+            try:
+                metadata = read_top_level_sections(path, ["metadata"])["metadata"]
+                if not metadata or "generation_date" not in metadata:
+                    self.logger.warning(LogMessages.SNAPSHOT_SKIPPED.format(path, "no metadata.generation_date"))
+                    continue
+                generation_date = pd.Timestamp(metadata["generation_date"])
+                if pd.isna(generation_date):
+                    raise ValueError("generation_date is empty")
+            except (ValueError, TypeError):
+                self.logger.warning(LogMessages.SNAPSHOT_SKIPPED.format(path, "unparsable metadata.generation_date"))
+                continue
+            if generation_date in dated_paths:
+                self.logger.warning(LogMessages.SNAPSHOT_SKIPPED.format(path, "duplicate generation_date"))
+                continue
+            dated_paths[generation_date] = path
+
+        return [dated_paths[date] for date in sorted(dated_paths)]
+
+    def _load_data(self):
+        """
+        @brief Ingest every snapshot of the directory into the store
+        Each snapshot is validated like a single data file: invalid records
+        are quarantined (tagged with their snapshot) and a snapshot with too
+        many of them is skipped, so one bad export does not abort the series.
+        """
+        self.logger.info(LogMessages.DATA_LOAD_START)
+        try:
+            self.snapshot_store = SnapshotStore()
+            decoder = JSONDecoder(IngestionSettings.JSON_BACKEND)
+            quarantined = []
+            for path in self._discover_snapshots():
+                try:
+                    company_data = validate_company_data(decoder.load_file(path), self.logger)
+                except ValueError as validation_error:
+                    self.logger.warning(LogMessages.SNAPSHOT_SKIPPED.format(path, str(validation_error)))
+                    continue
+                self.snapshot_store.ingest(company_data)
+                quarantined += [dict(entry, snapshot=path) for entry in company_data.quarantined]
+
+            quarantine_path = write_run_quarantine(quarantined, self.run_context)
+            if quarantined:
+                self.logger.warning(LogMessages.RECORDS_QUARANTINED.format(len(quarantined), quarantine_path))
+
+            self.logger.info(LogMessages.SNAPSHOTS_INGESTED.format(
+                self.snapshot_store.snapshot_count,
+                self.snapshot_store.version_count("employees")
+            ))
+        except Exception as loading_error:
+            error_message = LogMessages.DATA_LOAD_ERROR.format(self.snapshot_directory, str(loading_error))
+            self.logger.error(error_message)
+            raise loading_error
+
+    def _setup_dataframes(self):
+        """
+        @brief Materialize record versions as DataFrames
+        """
+        self.logger.info(LogMessages.DATA_PROCESSING_START.format(self.analysis_name))
+
+        try:
+            self.snapshot_dates = self.snapshot_store.date_index()
+            self.employee_versions = self.snapshot_store.versions("employees")
+            self.employee_versions['hire_date'] = pd.to_datetime(self.employee_versions['hire_date'])
+            self.project_versions = self.snapshot_store.versions("projects")
+            self.department_versions = self.snapshot_store.versions("departments")
+            self.data_create = self.snapshot_dates[-1] if len(self.snapshot_dates) else None
+        except Exception as dataframe_error:
+            error_message = LogMessages.DATA_LOAD_ERROR.format("snapshot versions", str(dataframe_error))
+            self.logger.error(error_message)
+            raise dataframe_error
+
+    def execute_analysis(self):
+        """
+        @brief Execute trend analysis over all ingested snapshots
+
+        @return Dictionary with basic, finance, project and skills trends
+                (DataFrames indexed by generation_date)
+        """
+        self.logger.info(LogMessages.ANALYSIS_START.format("Snapshot Trend"))
+
+        try:
+            po_employees = self.employee_versions[
+                self.employee_versions['department_id'] == DepartmentSettings.PO_DEPARTMENT_ID
+            ]
+
+            basic_trend = self._basic_trend(po_employees)
+
+            finance_trend = self._finance_trend(po_employees)
+
+            project_trend = self._project_trend()
+
+            skills_trend = self._skills_trend(po_employees)
+
+            analysis_result = {
+                "snapshot_count": len(self.snapshot_dates),
+                "employee_versions": len(self.employee_versions),
+                "basic_trend": basic_trend,
+                "finance_trend": finance_trend,
+                "project_trend": project_trend,
+                "skills_trend": skills_trend
+            }
+
+            self._generate_statistics_report(analysis_result)
+            self.logger.info(LogMessages.ANALYSIS_COMPLETE.format("Snapshot Trend"))
+
+            return analysis_result
+
+        except Exception as e:
+            error_message = LogMessages.ANALYSIS_ERROR.format("Snapshot Trend", str(e))
+            self.logger.error(error_message)
+            raise e
+
+    def _basic_trend(self, versions):
+        """
+        @brief Headcount, averages, high performers and categories per snapshot
+
+        @param versions: Employee versions of the department
+        @return DataFrame indexed by generation_date
+        """
+        self.logger.info(LogMessages.TREND_METRICS.format("basic statistics"))
+
+        periods = len(self.snapshot_dates)
+        start, end = versions['start_index'], versions['end_index']
+
+        employee_count = interval_sum(start, end, 1.0, periods)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            trend = pd.DataFrame({
+                "employee_count": employee_count,
+                "average_salary": interval_sum(start, end, versions['salary'], periods) / employee_count,
+                "average_performance": interval_sum(start, end, versions['performance_score'], periods) / employee_count,
+                "average_experience": interval_sum(start, end, versions['experience_years'], periods) / employee_count,
+                "high_performers": interval_sum(start, end, versions['performance_score'] > 90, periods)
+            }, index=self.snapshot_dates)
+
+        positions = versions['position'].unique()
+        category_by_position = dict(zip(positions, map(BasicStaticAnalayzer.map_to_category, positions)))
+        codes, categories = pd.factorize(versions['position'].map(category_by_position), sort=True)
+        category_counts = interval_sum(start, end, 1.0, periods, groups=codes, group_count=len(categories))
+        for position, category in enumerate(categories):
+            trend[f"category_{category}"] = category_counts[:, position]
+
+        return trend
+
+    def _finance_trend(self, versions):
+        """
+        @brief Department FOT and budget utilization per snapshot
+        FOT depends on the snapshot date, so it is evaluated on a
+        versions x snapshots matrix (in row chunks) masked by validity.
+
+        @param versions: Employee versions of the department
+        @return DataFrame indexed by generation_date
+        """
+        self.logger.info(LogMessages.TREND_METRICS.format("finance"))
+
+        periods = len(self.snapshot_dates)
+        report_dates = self.snapshot_dates.to_numpy(dtype="datetime64[s]")
+        snapshot_positions = np.arange(periods)
+
+        salary = versions['salary'].to_numpy(dtype=np.float64)
+        hire_dates = versions['hire_date'].to_numpy(dtype="datetime64[s]")
+        start = versions['start_index'].to_numpy()
+        end = versions['end_index'].to_numpy()
+
+        total_fot = np.zeros(periods)
+        for offset in range(0, len(versions), self.FOT_CHUNK_ROWS):
+            rows = slice(offset, offset + self.FOT_CHUNK_ROWS)
+            fot = vectorized_fot(salary[rows, None], hire_dates[rows, None], report_dates[None, :])
+            valid = (snapshot_positions >= start[rows, None]) & (snapshot_positions <= end[rows, None])
+            total_fot += np.where(valid, fot, 0.0).sum(axis=0)
+
+        departments = self.department_versions[
+            self.department_versions['id'] == DepartmentSettings.PO_DEPARTMENT_ID
+        ]
+        budget = interval_sum(departments['start_index'], departments['end_index'], departments['budget'], periods)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            utilization = np.where(budget > 0, np.round(total_fot / budget * 100, 2), 0.0)
+
+        return pd.DataFrame({
+            "total_fot": total_fot,
+            "department_budget": budget,
+            "budget_utilization_percent": utilization
+        }, index=self.snapshot_dates)
+
+    def _project_trend(self):
+        """
+        @brief Project counts, statuses, ROI and profit per snapshot
+
+        @return DataFrame indexed by generation_date
+        """
+        self.logger.info(LogMessages.TREND_METRICS.format("projects"))
+
+        periods = len(self.snapshot_dates)
+        participants = self.project_versions['department_ids'].explode()
+        po_rows = participants.index[participants == DepartmentSettings.PO_DEPARTMENT_ID].unique()
+        versions = self.project_versions.loc[po_rows]
+        start, end = versions['start_index'], versions['end_index']
+
+        total_projects = interval_sum(start, end, 1.0, periods)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            average_roi = interval_sum(start, end, versions['roi_percentage'], periods) / total_projects
+
+        return pd.DataFrame({
+            "total_projects": total_projects,
+            "active_projects": interval_sum(start, end, versions['status'] == 'active', periods),
+            "completed_projects": interval_sum(start, end, versions['status'] == 'completed', periods),
+            "average_roi": average_roi,
+            "total_profit": interval_sum(start, end, versions['profit'], periods)
+        }, index=self.snapshot_dates)
+
+    def _skills_trend(self, versions):
+        """
+        @brief Number of employees with each skill per snapshot
+
+        @param versions: Employee versions of the department
+        @return DataFrame indexed by generation_date, one column per skill
+        """
+        self.logger.info(LogMessages.TREND_METRICS.format("skills"))
+
+        periods = len(self.snapshot_dates)
+        skill_rows = versions[['skills', 'start_index', 'end_index']].explode('skills').dropna(subset=['skills'])
+        codes, skills = pd.factorize(skill_rows['skills'], sort=True)
+        counts = interval_sum(skill_rows['start_index'], skill_rows['end_index'], 1.0, periods,
+                              groups=codes, group_count=len(skills))
+
+        return pd.DataFrame(counts, index=self.snapshot_dates, columns=skills)
+
+    def _generate_statistics_report(self, analysis_results):
+        """
+        @brief Generate formatted trend report
+        Shows the first and the last snapshot and the change between them.
+
+        @param analysis_results: Dictionary containing trend analysis results
+        """
+        print("=" * 70)
+        print(ReportMessages.TREND_HEADER)
+        print("=" * 70)
+
+        print(f"\n{ReportMessages.TREND_SNAPSHOTS.format(analysis_results['snapshot_count'], analysis_results['employee_versions'])}")
+        if analysis_results['snapshot_count'] == 0:
+            return
+
+        for title, key in [("Basic Statistics", "basic_trend"), ("Finance", "finance_trend"), ("Projects", "project_trend")]:
+            trend = analysis_results[key]
+            summary = trend.iloc[[0, -1]].T
+            summary.columns = ["first", "last"]
+            summary["change"] = summary["last"] - summary["first"]
+            print(f"\n{ReportMessages.TREND_SECTION.format(title)}")
+            print(summary.to_string(float_format=lambda value: f"{value:,.2f}"))
+
+        skills_trend = analysis_results['skills_trend']
+        if not skills_trend.empty:
+            change = (skills_trend.iloc[-1] - skills_trend.iloc[0]).sort_values(ascending=False)
+            print(f"\n{ReportMessages.TREND_SECTION.format('Skills (change in employees)')}")
+            print(change.to_string())
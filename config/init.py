@@ -4,9 +4,27 @@ Contains enums and message templates for system configuration
 """
 
 from .messages import LogMessages, ReportMessages, ErrorMessages
+from .settings import DepartmentSettings, SkillSettings, DistributionSettings, KPIFastPathSettings, ChartSettings, StaffingSettings, SimilaritySettings, ScenarioSettings, RecommendationSettings, WatchSettings, IngestionSettings, ChunkedExecutionSettings, RunSettings, WorkerSettings, SalarySettings, PayrollProjectionSettings, EquipmentSettings
 
 __all__ = [
     'LogMessages',
     'ReportMessages',
-    'ErrorMessages'
-]
\ No newline at end of file
+    'ErrorMessages',
+    'DepartmentSettings',
+    'SkillSettings',
+    'DistributionSettings',
+    'KPIFastPathSettings',
+    'ChartSettings',
+    'StaffingSettings',
+    'SimilaritySettings',
+    'ScenarioSettings',
+    'RecommendationSettings',
+    'WatchSettings',
+    'IngestionSettings',
+    'ChunkedExecutionSettings',
+    'RunSettings',
+    'WorkerSettings',
+    'SalarySettings',
+    'PayrollProjectionSettings',
+    'EquipmentSettings'
+]
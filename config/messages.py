@@ -14,6 +14,7 @@ class LogMessages:
     PROJECT_STATUS_ANALYSIS = "Analyzing project status distribution"
     PROJECT_ROI_CALCULATION = "Calculating average ROI for all projects"
     TOP_PROFIT_PROJECT_IDENTIFICATION = "Identifying project with highest profit"
+    DEPARTMENT_PROJECT_METRICS = "Aggregating allocation-weighted project metrics for all departments"
 
     # Orchestrator
     ORCHESTRATOR_INIT = "Orchestrator initialized with data file: {}"
@@ -23,7 +24,17 @@ class LogMessages:
     ANALYSIS_MODULE_START = "{} analysis module execution started"
     ANALYSIS_MODULE_SUCCESS = "{} analysis module executed successfully"
     GENERATING_SUMMARY_REPORT = "Generating comprehensive summary report"
-    SUMMARY_REPORT_SAVED = "Summary report saved to logs/analysis_summary.txt"
+    SUMMARY_REPORT_SAVED = "Summary report saved to {}"
+    ANALYSIS_REFRESH_START = "Refreshing analysis modules: {}"
+    SHARED_FRAMES_PUBLISHED = "Data frames shared with {} worker processes in block {} ({:.1f} MB)"
+
+    # Watch mode
+    WATCH_STARTED = "Watching data file {} (poll interval {}s)"
+    WATCH_SECTIONS_CHANGED = "Data sections changed: {}"
+    WATCH_NO_DEPENDENT_MODULES = "No analysis module depends on the changed sections"
+    WATCH_INVALID_DATA = "Changed data file {} is not valid JSON yet, waiting for next change: {}"
+    WATCH_REFRESHED = "Outputs refreshed for modules {} in {:.2f}s"
+    WATCH_STOPPED = "Watch mode stopped"
     
     # PDF Generator
     PDF_GENERATION_STARTED = "PDF report generation started"
@@ -44,19 +55,53 @@ class LogMessages:
     DATA_LOAD_START = "Starting data loading process from JSON file"
     DATA_LOAD_SUCCESS = "Data successfully loaded from file: {}"
     DATA_LOAD_ERROR = "Error loading data from file: {} - {}"
+    JSON_DECODED = "Decoded {} with {} in {:.3f}s"
+    JSON_BACKEND_FALLBACK = "{} rejected {}, decoded with stdlib json instead"
+    RECORDS_VALIDATED = "Validated {} {} records in {:.3f}s, {} invalid"
+    RECORDS_QUARANTINED = "{} invalid records skipped and written to {}"
+    CHUNK_SIZE_SELECTED = "Chunked {}: {} records per chunk (~{:.0f} bytes per record, budget {} MB)"
+    CHUNKS_PROCESSED = "Chunked {}: {} records in {} chunks"
+    CHUNKED_MODULES_SKIPPED = "Chunked mode: skipping modules that need the whole employee frame: {}"
+    SECTIONS_SKIPPED = "Sections not loaded ({}): {}"
+    BINARY_SNAPSHOT_MAPPED = "Binary snapshot memory-mapped: {}"
+    BINARY_SNAPSHOT_CREATED = "Binary snapshot written to {}"
+    SQLITE_STORE_OPENED = "SQLite store opened: {}"
+    SQLITE_STORE_CREATED = "SQLite store written to {} in {:.2f}s"
     START_CREATE_DATAFRAME = "Start create dataframe {}"
     SUCCESS_CREATE_DATAFRAME = "Success create dataframe {}"
     ERROR_CREATE_DATAFRAME = "Erro create dataframe {} - {}"
 
+    # KPI fast path messages
+    KPI_SECTIONS_READ = "Precomputed KPI sections read without loading employees"
+    KPI_SECTIONS_MISSING = "Precomputed KPI sections not found, falling back to full load: {}"
+    KPI_VERIFICATION_START = "Verifying precomputed KPI for departments: {}"
+    KPI_VERIFICATION_SKIPPED = "KPI verification disabled"
+    KPI_DRIFT_DETECTED = "KPI drift above {}% detected for {} metric(s)"
+
+    # Snapshot trend messages
+    SNAPSHOT_SKIPPED = "Snapshot skipped: {} ({})"
+    SNAPSHOTS_INGESTED = "Ingested {} snapshots into {} employee versions"
+    TREND_METRICS = "Computing {} trend over all snapshots"
+
     # Recommendations analysis messages
     EFFICIENCY_RECOMMENDATIONS = "Generating efficiency improvement recommendations"
     TRAINING_NEEDS_IDENTIFICATION = "Identifying employee training needs"
+    DEPARTMENT_METRICS_BUILDING = "Building recommendation metrics for all departments"
+    RULES_EVALUATION = "Evaluating {} recommendation rules over {} departments"
     PRODUCTIVITY_IMPACT_CALCULATION = "Calculating financial impact of productivity increase"
+    SCENARIO_SIMULATION = "Simulating {} productivity scenarios over {} employees"
 
     # Skills analysis messages
     SKILL_MATRIX_BUILDING = "Building employee skill matrix"
     SKILL_DEMAND_ANALYSIS = "Analyzing skill demand and rarity"
+    SKILL_COVERAGE_BUILDING = "Building company-wide department x skill coverage matrix"
+    SKILL_COVERAGE_BUILT = "Skill coverage matrix built: {} departments x {} skills, {} entries"
     PYTHON_DOCKER_EXPERTS_SEARCH = "Searching for Python + Docker experts"
+    STAFFING_SEARCH = "Searching {} team for skills {} among {} candidates"
+    STAFFING_RESULT = "Staffing search ({}) finished: {} members"
+    SIMILARITY_INDEX_BUILDING = "Building skill similarity index over {} employees"
+    SIMILARITY_INDEX_BUILT = "Skill similarity index built: {} distinct skill sets"
+    SIMILARITY_SEARCH = "Searching employees similar to {} ({}, {})"
 
     # Analysis process messages
     ANALYSIS_START = "Starting {} analysis"
@@ -72,12 +117,21 @@ class LogMessages:
     EFOT_CALCULATION_START = "Calculating Fund of Wages (FOT) for all employees"
     BUDGET_COMPARISON_START = "Comparing FOT with department budget"
     TOP_SALARIES_RETRIEVAL = "Retrieving top 5 highest salaries"
+    PAYROLL_PROJECTION = "Projecting payroll of {} employees ({} planned) over {} months from {}"
+    BUDGET_EXHAUSTION_CHECK = "Comparing cumulative payroll with budgets of {} departments"
+
+    # Equipment analysis messages
+    EQUIPMENT_UTILIZATION_ANALYSIS = "Aggregating utilization and maintenance costs of {} equipment items"
+    EQUIPMENT_DATE_CHECK = "Checking maintenance and warranty dates as of {}"
 
     # Employees analisis messages
     EMPLOYEE_PARAMETR_CALCULATION = "Calculating avarage parametrs"
+    SALARY_PERCENTILE_RANKING = "Ranking salaries of {} employees within category and department"
+    SALARY_OUTLIER_DETECTION = "Flagging salary outliers by robust z-score per category"
     EMPLOYEE_WORK_LEVEL = "Count Junior/Middle/Senior/TeamLead level"
     EMPLOYEE_PERFOMANCE = "Define employees with perfomance_score > 90"
     EMPLOYEE_CATEGORY = "Create column for category employee from position"
+    DISTRIBUTION_SUMMARY_BUILDING = "Building distribution summaries for {}"
 
 class ReportMessages:
     """
@@ -92,6 +146,8 @@ class ReportMessages:
     AVERAGE_ROI = "Average ROI across projects: {:.2f}"
     PROJECT_STATUS_DISTRIBUTION = "Project Status Distribution:"
     TOP_PROFIT_PROJECT = "Most Profitable Project:"
+    WEIGHTED_ROI = "Allocation-weighted ROI: {:.2f}"
+    ATTRIBUTED_PROFIT = "Profit attributed by budget allocation: {:,.0f}"
 
     # Skills report messages
     SKILLS_HEADER = "EMPLOYEE SKILLS ANALYSIS"
@@ -100,6 +156,33 @@ class ReportMessages:
     MOST_IN_DEMAND_SKILLS = "Most In-Demand Skills (Top 5):"
     RARE_SKILLS = "Rare Skills (≤1 employee):"
     PYTHON_DOCKER_EXPERTS_COUNT = "Employees with Python and Docker: {}"
+    SKILL_COVERAGE_SUMMARY = "Company skill coverage: {} departments x {} skills ({} non-zero entries)"
+    CRITICAL_DEFICITS_HEADER = "Critical skills with fewer than {} employees ({} departments affected), PO department:"
+    STAFFING_HEADER = "TEAM STAFFING FOR: {}"
+    STAFFING_TEAM = "Team of {} members, salary sum {:,.0f} ({} search, objective: {})"
+    STAFFING_MISSING_SKILLS = "No candidate has skills: {}"
+    STAFFING_NOT_FOUND = "No team satisfies the limits."
+    SIMILAR_HEADER = "EMPLOYEES SIMILAR TO: {} ({})"
+    SIMILAR_SKILLS = "Skills: {}"
+    SIMILAR_SEARCH_SCOPE = "Scope: {}, search: {}"
+    SIMILAR_NOT_FOUND = "No employees with overlapping skills found."
+
+    # KPI fast path report messages
+    KPI_HEADER = "HEADLINE KPI (PRECOMPUTED)"
+    KPI_COMPANY_OVERVIEW = "Company Overview:"
+    KPI_DEPARTMENT = "Department {} KPI:"
+    KPI_VERIFICATION_HEADER = "Verification against raw data (tolerance {}%):"
+    KPI_VERIFICATION_SKIPPED = "Verification skipped."
+    KPI_DRIFT_SUMMARY = "Metrics drifted: {} of {}"
+
+    # Snapshot trend report messages
+    TREND_HEADER = "PO DEPARTMENT TREND ANALYSIS"
+    TREND_SNAPSHOTS = "Snapshots analyzed: {} (employee versions stored: {})"
+    TREND_SECTION = "{} (first vs last snapshot):"
+
+    # JSON decoder benchmark messages
+    JSON_BENCHMARK_HEADER = "JSON DECODING BENCHMARK: {} ({:.1f} MB)"
+    JSON_BENCHMARK_ROW = "{:<8} {:>8.3f}s {:>8.1f} MB/s   identical to stdlib: {}"
 
     # Section headers
     INVENTORY_HEADER = "EQUIPMENT INVENTORY ANALYSIS"
@@ -115,11 +198,16 @@ class ReportMessages:
     EFFICIENCY_MEASURES_HEADER = "Measures to Improve Department Efficiency:"
     TRAINING_NEEDS_HEADER = "Identified Training Needs:"
     PRODUCTIVITY_IMPACT_HEADER = "Potential Impact of +10% Productivity:"
+    RULES_FIRED_HEADER = "Recommendation rules fired company-wide ({} departments):"
+    SCENARIO_SUMMARY_HEADER = "Scenario simulation ({:,} scenarios, {:.0%} interval), RUB per year:"
+    SCENARIO_SWEEP_HEADER = "FOT savings by mean productivity uplift:"
+    FOT_SAVINGS_RANGE = "{:.0%} interval of FOT savings: {:,.0f} – {:,.0f} RUB"
 
     # Results messages
     AVERAGE_UTILIZATION = "Average equipment utilization rate: {:.1f}%"
     ANNUAL_MAINTENANCE_COST = "Annual maintenance costs: {:,.0f}"
     TOP_EMPLOYEE_COUNT = "Count employees with performance > 90%: {} employees"
+    PERCENTILES_HEADER = "Percentiles ({}):"
 
     # Finance report headers and messages
     FINANCE_HEADER = "FINANCE DEPARTMENT ANALYSIS"
@@ -131,6 +219,32 @@ class ReportMessages:
 
     TOP_SALARIES_HEADER = "Top 5 Highest Salaries:"
 
+    # Salary percentile report messages
+    SALARY_HEADER = "COMPANY-WIDE SALARY PERCENTILES AND OUTLIERS"
+    SALARY_EMPLOYEES_RANKED = "Employees ranked: {} in {} category/department groups"
+    SALARY_CATEGORY_SUMMARY = "Salary by position category (RUB):"
+    SALARY_OUTLIERS_FOUND = "Salary outliers (|robust z| > {}): {} ({} above, {} below the category median)"
+    SALARY_TOP_OUTLIERS = "Largest salary deviations (top {}):"
+
+    # Payroll projection report messages
+    PAYROLL_PROJECTION_HEADER = "MONTHLY PAYROLL PROJECTION"
+    PAYROLL_PROJECTION_PERIOD = "Projection: {} - {} ({} employees, {} planned hires, {} raises)"
+    PAYROLL_PO_MONTHLY = "PO department payroll by month (RUB):"
+    PAYROLL_PO_EXHAUSTED = "PO department budget runs out in {}"
+    PAYROLL_PO_WITHIN_BUDGET = "PO department payroll stays within budget"
+    PAYROLL_DEPARTMENTS_EXHAUSTED = "Departments whose budget runs out: {} of {}"
+
+    # Equipment report messages
+    EQUIPMENT_HEADER = "EQUIPMENT UTILIZATION AND MAINTENANCE"
+    CHUNKED_MODULES_SKIPPED = "Skipped in chunked mode (need the whole employee frame): {}"
+    EQUIPMENT_TOTAL = "Total equipment: {} items in {} departments"
+    MONTHLY_MAINTENANCE_COST = "Monthly maintenance costs: {:,.0f}"
+    EQUIPMENT_OVERDUE = "Overdue maintenance as of {}: {} items"
+    EQUIPMENT_WARRANTY = "Warranty expired: {} items, expiring within {} days: {} items"
+    EQUIPMENT_BY_DEPARTMENT = "Equipment by department:"
+    EQUIPMENT_BY_TYPE = "Equipment by type:"
+    EQUIPMENT_TOP_OVERDUE = "Most overdue maintenance (top {}):"
+
     # Recommendation messages
     CONSOLIDATION_RECOMMENDATION = "Recommended consolidation measures"
     COST_SAVINGS_POTENTIAL = "Potential annual savings: {:,.0f} RUB"
@@ -145,4 +259,10 @@ class ErrorMessages:
     FILE_NOT_FOUND = "Configuration file not found: {}"
     INVALID_JSON = "Invalid JSON format in file: {}"
     DATA_VALIDATION_ERROR = "Data validation error: {}"
+    TOO_MANY_INVALID_RECORDS = "Data validation error: {} of {} {} records are invalid (first: {})"
+    EMPLOYEE_NOT_FOUND = "Employee not found: {}"
+    WATCH_REQUIRES_JSON = "Watch mode needs a JSON data file, got: {}"
+    SQL_REQUIRES_STORE = "--sql needs an SQLite database created with --convert-sqlite as --data, got: {}"
+    SQL_NOT_READ_ONLY = "--sql only runs read-only queries (SELECT), rejected: {}"
+    SQL_NO_RESULT_SET = "Query returned no result set (expected a SELECT): {}"
     CALCULATION_ERROR = "Calculation error in {}: {}"
\ No newline at end of file
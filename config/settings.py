@@ -0,0 +1,306 @@
+"""
+@brief Analysis settings for PO infrastructure analysis
+Contains tunable parameters shared by analyzers and report generators
+"""
+
+
+class DepartmentSettings:
+    """
+    @brief Settings describing the analyzed department
+    """
+
+    # Department analyzed by the PO reports (Отдел разработки ПО)
+    PO_DEPARTMENT_ID = 1
+
+
+class SkillSettings:
+    """
+    @brief Settings for skill coverage and training needs
+    """
+
+    # Skills every department should have (matched case-insensitively)
+    CRITICAL_SKILLS = ("Docker", "Kubernetes", "Python", "CI/CD", "Cloud (AWS/Azure/GCP)")
+
+    # Fewer employees with a critical skill than this is a deficit
+    CRITICAL_SKILL_MIN_EMPLOYEES = 2
+
+
+class DistributionSettings:
+    """
+    @brief Settings for mergeable distribution summaries
+    Histogram specs are fixed up front so that summaries built by
+    different workers or shards always share the same bin edges.
+    """
+
+    # column: (lower bound, upper bound, bin count)
+    HISTOGRAM_BINS = {
+        "experience_years":     (0, 50, 50),
+        "performance_score":    (0, 100, 40),
+        "salary":               (0, 1_000_000, 200),
+        "roi_percentage":       (-100, 200, 150),
+    }
+
+    # Compactor capacity of the quantile sketch (higher = more accurate)
+    SKETCH_K = 200
+
+    # Percentiles printed in reports
+    REPORT_PERCENTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+
+    # Approximate number of bars drawn for a histogram chart
+    CHART_BINS = 15
+
+
+class KPIFastPathSettings:
+    """
+    @brief Settings for headline metrics served from precomputed KPI blocks
+    """
+
+    # Number of departments recomputed from raw rows (0 disables verification)
+    VERIFICATION_SAMPLE_SIZE = 3
+
+    # Relative difference (%) above which a precomputed metric is reported as drifted
+    DRIFT_TOLERANCE_PERCENT = 1.0
+
+    # Seed for department sampling (None picks a new sample every run)
+    VERIFICATION_SEED = None
+
+
+class ChartSettings:
+    """
+    @brief Settings for embedding charts into PDF reports
+    """
+
+    # Pixels per inch of the embedded size used for raster charts
+    RASTER_PPI = 150
+
+    # Lower resolution for dense charts (histograms) stored as JPEG
+    DENSE_RASTER_PPI = 110
+    JPEG_QUALITY = 80
+
+    # Embedded chart width in mm (matches PDF layout)
+    EMBED_WIDTH_MM = 180
+
+
+class StaffingSettings:
+    """
+    @brief Settings for the team staffing solver
+    """
+
+    # "size" (fewest members) or "cost" (lowest salary sum)
+    DEFAULT_OBJECTIVE = "size"
+
+    # Largest (skill subsets x distinct candidates x team size) product solved
+    # exactly; bigger queries use the greedy cover (~0.3s at 14 skills)
+    EXACT_WORK_LIMIT = 100_000_000
+
+
+class SimilaritySettings:
+    """
+    @brief Settings for the MinHash/LSH similar-employee index
+    64 hash functions in 16 bands of 4 rows favour neighbours with
+    Jaccard similarity above ~0.5; queries with fewer LSH hits than
+    requested fall back to the exact scan.
+    """
+
+    NUM_PERM = 64
+    BANDS = 16
+    SEED = 42
+
+    # Similar employees returned by default
+    TOP_K = 5
+
+
+class ScenarioSettings:
+    """
+    @brief Assumptions of the productivity what-if simulation
+    Rates are fractions per year (0.10 = 10%), salaries are monthly.
+    """
+
+    SCENARIO_COUNT = 10_000
+    CONFIDENCE = 0.9
+
+    # Fixed seed keeps reports reproducible (None draws new scenarios every run)
+    SEED = 42
+
+    ASSUMPTIONS = {
+        "uplift_mean":      0.10,
+        "uplift_std":       0.03,
+        "attrition_mean":   0.12,
+        "attrition_std":    0.03,
+        "indexation_mean":  0.06,
+        "indexation_std":   0.02,
+        "hires_mean":       2.0,
+    }
+
+    # Mean uplifts evaluated by the parameter sweep (empty disables it)
+    UPLIFT_SWEEP = (0.05, 0.10, 0.15, 0.20)
+
+
+class RecommendationSettings:
+    """
+    @brief Declarative recommendation rules
+    "when" is evaluated over the per-department metrics table built by
+    RecommendationsAnalayzer: headcount, average_performance,
+    high_performer_ratio, junior_ratio, senior_ratio, python_docker_experts,
+    critical_deficits, critical_deficit_skills. Messages may use these
+    metrics as {placeholders}.
+    """
+
+    RULES = (
+        {
+            "id": "low_average_performance",
+            "category": "efficiency",
+            "when": "average_performance < 85",
+            "message": "Повысить среднюю производительность через менторство и оптимизацию процессов"
+        },
+        {
+            "id": "few_high_performers",
+            "category": "efficiency",
+            "when": "high_performer_ratio < 0.2",
+            "message": "Разработать программу по выявлению и удержанию талантов"
+        },
+        {
+            "id": "junior_heavy_structure",
+            "category": "efficiency",
+            "when": "junior_ratio > 0.4 and senior_ratio < 0.2",
+            "message": "Усилить наставничество: назначить менторов для стажёров и junior-специалистов"
+        },
+        {
+            "id": "critical_skill_deficit",
+            "category": "training",
+            "when": "critical_deficits > 0",
+            "message": "Организовать обучение по дефицитным критическим навыкам: {critical_deficit_skills}"
+        },
+        {
+            "id": "no_python_docker_experts",
+            "category": "training",
+            "when": "python_docker_experts == 0",
+            "message": "Провести кросс-обучение: Python-разработчикам — Docker, DevOps — Python"
+        },
+    )
+
+    # Message used when no rule of a category fires
+    FALLBACK_MESSAGES = {
+        "efficiency": "Текущая структура отдела сбалансирована. Рекомендуется поддерживать достигнутый уровень.",
+        "training": "Потребность в массовом обучении не выявлена. Рекомендуется индивидуальное развитие."
+    }
+
+
+class WatchSettings:
+    """
+    @brief Settings for watch mode (--watch)
+    A change is processed once the file has been unchanged for one
+    interval, so the refresh lags an upload by one to two intervals.
+    """
+
+    POLL_INTERVAL_SECONDS = 1.0
+
+
+class IngestionSettings:
+    """
+    @brief Settings for validating ingestion of company JSON files
+    """
+
+    # JSON decoding backend: "auto" (orjson when installed), "orjson" or "stdlib"
+    JSON_BACKEND = "auto"
+
+    # NDJSON lines decoded per chunk (bounds the raw text held in memory)
+    NDJSON_CHUNK_LINES = 50000
+
+    # Read buffer for streamed decompression
+    READ_BUFFER_BYTES = 1 << 20
+
+    # JSON Lines file receiving invalid records and their reasons (rewritten on every load)
+    QUARANTINE_FILE = "logs/quarantine.jsonl"
+
+    # A section with a larger share of invalid records aborts the load
+    # (usually a schema change rather than a few bad rows)
+    MAX_INVALID_FRACTION = 0.5
+
+
+class ChunkedExecutionSettings:
+    """
+    @brief Settings for out-of-core (--chunked) execution
+    The chunk size is derived from the memory budget and the measured
+    DataFrame footprint of the first records.
+    """
+
+    # Memory available to one chunk of employee records
+    MEMORY_BUDGET_MB = 512
+
+    # Records validated first to measure the per-record footprint
+    PROBE_RECORDS = 1000
+
+    # Peak working set per record relative to its DataFrame row
+    # (raw decoded dicts, extracted tuples, validation masks, analyzer copies)
+    WORKING_SET_FACTOR = 8
+
+    MIN_CHUNK_RECORDS = 1000
+
+
+class RunSettings:
+    """
+    @brief Settings for run-scoped outputs
+    The command line run writes to LOG_DIRECTORY; runs started in-process
+    with a run id get their own directory below RUN_DIRECTORY.
+    """
+
+    LOG_DIRECTORY = "logs"
+    RUN_DIRECTORY = "logs/runs"
+
+    SUMMARY_FILE_NAME = "analysis_summary.txt"
+
+
+class WorkerSettings:
+    """
+    @brief Settings for running analysis modules in worker processes (--workers)
+    Workers attach the parent's frames from shared memory, so they get one
+    shared copy of the data even with a start method that inherits nothing.
+    """
+
+    START_METHOD = "spawn"
+
+
+class SalarySettings:
+    """
+    @brief Settings for company-wide salary percentiles and outliers
+    Outliers use the modified z-score of Iglewicz and Hoaglin:
+    0.6745 * (salary - median) / MAD within the position category.
+    """
+
+    MAD_SCALE = 0.6745
+    OUTLIER_Z_THRESHOLD = 3.5
+
+    # Outliers listed in the console report and the PDF
+    REPORT_OUTLIER_COUNT = 10
+
+
+class PayrollProjectionSettings:
+    """
+    @brief Settings for the monthly payroll projection
+    The projection starts with the fiscal year containing the data's
+    generation date. Department budgets are annual and compared with the
+    cumulative payroll of each fiscal year.
+    """
+
+    FISCAL_YEAR_START_MONTH = 1
+    HORIZON_MONTHS = 12
+
+    # Planned raises: (effective month "YYYY-MM", rate); raises compound
+    RAISES = ()
+
+    # Planned hires: dicts with department_id, salary (monthly), start ("YYYY-MM-DD") and optional count
+    PLANNED_HIRES = ()
+
+
+class EquipmentSettings:
+    """
+    @brief Settings for the equipment analysis
+    Dates are checked against the data's generation date.
+    """
+
+    # Warranties ending within this many days count as expiring
+    WARRANTY_HORIZON_DAYS = 90
+
+    # Overdue items listed in the console and PDF reports
+    REPORT_OVERDUE_COUNT = 10
@@ -3,24 +3,34 @@
 Orchestrates all analysis modules and generates comprehensive reports
 """
 
+import argparse
+import contextlib
+import io
+import multiprocessing
 import os
 import sys
-import tempfile
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import pandas as pd
+import time
+from concurrent.futures import ProcessPoolExecutor
 
-from utils.logger import analysis_logger
+from utils.run_context import RunContext, default_run_context
 from anlyzers.basic_statistics import BasicStaticAnalayzer
 from anlyzers.finance_analize import FinanceAnalayzer
+from anlyzers.salary_analyze import SalaryPercentileAnalayzer
+from anlyzers.payroll_projection_analyze import PayrollProjectionAnalayzer
 from anlyzers.project_analyze import ProjectAnalayzer
 from anlyzers.skills_analyzer import SkillsAnalayzer
+from anlyzers.equipment_analyze import EquipmentAnalayzer
 from anlyzers.recomendation_analyze import RecommendationsAnalayzer
-from config.messages import LogMessages, ReportMessages
-from fpdf import FPDF
-from fpdf.fonts import FontFace
-from fpdf.enums import XPos, YPos
+from anlyzers.kpi_fast_path_analyze import KPIFastPathAnalayzer
+from anlyzers.trend_analyze import SnapshotTrendAnalayzer
+from config.messages import LogMessages, ReportMessages, ErrorMessages
+from utils.binary_snapshot import convert_to_binary_snapshot, is_binary_snapshot
+from utils.sqlite_store import SQLiteStore, convert_to_sqlite_store, is_sqlite_store
+from utils.shared_frames import attach_company_data, share_company_data
+from utils.atomic_file import write_atomic
+from utils.file_watch import SectionChangeDetector
+from utils.json_decoder import benchmark_backends
+from config.settings import DepartmentSettings, WatchSettings, WorkerSettings
 
 class POInfrastructureAnalysisOrchestrator:
     """
@@ -28,31 +38,135 @@ class POInfrastructureAnalysisOrchestrator:
     Coordinates execution of all analysis modules and compiles results
     """
     
-    def __init__(self, json_data_file_path):
+    # Result key -> (analyzer class, module name for logs, console banner), in execution order
+    ANALYSIS_MODULES = {
+        'basic_static': (BasicStaticAnalayzer, "Employee Static", "EXECUTING EMPLOYEES STATIC ANALYSIS..."),
+        'finance': (FinanceAnalayzer, "Finance", "EXECUTING FINANCE ANALYSIS..."),
+        'salary': (SalaryPercentileAnalayzer, "Salary Percentiles", "EXECUTING SALARY PERCENTILE ANALYSIS..."),
+        'payroll': (PayrollProjectionAnalayzer, "Payroll Projection", "EXECUTING PAYROLL PROJECTION..."),
+        'project': (ProjectAnalayzer, "Project", "EXECUTING PROJECT ANALYSIS..."),
+        'skills': (SkillsAnalayzer, "Skills", "EXECUTING SKILLS ANALYSIS..."),
+        'equipment': (EquipmentAnalayzer, "Equipment", "EXECUTING EQUIPMENT ANALYSIS..."),
+        'recommendation': (RecommendationsAnalayzer, "Strategic Recommendations", "GENERATING STRATEGIC RECOMMENDATIONS...")
+    }
+
+    # Top-level data sections each analyzer reads
+    MODULE_SECTIONS = {
+        'basic_static': ("employees",),
+        'finance': ("employees", "departments", "metadata"),
+        'salary': ("employees",),
+        'payroll': ("employees", "departments", "metadata"),
+        'project': ("projects",),
+        'skills': ("employees",),
+        'equipment': ("equipment", "metadata"),
+        'recommendation': ("employees", "projects")
+    }
+
+    # Results each analyzer consumes (it is re-run when any of them is)
+    MODULE_INPUTS = {
+        'recommendation': ('basic_static', 'finance', 'skills', 'project')
+    }
+
+    # Analyzers able to stream employees in chunks (--chunked); other modules
+    # reading employees need the whole frame and are skipped in chunked mode
+    CHUNKED_MODULES = ('basic_static', 'finance')
+
+    def __init__(self, json_data_file_path, chunked=False, memory_budget_mb=None, run_context=None, workers=None):
         """
         @brief Initialize analysis orchestrator with data source
         Sets up all analyzer instances and configuration
         
         @param json_data_file_path: Path to company data JSON file
+        @param chunked: Stream employees in chunks for CHUNKED_MODULES and skip
+                        the modules needing the whole employee frame
+        @param memory_budget_mb: Memory budget of one chunk
+        @param run_context: RunContext holding the run's loggers and output paths
+                            (shared command line layout if None)
+        @param workers: Number of worker processes for modules without result
+                        inputs (all modules run in this process if None)
         """
         self.json_data_file_path = json_data_file_path
+        self.chunked = chunked
+        self.memory_budget_mb = memory_budget_mb
+        self.run_context = run_context or default_run_context
+        self.workers = workers
+        self.chunked_data = None
         self.analysis_results_collection = {}
-        self.logger = analysis_logger.get_analysis_logger("POInfrastructureAnalysisOrchestrator")
+        self.logger = self.run_context.get_logger("POInfrastructureAnalysisOrchestrator")
 
         self.logger.info(LogMessages.ORCHESTRATOR_INIT.format(json_data_file_path))
         
         # Verify file exists before initializing analyzers
         self._verify_data_file_exists()
 
-        # Initialize analyzer instances
-        self.basic_static_analysis_module = BasicStaticAnalayzer(json_data_file_path)
-        self.finance_analize_module = FinanceAnalayzer(json_data_file_path)
-        self.project_analize_module = ProjectAnalayzer(json_data_file_path)
-        self.skills_analize_module = SkillsAnalayzer(json_data_file_path)
-        self.recomendation_analuze_module = RecommendationsAnalayzer(json_data_file_path)
+        self.module_keys = self._select_modules()
+        self.skipped_modules = tuple(result_key for result_key in self.ANALYSIS_MODULES
+                                     if result_key not in self.module_keys)
+        if self.skipped_modules:
+            self.logger.warning(LogMessages.CHUNKED_MODULES_SKIPPED.format(", ".join(self.skipped_modules)))
+
+        # Initialize analyzer instances (worker modules are created in the workers)
+        self.worker_modules = self._select_worker_modules()
+        self.analysis_modules = {
+            result_key: self._create_analyzer(result_key)
+            for result_key in self.module_keys if result_key not in self.worker_modules
+        }
 
         self.logger.info(LogMessages.DATA_FILE_VERIFIED)
 
+    def _create_analyzer(self, result_key):
+        """
+        @brief Create the analyzer of a module for the data file
+
+        @param result_key: Result key of ANALYSIS_MODULES
+        @return Analyzer instance
+        """
+        analyzer_class = self.ANALYSIS_MODULES[result_key][0]
+        if self.chunked and result_key in self.CHUNKED_MODULES:
+            analyzer = analyzer_class(self.json_data_file_path, chunked=True, memory_budget_mb=self.memory_budget_mb,
+                                      run_context=self.run_context, chunked_data=self.chunked_data)
+            if analyzer.chunked:
+                # Later chunked modules stream the same file without parsing it again
+                self.chunked_data = analyzer.company_data
+            return analyzer
+        return analyzer_class(self.json_data_file_path, run_context=self.run_context)
+
+    def _select_modules(self):
+        """
+        @brief Modules to run on the data file
+        In chunked mode only CHUNKED_MODULES stream employees; modules that
+        read the whole employee frame, or consume the result of a skipped
+        module, are left out instead of loading it. Binary snapshots and
+        SQLite stores never chunk, so they run every module.
+
+        @return Tuple of result keys in execution order
+        """
+        if not self.chunked or is_binary_snapshot(self.json_data_file_path) or is_sqlite_store(self.json_data_file_path):
+            return tuple(self.ANALYSIS_MODULES)
+
+        selected = []
+        for result_key in self.ANALYSIS_MODULES:
+            streams_employees = result_key in self.CHUNKED_MODULES or "employees" not in self.MODULE_SECTIONS[result_key]
+            inputs_selected = set(self.MODULE_INPUTS.get(result_key, ())) <= set(selected)
+            if streams_employees and inputs_selected:
+                selected.append(result_key)
+        return tuple(selected)
+
+    def _select_worker_modules(self):
+        """
+        @brief Modules to run in worker processes
+        Modules consuming other results stay in this process. Worker frames
+        come from the JSON loader, so chunked runs, binary snapshots and
+        SQLite stores run all modules here.
+
+        @return Tuple of result keys
+        """
+        if not self.workers or self.chunked:
+            return ()
+        if is_binary_snapshot(self.json_data_file_path) or is_sqlite_store(self.json_data_file_path):
+            return ()
+        return tuple(result_key for result_key in self.module_keys if result_key not in self.MODULE_INPUTS)
+
     def _verify_data_file_exists(self):
         """
         @brief Verify that the data file exists before analysis
@@ -75,43 +189,7 @@ class POInfrastructureAnalysisOrchestrator:
         print("=" * 70)
 
         try:
-            # Execute all analysis modules
-            self.logger.info(LogMessages.ANALYSIS_MODULE_START.format("Employee Static"))
-            print("\nEXECUTING EMPLOYEES STATIC ANALYSIS...")
-            basic_static_analysis_results = self.basic_static_analysis_module.execute_analysis()
-            self.analysis_results_collection['basic_static'] = basic_static_analysis_results
-            self.logger.info(LogMessages.ANALYSIS_MODULE_SUCCESS.format("Employee Static"))
-
-            self.logger.info(LogMessages.ANALYSIS_MODULE_START.format("Finance"))
-            print("\nEXECUTING FINANCE ANALYSIS...")
-            finance_analysis_results = self.finance_analize_module.execute_analysis()
-            self.analysis_results_collection['finance'] = finance_analysis_results
-            self.logger.info(LogMessages.ANALYSIS_MODULE_SUCCESS.format("Finance"))
-
-            self.logger.info(LogMessages.ANALYSIS_MODULE_START.format("Project"))
-            print("\nEXECUTING PROJECT ANALYSIS...")
-            project_analysis_results = self.project_analize_module.execute_analysis()
-            self.analysis_results_collection['project'] = project_analysis_results
-            self.logger.info(LogMessages.ANALYSIS_MODULE_SUCCESS.format("Project"))
-
-            self.logger.info(LogMessages.ANALYSIS_MODULE_START.format("Skills"))
-            print("\nEXECUTING SKILLS ANALYSIS...")
-            skills_analysis_results = self.skills_analize_module.execute_analysis()
-            self.analysis_results_collection['skills'] = skills_analysis_results
-            self.logger.info(LogMessages.ANALYSIS_MODULE_SUCCESS.format("Skills"))
-
-            self.logger.info(LogMessages.ANALYSIS_MODULE_START.format("Strategic Recommendations"))
-            print("\nGENERATING STRATEGIC RECOMMENDATIONS...")
-            recommendation_analysis_results = self.recomendation_analuze_module.execute_analysis(basic_static_analysis_results,finance_analysis_results,skills_analysis_results)
-            self.analysis_results_collection['recommendation'] = recommendation_analysis_results
-            self.logger.info(LogMessages.ANALYSIS_MODULE_SUCCESS.format("Strategic Recommendations"))
-
-            # Generate final comprehensive report
-            self.logger.info(LogMessages.GENERATING_SUMMARY_REPORT)
-            summary_text = self._generate_comprehensive_summary_report()
-            self.analysis_results_collection['summary_text'] = summary_text
-            self.logger.info(LogMessages.SUMMARY_REPORT_SAVED)
-
+            self._execute_modules(self.module_keys)
             self.logger.info(LogMessages.ANALYSIS_COMPLETE.format("Comprehensive PO Infrastructure"))
             return self.analysis_results_collection
 
@@ -120,6 +198,96 @@ class POInfrastructureAnalysisOrchestrator:
             print(f"\nCOMPREHENSIVE ANALYSIS FAILED: {str(comprehensive_analysis_error)}")
             raise comprehensive_analysis_error
 
+    def modules_affected_by(self, changed_sections):
+        """
+        @brief Analysis modules to re-run after data sections changed
+        Includes modules consuming the results of affected modules.
+
+        @param changed_sections: Names of changed top-level sections
+        @return List of result keys in execution order
+        """
+        affected = set()
+        for result_key in self.module_keys:
+            reads_changed_section = set(self.MODULE_SECTIONS[result_key]) & set(changed_sections)
+            consumes_affected_result = set(self.MODULE_INPUTS.get(result_key, ())) & affected
+            if reads_changed_section or consumes_affected_result:
+                affected.add(result_key)
+        return [result_key for result_key in self.module_keys if result_key in affected]
+
+    def refresh_analysis(self, changed_sections):
+        """
+        @brief Re-run only the modules depending on changed data sections
+        Affected analyzers reload the data file; results of the other
+        modules are kept from the previous run.
+
+        @param changed_sections: Names of changed top-level sections
+        @return List of re-run result keys (empty if no module depends on the sections)
+        """
+        result_keys = self.modules_affected_by(changed_sections)
+        if not result_keys:
+            return result_keys
+
+        self.logger.info(LogMessages.ANALYSIS_REFRESH_START.format(", ".join(result_keys)))
+        self.chunked_data = None
+        try:
+            for result_key in result_keys:
+                if result_key not in self.worker_modules:
+                    self.analysis_modules[result_key] = self._create_analyzer(result_key)
+            self._execute_modules(result_keys)
+        except Exception as refresh_error:
+            self.logger.error(LogMessages.ANALYSIS_ERROR.format("refresh", str(refresh_error)))
+            raise refresh_error
+        return result_keys
+
+    def _execute_modules(self, result_keys):
+        """
+        @brief Execute analysis modules in order and regenerate the summary
+
+        @param result_keys: Result keys of ANALYSIS_MODULES to execute
+        """
+        worker_keys = [result_key for result_key in result_keys if result_key in self.worker_modules]
+        if worker_keys:
+            process_count = min(self.workers, len(worker_keys))
+            with share_company_data(self.json_data_file_path, self.run_context) as shared_frames, \
+                    ProcessPoolExecutor(process_count, multiprocessing.get_context(WorkerSettings.START_METHOD)) as executor:
+                self.logger.info(LogMessages.SHARED_FRAMES_PUBLISHED.format(
+                    process_count, shared_frames.descriptor.name, shared_frames.size / 2**20))
+                worker_runs = {
+                    result_key: executor.submit(execute_module_in_worker, shared_frames.descriptor, result_key,
+                                                self.json_data_file_path, self.run_context.run_id)
+                    for result_key in worker_keys
+                }
+                self._collect_module_results(result_keys, worker_runs)
+        else:
+            self._collect_module_results(result_keys, {})
+
+        # Generate final comprehensive report
+        self.logger.info(LogMessages.GENERATING_SUMMARY_REPORT)
+        summary_text = self._generate_comprehensive_summary_report()
+        self.analysis_results_collection['summary_text'] = summary_text
+        self.logger.info(LogMessages.SUMMARY_REPORT_SAVED.format(self.run_context.summary_path))
+
+    def _collect_module_results(self, result_keys, worker_runs):
+        """
+        @brief Execute modules in order, taking worker results as they are needed
+        Reports of worker modules are printed in module order.
+
+        @param result_keys: Result keys of ANALYSIS_MODULES to execute
+        @param worker_runs: Result key -> future of execute_module_in_worker
+        """
+        for result_key in result_keys:
+            _, module_name, banner = self.ANALYSIS_MODULES[result_key]
+            self.logger.info(LogMessages.ANALYSIS_MODULE_START.format(module_name))
+            print(f"\n{banner}")
+            if result_key in worker_runs:
+                result, report = worker_runs[result_key].result()
+                print(report, end="")
+            else:
+                inputs = [self.analysis_results_collection[input_key] for input_key in self.MODULE_INPUTS.get(result_key, ())]
+                result = self.analysis_modules[result_key].execute_analysis(*inputs)
+            self.analysis_results_collection[result_key] = result
+            self.logger.info(LogMessages.ANALYSIS_MODULE_SUCCESS.format(module_name))
+
     def _generate_comprehensive_summary_report(self):
         """
         @brief Generate final comprehensive summary report as a string
@@ -133,38 +301,67 @@ class POInfrastructureAnalysisOrchestrator:
         # Employee Statistics
         basic = self.analysis_results_collection['basic_static']
         report_lines.append("\nEMPLOYEE OVERVIEW:")
-        report_lines.append(f"• Total Employees: {basic['total_employee_count']}")
-        report_lines.append(f"• High Performers (>90%): {len(basic['high_performers'])}")
-        report_lines.append(f"• Avg. Salary: {basic['average_parameters']['avarage_salary']:,.0f} RUB")
-        report_lines.append(f"• Avg. Performance: {basic['average_parameters']['avarage_perfomance']:.1f}%")
-        report_lines.append(f"• Avg. Experience: {basic['average_parameters']['avarage_experience']:.1f} years")
+        report_lines.append(f"• Total Employees: {basic.total_employee_count}")
+        report_lines.append(f"• High Performers (>90%): {len(basic.high_performers)}")
+        report_lines.append(f"• Avg. Salary: {basic.average_parameters['avarage_salary']:,.0f} RUB")
+        report_lines.append(f"• Avg. Performance: {basic.average_parameters['avarage_perfomance']:.1f}%")
+        report_lines.append(f"• Avg. Experience: {basic.average_parameters['avarage_experience']:.1f} years")
+        salary_percentiles = basic.distributions['salary'].percentiles((0.5, 0.9))
+        report_lines.append(f"• Salary Median / P90: {salary_percentiles[0.5]:,.0f} / {salary_percentiles[0.9]:,.0f} RUB")
 
         # Position distribution
-        pos_dist = basic['distribution_position']
+        pos_dist = basic.distribution_position.to_frame()
         report_lines.append("\nPOSITION DISTRIBUTION:")
         for _, row in pos_dist.iterrows():
             report_lines.append(f"• {row['Category']}: {row['Count']} ({row['Percentage']}%)")
 
         # Finance
         finance = self.analysis_results_collection['finance']
-        budget_info = finance["distribution_position"]
+        budget_info = finance.distribution_position
         report_lines.append(f"\nFINANCIAL METRICS:")
         report_lines.append(f"• Total FOT (Payroll): {budget_info['total_fot']:,.0f} RUB")
         report_lines.append(f"• Department Budget: {budget_info['department_budget']:,.0f} RUB")
         report_lines.append(f"• Budget Utilization: {budget_info['budget_utilization_percent']}%")
 
         report_lines.append(f"\nTOP 5 HIGHEST SALARIES:")
-        report_lines.append(finance['top_salary'].to_string(index=False))
+        report_lines.append(finance.top_salary.to_frame().to_string(index=False))
+
+        # Salary percentiles
+        if 'salary' in self.analysis_results_collection:
+            salary = self.analysis_results_collection['salary']
+            report_lines.append(f"\nSALARY PERCENTILES (COMPANY-WIDE):")
+            report_lines.append(f"• Employees Ranked: {salary.total_employees} ({salary.group_count} category/department groups)")
+            for category, row in salary.category_summary.to_frame().iterrows():
+                report_lines.append(f"• {category}: median {row['median_salary']:,.0f} RUB, "
+                                    f"P10-P90 {row['p10']:,.0f} - {row['p90']:,.0f} RUB")
+            report_lines.append(f"• Outliers (|robust z| > {salary.outlier_threshold}): {len(salary.outliers)}")
+
+        # Payroll projection
+        if 'payroll' in self.analysis_results_collection:
+            payroll = self.analysis_results_collection['payroll']
+            budget_table = payroll.budget_table.to_frame()
+            exhausted = budget_table[budget_table['exhaustion_month'] != ""]
+            report_lines.append(f"\nPAYROLL PROJECTION:")
+            if payroll.months:
+                report_lines.append(f"• Period: {payroll.months[0]} - {payroll.months[-1]} "
+                                    f"({payroll.planned_hire_count} planned hires, {payroll.raise_count} raises)")
+            po_monthly = payroll.po_monthly.to_frame()
+            if len(po_monthly):
+                report_lines.append(f"• PO Projected Payroll: {po_monthly['payroll'].sum():,.0f} RUB")
+            if DepartmentSettings.PO_DEPARTMENT_ID in budget_table.index:
+                po_exhaustion = budget_table.loc[DepartmentSettings.PO_DEPARTMENT_ID, 'exhaustion_month']
+                report_lines.append(f"• PO Budget Exhausted: {po_exhaustion or 'no'}")
+            report_lines.append(f"• Departments Over Budget: {len(exhausted)} of {len(budget_table)}")
 
         # Project Analysis
         project = self.analysis_results_collection['project']
-        top_proj = project['top_project']
+        top_proj = project.top_project
         report_lines.append(f"\nPROJECT METRICS:")
-        report_lines.append(f"• Total Projects: {project['total_projects']}")
-        report_lines.append(f"• Average ROI: {project['average_ROI_project']:.2f}%")
+        report_lines.append(f"• Total Projects: {project.total_projects}")
+        report_lines.append(f"• Average ROI: {project.average_ROI_project:.2f}%")
 
         report_lines.append(f"\nPROJECT STATUS DISTRIBUTION:")
-        report_lines.append(project['status_project'].to_string(index=False))
+        report_lines.append(project.status_project.to_frame().to_string(index=False))
 
         report_lines.append(f"\nMOST PROFITABLE PROJECT:")
         if top_proj is not None:
@@ -177,306 +374,388 @@ class POInfrastructureAnalysisOrchestrator:
             report_lines.append("• No projects found.")
 
         # Skills
-        skills = self.analysis_results_collection['skills']
-        report_lines.append(f"\nSKILLS OVERVIEW:")
-        report_lines.append(f"• Total Employees: {skills['total_employees']}")
-        report_lines.append(f"• Python + Docker Experts: {len(skills['python_docker_experts'])}")
+        if 'skills' in self.analysis_results_collection:
+            skills = self.analysis_results_collection['skills']
+            report_lines.append(f"\nSKILLS OVERVIEW:")
+            report_lines.append(f"• Total Employees: {skills.total_employees}")
+            report_lines.append(f"• Python + Docker Experts: {len(skills.python_docker_experts)}")
+
+        # Equipment
+        equipment = self.analysis_results_collection['equipment']
+        report_lines.append(f"\nEQUIPMENT:")
+        report_lines.append(f"• Total Equipment: {equipment.total_equipment}")
+        report_lines.append(f"• Avg. Utilization: {equipment.average_utilization:.1f}%")
+        report_lines.append(f"• Maintenance Costs: {equipment.monthly_maintenance_cost:,.0f} RUB per month")
+        report_lines.append(f"• Overdue Maintenance (as of {equipment.as_of}): {equipment.overdue_count}")
+        report_lines.append(f"• Warranty Expired / Expiring in {equipment.warranty_horizon_days} Days: "
+                            f"{equipment.warranty_expired_count} / {equipment.warranty_expiring_count}")
 
         # Recommendations
-        recommendations = self.analysis_results_collection['recommendation']
-        report_lines.append(f"\nSTRATEGIC RECOMMENDATIONS:")
-
-        report_lines.append(f"\nMeasures to Improve Efficiency:")
-        for i, measure in enumerate(recommendations['efficiency_measures'], 1):
-            report_lines.append(f"  {i}. {measure}")
-
-        report_lines.append(f"\nTraining Needs:")
-        for i, need in enumerate(recommendations['training_needs'], 1):
-            report_lines.append(f"  {i}. {need}")
-
-        impact = recommendations['productivity_impact']
-        report_lines.append(f"\nPotential Impact of +10% Productivity:")
-        if 'fot_savings_potential' in impact:
-            report_lines.append(f"  • Estimated FOT savings: {impact['fot_savings_potential']:,.0f} RUB")
-            report_lines.append(f"  • Assumption: {impact['assumption']}")
-        else:
-            report_lines.append("  • Insufficient data for impact calculation.")
+        if 'recommendation' in self.analysis_results_collection:
+            recommendations = self.analysis_results_collection['recommendation']
+            report_lines.append(f"\nSTRATEGIC RECOMMENDATIONS:")
+
+            report_lines.append(f"\nMeasures to Improve Efficiency:")
+            for i, measure in enumerate(recommendations.efficiency_measures, 1):
+                report_lines.append(f"  {i}. {measure}")
+
+            report_lines.append(f"\nTraining Needs:")
+            for i, need in enumerate(recommendations.training_needs, 1):
+                report_lines.append(f"  {i}. {need}")
+
+            impact = recommendations.productivity_impact
+            report_lines.append(f"\nPotential Impact of +10% Productivity:")
+            if impact.available:
+                report_lines.append(f"  • Estimated FOT savings: {impact.fot_savings_potential:,.0f} RUB")
+                if impact.fot_savings_interval is not None:
+                    report_lines.append(f"  • {ReportMessages.FOT_SAVINGS_RANGE.format(impact.confidence, *impact.fot_savings_interval)}")
+                report_lines.append(f"  • Assumption: {impact.assumption}")
+            else:
+                report_lines.append("  • Insufficient data for impact calculation.")
+
+        if self.skipped_modules:
+            report_lines.append(f"\n{ReportMessages.CHUNKED_MODULES_SKIPPED.format(', '.join(self.skipped_modules))}")
 
         full_report = "\n".join(report_lines)
         
         print(full_report)
         
-        with open("logs/analysis_summary.txt", "w", encoding="utf-8") as f:
-            f.write(full_report)
+        write_atomic(self.run_context.summary_path, full_report)
         
         return full_report
 
-class PDFReportGenerator:
-    """
-    @brief Generates a professional PDF report with charts and analysis summary.
+def parse_arguments():
     """
+    @brief Parse command line arguments
 
-    def __init__(self, analysis_results, employee_df, project_df):
-        """
-        @brief Initialize this function. Need results analyzers
-
-        @param analysis_results: results analysis
-        @param employee_df: Dataframe employees with data
-        @param project_df: Dataframe projects data
-        """
-        self.analysis_results = analysis_results
-        self.employee_df = employee_df
-        self.logger = analysis_logger.get_analysis_logger("PDFReportGenerator")
-        self.project_df = project_df
-        
-        self.pdf = FPDF()
-        self.pdf.add_font("DejaVu", "", "DejaVuSans.ttf")
-        self.pdf.add_font("DejaVu", "B", "DejaVuSans-Bold.ttf")
-        
-        self.pdf.set_auto_page_break(auto=True, margin=15)
-        self.temp_files = []
-
-    def _create_temp_file(self, suffix=".png"):
-        """
-        @brief Create a temporary file for chart.
-        """
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as f:
-            path = f.name
-        self.temp_files.append(path)
-        return path
-
-    def _add_page_with_title(self, title):
-        """
-        @brief Generate new page PDF with title
+    @return argparse.Namespace with run options
+    """
+    parser = argparse.ArgumentParser(description="PO infrastructure analysis")
+    parser.add_argument("--data", default="company.json",
+                        help="Path to company data (JSON or NDJSON, optionally .gz/.zst compressed)")
+    parser.add_argument("--fast-kpi", action="store_true",
+                        help="Answer headline metrics from precomputed kpi_metrics/company_overview only")
+    parser.add_argument("--verify-sample", type=int, default=None,
+                        help="Departments recomputed from raw rows to check KPI drift (0 disables)")
+    parser.add_argument("--trend-dir", default=None,
+                        help="Directory of company.json snapshots to analyze as time series")
+    parser.add_argument("--convert-snapshot", default=None, metavar="OUTPUT_DIR",
+                        help="Convert --data JSON into a memory-mapped binary snapshot and exit")
+    parser.add_argument("--convert-sqlite", default=None, metavar="OUTPUT_DB",
+                        help="Convert --data JSON into an indexed SQLite database and exit")
+    parser.add_argument("--sql", default=None, metavar="QUERY",
+                        help="Run a read-only SQL query against the SQLite database given as --data and exit")
+    parser.add_argument("--staff", nargs="+", default=None, metavar="SKILL",
+                        help="Find a department team covering these skills and exit")
+    parser.add_argument("--max-salary-sum", type=float, default=None,
+                        help="Salary sum limit for --staff")
+    parser.add_argument("--min-performance", type=float, default=None,
+                        help="Minimal performance_score of --staff members")
+    parser.add_argument("--staff-objective", choices=["size", "cost"], default=None,
+                        help="Minimize team size (default) or salary sum for --staff")
+    parser.add_argument("--similar-to", type=int, default=None, metavar="EMPLOYEE_ID",
+                        help="List employees with the most similar skill sets and exit")
+    parser.add_argument("--similar-top-k", type=int, default=None,
+                        help="Number of similar employees for --similar-to")
+    parser.add_argument("--similar-scope", choices=["department", "company"], default="department",
+                        help="Search within the employee's department (default) or company-wide")
+    parser.add_argument("--similar-exact", action="store_true",
+                        help="Exact brute-force similarity scan instead of LSH (validation)")
+    parser.add_argument("--analysis-only", "--no-pdf", action="store_true", dest="analysis_only",
+                        help="Run all analyzers and emit results without loading the charting/PDF stack")
+    parser.add_argument("--pdf-output", default="PO_Analysis_Report.pdf",
+                        help="Path of the generated PDF report")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and refresh outputs when --data changes")
+    parser.add_argument("--watch-interval", type=float, default=None,
+                        help="Seconds between checks of --data in watch mode")
+    parser.add_argument("--chunked", action="store_true",
+                        help="Stream employees in chunks for basic statistics and finance; salary, payroll, "
+                             "skills and recommendations need the whole employee frame and are skipped")
+    parser.add_argument("--memory-budget-mb", type=int, default=None,
+                        help="Memory budget of one chunk in --chunked mode")
+    parser.add_argument("--workers", type=int, default=None, metavar="N",
+                        help="Run the analyses that need no other results in N worker processes "
+                             "sharing one in-memory copy of the data")
+    parser.add_argument("--benchmark-json", action="store_true",
+                        help="Time the installed JSON decoding backends on --data and exit")
+    return parser.parse_args()
+
+def execute_module_in_worker(descriptor, result_key, json_data_file_path, run_id):
+    """
+    @brief Run one analysis module in a worker process on shared frames
+    The module's console report is captured and returned with its result
+    so that the parent prints the reports in module order.
+
+    @param descriptor: SharedFramesDescriptor of the parent's data
+    @param result_key: Result key of ANALYSIS_MODULES
+    @param json_data_file_path: Path to company data file the frames were loaded from
+    @param run_id: Identifier of the parent's run (None for the command line layout)
+    @return Tuple (analysis result, console report)
+    """
+    run_context = default_run_context if run_id is None else RunContext(run_id)
+    try:
+        attach_company_data(descriptor, run_context)
+        analyzer_class = POInfrastructureAnalysisOrchestrator.ANALYSIS_MODULES[result_key][0]
+        report = io.StringIO()
+        with contextlib.redirect_stdout(report):
+            result = analyzer_class(json_data_file_path, run_context=run_context).execute_analysis()
+        return result, report.getvalue()
+    finally:
+        run_context.close()
+
+def generate_pdf_report(results, output_path, chart_cache=None, run_context=None):
+    """
+    @brief Render analysis results into a PDF report
+    matplotlib and fpdf are imported here, so runs without a PDF never load them.
 
-        @param title: How you wont named this page
-        """
-        self.pdf.add_page()
-        self.pdf.set_font("DejaVu", "B", 30) 
-        x_pos = 1
-        self.pdf.set_x(x_pos)
-        self.pdf.cell(0, 10, title, ln=True, align="C")
-        self.pdf.ln(10)
-
-    def _add_chart(self, fig, title, hight):
-        """
-        @brief Create image in PDF
+    @param results: Results of POInfrastructureAnalysisOrchestrator
+    @param output_path: Path of the PDF file
+    @param chart_cache: ChartImageCache kept between reports (None for a one-off cache)
+    @param run_context: RunContext the generator logs to (default layout if None)
+    """
+    from reports.pdf_report import PDFReportGenerator
 
-        @param fig: Your image, whish you use
-        @param title: Name this image
-        @param hight: Hight this image
-        """
-        temp_path = self._create_temp_file()
-        fig.savefig(temp_path, bbox_inches="tight", dpi=150)
-        plt.close(fig)
+    print("Font file readable, size:", os.path.getsize("DejaVuSans.ttf"))
 
-        self.pdf.set_font("DejaVu", "B", 9)
-        self.pdf.cell(0, 10, title, ln=True)
-        self.pdf.ln(2)
-        self.pdf.image(temp_path,h= hight, w=180)
-        self.pdf.ln(10)
+    pdf_gen = PDFReportGenerator(analysis_results=results, chart_cache=chart_cache, run_context=run_context)
+    pdf_gen.save_pdf(output_path)
 
-    def generate_summary_analysis(self):
-        """
-        @brief Generate print from terminal in PDF
-        """
-        self._add_page_with_title("0. Executive Summary (Text)")
-        self.pdf.set_font("DejaVu", size=12)
-        
-        summary = self.analysis_results['summary_text']
-        for line in summary.split("\n"):
-            self.pdf.multi_cell(0, 5, line)
-            self.pdf.ln(1)
-        self.logger.info(LogMessages.PDF_PAGE_ADDED.format("Executive Summary"))
+def run_isolated_analysis(company_data_json_file_path, pdf_output=None, chunked=False, memory_budget_mb=None,
+                          workers=None):
+    """
+    @brief Run a complete analysis with its own loggers and output paths
+    Entry point for running analyses in parallel threads of one process
+    (e.g. a report server): logs, summary report and quarantine file go
+    to a directory of the run, the PDF to pdf_output.
+
+    @param company_data_json_file_path: Path to company data file
+    @param pdf_output: Path of the PDF report (no PDF if None)
+    @param chunked: Stream employees in chunks and skip the modules needing the whole frame
+    @param memory_budget_mb: Memory budget of one chunk
+    @param workers: Worker processes of the run; concurrent runs of one
+                    file share a single shared-memory copy of its frames
+    @return Tuple (analysis results, RunContext of the run)
+    """
+    run_context = RunContext.create()
+    try:
+        analysis_orchestrator = POInfrastructureAnalysisOrchestrator(
+            company_data_json_file_path, chunked, memory_budget_mb, run_context, workers)
+        results = analysis_orchestrator.execute_comprehensive_analysis()
+        if pdf_output is not None:
+            generate_pdf_report(results, pdf_output, run_context=run_context)
+        return results, run_context
+    finally:
+        run_context.close()
 
-    def generate_basic_statistics_charts(self):
-        """
-        @brief Generate charts for Basic Statistics.
-        """
-        self._add_page_with_title("1. Employee Statistics")
-
-        # Grafic experience, performance, salary
-        fig, axes = plt.subplots(1, 3, figsize=(18, 5))
-        params = [
-            ("Experience (years)", "experience_years"),
-            ("Performance (%)", "performance_score"),
-            ("Salary (RUB)", "salary")
-        ]
-        for ax, (label, col) in zip(axes, params):
-            data = self.employee_df[col].dropna()
-            ax.hist(data, bins=15, color='skyblue', edgecolor='black')
-            ax.set_title(f"Distribution of {label}")
-            ax.set_xlabel(label)
-            ax.set_ylabel("Frequency")
-        self._add_chart(fig, "Distributions: Experience, Performance, Salary", 60)
-
-        # Grafic work level
-        pos_dist = self.analysis_results['basic_static']['distribution_position']
-        fig, ax = plt.subplots(figsize=(8, 8))
-        ax.pie(pos_dist['Count'], labels=pos_dist['Category'], autopct='%1.1f%%', startangle=90)
-        ax.set_title("Position Distribution")
-        self._add_chart(fig, "Position Distribution (Junior/Middle/Senior/TeamLead)", 120)
-        self.logger.info(LogMessages.PDF_PAGE_ADDED.format("Employee Statistics"))
-
-    def generate_finance_charts(self):
-        """
-        @brief Generate charts for Finance.
-        """
-        self._add_page_with_title("2. Financial Analysis")
-
-        # Grafic FOT budget
-        finance = self.analysis_results['finance']
-        budget_info = finance["distribution_position"]
-        fot = budget_info['total_fot']
-        budget = budget_info['department_budget']
-        if fot > budget:
-            sizes = [budget, fot - budget]
-            labels = ['Remaining Budget' ,'FOT (exceeds budget)']
-            colors = ['#ff9999', '#66b3ff']
-        else:
-            sizes = [fot, budget - fot]
-            labels = ['FOT', 'Remaining Budget']
-            colors = ['#ff9999', '#66b3ff']
-        fig, ax = plt.subplots(figsize=(8, 8))
-        ax.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90, colors=colors)
-        ax.set_title("Budget Utilization")
-
-        self._add_chart(fig, "Department Budget Allocation", 120)
-
-        # Grafic top 5 employees
-        top5 = finance['top_salary']
-        fig, ax = plt.subplots(figsize=(10, 6))
-        ax.barh(top5['full_name'], top5['salary'], color='green')
-        ax.set_xlabel("Salary (RUB)")
-        ax.set_title("Top 5 Highest Salaries")
-        ax.ticklabel_format(style='plain', axis='x')
-        self._add_chart(fig, "Top 5 Highest Paid Employees", 80)
-        self.logger.info(LogMessages.PDF_PAGE_ADDED.format("Financial Analysis"))
-
-    def generate_project_charts(self):
-        """
-        @brief Generate charts for Projects.
-        """
-        self._add_page_with_title("3. Project Analysis")
-
-        # Grafic status project
-        project = self.analysis_results['project']
-        status_df = project['status_project']
-        fig, ax = plt.subplots(figsize=(8, 8))
-        ax.pie(status_df['Count'], labels=status_df['Status'], autopct='%1.1f%%', startangle=90)
-        ax.set_title("Project Status Distribution")
-        self._add_chart(fig, "Project Status: Active vs Closed", 120)
-
-        # roi
-        if not self.project_df.empty:
-            fig, ax = plt.subplots(figsize=(10, 6))
-            roi_data = self.project_df['roi_percentage'].dropna()
-            ax.hist(roi_data, bins=15, color='orange', edgecolor='black')
-            ax.set_title("Distribution of Project ROI (%)")
-            ax.set_xlabel("ROI (%)")
-            ax.set_ylabel("Number of Projects")
-            self._add_chart(fig, "ROI Distribution Across Projects", 80)
-        self.logger.info(LogMessages.PDF_PAGE_ADDED.format("Project Analysis"))
-
-    def generate_recommendations_page(self):
-        """
-        @brief Generate reccommendation in PDF
-        """
-        self._add_page_with_title("4. Strategic Recommendations")
-        rec = self.analysis_results['recommendation']
-
-        self.pdf.set_font("DejaVu", "B", 10)
-        self.pdf.cell(0, 10, "Efficiency Improvement Measures:", ln=True)
-        self.pdf.set_font("DejaVu", size=8)
-        for measure in rec['efficiency_measures']:
-            self.pdf.multi_cell(0, 6, f"• {measure}")
-        self.pdf.ln(5)
-
-        self.pdf.set_font("DejaVu", "B", 10)
-        self.pdf.cell(0, 10, "Training Needs:", ln=True)
-        self.pdf.set_font("DejaVu", size=8)
-        for need in rec['training_needs']:
-            self.pdf.multi_cell(0, 6, f"• {need}")
-        self.pdf.ln(5)
-
-        self.pdf.set_font("DejaVu", "B", 10)
-        self.pdf.cell(0, 10, "Productivity Impact (+10%):", ln=True)
-        self.pdf.set_font("DejaVu", size=8)
-        impact = rec['productivity_impact']
-        if 'fot_savings_potential' in impact:
-            self.pdf.cell(0, 6, f"• Estimated FOT savings: {impact['fot_savings_potential']:,.0f} RUB")
-        else:
-            self.pdf.multi_cell(0, 6, "• Insufficient data for impact calculation.")
-        self.logger.info(LogMessages.PDF_PAGE_ADDED.format("Strategic Recommendations"))
+def run_watch_mode(company_data_json_file_path, arguments, logger):
+    """
+    @brief Run the analysis, then refresh outputs whenever the data file changes
+    Only analyzers reading a changed section (and those consuming their
+    results) are re-run. The PDF is rebuilt from a chart cache kept for
+    the whole session, so charts of unchanged sections are not re-rendered.
+
+    @param company_data_json_file_path: Path to company data JSON file
+    @param arguments: Parsed command line arguments
+    @param logger: Logger of the main module
+    """
+    if os.path.isdir(company_data_json_file_path) or is_sqlite_store(company_data_json_file_path):
+        raise ValueError(ErrorMessages.WATCH_REQUIRES_JSON.format(company_data_json_file_path))
+
+    interval = arguments.watch_interval or WatchSettings.POLL_INTERVAL_SECONDS
+    detector = SectionChangeDetector(company_data_json_file_path)
+    analysis_orchestrator = POInfrastructureAnalysisOrchestrator(
+        company_data_json_file_path, arguments.chunked, arguments.memory_budget_mb, workers=arguments.workers)
+    results = analysis_orchestrator.execute_comprehensive_analysis()
+
+    chart_cache = None
+    if not arguments.analysis_only:
+        from reports.chart_output import ChartImageCache
+        chart_cache = ChartImageCache()
+        generate_pdf_report(results, arguments.pdf_output, chart_cache)
+        chart_cache.prune()
+
+    logger.info(LogMessages.WATCH_STARTED.format(company_data_json_file_path, interval))
+    print(f"\nWatching {company_data_json_file_path} for changes (Ctrl+C to stop)...")
+    try:
+        while True:
+            time.sleep(interval)
+            try:
+                changed_sections = detector.poll()
+            except ValueError as data_error:
+                logger.warning(LogMessages.WATCH_INVALID_DATA.format(company_data_json_file_path, str(data_error)))
+                continue
+            if not changed_sections:
+                continue
+
+            logger.info(LogMessages.WATCH_SECTIONS_CHANGED.format(", ".join(sorted(changed_sections))))
+            started = time.perf_counter()
+            try:
+                refreshed = analysis_orchestrator.refresh_analysis(changed_sections)
+                if not refreshed:
+                    logger.info(LogMessages.WATCH_NO_DEPENDENT_MODULES)
+                    continue
+                if chart_cache is not None:
+                    generate_pdf_report(analysis_orchestrator.analysis_results_collection, arguments.pdf_output, chart_cache)
+                    chart_cache.prune()
+            except Exception as refresh_error:
+                # Keep watching: the previous outputs stay in place until the next valid upload
+                logger.error(LogMessages.ANALYSIS_ERROR.format("watch refresh", str(refresh_error)))
+                print(f"\nREFRESH FAILED: {str(refresh_error)}")
+                continue
+
+            elapsed = time.perf_counter() - started
+            logger.info(LogMessages.WATCH_REFRESHED.format(", ".join(refreshed), elapsed))
+            print(f"\nOutputs refreshed ({', '.join(refreshed)}) in {elapsed:.1f}s")
+    except KeyboardInterrupt:
+        logger.info(LogMessages.WATCH_STOPPED)
+        print("\nWatch mode stopped.")
+    finally:
+        if chart_cache is not None:
+            chart_cache.cleanup()
+
+def run_json_benchmark(company_data_json_file_path):
+    """
+    @brief Print decoding time of every installed JSON backend for a file
 
-    def save_pdf(self, output_path="PO_Analysis_Report.pdf"):
-        """
-        @brief Save this beatifully PDF
-        """
-        try:
-            self.pdf.add_page()
-            self.pdf.set_font("DejaVu", size=30)
-            title = "PO Department Analysis Report"
-            title_width = self.pdf.get_string_width(title)
-            x_pos = (self.pdf.w - title_width) / 2
-            self.pdf.set_x(x_pos)
-            self.pdf.cell(0, 30, title, ln=True)
-
-            self.pdf.set_font("DejaVu", size=10)
-            subtitle = "Comprehensive analysis of employees, finances, projects, and skills"
-            subtitle_width = self.pdf.get_string_width(subtitle)
-            x_pos = (self.pdf.w - subtitle_width) / 2
-            self.pdf.set_x(x_pos)
-            self.pdf.cell(0, 10, subtitle, ln=True)
-
-            self.pdf.ln(10)
-            date_str = f"Generated on: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M')}"
-            date_width = self.pdf.get_string_width(date_str)
-            x_pos = (self.pdf.w - date_width) / 2
-            self.pdf.set_x(x_pos)
-            self.pdf.cell(0, 10, date_str, ln=True)
-
-            self.pdf.ln(20)
-
-            # All generation
-            self.generate_summary_analysis()
-            self.generate_basic_statistics_charts()
-            self.generate_finance_charts()
-            self.generate_project_charts()
-            self.generate_recommendations_page()
-
-            self.pdf.output(output_path)
-            self.logger.info(LogMessages.PDF_SAVED.format(output_path))
-            print(f"\nPDF report saved as: {output_path}")
+    @param company_data_json_file_path: Path to company data JSON file
+    """
+    results = benchmark_backends(company_data_json_file_path)
+    size_megabytes = os.path.getsize(company_data_json_file_path) / 1e6
+    print("\n" + "=" * 60)
+    print(ReportMessages.JSON_BENCHMARK_HEADER.format(company_data_json_file_path, size_megabytes))
+    print("=" * 60)
+    for result in results:
+        print(ReportMessages.JSON_BENCHMARK_ROW.format(
+            result["backend"], result["seconds"], result["megabytes_per_second"], result["identical"]))
+
+def run_fast_kpi(company_data_json_file_path, verify_sample):
+    """
+    @brief Print headline metrics from precomputed KPI blocks
 
-        finally:
-            for path in self.temp_files:
-                if os.path.exists(path):
-                    os.remove(path)
-            self.logger.info(LogMessages.TEMP_FILES_CLEANED)
+    @param company_data_json_file_path: Path to company data JSON file
+    @param verify_sample: Number of departments to verify (None uses settings)
+    @return Dictionary with headline KPI results
+    """
+    kpi_analyzer = KPIFastPathAnalayzer(company_data_json_file_path, verification_sample_size=verify_sample)
+    return kpi_analyzer.execute_analysis()
 
 def main():
     """
     @brief Main execution function for IT Infrastructure Analysis
     Handles command line arguments and orchestrates analysis execution
     """
-    # Configuration - update this path to match your JSON file
-    logger = analysis_logger.get_analysis_logger("main")
-    company_data_json_file_path = "company.json"  # Changed from company_data_detailed.json
-    with open("DejaVuSans.ttf", "rb") as f:
-        print("Font file readable, size:", len(f.read()))
+    arguments = parse_arguments()
+    logger = default_run_context.get_logger("main")
+    company_data_json_file_path = arguments.data
+
+    if arguments.convert_snapshot:
+        try:
+            convert_to_binary_snapshot(company_data_json_file_path, arguments.convert_snapshot)
+        except FileNotFoundError as file_error:
+            logger.error(LogMessages.FILE_NOT_FOUND.format(company_data_json_file_path))
+            print(f"\nFILE ERROR: {str(file_error)}")
+            sys.exit(1)
+        logger.info(LogMessages.BINARY_SNAPSHOT_CREATED.format(arguments.convert_snapshot))
+        print(f"\nBinary snapshot saved to: {arguments.convert_snapshot}")
+        return
+
+    if arguments.convert_sqlite:
+        started = time.perf_counter()
+        try:
+            convert_to_sqlite_store(company_data_json_file_path, arguments.convert_sqlite)
+        except FileNotFoundError as file_error:
+            logger.error(LogMessages.FILE_NOT_FOUND.format(company_data_json_file_path))
+            print(f"\nFILE ERROR: {str(file_error)}")
+            sys.exit(1)
+        logger.info(LogMessages.SQLITE_STORE_CREATED.format(arguments.convert_sqlite, time.perf_counter() - started))
+        print(f"\nSQLite database saved to: {arguments.convert_sqlite}")
+        return
+
+    if arguments.sql:
+        if not is_sqlite_store(company_data_json_file_path):
+            print(f"\nERROR: {ErrorMessages.SQL_REQUIRES_STORE.format(company_data_json_file_path)}")
+            sys.exit(1)
+        store = SQLiteStore(company_data_json_file_path)
+        try:
+            print(store.query(arguments.sql).to_string(index=False))
+        except Exception as query_error:
+            print(f"\nERROR: {str(query_error)}")
+            sys.exit(1)
+        finally:
+            store.close()
+        return
+
+    if arguments.benchmark_json:
+        try:
+            run_json_benchmark(company_data_json_file_path)
+        except FileNotFoundError as file_error:
+            logger.error(LogMessages.FILE_NOT_FOUND.format(company_data_json_file_path))
+            print(f"\nFILE ERROR: {str(file_error)}")
+            sys.exit(1)
+        return
+
+    if arguments.fast_kpi:
+        try:
+            run_fast_kpi(company_data_json_file_path, arguments.verify_sample)
+        except FileNotFoundError as file_error:
+            logger.error(LogMessages.FILE_NOT_FOUND.format(company_data_json_file_path))
+            print(f"\nFILE ERROR: {str(file_error)}")
+            sys.exit(1)
+        return
+
+    if arguments.trend_dir:
+        if not os.path.isdir(arguments.trend_dir):
+            logger.error(LogMessages.FILE_NOT_FOUND.format(arguments.trend_dir))
+            print(f"\nFILE ERROR: {LogMessages.FILE_NOT_FOUND.format(arguments.trend_dir)}")
+            sys.exit(1)
+        SnapshotTrendAnalayzer(arguments.trend_dir).execute_analysis()
+        return
+
+    if arguments.staff or arguments.similar_to is not None:
+        try:
+            skills_analyzer = SkillsAnalayzer(company_data_json_file_path)
+        except FileNotFoundError as file_error:
+            logger.error(LogMessages.FILE_NOT_FOUND.format(company_data_json_file_path))
+            print(f"\nFILE ERROR: {str(file_error)}")
+            sys.exit(1)
+
+    if arguments.similar_to is not None:
+        try:
+            similarity_result = skills_analyzer.find_similar_employees(
+                arguments.similar_to,
+                top_k=arguments.similar_top_k,
+                scope=arguments.similar_scope,
+                exact=arguments.similar_exact
+            )
+        except ValueError as lookup_error:
+            print(f"\nERROR: {str(lookup_error)}")
+            sys.exit(1)
+        skills_analyzer.print_similar_employees(similarity_result)
+        return
+
+    if arguments.staff:
+        staffing_result = skills_analyzer.find_staffing_team(
+            arguments.staff,
+            max_salary_sum=arguments.max_salary_sum,
+            min_performance=arguments.min_performance,
+            objective=arguments.staff_objective
+        )
+        skills_analyzer.print_staffing_team(staffing_result)
+        return
 
     try:
+        if arguments.watch:
+            run_watch_mode(company_data_json_file_path, arguments, logger)
+            return
+
         # Initialize and execute analysis
-        analysis_orchestrator = POInfrastructureAnalysisOrchestrator(company_data_json_file_path)
+        analysis_orchestrator = POInfrastructureAnalysisOrchestrator(
+            company_data_json_file_path, arguments.chunked, arguments.memory_budget_mb, workers=arguments.workers)
         results = analysis_orchestrator.execute_comprehensive_analysis()
 
-        pdf_gen = PDFReportGenerator(
-            analysis_results=results,
-            employee_df=analysis_orchestrator.basic_static_analysis_module.po_employee_dataframe,
-            project_df=analysis_orchestrator.project_analize_module.po_project_dataframe
-        )
-        pdf_gen.save_pdf("PO_Analysis_Report.pdf")
+        if not arguments.analysis_only:
+            generate_pdf_report(results, arguments.pdf_output)
 
         print(f"\nANALYSIS COMPLETED SUCCESSFULLY!")
         print(f"Log files generated in 'logs/' directory")
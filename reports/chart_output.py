@@ -0,0 +1,179 @@
+"""
+@brief Chart output options and image cache for PDF reports
+Decides how each chart is written (vector SVG, PNG or downsampled JPEG)
+and de-duplicates chart images, so identical charts are rendered and
+stored once even when several reports include them.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from config.settings import ChartSettings
+
+
+MM_PER_INCH = 25.4
+
+
+class ChartOutputOptions:
+    """
+    @brief How a single chart is saved before embedding
+    """
+
+    def __init__(self, image_format="png", ppi=None, jpeg_quality=None):
+        """
+        @brief Initialize chart output options
+
+        @param image_format: "svg" (vector), "png" or "jpeg"
+        @param ppi: Pixels per inch of the embedded size (raster formats only)
+        @param jpeg_quality: JPEG quality 1-95 (jpeg only)
+        """
+        if image_format not in ("svg", "png", "jpeg"):
+            raise ValueError(f"Unsupported chart format: {image_format}")
+        self.image_format = image_format
+        self.ppi = ppi or ChartSettings.RASTER_PPI
+        self.jpeg_quality = jpeg_quality or ChartSettings.JPEG_QUALITY
+
+    @property
+    def suffix(self):
+        """
+        @brief File suffix of the saved image
+        """
+        return ".jpg" if self.image_format == "jpeg" else f".{self.image_format}"
+
+    def savefig_kwargs(self, fig, embed_width_mm):
+        """
+        @brief Keyword arguments for Figure.savefig
+        Raster dpi is chosen so the image has ppi pixels per inch of its
+        embedded width instead of rendering the full figure size.
+
+        @param fig: Matplotlib figure
+        @param embed_width_mm: Width of the image in the PDF
+        @return Dictionary of savefig arguments
+        """
+        if self.image_format == "svg":
+            return {"format": "svg", "metadata": {"Creator": None, "Date": None, "Format": None, "Type": None}}
+
+        figure_width_inches = fig.get_size_inches()[0]
+        dpi = self.ppi * (embed_width_mm / MM_PER_INCH) / figure_width_inches
+        kwargs = {"format": self.image_format, "dpi": dpi}
+        if self.image_format == "jpeg":
+            kwargs["pil_kwargs"] = {"quality": self.jpeg_quality, "optimize": True}
+        return kwargs
+
+    def cache_token(self):
+        """
+        @brief String identifying these options in cache keys
+        """
+        return f"{self.image_format}:{self.ppi}:{self.jpeg_quality}"
+
+
+# Simple bar and pie charts are embedded as vector drawings
+VECTOR_CHART = ChartOutputOptions("svg")
+# Dense histograms are embedded as downsampled JPEG
+DENSE_CHART = ChartOutputOptions("jpeg", ppi=ChartSettings.DENSE_RASTER_PPI)
+
+
+def chart_cache_key(*parts):
+    """
+    @brief Build cache key from the data a chart is drawn from
+
+    @param parts: Values describing the chart (arrays, labels, options)
+    @return Hex digest
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if hasattr(part, "tobytes"):
+            digest.update(part.tobytes())
+        else:
+            digest.update(repr(part).encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class ChartImageCache:
+    """
+    @brief Store of rendered chart images shared between reports
+    Looks images up by chart key (skipping rendering entirely) and by
+    content hash (so identical images map to one file).
+    """
+
+    def __init__(self, directory=None):
+        """
+        @brief Initialize cache
+
+        @param directory: Directory for image files (temporary directory if None)
+        """
+        self.owns_directory = directory is None
+        self.directory = directory or tempfile.mkdtemp(prefix="po_charts_")
+        os.makedirs(self.directory, exist_ok=True)
+        self.paths_by_key = {}
+        self.paths_by_content = {}
+        self.used_keys = set()
+
+    def get(self, key):
+        """
+        @brief Path of an already rendered chart, or None
+        """
+        path = self.paths_by_key.get(key) if key else None
+        if path is not None:
+            self.used_keys.add(key)
+        return path
+
+    def store(self, fig, options, embed_width_mm, key=None):
+        """
+        @brief Render figure once and register it in the cache
+
+        @param fig: Matplotlib figure
+        @param options: ChartOutputOptions
+        @param embed_width_mm: Width of the image in the PDF
+        @param key: Optional chart key from chart_cache_key
+        @return Path of the image file
+        """
+        handle, path = tempfile.mkstemp(suffix=options.suffix, dir=self.directory)
+        with os.fdopen(handle, "wb") as image_file:
+            fig.savefig(image_file, **options.savefig_kwargs(fig, embed_width_mm))
+
+        with open(path, "rb") as image_file:
+            content_hash = hashlib.sha256(image_file.read()).hexdigest()
+
+        existing = self.paths_by_content.get(content_hash)
+        if existing is not None:
+            os.remove(path)
+            path = existing
+        else:
+            self.paths_by_content[content_hash] = path
+
+        if key:
+            self.paths_by_key[key] = path
+            self.used_keys.add(key)
+        return path
+
+    def prune(self):
+        """
+        @brief Drop charts not requested since the previous prune
+        Keeps a long-lived cache (watch mode) from accumulating images of
+        data that has changed since.
+        """
+        self.paths_by_key = {key: path for key, path in self.paths_by_key.items() if key in self.used_keys}
+        live_paths = set(self.paths_by_key.values())
+        for content_hash, path in list(self.paths_by_content.items()):
+            if path not in live_paths:
+                del self.paths_by_content[content_hash]
+                if os.path.exists(path):
+                    os.remove(path)
+        self.used_keys.clear()
+
+    def cleanup(self):
+        """
+        @brief Remove cached files (and the directory if the cache created it)
+        """
+        if self.owns_directory:
+            shutil.rmtree(self.directory, ignore_errors=True)
+        else:
+            for path in set(self.paths_by_content.values()):
+                if os.path.exists(path):
+                    os.remove(path)
+        self.paths_by_key.clear()
+        self.paths_by_content.clear()
+        self.used_keys.clear()
@@ -0,0 +1,10 @@
+"""
+@brief Reports package for PO infrastructure analysis
+Contains report generators built on top of analysis results
+"""
+
+from .pdf_report import PDFReportGenerator
+
+__all__ = [
+    "PDFReportGenerator"
+]
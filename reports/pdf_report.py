@@ -0,0 +1,448 @@
+"""
+@brief PDF report generation module
+Renders analysis results into a PDF with charts. Imports the plotting
+and PDF stack, so it is only imported when a PDF is requested.
+Charts are standalone Figure objects rather than pyplot's global figure
+state, so reports can be rendered concurrently in several threads.
+"""
+
+import pandas as pd
+from matplotlib.figure import Figure
+from fpdf import FPDF
+from fpdf.enums import XPos, YPos
+
+from config.messages import LogMessages, ReportMessages
+from config.settings import ChartSettings, SalarySettings, EquipmentSettings
+from reports.pdf_table import PDFTableRenderer
+from reports.chart_output import ChartImageCache, ChartOutputOptions, VECTOR_CHART, DENSE_CHART, chart_cache_key
+from utils.atomic_file import write_atomic
+from utils.run_context import default_run_context
+
+class PDFReportGenerator:
+    """
+    @brief Generates a professional PDF report with charts and analysis summary.
+    """
+
+    def __init__(self, analysis_results, chart_cache=None, run_context=None):
+        """
+        @brief Initialize this function. Need results analyzers
+        Distribution charts are drawn from summaries in the results,
+        so no raw employee or project data is required here.
+
+        @param analysis_results: results analysis
+        @param chart_cache: ChartImageCache shared between reports (own cache if None)
+        @param run_context: RunContext the generator logs to (default layout if None)
+        """
+        self.analysis_results = analysis_results
+        self.logger = (run_context or default_run_context).get_logger("PDFReportGenerator")
+        
+        self.pdf = FPDF()
+        self.pdf.add_font("DejaVu", "", "DejaVuSans.ttf")
+        self.pdf.add_font("DejaVu", "B", "DejaVuSans-Bold.ttf")
+        
+        self.pdf.set_auto_page_break(auto=True, margin=15)
+        self.table_renderer = PDFTableRenderer(self.pdf)
+        self.owns_chart_cache = chart_cache is None
+        self.chart_cache = chart_cache or ChartImageCache()
+
+    def _add_page_with_title(self, title):
+        """
+        @brief Generate new page PDF with title
+
+        @param title: How you wont named this page
+        """
+        self.pdf.add_page()
+        self.pdf.set_font("DejaVu", "B", 30) 
+        x_pos = 1
+        self.pdf.set_x(x_pos)
+        self.pdf.cell(0, 10, title, ln=True, align="C")
+        self.pdf.ln(10)
+
+    def _add_chart(self, fig, title, hight, output=None, chart_data=None):
+        """
+        @brief Create image in PDF
+        The figure is laid out by the constrained layout engine instead of
+        a tight bounding box, so its size (and the raster dpi derived from
+        the embedded width) stays predictable. A chart drawn from the same
+        data with the same options is saved only once.
+
+        @param fig: Your image, whish you use
+        @param title: Name this image
+        @param hight: Hight this image
+        @param output: ChartOutputOptions (PNG if None)
+        @param chart_data: Values the chart is drawn from, used as cache key
+        """
+        output = output or ChartOutputOptions()
+        width = ChartSettings.EMBED_WIDTH_MM
+        cache_key = None
+        if chart_data is not None:
+            cache_key = chart_cache_key(title, hight, output.cache_token(), *chart_data)
+
+        image_path = self.chart_cache.get(cache_key)
+        if image_path is None:
+            fig.set_layout_engine("constrained")
+            image_path = self.chart_cache.store(fig, output, width, cache_key)
+
+        self.pdf.set_font("DejaVu", "B", 9)
+        self.pdf.cell(0, 10, title, ln=True)
+        self.pdf.ln(2)
+        self.pdf.image(image_path, h=hight, w=width)
+        self.pdf.ln(10)
+
+    def _draw_histogram(self, ax, summary, color):
+        """
+        @brief Draw histogram bars from a precomputed distribution summary
+        Values outside the fixed bin range are drawn as hatched edge bars
+        labelled with the bound they passed.
+
+        @param ax: Matplotlib axes to draw on
+        @param summary: DistributionSummary built by an analyzer
+        @param color: Bar fill color
+        """
+        histogram = summary.histogram
+        counts, edges = histogram.chart_bins()
+        if not len(counts):
+            return
+        bars = ax.bar(edges[:-1], counts, width=edges[1:] - edges[:-1], align='edge', color=color, edgecolor='black')
+
+        edge_bars = []
+        if histogram.underflow:
+            edge_bars.append((bars[0], f"< {histogram.lower:,.0f}"))
+        if histogram.overflow:
+            edge_bars.append((bars[-1], f"> {histogram.upper:,.0f}"))
+        for bar, label in edge_bars:
+            bar.set_hatch('//')
+            ax.annotate(label, (bar.get_x() + bar.get_width() / 2, bar.get_height()),
+                        ha='center', va='bottom', fontsize=8)
+
+    def generate_summary_analysis(self):
+        """
+        @brief Generate print from terminal in PDF
+        """
+        self._add_page_with_title("0. Executive Summary (Text)")
+        self.pdf.set_font("DejaVu", size=12)
+        
+        summary = self.analysis_results['summary_text']
+        for line in summary.split("\n"):
+            self.pdf.multi_cell(0, 5, line)
+            self.pdf.ln(1)
+        self.logger.info(LogMessages.PDF_PAGE_ADDED.format("Executive Summary"))
+
+    def generate_basic_statistics_charts(self):
+        """
+        @brief Generate charts for Basic Statistics.
+        """
+        self._add_page_with_title("1. Employee Statistics")
+
+        # Grafic experience, performance, salary
+        fig = Figure(figsize=(18, 5))
+        axes = fig.subplots(1, 3)
+        params = [
+            ("Experience (years)", "experience_years"),
+            ("Performance (%)", "performance_score"),
+            ("Salary (RUB)", "salary")
+        ]
+        distributions = self.analysis_results['basic_static'].distributions
+        for ax, (label, col) in zip(axes, params):
+            self._draw_histogram(ax, distributions[col], color='skyblue')
+            ax.set_title(f"Distribution of {label}")
+            ax.set_xlabel(label)
+            ax.set_ylabel("Frequency")
+        chart_data = []
+        for _, col in params:
+            histogram = distributions[col].histogram
+            chart_data += [histogram.spec, histogram.counts, histogram.underflow, histogram.overflow]
+        self._add_chart(fig, "Distributions: Experience, Performance, Salary", 60, DENSE_CHART, chart_data)
+
+        # Grafic work level
+        pos_dist = self.analysis_results['basic_static'].distribution_position.to_frame()
+        fig = Figure(figsize=(8, 8))
+        ax = fig.subplots()
+        ax.pie(pos_dist['Count'], labels=pos_dist['Category'], autopct='%1.1f%%', startangle=90)
+        ax.set_title("Position Distribution")
+        self._add_chart(fig, "Position Distribution (Junior/Middle/Senior/TeamLead)", 120, VECTOR_CHART,
+                        [pos_dist['Category'].tolist(), pos_dist['Count'].tolist()])
+        self.logger.info(LogMessages.PDF_PAGE_ADDED.format("Employee Statistics"))
+
+    def generate_finance_charts(self):
+        """
+        @brief Generate charts for Finance.
+        """
+        self._add_page_with_title("2. Financial Analysis")
+
+        # Grafic FOT budget
+        finance = self.analysis_results['finance']
+        budget_info = finance.distribution_position
+        fot = budget_info['total_fot']
+        budget = budget_info['department_budget']
+        if fot > budget:
+            sizes = [budget, fot - budget]
+            labels = ['Remaining Budget' ,'FOT (exceeds budget)']
+            colors = ['#ff9999', '#66b3ff']
+        else:
+            sizes = [fot, budget - fot]
+            labels = ['FOT', 'Remaining Budget']
+            colors = ['#ff9999', '#66b3ff']
+        fig = Figure(figsize=(8, 8))
+        ax = fig.subplots()
+        ax.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90, colors=colors)
+        ax.set_title("Budget Utilization")
+
+        self._add_chart(fig, "Department Budget Allocation", 120, VECTOR_CHART, [labels, sizes])
+
+        # Grafic top 5 employees
+        top5 = finance.top_salary.to_frame()
+        fig = Figure(figsize=(10, 6))
+        ax = fig.subplots()
+        ax.barh(top5['full_name'], top5['salary'], color='green')
+        ax.set_xlabel("Salary (RUB)")
+        ax.set_title("Top 5 Highest Salaries")
+        ax.ticklabel_format(style='plain', axis='x')
+        self._add_chart(fig, "Top 5 Highest Paid Employees", 80, VECTOR_CHART,
+                        [top5['full_name'].tolist(), top5['salary'].tolist()])
+        self.logger.info(LogMessages.PDF_PAGE_ADDED.format("Financial Analysis"))
+
+    def generate_fot_table(self):
+        """
+        @brief Generate full FOT table for all department employees
+        """
+        self._add_page_with_title("2.1 Payroll (FOT) by Employee")
+        fot_table = self.analysis_results['finance'].fot_table.to_frame()
+        self.table_renderer.render(fot_table.sort_values('FOT', ascending=False), "FOT per employee (RUB)")
+        self.logger.info(LogMessages.PDF_PAGE_ADDED.format("FOT Table"))
+
+    def generate_salary_percentile_page(self):
+        """
+        @brief Generate company-wide salary ranges per category and the outlier list
+        """
+        self._add_page_with_title("2.2 Salary Percentiles")
+        salary = self.analysis_results['salary']
+        summary = salary.category_summary.to_frame()
+
+        # Grafic P10-P90 range and median per category
+        categories = summary.index.tolist()
+        fig = Figure(figsize=(10, 6))
+        ax = fig.subplots()
+        ax.barh(categories, summary['p90'] - summary['p10'], left=summary['p10'], color='lightsteelblue',
+                label='P10 - P90')
+        ax.scatter(summary['median_salary'], categories, color='navy', zorder=3, label='Median')
+        ax.set_xlabel("Salary (RUB)")
+        ax.set_title("Company-wide Salary Range by Category")
+        ax.ticklabel_format(style='plain', axis='x')
+        ax.legend()
+        self._add_chart(fig, "Salary Range by Position Category", 80, VECTOR_CHART,
+                        [categories, summary['p10'].tolist(), summary['median_salary'].tolist(), summary['p90'].tolist()])
+
+        outliers = salary.outliers.to_frame()
+        self.pdf.set_font("DejaVu", size=9)
+        self.pdf.multi_cell(0, 6, f"Outliers (|robust z| > {salary.outlier_threshold}): {len(outliers)} "
+                                  f"of {salary.total_employees} employees")
+        if len(outliers):
+            top_outliers = outliers.head(SalarySettings.REPORT_OUTLIER_COUNT).round({'salary_percentile': 1, 'robust_z': 2})
+            self.table_renderer.render(top_outliers, "Largest salary deviations")
+        self.logger.info(LogMessages.PDF_PAGE_ADDED.format("Salary Percentiles"))
+
+    def generate_payroll_projection_page(self):
+        """
+        @brief Generate projected PO payroll against budget and the departments running out of budget
+        """
+        self._add_page_with_title("2.3 Payroll Projection")
+        payroll = self.analysis_results['payroll']
+        po_monthly = payroll.po_monthly.to_frame()
+
+        # Grafic cumulative PO payroll vs budget
+        if len(po_monthly):
+            budget = po_monthly['cumulative'] + po_monthly['budget_remaining']
+            fig = Figure(figsize=(10, 5))
+            ax = fig.subplots()
+            ax.bar(po_monthly['month'], po_monthly['cumulative'], color='steelblue', label='Cumulative payroll')
+            ax.step(po_monthly['month'], budget, where='mid', color='red', label='Budget')
+            ax.set_ylabel("RUB")
+            ax.set_title("PO Department: Cumulative Payroll vs Budget")
+            ax.ticklabel_format(style='plain', axis='y')
+            ax.tick_params(axis='x', rotation=45)
+            ax.legend()
+            self._add_chart(fig, "PO Cumulative Payroll vs Budget", 70, VECTOR_CHART,
+                            [po_monthly['month'].tolist(), po_monthly['cumulative'].tolist(), budget.tolist()])
+
+        budget_table = payroll.budget_table.to_frame()
+        exhausted = budget_table[budget_table['exhaustion_month'] != ""]
+        self.pdf.set_font("DejaVu", size=9)
+        self.pdf.multi_cell(0, 6, ReportMessages.PAYROLL_DEPARTMENTS_EXHAUSTED.format(len(exhausted), len(budget_table)))
+        if len(exhausted):
+            self.table_renderer.render(exhausted.round({'first_year_payroll': 0, 'utilization_percent': 1}),
+                                       "Departments exceeding budget")
+        self.logger.info(LogMessages.PDF_PAGE_ADDED.format("Payroll Projection"))
+
+    def generate_skill_matrix_table(self):
+        """
+        @brief Generate skill matrix table (employees vs technologies)
+        """
+        self._add_page_with_title("3.1 Skill Matrix")
+        skill_matrix = self.analysis_results['skills'].skill_matrix.to_frame()
+        self.table_renderer.render(skill_matrix, "Skill Matrix (+: has skill, -: no skill)")
+        self.logger.info(LogMessages.PDF_PAGE_ADDED.format("Skill Matrix"))
+
+    def generate_project_charts(self):
+        """
+        @brief Generate charts for Projects.
+        """
+        self._add_page_with_title("3. Project Analysis")
+
+        # Grafic status project
+        project = self.analysis_results['project']
+        status_df = project.status_project.to_frame()
+        if status_df['Count'].sum() > 0:
+            fig = Figure(figsize=(8, 8))
+            ax = fig.subplots()
+            ax.pie(status_df['Count'], labels=status_df['Status'], autopct='%1.1f%%', startangle=90)
+            ax.set_title("Project Status Distribution")
+            self._add_chart(fig, "Project Status: Active vs Closed", 120, VECTOR_CHART,
+                            [status_df['Status'].tolist(), status_df['Count'].tolist()])
+
+        # roi
+        roi_distribution = project.roi_distribution
+        if roi_distribution.count > 0:
+            fig = Figure(figsize=(10, 6))
+            ax = fig.subplots()
+            self._draw_histogram(ax, roi_distribution, color='orange')
+            ax.set_title("Distribution of Project ROI (%)")
+            ax.set_xlabel("ROI (%)")
+            ax.set_ylabel("Number of Projects")
+            self._add_chart(fig, "ROI Distribution Across Projects", 80, DENSE_CHART,
+                            [roi_distribution.histogram.spec, roi_distribution.histogram.counts,
+                             roi_distribution.histogram.underflow, roi_distribution.histogram.overflow])
+        self.logger.info(LogMessages.PDF_PAGE_ADDED.format("Project Analysis"))
+
+    def generate_recommendations_page(self):
+        """
+        @brief Generate reccommendation in PDF
+        """
+        self._add_page_with_title("4. Strategic Recommendations")
+        rec = self.analysis_results['recommendation']
+
+        self.pdf.set_font("DejaVu", "B", 10)
+        self.pdf.cell(0, 10, "Efficiency Improvement Measures:", ln=True)
+        self.pdf.set_font("DejaVu", size=8)
+        for measure in rec.efficiency_measures:
+            self.pdf.multi_cell(0, 6, f"• {measure}")
+        self.pdf.ln(5)
+
+        self.pdf.set_font("DejaVu", "B", 10)
+        self.pdf.cell(0, 10, "Training Needs:", ln=True)
+        self.pdf.set_font("DejaVu", size=8)
+        for need in rec.training_needs:
+            self.pdf.multi_cell(0, 6, f"• {need}")
+        self.pdf.ln(5)
+
+        self.pdf.set_font("DejaVu", "B", 10)
+        self.pdf.cell(0, 10, "Productivity Impact (+10%):", ln=True)
+        self.pdf.set_font("DejaVu", size=8)
+        impact = rec.productivity_impact
+        if impact.available:
+            self.pdf.cell(0, 6, f"• Estimated FOT savings: {impact.fot_savings_potential:,.0f} RUB",
+                          new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            if impact.fot_savings_interval is not None:
+                low, high = impact.fot_savings_interval
+                self.pdf.cell(0, 6, f"• {ReportMessages.FOT_SAVINGS_RANGE.format(impact.confidence, low, high)}",
+                              new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        else:
+            self.pdf.multi_cell(0, 6, "• Insufficient data for impact calculation.")
+        self.logger.info(LogMessages.PDF_PAGE_ADDED.format("Strategic Recommendations"))
+
+    def generate_equipment_page(self):
+        """
+        @brief Generate equipment utilization, maintenance costs and warranty status per department
+        """
+        self._add_page_with_title("5. Equipment")
+        equipment = self.analysis_results['equipment']
+        departments = equipment.department_equipment.to_frame()
+
+        self.pdf.set_font("DejaVu", size=9)
+        self.pdf.multi_cell(0, 6, f"{ReportMessages.AVERAGE_UTILIZATION.format(equipment.average_utilization)}; "
+                                  f"{ReportMessages.MONTHLY_MAINTENANCE_COST.format(equipment.monthly_maintenance_cost)} RUB")
+
+        # Grafic utilization and maintenance costs per department
+        if len(departments):
+            labels = departments.index.astype(str).tolist()
+            fig = Figure(figsize=(10, 6))
+            utilization_ax, cost_ax = fig.subplots(2, 1, sharex=True)
+            utilization_ax.bar(labels, departments['average_utilization'], color='teal')
+            utilization_ax.set_ylabel("Utilization (%)")
+            utilization_ax.set_title("Equipment Utilization and Maintenance Costs by Department")
+            cost_ax.bar(labels, departments['maintenance_cost_per_month'], color='darkorange')
+            cost_ax.set_ylabel("RUB per month")
+            cost_ax.set_xlabel("Department ID")
+            cost_ax.ticklabel_format(style='plain', axis='y')
+            self._add_chart(fig, "Utilization and Maintenance Costs by Department", 80, VECTOR_CHART,
+                            [labels, departments['average_utilization'].tolist(),
+                             departments['maintenance_cost_per_month'].tolist()])
+
+        self.pdf.multi_cell(0, 6, ReportMessages.EQUIPMENT_WARRANTY.format(
+            equipment.warranty_expired_count, equipment.warranty_horizon_days, equipment.warranty_expiring_count))
+        warranty = departments[['department_name', 'equipment_count', 'warranty_expired', 'warranty_expiring']]
+        self.table_renderer.render(warranty[(warranty['warranty_expired'] > 0) | (warranty['warranty_expiring'] > 0)],
+                                   "Warranty status by department")
+
+        overdue = equipment.overdue_maintenance.to_frame()
+        self.pdf.multi_cell(0, 6, ReportMessages.EQUIPMENT_OVERDUE.format(equipment.as_of, equipment.overdue_count))
+        if len(overdue):
+            top_overdue = overdue.head(EquipmentSettings.REPORT_OVERDUE_COUNT).assign(
+                next_maintenance_date=lambda frame: pd.to_datetime(frame['next_maintenance_date']).dt.date)
+            self.table_renderer.render(top_overdue, "Most overdue maintenance")
+        self.logger.info(LogMessages.PDF_PAGE_ADDED.format("Equipment"))
+
+    def save_pdf(self, output_path="PO_Analysis_Report.pdf"):
+        """
+        @brief Save this beatifully PDF
+        The file is replaced atomically, so readers never see a partial report.
+        """
+        try:
+            self.pdf.add_page()
+            self.pdf.set_font("DejaVu", size=30)
+            title = "PO Department Analysis Report"
+            title_width = self.pdf.get_string_width(title)
+            x_pos = (self.pdf.w - title_width) / 2
+            self.pdf.set_x(x_pos)
+            self.pdf.cell(0, 30, title, ln=True)
+
+            self.pdf.set_font("DejaVu", size=10)
+            subtitle = "Comprehensive analysis of employees, finances, projects, and skills"
+            subtitle_width = self.pdf.get_string_width(subtitle)
+            x_pos = (self.pdf.w - subtitle_width) / 2
+            self.pdf.set_x(x_pos)
+            self.pdf.cell(0, 10, subtitle, ln=True)
+
+            self.pdf.ln(10)
+            date_str = f"Generated on: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M')}"
+            date_width = self.pdf.get_string_width(date_str)
+            x_pos = (self.pdf.w - date_width) / 2
+            self.pdf.set_x(x_pos)
+            self.pdf.cell(0, 10, date_str, ln=True)
+
+            self.pdf.ln(20)
+
+            # All generation (modules skipped in chunked mode have no page)
+            self.generate_summary_analysis()
+            self.generate_basic_statistics_charts()
+            self.generate_finance_charts()
+            self.generate_fot_table()
+            if 'salary' in self.analysis_results:
+                self.generate_salary_percentile_page()
+            if 'payroll' in self.analysis_results:
+                self.generate_payroll_projection_page()
+            self.generate_project_charts()
+            if 'skills' in self.analysis_results:
+                self.generate_skill_matrix_table()
+            if 'recommendation' in self.analysis_results:
+                self.generate_recommendations_page()
+            self.generate_equipment_page()
+
+            write_atomic(output_path, bytes(self.pdf.output()))
+            self.logger.info(LogMessages.PDF_SAVED.format(output_path))
+            print(f"\nPDF report saved as: {output_path}")
+
+        finally:
+            if self.owns_chart_cache:
+                self.chart_cache.cleanup()
+                self.logger.info(LogMessages.TEMP_FILES_CLEANED)
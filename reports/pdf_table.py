@@ -0,0 +1,202 @@
+"""
+@brief Paginated table rendering for PDF reports
+Lays out large DataFrames across pages with repeated headers. Column
+widths are measured once per table and rows are converted to text and
+written in fixed-size chunks, so build time is linear in the number of
+rows and only one chunk of formatted text is held at a time.
+"""
+
+import math
+from fpdf.enums import XPos, YPos
+
+
+class PDFTableRenderer:
+    """
+    @brief Streams DataFrame rows into an FPDF document as a table
+    """
+
+    # Rows converted to strings at once
+    CHUNK_ROWS = 500
+    # Rows sampled per column (longest by character count) when measuring widths
+    MEASURE_SAMPLE = 5
+    # Minimal column width in mm
+    MIN_COLUMN_WIDTH = 8
+    # Truncated texts remembered per table (bounds memory for unique values)
+    FIT_CACHE_SIZE = 10000
+
+    def __init__(self, pdf, font_family="DejaVu", font_size=7, row_height=5):
+        """
+        @brief Initialize renderer for an FPDF document
+
+        @param pdf: FPDF instance to render into
+        @param font_family: Registered font family
+        @param font_size: Font size for header and body
+        @param row_height: Height of one table row in mm
+        """
+        self.pdf = pdf
+        self.font_family = font_family
+        self.font_size = font_size
+        self.row_height = row_height
+        self._fit_cache = {}
+
+    def _measure_columns(self, dataframe):
+        """
+        @brief Compute column widths once for the whole table
+        Each column is as wide as its header or its longest sampled values,
+        scaled down proportionally to fit the page width.
+
+        @param dataframe: Table to measure
+        @return List of widths in mm
+        """
+        padding = 2 * self.pdf.c_margin
+        widths = []
+        for column in dataframe.columns:
+            self.pdf.set_font(self.font_family, "B", self.font_size)
+            width = self.pdf.get_string_width(str(column))
+
+            self.pdf.set_font(self.font_family, "", self.font_size)
+            values = dataframe[column].astype(str)
+            if len(values):
+                longest = values.str.len().nlargest(self.MEASURE_SAMPLE).index
+                width = max([width] + [self.pdf.get_string_width(value) for value in values.loc[longest]])
+            widths.append(max(self.MIN_COLUMN_WIDTH, width + padding))
+
+        return widths
+
+    def _column_groups(self, widths):
+        """
+        @brief Fit columns to the page width
+        Widths are scaled down proportionally when that keeps every column
+        above MIN_COLUMN_WIDTH; otherwise columns are split into groups
+        rendered one after another, each repeating the first column.
+
+        @param widths: Measured widths
+        @return List of (column positions, widths) groups
+        """
+        available = self.pdf.epw
+        total = sum(widths)
+        if total <= available:
+            return [(list(range(len(widths))), widths)]
+
+        scaled = [width * available / total for width in widths]
+        if min(scaled) >= self.MIN_COLUMN_WIDTH:
+            return [(list(range(len(widths))), scaled)]
+
+        widths = [min(width, available / 2) for width in widths]
+        groups = []
+        current = [0]
+        used = widths[0]
+        for position in range(1, len(widths)):
+            if used + widths[position] > available and len(current) > 1:
+                groups.append(current)
+                current = [0]
+                used = widths[0]
+            current.append(position)
+            used += widths[position]
+        groups.append(current)
+        return [(group, [widths[position] for position in group]) for group in groups]
+
+    def _character_limits(self, widths):
+        """
+        @brief Number of characters that always fit into each column
+        Based on the widest glyph, so most cells skip per-cell measurement.
+        """
+        self.pdf.set_font(self.font_family, "", self.font_size)
+        widest_glyph = max(self.pdf.get_string_width(glyph) for glyph in "WШЖЮМ@")
+        padding = 2 * self.pdf.c_margin
+        return [max(1, math.floor((width - padding) / widest_glyph)) for width in widths]
+
+    def _fit_text(self, text, width, safe_length):
+        """
+        @brief Truncate text with an ellipsis if it does not fit the column
+        Texts not longer than safe_length are returned without measuring.
+        """
+        if len(text) <= safe_length:
+            return text
+        cached = self._fit_cache.get((text, width))
+        if cached is not None:
+            return cached
+
+        fitted = text
+        available = width - 2 * self.pdf.c_margin
+        if self.pdf.get_string_width(text) > available:
+            shortest, longest = 0, len(text) - 1
+            while shortest < longest:
+                middle = (shortest + longest + 1) // 2
+                if self.pdf.get_string_width(text[:middle] + "…") <= available:
+                    shortest = middle
+                else:
+                    longest = middle - 1
+            fitted = text[:shortest] + "…"
+
+        if len(self._fit_cache) >= self.FIT_CACHE_SIZE:
+            self._fit_cache.clear()
+        self._fit_cache[(text, width)] = fitted
+        return fitted
+
+    def _needs_page_break(self, height):
+        """
+        @brief Check whether an element of given height overflows the page
+        """
+        return self.pdf.y + height > self.pdf.page_break_trigger
+
+    def _draw_header(self, headers, widths):
+        """
+        @brief Draw table header row
+        """
+        self.pdf.set_font(self.font_family, "B", self.font_size)
+        self.pdf.set_fill_color(220, 220, 220)
+        for header, width in zip(headers, widths):
+            self.pdf.cell(width, self.row_height, header, border=1, align="C", fill=True)
+        self.pdf.ln(self.row_height)
+        self.pdf.set_font(self.font_family, "", self.font_size)
+
+    def _render_columns(self, dataframe, widths):
+        """
+        @brief Stream rows of a column group in chunks
+
+        @param dataframe: Table restricted to the group's columns
+        @param widths: Column widths in mm
+        """
+        safe_lengths = self._character_limits(widths)
+        headers = [self._fit_text(str(column), width, limit)
+                   for column, width, limit in zip(dataframe.columns, widths, safe_lengths)]
+
+        if self._needs_page_break(2 * self.row_height):
+            self.pdf.add_page()
+        self._draw_header(headers, widths)
+
+        for offset in range(0, len(dataframe), self.CHUNK_ROWS):
+            chunk = dataframe.iloc[offset:offset + self.CHUNK_ROWS].astype(str).to_numpy()
+            for row in chunk:
+                if self._needs_page_break(self.row_height):
+                    self.pdf.add_page()
+                    self._draw_header(headers, widths)
+                for text, width, limit in zip(row, widths, safe_lengths):
+                    self.pdf.cell(width, self.row_height, self._fit_text(text, width, limit), border=1)
+                self.pdf.ln(self.row_height)
+        self.pdf.ln(3)
+
+    def render(self, dataframe, title=None):
+        """
+        @brief Render DataFrame as a table starting at current position
+        Adds pages as needed and repeats the header on each new page.
+
+        @param dataframe: Table to render
+        @param title: Optional caption printed above the table
+        @return Number of rendered rows
+        """
+        if title:
+            self.pdf.set_font(self.font_family, "B", 9)
+            self.pdf.cell(0, 10, title, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+
+        if dataframe is None or dataframe.empty:
+            return 0
+
+        self._fit_cache.clear()
+        measured = self._measure_columns(dataframe)
+        for positions, widths in self._column_groups(measured):
+            self._render_columns(dataframe.iloc[:, positions], widths)
+
+        self.pdf.ln(5)
+        return len(dataframe)
@@ -0,0 +1,61 @@
+"""
+@brief Atomic replacement of output files
+Outputs are written to a temporary file in the target directory and
+moved over the target with os.replace, so readers (e.g. a wallboard
+polling the shared volume) see either the previous or the new file,
+never a partially written one.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+DEFAULT_FILE_MODE = 0o644
+
+
+@contextmanager
+def atomic_output(path, mode="w", encoding=None):
+    """
+    @brief Open a temporary file that replaces path when the block succeeds
+    On error the temporary file is removed and path is left untouched.
+    The new file keeps the permissions of the file it replaces.
+
+    @param path: Target file path
+    @param mode: "w" (text) or "wb" (binary)
+    @param encoding: Text encoding (text mode only)
+    @return File object to write to
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(descriptor, mode, encoding=encoding) as output_file:
+            yield output_file
+            output_file.flush()
+            os.fsync(output_file.fileno())
+        try:
+            file_mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            file_mode = DEFAULT_FILE_MODE
+        os.chmod(temporary_path, file_mode)
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+
+def write_atomic(path, content, encoding="utf-8"):
+    """
+    @brief Atomically replace a file with text or bytes
+
+    @param path: Target file path
+    @param content: str or bytes-like content
+    @param encoding: Encoding of text content
+    """
+    if isinstance(content, str):
+        with atomic_output(path, "w", encoding=encoding) as output_file:
+            output_file.write(content)
+    else:
+        with atomic_output(path, "wb") as output_file:
+            output_file.write(content)
@@ -0,0 +1,350 @@
+"""
+@brief Memory-mapped binary snapshot of company.json
+A snapshot is a directory with fixed-width numeric columns stored as
+structured NumPy arrays (.npy), dictionary-encoded strings in a shared
+UTF-8 pool and a JSON manifest. Arrays are opened with mmap_mode='r', so
+loading is near-instant and processes on one host share pages through
+the OS page cache.
+"""
+
+import json
+import os
+import numpy as np
+import pandas as pd
+from utils.data_loader import load_company_data
+
+
+SNAPSHOT_FORMAT = "po-binary-snapshot"
+SNAPSHOT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+
+# Dictionary code of a missing (null) string
+NULL_CODE = -1
+
+EMPLOYEE_STRING_COLUMNS = ["full_name", "gender", "email", "phone", "address", "department_name", "position"]
+EMPLOYEE_COLUMN_ORDER = [
+    "employee_id", "full_name", "gender", "birth_date", "email", "phone", "address",
+    "department_id", "department_name", "position", "salary", "hire_date",
+    "experience_years", "performance_score", "skills", "is_team_lead"
+]
+PROJECT_STRING_COLUMNS = ["project_id", "name", "description", "status"]
+PROJECT_COLUMN_ORDER = ["project_id", "name", "description", "status", "budget", "profit", "roi_percentage"]
+DEPARTMENT_STRING_COLUMNS = ["name", "type"]
+DEPARTMENT_COLUMN_ORDER = ["id", "name", "type", "budget"]
+EQUIPMENT_STRING_COLUMNS = ["equipment_id", "name", "type", "department_name", "status"]
+EQUIPMENT_COLUMN_ORDER = [
+    "equipment_id", "name", "type", "department_id", "department_name", "purchase_date", "cost",
+    "warranty_end_date", "status", "efficiency_percentage", "maintenance_cost_per_month",
+    "last_maintenance_date", "next_maintenance_date", "hours_used_daily", "utilization_rate"
+]
+
+
+def is_binary_snapshot(path):
+    """
+    @brief Check whether path points to a binary snapshot directory
+    """
+    return os.path.isdir(path) and os.path.isfile(os.path.join(path, MANIFEST_FILE))
+
+
+def _numeric_dtype(values):
+    """
+    @brief int64 when every value is integral, float64 otherwise
+    Keeps the dtypes pandas would infer from the JSON records.
+    """
+    return np.int64 if all(isinstance(v, (int, bool)) for v in values) else np.float64
+
+
+class _StringPool:
+    """
+    @brief Collects per-column string dictionaries into one UTF-8 blob
+    """
+
+    def __init__(self):
+        self.encoded = []
+        self.ranges = {}
+
+    def encode(self, name, values):
+        """
+        @brief Dictionary-encode values of a column
+
+        @param name: Dictionary name, e.g. "employees.position"
+        @param values: Sequence of strings (missing values get NULL_CODE)
+        @return int32 codes into the column dictionary
+        """
+        codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=True)
+        start = len(self.encoded)
+        self.encoded.extend(str(value).encode("utf-8") for value in uniques)
+        self.ranges[name] = [start, len(self.encoded)]
+        return codes.astype(np.int32)
+
+    def save(self, directory):
+        """
+        @brief Write pool blob and offsets
+        """
+        lengths = np.fromiter((len(item) for item in self.encoded), dtype=np.int64, count=len(self.encoded))
+        offsets = np.zeros(len(self.encoded) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        blob = np.frombuffer(b"".join(self.encoded), dtype=np.uint8)
+        np.save(os.path.join(directory, "strings_blob.npy"), blob)
+        np.save(os.path.join(directory, "strings_offsets.npy"), offsets)
+
+
+def _frame_columns(pool, table_name, frame, column_order, string_columns):
+    """
+    @brief {name: (dtype, values)} of validated frame columns
+    Text columns are dictionary-encoded into pool, dates stored as
+    datetime64[us]; numeric columns keep the dtype the validator gave them.
+
+    @param pool: _StringPool receiving the text columns
+    @param table_name: Table name prefixing the dictionary names
+    @param frame: Validated DataFrame of the section
+    @param column_order: Columns to store (list columns are stored separately)
+    @param string_columns: Columns stored as dictionary codes
+    """
+    columns = {}
+    for column in column_order:
+        values = frame[column]
+        if column in string_columns:
+            columns[column] = (np.int32, pool.encode(f"{table_name}.{column}", values.tolist()))
+        elif values.dtype.kind == "M":
+            columns[column] = ("datetime64[us]", values.to_numpy("datetime64[us]"))
+        elif values.dtype.kind in "iufb":
+            columns[column] = (values.dtype, values.to_numpy())
+        else:
+            # Empty sections come without inferred dtypes
+            columns[column] = (_numeric_dtype(values.tolist()), values.tolist())
+    return columns
+
+
+def _structured_table(columns):
+    """
+    @brief Build structured array from {name: (dtype, values)}
+    """
+    names = list(columns)
+    length = len(next(iter(columns.values()))[1]) if columns else 0
+    table = np.zeros(length, dtype=[(name, columns[name][0]) for name in names])
+    for name in names:
+        table[name] = columns[name][1]
+    return table
+
+
+def convert_to_binary_snapshot(json_file_path, output_directory):
+    """
+    @brief Convert company.json into a binary snapshot directory
+    Only valid records are converted; invalid ones are quarantined.
+
+    @param json_file_path: Source JSON file
+    @param output_directory: Directory to create (existing files are overwritten)
+    @return Path of the snapshot directory
+    """
+    company_data = load_company_data(json_file_path)
+
+    os.makedirs(output_directory, exist_ok=True)
+    pool = _StringPool()
+
+    frames = company_data.frames
+    department_columns = _frame_columns(pool, "departments", frames["departments"],
+                                        DEPARTMENT_COLUMN_ORDER, DEPARTMENT_STRING_COLUMNS)
+
+    employees = frames["employees"]
+    employee_columns = _frame_columns(pool, "employees", employees,
+                                      [column for column in EMPLOYEE_COLUMN_ORDER if column != "skills"],
+                                      EMPLOYEE_STRING_COLUMNS)
+    employee_columns["performance_score"] = (np.float64, employee_columns["performance_score"][1])
+
+    skill_lists = [skills or [] for skills in employees["skills"].tolist()]
+    skill_offsets = np.zeros(len(skill_lists) + 1, dtype=np.int64)
+    np.cumsum([len(skills) for skills in skill_lists], out=skill_offsets[1:])
+    skill_codes = pool.encode("employees.skills", [skill for skills in skill_lists for skill in skills])
+
+    projects = frames["projects"]
+    project_columns = _frame_columns(pool, "projects", projects, PROJECT_COLUMN_ORDER, PROJECT_STRING_COLUMNS)
+
+    links = [(index, d["department_id"], d.get("budget_allocation") or 0)
+             for index, allocations in enumerate(projects["participating_departments"].tolist()) for d in allocations]
+    link_columns = {
+        "project_index":        (np.int64, [link[0] for link in links]),
+        "department_id":        (np.int64, [link[1] for link in links]),
+        "budget_allocation":    (_numeric_dtype([link[2] for link in links]), [link[2] for link in links]),
+    }
+
+    equipment = frames["equipment"]
+    equipment_columns = _frame_columns(pool, "equipment", equipment, EQUIPMENT_COLUMN_ORDER, EQUIPMENT_STRING_COLUMNS)
+
+    tables = {
+        "departments": _structured_table(department_columns),
+        "employees": _structured_table(employee_columns),
+        "employee_skill_offsets": skill_offsets,
+        "employee_skill_codes": skill_codes,
+        "projects": _structured_table(project_columns),
+        "project_departments": _structured_table(link_columns),
+    }
+    if len(equipment):
+        tables["equipment"] = _structured_table(equipment_columns)
+    for name, table in tables.items():
+        np.save(os.path.join(output_directory, f"{name}.npy"), table)
+    pool.save(output_directory)
+
+    manifest = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "source": os.path.basename(json_file_path),
+        "metadata": company_data.data.get("metadata", {}),
+        "tables": sorted(tables),
+        "dictionaries": pool.ranges
+    }
+    with open(os.path.join(output_directory, MANIFEST_FILE), "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, ensure_ascii=False, indent=2)
+
+    return output_directory
+
+
+class BinarySnapshot:
+    """
+    @brief Read-only, memory-mapped view of a binary snapshot
+    Builds the same DataFrames BaseAnalyzer builds from JSON records.
+    """
+
+    def __init__(self, snapshot_directory):
+        """
+        @brief Open snapshot and memory-map its arrays
+
+        @param snapshot_directory: Directory created by convert_to_binary_snapshot
+        """
+        self.snapshot_directory = snapshot_directory
+        with open(os.path.join(snapshot_directory, MANIFEST_FILE), "r", encoding="utf-8") as manifest_file:
+            self.manifest = json.load(manifest_file)
+
+        if self.manifest.get("format") != SNAPSHOT_FORMAT or self.manifest.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot format in {snapshot_directory}")
+
+        self.tables = {name: self._map(name) for name in self.manifest["tables"]}
+        self.strings_blob = self._map("strings_blob")
+        self.strings_offsets = self._map("strings_offsets")
+
+    def _map(self, name):
+        """
+        @brief Memory-map one .npy array
+        """
+        return np.load(os.path.join(self.snapshot_directory, f"{name}.npy"), mmap_mode="r")
+
+    @property
+    def metadata(self):
+        """
+        @brief metadata block of the source JSON
+        """
+        return self.manifest["metadata"]
+
+    def decode(self, dictionary, codes):
+        """
+        @brief Decode dictionary codes into an object array of strings
+        Only the distinct codes present are decoded.
+
+        @param dictionary: Dictionary name, e.g. "employees.position"
+        @param codes: Array of codes
+        @return numpy object array of strings (None for NULL_CODE)
+        """
+        start, _ = self.manifest["dictionaries"][dictionary]
+        unique_codes, inverse = np.unique(np.asarray(codes), return_inverse=True)
+        offsets = self.strings_offsets
+        decoded = [
+            None if code == NULL_CODE else
+            bytes(self.strings_blob[offsets[start + code]:offsets[start + code + 1]]).decode("utf-8")
+            for code in unique_codes.tolist()
+        ]
+        return np.asarray(decoded, dtype=object)[inverse] if decoded else np.empty(0, dtype=object)
+
+    def _frame(self, table_name, rows, string_columns, column_order):
+        """
+        @brief Build DataFrame from selected rows of a structured table
+        """
+        table = self.tables[table_name][rows]
+        columns = {}
+        for name in column_order:
+            if name in string_columns:
+                columns[name] = self.decode(f"{table_name}.{name}", table[name])
+            elif name in table.dtype.names:
+                columns[name] = np.asarray(table[name])
+        return pd.DataFrame(columns, columns=[name for name in column_order if name in columns])
+
+    def department_dataframe(self):
+        """
+        @brief All departments (id, name, type, budget)
+        """
+        rows = np.arange(len(self.tables["departments"]))
+        return self._frame("departments", rows, DEPARTMENT_STRING_COLUMNS, DEPARTMENT_COLUMN_ORDER)
+
+    def employee_dataframe(self, department_id=None, rows=None):
+        """
+        @brief Employees, optionally filtered by department or row positions
+        The department filter runs on the mapped array before any string
+        is decoded.
+
+        @param department_id: Department to keep (None keeps all)
+        @param rows: Row positions to keep (overrides department_id)
+        @return DataFrame with the same columns as BaseAnalyzer's employee frame
+        """
+        employees = self.tables["employees"]
+        if rows is not None:
+            rows = np.asarray(rows, dtype=np.int64)
+        elif department_id is None:
+            rows = np.arange(len(employees))
+        else:
+            rows = np.flatnonzero(employees["department_id"] == department_id)
+
+        frame = self._frame("employees", rows, EMPLOYEE_STRING_COLUMNS, EMPLOYEE_COLUMN_ORDER)
+        frame.insert(EMPLOYEE_COLUMN_ORDER.index("skills"), "skills", self._skill_lists(rows))
+        return frame
+
+    def employee_skill_csr(self):
+        """
+        @brief Skills of all employees as CSR arrays
+
+        @return Tuple (offsets, dictionary codes, dictionary of skill names)
+        """
+        start, end = self.manifest["dictionaries"]["employees.skills"]
+        dictionary = self.decode("employees.skills", np.arange(end - start))
+        return (np.asarray(self.tables["employee_skill_offsets"]),
+                np.asarray(self.tables["employee_skill_codes"]),
+                dictionary.tolist())
+
+    def _skill_lists(self, rows):
+        """
+        @brief Rebuild per-employee skill lists from CSR arrays
+        """
+        offsets = self.tables["employee_skill_offsets"]
+        starts = np.asarray(offsets[rows])
+        lengths = np.asarray(offsets[rows + 1]) - starts
+        bounds = np.cumsum(lengths)
+        selected = np.arange(bounds[-1] if len(bounds) else 0) + np.repeat(starts - (bounds - lengths), lengths)
+        names = self.decode("employees.skills", np.asarray(self.tables["employee_skill_codes"][selected])).tolist()
+        return [names[end - length:end] for end, length in zip(bounds.tolist(), lengths.tolist())]
+
+    def project_dataframe(self):
+        """
+        @brief All projects (project_id, name, description, status, budget, profit, roi_percentage)
+        """
+        rows = np.arange(len(self.tables["projects"]))
+        return self._frame("projects", rows, PROJECT_STRING_COLUMNS, PROJECT_COLUMN_ORDER)
+
+    def equipment_dataframe(self):
+        """
+        @brief All equipment (EQUIPMENT_COLUMN_ORDER), empty for snapshots without equipment
+        """
+        if "equipment" not in self.tables:
+            return pd.DataFrame(columns=EQUIPMENT_COLUMN_ORDER)
+        rows = np.arange(len(self.tables["equipment"]))
+        return self._frame("equipment", rows, EQUIPMENT_STRING_COLUMNS, EQUIPMENT_COLUMN_ORDER)
+
+    def project_department_links(self):
+        """
+        @brief Project-department link table indexed by department_id
+        """
+        links = self.tables["project_departments"]
+        project_ids = self.decode("projects.project_id", self.tables["projects"]["project_id"])
+        frame = pd.DataFrame({
+            "project_id": project_ids[np.asarray(links["project_index"])] if len(links) else np.empty(0, dtype=object),
+            "department_id": np.asarray(links["department_id"]),
+            "budget_allocation": np.asarray(links["budget_allocation"])
+        })
+        return frame.set_index("department_id").sort_index(kind="stable")
@@ -0,0 +1,169 @@
+"""
+@brief Compact columnar tables for analysis results
+Results hand tables to the summary, the PDF builder and other processes.
+A ColumnTable keeps one numpy array per column: numeric, boolean and
+datetime columns are taken from the source frame without copying, text
+columns are dictionary encoded (small integer codes plus the distinct
+values), so a result costs kilobytes to pickle or cache instead of the
+size of an object DataFrame. to_frame() rebuilds the DataFrame for
+display.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from utils.result_codec import register_result_type
+
+
+@register_result_type
+@dataclass(slots=True, frozen=True)
+class DictionaryColumn:
+    """
+    @brief Dictionary encoded text column
+    """
+
+    codes: np.ndarray
+    labels: np.ndarray
+    dtype: str
+
+    @classmethod
+    def encode(cls, values):
+        """
+        @brief Encode a Series (missing values get code -1)
+        """
+        codes, labels = pd.factorize(values, use_na_sentinel=True)
+        code_dtype = np.int16 if len(labels) < np.iinfo(np.int16).max else np.int32
+        return cls(codes.astype(code_dtype, copy=False), np.asarray(labels, dtype=object), str(values.dtype))
+
+    def decode(self):
+        """
+        @brief Values as an array of the original dtype
+        """
+        values = pd.Categorical.from_codes(self.codes, categories=pd.Index(self.labels, dtype=object))
+        return pd.Series(values).astype(self.dtype).array
+
+    def __len__(self):
+        return len(self.codes)
+
+
+def _encode_column(values):
+    """
+    @brief Column array of a Series: zero-copy numpy view or DictionaryColumn
+    """
+    if isinstance(values.dtype, np.dtype) and values.dtype != object:
+        return values.to_numpy(copy=False)
+    return DictionaryColumn.encode(values)
+
+
+def _decode_column(column):
+    """
+    @brief Inverse of _encode_column
+    """
+    return column.decode() if isinstance(column, DictionaryColumn) else column
+
+
+@register_result_type
+@dataclass(slots=True, frozen=True)
+class ColumnTable:
+    """
+    @brief Immutable table stored column by column
+    """
+
+    columns: tuple
+    values: tuple
+    row_count: int
+    index: object = None
+    index_name: str = None
+
+    @classmethod
+    def from_frame(cls, frame, columns=None, keep_index=False):
+        """
+        @brief Build a table from DataFrame columns
+
+        @param frame: Source DataFrame
+        @param columns: Columns to take (all if None)
+        @param keep_index: Keep the frame's index (e.g. department_id); a
+                           default positional index is rebuilt otherwise
+        @return ColumnTable
+        """
+        columns = tuple(frame.columns if columns is None else columns)
+        index = index_name = None
+        if keep_index:
+            index = _encode_column(frame.index.to_series())
+            index_name = frame.index.name
+        return cls(columns, tuple(_encode_column(frame[column]) for column in columns), len(frame), index, index_name)
+
+    def column(self, name):
+        """
+        @brief Values of one column
+        """
+        return _decode_column(self.values[self.columns.index(name)])
+
+    def to_frame(self):
+        """
+        @brief DataFrame with the table's columns (and index, if kept)
+        """
+        index = None
+        if self.index is not None:
+            index = pd.Index(_decode_column(self.index), name=self.index_name)
+        frame = pd.DataFrame({column: _decode_column(values) for column, values in zip(self.columns, self.values)},
+                             index=index)
+        if not self.columns:
+            frame = pd.DataFrame(index=index if index is not None else pd.RangeIndex(self.row_count))
+        return frame
+
+    def __len__(self):
+        return self.row_count
+
+
+@register_result_type
+@dataclass(slots=True, frozen=True)
+class SkillMatrix:
+    """
+    @brief Employees x skills presence matrix in CSR form
+    Stores, per employee, the codes of the skills the employee has; the
+    '+'/'-' table is only materialized for display.
+    """
+
+    names: np.ndarray
+    skills: tuple
+    offsets: np.ndarray
+    codes: np.ndarray
+
+    NAME_COLUMN = "ФИО"
+
+    @classmethod
+    def build(cls, names, skill_lists):
+        """
+        @brief Build matrix from employee names and raw skill lists
+        Skills are the sorted distinct names over all employees.
+
+        @param names: Employee full names (matrix rows)
+        @param skill_lists: Skill list of every employee (non-lists count as none)
+        @return SkillMatrix
+        """
+        skill_sets = [set(skills) if isinstance(skills, list) else set() for skills in skill_lists]
+        skills = sorted(set().union(*skill_sets))
+        code_by_skill = {skill: code for code, skill in enumerate(skills)}
+        offsets = np.zeros(len(skill_sets) + 1, dtype=np.int64)
+        np.cumsum([len(skill_set) for skill_set in skill_sets], out=offsets[1:])
+        codes = np.fromiter((code_by_skill[skill] for skill_set in skill_sets for skill in skill_set),
+                            dtype=np.int32, count=int(offsets[-1]))
+        return cls(np.asarray(names, dtype=object), tuple(skills), offsets, codes)
+
+    def to_frame(self):
+        """
+        @brief '+'/'-' DataFrame with the name column first (empty if there are no skills)
+        """
+        if not len(self.names) or not self.skills:
+            return pd.DataFrame()
+        cells = np.full((len(self.names), len(self.skills)), '-', dtype=object)
+        cells[np.repeat(np.arange(len(self.names)), np.diff(self.offsets)), self.codes] = '+'
+        frame = pd.DataFrame(cells, columns=list(self.skills))
+        frame.insert(0, self.NAME_COLUMN, self.names)
+        return frame
+
+    def __len__(self):
+        return len(self.names)
@@ -0,0 +1,345 @@
+"""
+@brief Shared validating loader for company JSON files
+The file is parsed and validated once; every analyzer created for the
+same unchanged file reuses the result instead of reparsing it. Invalid
+departments, employees and projects are written to a quarantine file
+with their reasons and left out of the data, so one malformed record no
+longer aborts the run.
+
+ChunkedCompanyData is the out-of-core variant: every section except
+employees is loaded as usual, while employees are validated and handed
+out in chunks sized from a memory budget.
+"""
+
+import json
+import os
+import threading
+import time
+from itertools import islice
+
+from config.messages import LogMessages, ErrorMessages
+from config.settings import IngestionSettings, ChunkedExecutionSettings
+from utils.atomic_file import write_atomic
+from utils.input_formats import input_format, iter_ndjson_records, read_company_document
+from utils.json_decoder import JSONDecoder
+from utils.run_context import default_run_context
+from utils.record_validation import RecordValidator, DEPARTMENT_FIELDS, EMPLOYEE_FIELDS, PROJECT_FIELDS, EQUIPMENT_FIELDS
+
+
+# Section -> (validator, key field reported in the quarantine file)
+SECTION_VALIDATORS = {
+    "departments": (RecordValidator(DEPARTMENT_FIELDS), "id"),
+    "employees": (RecordValidator(EMPLOYEE_FIELDS), "employee_id"),
+    "projects": (RecordValidator(PROJECT_FIELDS), "project_id"),
+    "equipment": (RecordValidator(EQUIPMENT_FIELDS), "equipment_id"),
+}
+
+# Last loaded file: (path, size, mtime) -> CompanyData
+_loaded = {}
+_loaded_lock = threading.Lock()
+
+
+class CompanyData:
+    """
+    @brief Validated company document
+    """
+
+    def __init__(self, data, frames, quarantined):
+        """
+        @brief Initialize validated document
+
+        @param data: Parsed document with invalid records removed from validated sections
+        @param frames: Section name -> DataFrame of the valid records (same order as data)
+        @param quarantined: List of quarantine entries (section, position, key, reasons, record)
+        """
+        self.data = data
+        self.frames = frames
+        self.quarantined = quarantined
+
+
+def _file_key(json_file_path):
+    """
+    @brief Identity of the file content used for sharing loads
+    """
+    file_stat = os.stat(json_file_path)
+    return os.path.realpath(json_file_path), file_stat.st_size, file_stat.st_mtime_ns
+
+
+def _write_quarantine(quarantined, quarantine_path):
+    """
+    @brief Replace the quarantine file with the entries of the last load
+    The file is rewritten (empty when all records are valid), so it always
+    describes the current data.
+    """
+    directory = os.path.dirname(quarantine_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    write_atomic(quarantine_path, "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in quarantined))
+
+
+def _quarantine_entries(section, key_field, records, invalid, first_position=0):
+    """
+    @brief Quarantine file entries for invalid records of a section
+
+    @param section: Section name
+    @param key_field: Field identifying a record
+    @param records: Raw records the positions of invalid refer to
+    @param invalid: List of (position, reasons)
+    @param first_position: Position of records[0] within the section
+    @return List of quarantine entries
+    """
+    entries = []
+    for position, reasons in invalid:
+        record = records[position]
+        entries.append({
+            "section": section,
+            "position": first_position + position,
+            "key": record.get(key_field) if isinstance(record, dict) else None,
+            "reasons": reasons,
+            "record": record
+        })
+    return entries
+
+
+def _check_invalid_fraction(section, invalid_count, record_count, first_reasons):
+    """
+    @brief Abort the load when too many records of a section are invalid
+    """
+    if record_count and invalid_count / record_count > IngestionSettings.MAX_INVALID_FRACTION:
+        raise ValueError(ErrorMessages.TOO_MANY_INVALID_RECORDS.format(
+            invalid_count, record_count, section, first_reasons))
+
+
+def validate_company_data(data, logger=None):
+    """
+    @brief Validate the record sections of a parsed company document
+
+    @param data: Parsed company JSON document
+    @param logger: Optional logger for per-section statistics
+    @return CompanyData
+    """
+    if not isinstance(data, dict):
+        raise ValueError(ErrorMessages.DATA_VALIDATION_ERROR.format("top-level JSON value is not an object"))
+
+    validated = dict(data)
+    frames = {}
+    quarantined = []
+    for section, (validator, key_field) in SECTION_VALIDATORS.items():
+        records = data.get(section) or []
+        if not isinstance(records, list):
+            raise ValueError(ErrorMessages.DATA_VALIDATION_ERROR.format(f"section '{section}' is not a list"))
+
+        started = time.perf_counter()
+        frames[section], valid_positions, invalid = validator.validate(records)
+        elapsed = time.perf_counter() - started
+        if logger is not None:
+            logger.info(LogMessages.RECORDS_VALIDATED.format(len(records), section, elapsed, len(invalid)))
+
+        if invalid:
+            _check_invalid_fraction(section, len(invalid), len(records), invalid[0][1])
+            validated[section] = [records[position] for position in valid_positions]
+            quarantined += _quarantine_entries(section, key_field, records, invalid)
+
+    return CompanyData(validated, frames, quarantined)
+
+
+def _record_quarantine(company_data, file_key, run_context, logger):
+    """
+    @brief Write the quarantine file of a run once per loaded file
+    """
+    if run_context.quarantine_source == file_key:
+        return
+    _write_quarantine(company_data.quarantined, run_context.quarantine_path)
+    if company_data.quarantined:
+        logger.warning(LogMessages.RECORDS_QUARANTINED.format(len(company_data.quarantined), run_context.quarantine_path))
+    run_context.quarantine_source = file_key
+
+
+def write_run_quarantine(quarantined, run_context=None):
+    """
+    @brief Replace the run's quarantine file with entries validated outside load_company_data
+    Used by inputs spanning several files, such as a directory of snapshots.
+
+    @param quarantined: List of quarantine entries
+    @param run_context: RunContext receiving the quarantine file (default layout if None)
+    @return Path of the quarantine file
+    """
+    run_context = run_context or default_run_context
+    _write_quarantine(quarantined, run_context.quarantine_path)
+    # The file no longer describes a single loaded data file
+    run_context.quarantine_source = None
+    return run_context.quarantine_path
+
+
+def load_company_data(json_file_path, run_context=None, skip_sections=()):
+    """
+    @brief Parse and validate a company JSON file, reusing the last load
+    The result is shared (also between concurrent runs) while the file's
+    path, size and modification time are unchanged; callers must not
+    modify it. A load leaving sections out is private to its caller and
+    only made when no shared load of the file exists.
+
+    @param json_file_path: Path to company data file (JSON or NDJSON, optionally gzip/zstd compressed)
+    @param run_context: RunContext receiving logs and the quarantine file (default layout if None)
+    @param skip_sections: Sections the caller never reads (e.g. employees); NDJSON never holds them in memory
+    @return CompanyData (without frames for skip_sections when freshly loaded)
+    """
+    run_context = run_context or default_run_context
+    logger = run_context.get_logger("CompanyDataLoader")
+    file_key = _file_key(json_file_path)
+    with _loaded_lock:
+        company_data = _loaded.get(file_key)
+    if company_data is not None:
+        _record_quarantine(company_data, file_key, run_context, logger)
+        return company_data
+
+    decoder = JSONDecoder(IngestionSettings.JSON_BACKEND)
+    started = time.perf_counter()
+    data = read_company_document(json_file_path, decoder, skip_sections=skip_sections)
+    logger.info(LogMessages.JSON_DECODED.format(json_file_path, decoder.backend, time.perf_counter() - started))
+    if decoder.fallbacks:
+        logger.warning(LogMessages.JSON_BACKEND_FALLBACK.format(decoder.backend, json_file_path))
+    company_data = validate_company_data(data, logger)
+    if skip_sections:
+        for section in skip_sections:
+            company_data.frames.pop(section, None)
+        # Its quarantine file misses the skipped sections, so a later full load rewrites it
+        _record_quarantine(company_data, file_key + (tuple(skip_sections),), run_context, logger)
+        logger.info(LogMessages.SECTIONS_SKIPPED.format(", ".join(skip_sections), json_file_path))
+        return company_data
+    _record_quarantine(company_data, file_key, run_context, logger)
+
+    with _loaded_lock:
+        _loaded.clear()
+        _loaded[file_key] = company_data
+    return company_data
+
+
+def register_company_data(file_key, company_data, run_context=None):
+    """
+    @brief Make a document validated elsewhere the shared load of a file
+    Used by worker processes attached to frames published by the parent:
+    later load_company_data calls for the unchanged file return it without
+    parsing, and the run's quarantine file (already written by the parent)
+    is left alone.
+
+    @param file_key: Identity of the file the document was loaded from
+    @param company_data: CompanyData
+    @param run_context: RunContext whose quarantine file is up to date (default layout if None)
+    """
+    run_context = run_context or default_run_context
+    with _loaded_lock:
+        _loaded.clear()
+        _loaded[file_key] = company_data
+    run_context.quarantine_source = file_key
+
+
+def forget_company_data(file_key):
+    """
+    @brief Drop the shared load of a file, if it is the current one
+    """
+    with _loaded_lock:
+        _loaded.pop(file_key, None)
+
+
+class ChunkedCompanyData:
+    """
+    @brief Company data with employees streamed in bounded chunks
+    NDJSON inputs are read twice (context sections, then employees), so
+    employee records are never all in memory. A single JSON document can
+    only be decoded whole; its employees are still validated and analyzed
+    chunk by chunk, which bounds the DataFrame side.
+    """
+
+    SECTION = "employees"
+
+    def __init__(self, json_file_path, memory_budget_mb=None, run_context=None):
+        """
+        @brief Load and validate every section except employees
+
+        @param json_file_path: Path to company data file
+        @param memory_budget_mb: Memory budget of one chunk (defaults to settings)
+        @param run_context: RunContext receiving logs and the quarantine file (default layout if None)
+        """
+        self.json_file_path = json_file_path
+        self.memory_budget_mb = memory_budget_mb or ChunkedExecutionSettings.MEMORY_BUDGET_MB
+        self.run_context = run_context or default_run_context
+        self.logger = self.run_context.get_logger("CompanyDataLoader")
+        self.decoder = JSONDecoder(IngestionSettings.JSON_BACKEND)
+        self.chunk_size = None
+
+        layout, _ = input_format(json_file_path)
+        streamed = layout == "ndjson"
+        document = read_company_document(json_file_path, self.decoder,
+                                         skip_sections=(self.SECTION,) if streamed else ())
+        if not isinstance(document, dict):
+            raise ValueError(ErrorMessages.DATA_VALIDATION_ERROR.format("top-level JSON value is not an object"))
+        self._records = None if streamed else (document.pop(self.SECTION, None) or [])
+
+        context = validate_company_data(document, self.logger)
+        self.data = context.data
+        self.frames = {name: frame for name, frame in context.frames.items() if name != self.SECTION}
+        self.quarantined = context.quarantined
+
+    def _employee_records(self):
+        """
+        @brief Iterator over raw employee records in file order
+        """
+        if self._records is not None:
+            return iter(self._records)
+        return iter_ndjson_records(self.json_file_path, self.SECTION, self.decoder)
+
+    def _select_chunk_size(self, probe_frame):
+        """
+        @brief Records per chunk fitting the memory budget
+
+        @param probe_frame: Validated DataFrame of the first records
+        @return Number of records per chunk
+        """
+        row_bytes = probe_frame.memory_usage(deep=True).sum() / max(len(probe_frame), 1)
+        record_bytes = max(row_bytes * ChunkedExecutionSettings.WORKING_SET_FACTOR, 1.0)
+        chunk_size = max(ChunkedExecutionSettings.MIN_CHUNK_RECORDS,
+                         int(self.memory_budget_mb * 2 ** 20 // record_bytes))
+        self.logger.info(LogMessages.CHUNK_SIZE_SELECTED.format(
+            self.SECTION, chunk_size, record_bytes, self.memory_budget_mb))
+        return chunk_size
+
+    def employee_chunks(self):
+        """
+        @brief Validated employee DataFrames, one per chunk
+        The first chunk is a small probe used to size the others. Invalid
+        records are quarantined as in load_company_data once the last
+        chunk has been read.
+
+        @return Generator of DataFrames with EMPLOYEE_FIELDS columns
+        """
+        validator, key_field = SECTION_VALIDATORS[self.SECTION]
+        records = self._employee_records()
+        quarantined = []
+        first_reasons = None
+        record_count = 0
+        chunk_count = 0
+
+        batch = list(islice(records, ChunkedExecutionSettings.PROBE_RECORDS))
+        while batch:
+            frame, _, invalid = validator.validate(batch)
+            if invalid:
+                quarantined += _quarantine_entries(self.SECTION, key_field, batch, invalid, record_count)
+                first_reasons = first_reasons or invalid[0][1]
+            if self.chunk_size is None:
+                self.chunk_size = self._select_chunk_size(frame)
+            record_count += len(batch)
+            chunk_count += 1
+            del batch
+            yield frame
+            batch = list(islice(records, self.chunk_size))
+
+        self.logger.info(LogMessages.CHUNKS_PROCESSED.format(self.SECTION, record_count, chunk_count))
+        if quarantined:
+            _check_invalid_fraction(self.SECTION, len(quarantined), record_count, first_reasons)
+
+        all_quarantined = self.quarantined + quarantined
+        quarantine_path = self.run_context.quarantine_path
+        _write_quarantine(all_quarantined, quarantine_path)
+        if all_quarantined:
+            self.logger.warning(LogMessages.RECORDS_QUARANTINED.format(len(all_quarantined), quarantine_path))
@@ -0,0 +1,421 @@
+"""
+@brief Mergeable distribution summaries for charts and percentile reports
+Provides fixed-bin histograms and a KLL quantile sketch that can be built
+independently by workers or shards and combined without shipping raw rows.
+"""
+
+import math
+import numpy as np
+from config.settings import DistributionSettings
+
+
+class FixedBinHistogram:
+    """
+    @brief Histogram with bin edges fixed in advance
+    Two histograms with the same spec merge exactly by adding their counts.
+    Values outside [lower, upper] are tallied as underflow/overflow.
+    """
+
+    def __init__(self, lower, upper, bin_count, counts=None, underflow=0, overflow=0):
+        """
+        @brief Initialize an empty (or pre-filled) histogram
+
+        @param lower: Left edge of the first bin
+        @param upper: Right edge of the last bin (inclusive)
+        @param bin_count: Number of equal-width bins
+        @param counts: Optional existing bin counts
+        @param underflow: Number of values below lower
+        @param overflow: Number of values above upper
+        """
+        if upper <= lower or bin_count <= 0:
+            raise ValueError(f"Invalid histogram spec: ({lower}, {upper}, {bin_count})")
+
+        self.lower = float(lower)
+        self.upper = float(upper)
+        self.bin_count = int(bin_count)
+        self.counts = np.zeros(self.bin_count, dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+        self.underflow = int(underflow)
+        self.overflow = int(overflow)
+
+    @property
+    def spec(self):
+        """
+        @brief Bin specification tuple used for compatibility checks
+        """
+        return (self.lower, self.upper, self.bin_count)
+
+    @property
+    def edges(self):
+        """
+        @brief Bin edges as array of length bin_count + 1
+        """
+        return np.linspace(self.lower, self.upper, self.bin_count + 1)
+
+    @property
+    def total(self):
+        """
+        @brief Total number of values seen, including out-of-range ones
+        """
+        return int(self.counts.sum()) + self.underflow + self.overflow
+
+    def update(self, values):
+        """
+        @brief Add a batch of values to the histogram
+
+        @param values: Array-like of numbers (NaN values are ignored)
+        @return self
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+
+        below = values < self.lower
+        above = values > self.upper
+        self.underflow += int(below.sum())
+        self.overflow += int(above.sum())
+
+        in_range = values[~(below | above)]
+        width = (self.upper - self.lower) / self.bin_count
+        bin_index = ((in_range - self.lower) / width).astype(np.int64)
+        np.clip(bin_index, 0, self.bin_count - 1, out=bin_index)
+        self.counts += np.bincount(bin_index, minlength=self.bin_count)
+        return self
+
+    def merge(self, other):
+        """
+        @brief Merge another histogram with identical spec into this one
+
+        @param other: FixedBinHistogram with the same lower/upper/bin_count
+        @return self
+        """
+        if self.spec != other.spec:
+            raise ValueError(f"Cannot merge histograms with different specs: {self.spec} vs {other.spec}")
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        return self
+
+    def chart_bins(self, target_bins=None):
+        """
+        @brief Counts and edges prepared for plotting
+        Drops empty leading/trailing bins and joins neighbouring bins
+        so that roughly target_bins bars remain. Underflow and overflow
+        become one extra bar (one bar wide) before the first and after the
+        last bin; those edge bars are open-ended, their outer edge only
+        places the bar.
+
+        @param target_bins: Desired number of bars (defaults to settings)
+        @return Tuple (counts, edges)
+        """
+        target_bins = target_bins or DistributionSettings.CHART_BINS
+        edges = self.edges
+        if self.total == 0:
+            return np.zeros(0, dtype=np.int64), edges[:1]
+
+        non_empty = np.flatnonzero(self.counts)
+        if non_empty.size:
+            first, last = non_empty[0], non_empty[-1] + 1
+        elif self.underflow and self.overflow:
+            first, last = 0, self.bin_count
+        else:
+            first = last = self.bin_count if self.overflow else 0
+        counts = self.counts[first:last]
+        edges = edges[first:last + 1]
+
+        factor = max(1, math.ceil(len(counts) / target_bins))
+        width = (self.upper - self.lower) / self.bin_count
+        pad = (-len(counts)) % factor
+        if pad:
+            counts = np.concatenate([counts, np.zeros(pad, dtype=np.int64)])
+            edges = np.concatenate([edges, edges[-1] + width * np.arange(1, pad + 1)])
+
+        counts = counts.reshape(-1, factor).sum(axis=1)
+        edges = edges[::factor]
+
+        bar_width = width * factor
+        if self.underflow:
+            counts = np.concatenate([[self.underflow], counts])
+            edges = np.concatenate([[edges[0] - bar_width], edges])
+        if self.overflow:
+            counts = np.concatenate([counts, [self.overflow]])
+            edges = np.concatenate([edges, [edges[-1] + bar_width]])
+        return counts, edges
+
+    def to_dict(self):
+        """
+        @brief Serialize histogram into plain Python types
+        """
+        return {
+            "lower": self.lower,
+            "upper": self.upper,
+            "bin_count": self.bin_count,
+            "counts": self.counts.tolist(),
+            "underflow": self.underflow,
+            "overflow": self.overflow
+        }
+
+    @classmethod
+    def from_dict(cls, payload):
+        """
+        @brief Restore histogram produced by to_dict
+        """
+        return cls(payload["lower"], payload["upper"], payload["bin_count"],
+                   counts=payload["counts"], underflow=payload["underflow"], overflow=payload["overflow"])
+
+
+class KLLSketch:
+    """
+    @brief KLL quantile sketch
+    Keeps a hierarchy of compactors; an item stored at level h stands for
+    2**h original values. While fewer than k values were seen nothing is
+    compacted and quantiles are exact.
+    """
+
+    def __init__(self, k=None):
+        """
+        @brief Initialize an empty sketch
+
+        @param k: Capacity of the top compactor (defaults to settings)
+        """
+        self.k = int(k or DistributionSettings.SKETCH_K)
+        self.compactors = [np.zeros(0, dtype=np.float64)]
+        self.offsets = [0]
+        self.count = 0
+        self.min_value = math.inf
+        self.max_value = -math.inf
+
+    def _capacity(self, level):
+        """
+        @brief Capacity of compactor at given level
+        Lower levels get geometrically smaller capacities (factor 2/3).
+        """
+        depth = len(self.compactors) - level - 1
+        return max(2, int(math.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def _compress(self):
+        """
+        @brief Compact every level that exceeds its capacity
+        Half of the sorted items (alternating odd/even positions between
+        compactions) are promoted to the next level with doubled weight.
+        """
+        level = 0
+        while level < len(self.compactors):
+            items = self.compactors[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.compactors):
+                    self.compactors.append(np.zeros(0, dtype=np.float64))
+                    self.offsets.append(0)
+
+                items = np.sort(items)
+                kept = items[-1:] if len(items) % 2 else items[:0]
+                paired = items[:len(items) - len(kept)]
+
+                offset = self.offsets[level]
+                self.offsets[level] ^= 1
+
+                self.compactors[level + 1] = np.concatenate([self.compactors[level + 1], paired[offset::2]])
+                self.compactors[level] = kept
+            level += 1
+
+    def update(self, values):
+        """
+        @brief Add a batch of values to the sketch
+
+        @param values: Array-like of numbers (NaN values are ignored)
+        @return self
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+
+        self.count += int(values.size)
+        self.min_value = min(self.min_value, float(values.min()))
+        self.max_value = max(self.max_value, float(values.max()))
+        self.compactors[0] = np.concatenate([self.compactors[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """
+        @brief Merge another sketch into this one
+
+        @param other: KLLSketch built with the same k
+        @return self
+        """
+        if self.k != other.k:
+            raise ValueError(f"Cannot merge sketches with different k: {self.k} vs {other.k}")
+
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append(np.zeros(0, dtype=np.float64))
+            self.offsets.append(0)
+        for level, items in enumerate(other.compactors):
+            self.compactors[level] = np.concatenate([self.compactors[level], items])
+
+        self.count += other.count
+        self.min_value = min(self.min_value, other.min_value)
+        self.max_value = max(self.max_value, other.max_value)
+        self._compress()
+        return self
+
+    def quantiles(self, fractions):
+        """
+        @brief Estimate quantiles for the given fractions
+        Uses the inverted CDF definition: the smallest retained item whose
+        cumulative weight reaches fraction * count.
+
+        @param fractions: Iterable of floats in [0, 1]
+        @return numpy array of quantile values (NaN when sketch is empty)
+        """
+        fractions = np.asarray(list(fractions), dtype=np.float64)
+        if self.count == 0:
+            return np.full(fractions.shape, np.nan)
+
+        items = np.concatenate(self.compactors)
+        weights = np.concatenate([np.full(len(c), 2 ** level, dtype=np.int64)
+                                  for level, c in enumerate(self.compactors)])
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        cumulative = np.cumsum(weights[order])
+
+        targets = fractions * cumulative[-1]
+        positions = np.searchsorted(cumulative, targets, side="left")
+        np.clip(positions, 0, len(items) - 1, out=positions)
+
+        result = items[positions]
+        result[fractions <= 0] = self.min_value
+        result[fractions >= 1] = self.max_value
+        return result
+
+    def to_dict(self):
+        """
+        @brief Serialize sketch into plain Python types
+        """
+        return {
+            "k": self.k,
+            "count": self.count,
+            "min": self.min_value,
+            "max": self.max_value,
+            "compactors": [c.tolist() for c in self.compactors],
+            "offsets": list(self.offsets)
+        }
+
+    @classmethod
+    def from_dict(cls, payload):
+        """
+        @brief Restore sketch produced by to_dict
+        """
+        sketch = cls(payload["k"])
+        sketch.count = payload["count"]
+        sketch.min_value = payload["min"]
+        sketch.max_value = payload["max"]
+        sketch.compactors = [np.asarray(c, dtype=np.float64) for c in payload["compactors"]]
+        sketch.offsets = list(payload["offsets"])
+        return sketch
+
+
+class DistributionSummary:
+    """
+    @brief Histogram plus quantile sketch for one numeric column
+    Used by analyzers to hand distributions to the report without raw data.
+    """
+
+    def __init__(self, column, histogram=None, sketch=None):
+        """
+        @brief Initialize summary for a configured column
+
+        @param column: Column name, must be present in DistributionSettings.HISTOGRAM_BINS
+        @param histogram: Optional existing FixedBinHistogram
+        @param sketch: Optional existing KLLSketch
+        """
+        self.column = column
+        self.histogram = histogram or FixedBinHistogram(*DistributionSettings.HISTOGRAM_BINS[column])
+        self.sketch = sketch or KLLSketch()
+
+    @property
+    def count(self):
+        """
+        @brief Number of values summarized
+        """
+        return self.sketch.count
+
+    def update(self, values):
+        """
+        @brief Add a batch of values to histogram and sketch
+        """
+        self.histogram.update(values)
+        self.sketch.update(values)
+        return self
+
+    def merge(self, other):
+        """
+        @brief Merge summary of the same column built elsewhere
+        """
+        if self.column != other.column:
+            raise ValueError(f"Cannot merge summaries of '{self.column}' and '{other.column}'")
+        self.histogram.merge(other.histogram)
+        self.sketch.merge(other.sketch)
+        return self
+
+    def percentiles(self, fractions=None):
+        """
+        @brief Percentiles as dictionary {fraction: value}
+
+        @param fractions: Iterable of fractions (defaults to settings)
+        """
+        fractions = tuple(fractions or DistributionSettings.REPORT_PERCENTILES)
+        return dict(zip(fractions, self.sketch.quantiles(fractions).tolist()))
+
+    def to_dict(self):
+        """
+        @brief Serialize summary into plain Python types
+        """
+        return {
+            "column": self.column,
+            "histogram": self.histogram.to_dict(),
+            "sketch": self.sketch.to_dict()
+        }
+
+    @classmethod
+    def from_dict(cls, payload):
+        """
+        @brief Restore summary produced by to_dict
+        """
+        return cls(payload["column"],
+                   histogram=FixedBinHistogram.from_dict(payload["histogram"]),
+                   sketch=KLLSketch.from_dict(payload["sketch"]))
+
+
+def build_distribution_summaries(dataframe, columns):
+    """
+    @brief Build summaries for several columns of a DataFrame
+
+    @param dataframe: Source DataFrame
+    @param columns: Column names configured in DistributionSettings
+    @return Dictionary column -> DistributionSummary
+    """
+    summaries = {}
+    for column in columns:
+        summary = DistributionSummary(column)
+        if column in dataframe:
+            summary.update(dataframe[column].to_numpy(dtype=np.float64, na_value=np.nan))
+        summaries[column] = summary
+    return summaries
+
+
+def merge_distribution_summaries(summary_dicts):
+    """
+    @brief Combine per-shard summary dictionaries column by column
+
+    @param summary_dicts: Iterable of {column: DistributionSummary}
+    @return Dictionary column -> merged DistributionSummary
+    """
+    merged = {}
+    for summaries in summary_dicts:
+        for column, summary in summaries.items():
+            if column in merged:
+                merged[column].merge(summary)
+            else:
+                merged[column] = DistributionSummary.from_dict(summary.to_dict())
+    return merged
@@ -0,0 +1,109 @@
+"""
+@brief Change detection for the company data file
+Polls the file's size and modification time; once a change has stayed
+stable for one poll (so an upload in progress is not read), the file
+is read and every top-level section (employees, projects, departments,
+...) is fingerprinted by a content hash. Only sections whose hash
+differs are reported as changed, so touching the file or rewriting it
+with the same content triggers nothing. Polling is used instead of
+inotify because change events are not delivered reliably on network
+shares.
+"""
+
+import hashlib
+import io
+import json
+import os
+
+from config.settings import IngestionSettings
+from utils.input_formats import read_company_document
+from utils.json_decoder import JSONDecoder
+
+
+def _digest(content):
+    """
+    @brief Content hash of bytes
+    """
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def section_fingerprints(content, file_path):
+    """
+    @brief Content hash of every top-level section of a JSON document
+    Sections are re-serialized canonically, so formatting changes and key
+    reordering inside a section do not count as changes.
+
+    @param content: Raw file bytes
+    @param file_path: Path of the file (selects layout and compression)
+    @return Dictionary section name -> hash
+    """
+    document = read_company_document(file_path, JSONDecoder(IngestionSettings.JSON_BACKEND), io.BytesIO(content))
+    if not isinstance(document, dict):
+        raise ValueError("Top-level JSON value is not an object")
+    return {
+        name: _digest(json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        for name, value in document.items()
+    }
+
+
+class SectionChangeDetector:
+    """
+    @brief Reports which top-level sections of a JSON file changed
+    """
+
+    def __init__(self, file_path):
+        """
+        @brief Fingerprint the current file content
+
+        @param file_path: Path to the watched JSON file
+        """
+        self.file_path = file_path
+        self.file_state = self._stat()
+        self.pending_state = self.file_state
+        with open(file_path, "rb") as data_file:
+            content = data_file.read()
+        self.file_digest = _digest(content)
+        self.sections = section_fingerprints(content, file_path)
+
+    def _stat(self):
+        """
+        @brief (size, mtime) of the file, or None while it does not exist
+        """
+        try:
+            file_stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+        return file_stat.st_size, file_stat.st_mtime_ns
+
+    def poll(self):
+        """
+        @brief Check the file once
+        A changed file is read only when its size and mtime are the same as
+        on the previous poll. Invalid JSON (e.g. a truncated upload) raises
+        ValueError; the file is read again after its next modification.
+
+        @return Set of changed section names (empty if nothing changed)
+        """
+        state = self._stat()
+        if state is None or state == self.file_state:
+            return set()
+        if state != self.pending_state:
+            self.pending_state = state
+            return set()
+
+        with open(self.file_path, "rb") as data_file:
+            content = data_file.read()
+        if self._stat() != state:
+            return set()
+
+        self.file_state = state
+        digest = _digest(content)
+        if digest == self.file_digest:
+            return set()
+
+        sections = section_fingerprints(content, self.file_path)
+        changed = {name for name in sections.keys() | self.sections.keys()
+                   if sections.get(name) != self.sections.get(name)}
+        self.file_digest = digest
+        self.sections = sections
+        return changed
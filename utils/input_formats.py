@@ -0,0 +1,168 @@
+"""
+@brief Compressed and newline-delimited company data inputs
+Besides plain company.json, gzip (.gz) and zstd (.zst) archives are read
+with decompression streamed straight into the decoder, so no decompressed
+copy is written to disk. The NDJSON layout (.ndjson / .jsonl) holds one
+tagged line per record:
+
+    {"section": "employees", "record": {...}}    appended to a list section
+    {"section": "metadata", "value": {...}}      a whole non-list section
+
+NDJSON lines are decoded in bounded chunks, so only one chunk of raw
+text is held in memory next to the decoded records.
+"""
+
+import gzip
+import io
+from contextlib import contextmanager
+from itertools import islice
+
+from config.settings import IngestionSettings
+
+
+COMPRESSIONS = {".gz": "gzip", ".zst": "zstd"}
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+
+def input_format(file_path):
+    """
+    @brief Layout and compression of an input file, from its suffixes
+
+    @param file_path: Path to the input file
+    @return Tuple (layout "json" or "ndjson", compression name or None)
+    """
+    name = str(file_path).lower()
+    compression = None
+    for suffix, compression_name in COMPRESSIONS.items():
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+            compression = compression_name
+    layout = "ndjson" if name.endswith(NDJSON_SUFFIXES) else "json"
+    return layout, compression
+
+
+def is_plain_json(file_path):
+    """
+    @brief Whether a file is an uncompressed single JSON document
+    """
+    return input_format(file_path) == ("json", None)
+
+
+@contextmanager
+def open_input(file_path, stream=None):
+    """
+    @brief Binary stream of the decompressed content of an input file
+
+    @param file_path: Path to the input file (also selects the compression)
+    @param stream: Optional already open binary stream of the raw file content
+    @return Readable binary stream
+    """
+    _, compression = input_format(file_path)
+    raw_stream = open(file_path, "rb") if stream is None else stream
+    try:
+        if compression == "gzip":
+            with gzip.GzipFile(fileobj=raw_stream, mode="rb") as decompressed:
+                yield decompressed
+        elif compression == "zstd":
+            try:
+                import zstandard
+            except ImportError as import_error:
+                raise ValueError(f"Reading {file_path} requires the zstandard package") from import_error
+            # stream_reader yields raw chunks; buffering restores efficient line iteration
+            with io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(raw_stream),
+                                   buffer_size=IngestionSettings.READ_BUFFER_BYTES) as decompressed:
+                yield decompressed
+        else:
+            yield raw_stream
+    finally:
+        if stream is None:
+            raw_stream.close()
+
+
+def _ndjson_entries(stream, decoder):
+    """
+    @brief Decode tagged NDJSON lines chunk by chunk
+
+    @param stream: Binary stream of NDJSON lines
+    @param decoder: JSONDecoder used for every line
+    @return Generator of (line number, section, entry)
+    """
+    line_number = 0
+    while True:
+        chunk = list(islice(stream, IngestionSettings.NDJSON_CHUNK_LINES))
+        if not chunk:
+            return
+        for line in chunk:
+            line_number += 1
+            if not line.strip():
+                continue
+            entry = decoder.loads(line)
+            if not isinstance(entry, dict) or not isinstance(entry.get("section"), str):
+                raise ValueError(f"NDJSON line {line_number}: expected an object with a \"section\" tag")
+            yield line_number, entry["section"], entry
+
+
+def _read_ndjson(stream, decoder, skip_sections=()):
+    """
+    @brief Assemble a company document from tagged NDJSON lines
+
+    @param stream: Binary stream of NDJSON lines
+    @param decoder: JSONDecoder used for every line
+    @param skip_sections: Sections whose lines are dropped
+    @return Company document dictionary
+    """
+    document = {}
+    for line_number, section, entry in _ndjson_entries(stream, decoder):
+        if section in skip_sections:
+            continue
+        if "record" in entry:
+            records = document.setdefault(section, [])
+            if not isinstance(records, list):
+                raise ValueError(f"NDJSON line {line_number}: section '{section}' mixes records and a value")
+            records.append(entry["record"])
+        elif "value" in entry:
+            if section in document:
+                raise ValueError(f"NDJSON line {line_number}: section '{section}' is already defined")
+            document[section] = entry["value"]
+        else:
+            raise ValueError(f"NDJSON line {line_number}: expected \"record\" or \"value\"")
+    return document
+
+
+def read_company_document(file_path, decoder, stream=None, skip_sections=()):
+    """
+    @brief Decode a company document from any supported input format
+
+    @param file_path: Path to the input file (selects layout and compression)
+    @param decoder: JSONDecoder instance
+    @param stream: Optional already open binary stream of the raw file content
+    @param skip_sections: Sections left out of the result (NDJSON never holds them in memory)
+    @return Decoded document
+    """
+    layout, _ = input_format(file_path)
+    with open_input(file_path, stream) as content:
+        if layout == "ndjson":
+            return _read_ndjson(content, decoder, skip_sections)
+        document = decoder.loads(content.read())
+    if isinstance(document, dict):
+        for section in skip_sections:
+            document.pop(section, None)
+    return document
+
+
+def iter_ndjson_records(file_path, section, decoder):
+    """
+    @brief Stream the records of one section of an NDJSON input
+
+    @param file_path: Path to an NDJSON input (optionally compressed)
+    @param section: Section whose records are yielded
+    @param decoder: JSONDecoder instance
+    @return Generator of raw records in file order
+    """
+    with open_input(file_path) as content:
+        for line_number, entry_section, entry in _ndjson_entries(content, decoder):
+            if entry_section != section:
+                continue
+            if "record" not in entry:
+                raise ValueError(f"NDJSON line {line_number}: section '{section}' expects \"record\" lines")
+            yield entry["record"]
@@ -0,0 +1,122 @@
+"""
+@brief Pluggable JSON decoding backends
+Files are read as bytes and decoded by the fastest available backend:
+orjson when installed, the stdlib json module otherwise. Decoding UTF-8
+bytes directly avoids the text-mode decode pass, which is slow for
+Cyrillic-heavy exports. Documents a fast backend refuses (NaN literals,
+integers beyond 64 bits, non UTF-8 encodings) are decoded again with the
+stdlib, so every backend yields the same records.
+"""
+
+import json
+import time
+
+
+JSON_BACKENDS = ("orjson", "stdlib")
+
+
+def _orjson_loads():
+    """
+    @brief orjson.loads, or None if orjson is not installed
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson.loads
+
+
+_BACKEND_LOADERS = {
+    "orjson": _orjson_loads,
+    "stdlib": lambda: json.loads,
+}
+
+
+def available_backends():
+    """
+    @brief Installed backends, fastest first
+    """
+    return [name for name in JSON_BACKENDS if _BACKEND_LOADERS[name]() is not None]
+
+
+class JSONDecoder:
+    """
+    @brief Decoder bound to one backend with stdlib fallback
+    """
+
+    def __init__(self, backend="auto"):
+        """
+        @brief Select backend
+
+        @param backend: "auto" (fastest installed) or a name from JSON_BACKENDS
+        """
+        if backend == "auto":
+            backend = available_backends()[0]
+        if backend not in _BACKEND_LOADERS:
+            raise ValueError(f"Unknown JSON backend: {backend}")
+        loads = _BACKEND_LOADERS[backend]()
+        if loads is None:
+            raise ValueError(f"JSON backend is not installed: {backend}")
+        self.backend = backend
+        self._loads = loads
+        self.fallbacks = 0
+
+    def loads(self, content):
+        """
+        @brief Decode a JSON document
+
+        @param content: bytes (or str) of the document
+        @return Decoded value
+        """
+        if self.backend == "stdlib":
+            return json.loads(content)
+        try:
+            return self._loads(content)
+        except ValueError:
+            # The stdlib decides: it accepts what the fast backend refused or raises the real error
+            self.fallbacks += 1
+            return json.loads(content)
+
+    def load_file(self, json_file_path):
+        """
+        @brief Read a file as bytes and decode it
+
+        @param json_file_path: Path to a JSON file
+        @return Decoded value
+        """
+        with open(json_file_path, "rb") as json_file:
+            return self.loads(json_file.read())
+
+
+def benchmark_backends(json_file_path, repeats=3):
+    """
+    @brief Time every installed backend on one file
+    The file is read once; only decoding is timed (best of repeats).
+
+    @param json_file_path: Path to a JSON file
+    @param repeats: Timed runs per backend
+    @return List of dicts (backend, seconds, megabytes_per_second, identical)
+            where identical compares the result with the stdlib result
+    """
+    with open(json_file_path, "rb") as json_file:
+        content = json_file.read()
+
+    reference = None
+    results = []
+    for backend in reversed(available_backends()):
+        decoder = JSONDecoder(backend)
+        best = float("inf")
+        for _ in range(repeats):
+            started = time.perf_counter()
+            decoded = decoder.loads(content)
+            best = min(best, time.perf_counter() - started)
+        if reference is None:
+            reference = decoded
+        results.append({
+            "backend": backend,
+            "seconds": best,
+            "megabytes_per_second": len(content) / best / 1e6 if best > 0 else float("inf"),
+            "identical": decoded == reference
+        })
+        del decoded
+    return results
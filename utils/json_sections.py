@@ -0,0 +1,196 @@
+"""
+@brief Selective reader for top-level sections of a company JSON file
+Decodes only the requested sections instead of the whole document,
+which keeps small summary blocks cheap to read from large exports.
+"""
+
+import json
+import mmap
+import re
+
+import numpy as np
+
+
+# Bytes scanned per step from either end of the file
+SCAN_CHUNK_BYTES = 4 * 2 ** 20
+
+_QUOTE, _BACKSLASH = ord('"'), ord("\\")
+_OPENING, _CLOSING = ord("["), ord("]")
+_LEADING_WHITESPACE = re.compile(rb"\s*")
+_KEY = re.compile(rb'"((?:[^"\\]|\\.)*)"\s*:\s*', re.DOTALL)
+
+
+def read_top_level_sections(json_file_path, section_names):
+    """
+    @brief Decode selected top-level sections without parsing the whole file
+    The file is memory-mapped and scanned for keys of the top-level object
+    alternately from its start (metadata) and its end (kpi_metrics,
+    company_overview), so usually only the pages holding the requested
+    sections are touched. The scan tracks strings and nesting depth, so
+    keys of nested records are never mistaken for sections, whatever the
+    formatting. Sections that cannot be located or decoded are returned
+    as None and the caller is expected to fall back to a full load.
+
+    @param json_file_path: Path to JSON data file
+    @param section_names: Iterable of top-level keys to extract
+    @return Dictionary section name -> decoded value (or None)
+    """
+    section_names = list(section_names)
+    with open(json_file_path, "rb") as json_file:
+        if not json_file.seek(0, 2):
+            return dict.fromkeys(section_names)
+        with mmap.mmap(json_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            scanner = _TopLevelScanner(buffer)
+            sections = scanner.read(section_names)
+            # The scanner's array views must be gone before the map closes
+            del scanner
+    return sections
+
+
+def _unescaped_quotes(buffer, chunk, start):
+    """
+    @brief Positions (relative to start) of the quotes in chunk that delimit strings
+
+    @param buffer: mmap over the JSON file
+    @param chunk: uint8 view of buffer[start:start + len(chunk)]
+    @param start: Offset of chunk in buffer
+    @return int64 array of positions
+    """
+    quotes = np.flatnonzero(chunk == _QUOTE)
+    escaped_candidates = quotes[(quotes > 0) & (chunk[np.maximum(quotes - 1, 0)] == _BACKSLASH)].tolist()
+    if len(quotes) and quotes[0] == 0 and start > 0 and buffer[start - 1] == _BACKSLASH:
+        escaped_candidates.insert(0, 0)
+    if not escaped_candidates:
+        return quotes
+
+    # A quote is escaped by an odd run of backslashes
+    escaped = []
+    for position in escaped_candidates:
+        backslash = start + position - 1
+        while backslash >= 0 and buffer[backslash] == _BACKSLASH:
+            backslash -= 1
+        if (start + position - 1 - backslash) % 2:
+            escaped.append(position)
+    return np.setdiff1d(quotes, escaped, assume_unique=True)
+
+
+def _chunk_structure(chunk, quotes, parity):
+    """
+    @brief String openings and bracket balance of a chunk
+
+    @param chunk: uint8 array
+    @param quotes: Unescaped quote positions in chunk
+    @param parity: Number of unescaped quotes before the chunk, modulo 2
+    @return Tuple (positions of quotes opening a string, nesting depth at
+            each of them relative to the chunk start, depth change over the chunk)
+    """
+    # Clearing bit 0x20 folds "{" onto "[" and "}" onto "]"
+    folded = chunk & np.uint8(0xDF)
+    opening = folded == _OPENING
+    brackets = np.flatnonzero(opening | (folded == _CLOSING))
+    brackets = brackets[(np.searchsorted(quotes, brackets) + parity) % 2 == 0]
+    change = np.where(opening[brackets], 1, -1)
+    depth_before = np.concatenate(([0], np.cumsum(change)))
+
+    openings = quotes[(np.arange(len(quotes)) + parity) % 2 == 0]
+    return openings, depth_before[np.searchsorted(brackets, openings)], int(depth_before[-1])
+
+
+class _TopLevelScanner:
+    """
+    @brief Finds keys of the top-level object scanning inward from both ends
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.size = len(buffer)
+        self.data = np.frombuffer(buffer, dtype=np.uint8)
+        self.keys = {}
+
+        # Forward scan: [0, front) done; backward scan: [back, size) done
+        self.front, self.front_parity, self.front_depth = 0, 0, 0
+        self.back, self.back_parity, self.back_depth = self.size, 0, 0
+
+    def read(self, section_names):
+        """
+        @brief Decoded values of the requested top-level keys (None if absent)
+        """
+        sections = dict.fromkeys(section_names)
+        first = _LEADING_WHITESPACE.match(self.buffer).end()
+        if self.buffer[first:first + 1] != b"{":
+            return sections
+
+        pending = set(sections)
+        decoder = json.JSONDecoder()
+        forward = True
+        while pending:
+            met = self.front >= self.back
+            for position, (name, value_start) in sorted(self.keys.items()):
+                if name not in pending:
+                    continue
+                value_end = self._value_end(position, met)
+                if value_end is None:
+                    continue
+                pending.discard(name)
+                try:
+                    sections[name], _ = decoder.raw_decode(self.buffer[value_start:value_end].decode("utf-8"))
+                except (ValueError, UnicodeDecodeError):
+                    sections[name] = None
+            if met or not pending:
+                break
+            if forward:
+                self._scan_forward()
+            else:
+                self._scan_backward()
+            forward = not forward
+        return sections
+
+    def _value_end(self, position, met):
+        """
+        @brief Offset bounding the value of the key at position, None while unknown
+        The value ends before the next top-level key (or the closing brace),
+        which is only certain once everything in between has been scanned.
+        """
+        following = [key for key in self.keys if key > position]
+        if position >= self.back or met or (following and min(following) < self.front):
+            return min(following) if following else self.size
+        return None
+
+    def _record_keys(self, start, openings, depths, depth_at_start):
+        """
+        @brief Register the strings opened at depth 1 that are followed by a colon
+        """
+        for position in (openings[depths + depth_at_start == 1] + start).tolist():
+            match = _KEY.match(self.buffer, position)
+            if match:
+                try:
+                    name = json.loads(b'"' + match.group(1) + b'"')
+                except ValueError:
+                    continue
+                self.keys[position] = (name, match.end())
+
+    def _scan_forward(self):
+        """
+        @brief Scan the next chunk after the front of the file
+        """
+        start, end = self.front, min(self.front + SCAN_CHUNK_BYTES, self.back)
+        chunk = self.data[start:end]
+        quotes = _unescaped_quotes(self.buffer, chunk, start)
+        openings, depths, change = _chunk_structure(chunk, quotes, self.front_parity)
+        self._record_keys(start, openings, depths, self.front_depth)
+        self.front, self.front_parity, self.front_depth = end, (self.front_parity + len(quotes)) % 2, self.front_depth + change
+
+    def _scan_backward(self):
+        """
+        @brief Scan the chunk before the already scanned end of the file
+        """
+        start, end = max(self.back - SCAN_CHUNK_BYTES, self.front), self.back
+        chunk = self.data[start:end]
+        quotes = _unescaped_quotes(self.buffer, chunk, start)
+        # The file outside strings has an even number of quotes, so the parity
+        # and depth at the chunk start follow from those after it
+        parity = (self.back_parity + len(quotes)) % 2
+        openings, depths, change = _chunk_structure(chunk, quotes, parity)
+        depth = self.back_depth - change
+        self._record_keys(start, openings, depths, depth)
+        self.back, self.back_parity, self.back_depth = start, parity, depth
@@ -1,29 +1,41 @@
 """
 @bref Custom logger configuration for technical department performance analysis
 Provides centralized logging functionality using file handlers.
+Handlers are attached under a lock and only replaced when the log file
+changes, so analyzers created concurrently in several threads never
+strip each other's handlers.
 """
 
 
 import logging
 import os
+import threading
 from datetime import datetime
 
 
+# Guards handler changes of every logger created here
+_handler_lock = threading.Lock()
+
+
 class AnalysisLogger:
     """
     @brief Custom logger class for analysis operations
     Handles log file creation and management for different analysis types
     """
 
-    def __init__(self, log_directory="logs"):
+    def __init__(self, log_directory="logs", run_id=None):
         """
         @brief Initialize the analysis logger
         Creates log directory and configures logging handlers
 
         @param log_directory: Directory to store log files
+        @param run_id: Run identifier; a run gets private loggers that are
+                       not registered in the logging module's global registry
         """
 
         self.log_directory = log_directory
+        self.run_id = run_id
+        self.run_loggers = {}
 
 
     def _ensure_log_directory(self):
@@ -48,6 +60,21 @@ class AnalysisLogger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
 
+    def _named_logger(self, analysis_name):
+        """
+        @brief Logger object for an analysis name
+        Without a run the shared named logger is used; a run gets its own
+        Logger instance, released together with the run.
+        """
+        if self.run_id is None:
+            return logging.getLogger(analysis_name)
+        logger = self.run_loggers.get(analysis_name)
+        if logger is None:
+            logger = logging.Logger(f"{analysis_name}[{self.run_id}]")
+            logger.parent = logging.getLogger()
+            self.run_loggers[analysis_name] = logger
+        return logger
+
     def get_analysis_logger(self, analysis_name):
         """
         @brief Create and configure a dedicated logger for specific analysis
@@ -56,32 +83,50 @@ class AnalysisLogger:
         @param analysis_name: Name of the analysis for log file naming
         @return: Configured logger instance
         """
-        logger = logging.getLogger(analysis_name)
-        logger.setLevel(logging.INFO)
+        log_filename = f"{analysis_name.lower()}_{datetime.now().strftime('%Y%m%d')}.log"
+        log_filepath = os.path.abspath(os.path.join(self.log_directory, log_filename))
 
-        # Remove existing handlers to avoid duplicates
-        for handler in logger.handlers[:]:
-            logger.removeHandler(handler)
+        with _handler_lock:
+            logger = self._named_logger(analysis_name)
+            logger.setLevel(logging.INFO)
 
-        # Create file handler for this analysis
-        log_filename = f"{analysis_name.lower()}_{datetime.now().strftime('%Y%m%d')}.log"
-        log_filepath = os.path.join(self.log_directory, log_filename)
+            # Keep the handler while it still writes to today's file
+            if any(getattr(handler, "baseFilename", None) == log_filepath for handler in logger.handlers):
+                return logger
 
-        try:
-            file_handler = logging.FileHandler(log_filepath, encoding='utf-8')
-            file_handler.setLevel(logging.INFO)
+            # Remove existing handlers to avoid duplicates
+            for handler in logger.handlers[:]:
+                logger.removeHandler(handler)
+                handler.close()
 
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            file_handler.setFormatter(formatter)
+            self._ensure_log_directory()
+            try:
+                file_handler = logging.FileHandler(log_filepath, encoding='utf-8')
+                file_handler.setLevel(logging.INFO)
 
-            logger.addHandler(file_handler)
-        except Exception as error:
-            print(f"Error creating log file handler: {error}")
+                formatter = logging.Formatter(
+                    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+                )
+                file_handler.setFormatter(formatter)
+
+                logger.addHandler(file_handler)
+            except Exception as error:
+                print(f"Error creating log file handler: {error}")
 
         return logger
 
+    def close(self):
+        """
+        @brief Close the log files of the run's loggers
+        The shared named loggers of the global instance stay open.
+        """
+        with _handler_lock:
+            for logger in self.run_loggers.values():
+                for handler in logger.handlers[:]:
+                    logger.removeHandler(handler)
+                    handler.close()
+            self.run_loggers.clear()
+
 # Global logger instance
 analysis_logger = AnalysisLogger()
 
@@ -0,0 +1,179 @@
+"""
+@brief Vectorized payroll (FOT) arithmetic
+Implements the FinanceAnalayzer payroll rule over NumPy arrays so that
+many employees and many report dates can be processed without Python loops.
+"""
+
+import numpy as np
+
+
+SECONDS_PER_DAY = 86400
+
+
+def date_parts(dates):
+    """
+    @brief Split datetime64 array into calendar year, month and day
+
+    @param dates: numpy datetime64 array (any unit)
+    @return Tuple of int64 arrays (year, month, day)
+    """
+    dates = np.asarray(dates, dtype="datetime64[s]")
+    months = dates.astype("datetime64[M]")
+    year = months.astype("datetime64[Y]").astype(np.int64) + 1970
+    month = months.astype(np.int64) % 12 + 1
+    day = (dates.astype("datetime64[D]") - months.astype("datetime64[D]")).astype(np.int64) + 1
+    return year, month, day
+
+
+def full_months_worked(report_dates, hire_dates):
+    """
+    @brief Full calendar months between hire date and report date
+    Same rule as FinanceAnalayzer: month difference minus one when the
+    report day of month is before the hire day, never negative.
+    Inputs broadcast against each other.
+
+    @param report_dates: datetime64 array of report dates
+    @param hire_dates: datetime64 array of hire dates
+    @return int64 array of months
+    """
+    report_year, report_month, report_day = date_parts(report_dates)
+    hire_year, hire_month, hire_day = date_parts(hire_dates)
+
+    months = (report_year - hire_year) * 12 + (report_month - hire_month)
+    months = months - (report_day < hire_day)
+    return np.maximum(months, 0)
+
+
+def vectorized_fot(salary, hire_dates, report_dates):
+    """
+    @brief Payroll contribution (FOT) for the reporting period
+    If employee worked more than 365 days, FOT = 12 * salary,
+    otherwise FOT = salary * full months worked. Inputs broadcast, so a
+    (employees, 1) hire array against a (dates,) report array yields an
+    employees x dates matrix.
+
+    @param salary: Monthly salaries
+    @param hire_dates: datetime64 hire dates
+    @param report_dates: datetime64 report dates
+    @return float64 array of FOT values
+    """
+    salary = np.asarray(salary, dtype=np.float64)
+    report_dates = np.asarray(report_dates, dtype="datetime64[s]")
+    hire_dates = np.asarray(hire_dates, dtype="datetime64[s]")
+
+    elapsed_seconds = (report_dates - hire_dates).astype(np.int64)
+    elapsed_days = np.floor_divide(elapsed_seconds, SECONDS_PER_DAY)
+    months = full_months_worked(report_dates, hire_dates)
+
+    return np.where(elapsed_days > 365, salary * 12, salary * months)
+
+
+def projection_months(first_month, month_count):
+    """
+    @brief Consecutive calendar months of a projection
+
+    @param first_month: First month (datetime64 or "YYYY-MM")
+    @param month_count: Number of months
+    @return datetime64[M] array
+    """
+    return np.datetime64(first_month, "M") + np.arange(month_count)
+
+
+def salary_index(months, raises=()):
+    """
+    @brief Salary multiplier of every projection month
+    A raise applies from its effective month on; raises compound.
+
+    @param months: datetime64[M] projection months
+    @param raises: Iterable of (effective month, rate), e.g. ("2026-01", 0.05)
+    @return float64 array, one factor per month
+    """
+    months = np.asarray(months, dtype="datetime64[M]")
+    index = np.ones(len(months))
+    for effective_month, rate in raises:
+        index[months >= np.datetime64(effective_month, "M")] *= 1 + rate
+    return index
+
+
+def monthly_payroll(salary, hire_dates, months, month_index=None):
+    """
+    @brief Employees x months payroll matrix
+    An employee is paid from the hire month on; the hire month is paid
+    for the calendar days from the hire date to the month's end.
+
+    @param salary: Monthly salaries (employees,)
+    @param hire_dates: datetime64 hire dates (employees,)
+    @param months: datetime64[M] consecutive projection months
+    @param month_index: Salary multiplier per month (salary_index), none if None
+    @return float64 array (employees, months)
+    """
+    salary = np.asarray(salary, dtype=np.float64)
+    months = np.asarray(months, dtype="datetime64[M]")
+    hire_days = np.asarray(hire_dates, dtype="datetime64[D]")
+    hire_months = hire_days.astype("datetime64[M]")
+
+    payroll = np.multiply.outer(salary, np.ones(len(months)) if month_index is None else month_index)
+    if not len(months):
+        return payroll
+
+    # Month position of each hire relative to the first projection month
+    hire_offset = (hire_months - months[0]).astype(np.int64)
+    payroll *= np.arange(len(months)) >= hire_offset[:, None]
+
+    hired_within = np.flatnonzero((hire_offset >= 0) & (hire_offset < len(months)))
+    month_start = hire_months[hired_within].astype("datetime64[D]")
+    days_in_month = ((hire_months[hired_within] + 1).astype("datetime64[D]") - month_start).astype(np.int64)
+    days_paid = days_in_month - (hire_days[hired_within] - month_start).astype(np.int64)
+    payroll[hired_within, hire_offset[hired_within]] *= days_paid / days_in_month
+    return payroll
+
+
+def department_payroll(salary, hire_dates, department_ids, months, month_index=None, department_id=None):
+    """
+    @brief Monthly payroll per department
+    Employees are ordered by department before the payroll matrix is
+    built, so department sums are contiguous row ranges (np.add.reduceat).
+
+    @param salary: Monthly salaries (employees,)
+    @param hire_dates: datetime64 hire dates (employees,)
+    @param department_ids: Department of every employee (employees,)
+    @param months: datetime64[M] consecutive projection months
+    @param month_index: Salary multiplier per month (salary_index), none if None
+    @param department_id: Project only this department (all departments if None)
+    @return Tuple (sorted department ids, float64 array (departments, months))
+    """
+    department_ids = np.asarray(department_ids)
+    rows = np.arange(len(department_ids)) if department_id is None else np.flatnonzero(department_ids == department_id)
+    rows = rows[np.argsort(department_ids[rows], kind="stable")]
+
+    ids, starts = np.unique(department_ids[rows], return_index=True)
+    if not len(ids):
+        return ids, np.zeros((0, len(months)))
+    payroll = monthly_payroll(np.asarray(salary)[rows], np.asarray(hire_dates)[rows], months, month_index)
+    return ids, np.add.reduceat(payroll, starts, axis=0)
+
+
+def budget_exhaustion(payroll, budgets, months_per_year=12):
+    """
+    @brief Cumulative spend per fiscal year and the month a budget runs out
+    Payroll columns start at a fiscal year start; budgets are annual and
+    cumulative spend restarts with every fiscal year.
+
+    @param payroll: Monthly payroll (departments, months)
+    @param budgets: Annual budget per department (NaN for none)
+    @param months_per_year: Months of a fiscal year
+    @return Tuple (cumulative spend (departments, months), index of the
+            first month the cumulative spend exceeds the budget, -1 if never)
+    """
+    payroll = np.asarray(payroll, dtype=np.float64)
+    budgets = np.asarray(budgets, dtype=np.float64)
+    month_count = payroll.shape[1]
+
+    running = np.zeros((payroll.shape[0], month_count + 1))
+    np.cumsum(payroll, axis=1, out=running[:, 1:])
+    year_start = np.arange(month_count) // months_per_year * months_per_year
+    cumulative = running[:, 1:] - running[:, year_start]
+
+    exceeded = cumulative > budgets[:, None]
+    first_exceeded = np.where(exceeded.any(axis=1), exceeded.argmax(axis=1), -1)
+    return cumulative, first_exceeded
@@ -0,0 +1,333 @@
+"""
+@brief Validating extraction of JSON records into DataFrames
+A schema lists the fields taken from each record (path, kind, range).
+It is compiled once into itemgetter chains, so the single pass over the
+records only extracts tuples at C speed. Records with a broken structure
+(missing keys, wrong nesting) are diagnosed field by field when the fast
+extraction fails. Type and range checks run afterwards as vectorized
+column checks, which cost next to nothing when a column already has the
+expected dtype. Invalid records are returned with their reasons instead
+of aborting the load.
+"""
+
+import gc
+from operator import itemgetter
+
+import numpy as np
+import pandas as pd
+
+
+FIELD_KINDS = ("int", "number", "str", "bool", "date", "str_list", "allocations")
+NOT_AN_OBJECT = "record is not an object"
+
+_MISSING = object()
+
+
+class Field:
+    """
+    @brief One column extracted from a nested record
+    """
+
+    def __init__(self, column, path, kind, minimum=None, maximum=None, required=True):
+        """
+        @brief Initialize field
+
+        @param column: DataFrame column name
+        @param path: Tuple of keys leading to the value in the record
+        @param kind: One of FIELD_KINDS
+        @param minimum: Optional lower bound (numeric kinds)
+        @param maximum: Optional upper bound (numeric kinds)
+        @param required: Whether a missing or null value invalidates the record
+        """
+        if kind not in FIELD_KINDS:
+            raise ValueError(f"Unknown field kind: {kind}")
+        self.column = column
+        self.path = tuple(path)
+        self.kind = kind
+        self.minimum = minimum
+        self.maximum = maximum
+        self.required = required
+
+    @property
+    def name(self):
+        """
+        @brief Dotted path used in quarantine reasons
+        """
+        return ".".join(self.path)
+
+
+EMPLOYEE_FIELDS = (
+    Field("employee_id", ("employee_id",), "int"),
+    Field("full_name", ("personal_info", "full_name"), "str"),
+    Field("gender", ("personal_info", "gender"), "str"),
+    Field("birth_date", ("personal_info", "birth_date"), "date"),
+    Field("email", ("personal_info", "email"), "str", required=False),
+    Field("phone", ("personal_info", "phone"), "str", required=False),
+    Field("address", ("personal_info", "address"), "str", required=False),
+    Field("department_id", ("work_info", "department_id"), "int"),
+    Field("department_name", ("work_info", "department_name"), "str"),
+    Field("position", ("work_info", "position"), "str"),
+    Field("salary", ("work_info", "salary"), "number", minimum=0),
+    Field("hire_date", ("work_info", "hire_date"), "date"),
+    Field("experience_years", ("work_info", "experience_years"), "number", minimum=0),
+    Field("performance_score", ("work_info", "performance_score"), "number", minimum=0, maximum=100),
+    Field("skills", ("work_info", "skills"), "str_list"),
+    Field("is_team_lead", ("work_info", "is_team_lead"), "bool"),
+)
+
+DEPARTMENT_FIELDS = (
+    Field("id", ("id",), "int"),
+    Field("name", ("name",), "str"),
+    Field("type", ("type",), "str"),
+    Field("budget", ("budget",), "number"),
+)
+
+PROJECT_FIELDS = (
+    Field("project_id", ("project_id",), "str"),
+    Field("name", ("name",), "str"),
+    Field("description", ("description",), "str", required=False),
+    Field("status", ("status",), "str"),
+    Field("budget", ("financials", "budget"), "number"),
+    Field("profit", ("financials", "profit"), "number"),
+    Field("roi_percentage", ("financials", "roi_percentage"), "number"),
+    Field("participating_departments", ("participating_departments",), "allocations"),
+)
+
+EQUIPMENT_FIELDS = (
+    Field("equipment_id", ("equipment_id",), "str"),
+    Field("name", ("name",), "str"),
+    Field("type", ("type",), "str"),
+    Field("department_id", ("department_id",), "int"),
+    Field("department_name", ("department_name",), "str"),
+    Field("purchase_date", ("purchase_info", "purchase_date"), "date"),
+    Field("cost", ("purchase_info", "cost"), "number", minimum=0),
+    Field("warranty_end_date", ("purchase_info", "warranty_end_date"), "date"),
+    Field("status", ("operational_info", "status"), "str"),
+    Field("efficiency_percentage", ("operational_info", "efficiency_percentage"), "number", minimum=0, maximum=100),
+    Field("maintenance_cost_per_month", ("operational_info", "maintenance_cost_per_month"), "number", minimum=0),
+    Field("last_maintenance_date", ("operational_info", "last_maintenance_date"), "date", required=False),
+    Field("next_maintenance_date", ("operational_info", "next_maintenance_date"), "date"),
+    Field("hours_used_daily", ("utilization", "hours_used_daily"), "number", minimum=0, maximum=24),
+    Field("utilization_rate", ("utilization", "utilization_rate"), "number", minimum=0, maximum=100),
+)
+
+
+def _range_text(field):
+    """
+    @brief Allowed range of a numeric field for quarantine reasons
+    """
+    if field.maximum is None:
+        return f">= {field.minimum}"
+    if field.minimum is None:
+        return f"<= {field.maximum}"
+    return f"[{field.minimum}, {field.maximum}]"
+
+
+def _is_allocation_list(value):
+    """
+    @brief List of {department_id: int, budget_allocation: number?} objects
+    """
+    if type(value) is not list:
+        return False
+    for allocation in value:
+        if not isinstance(allocation, dict) or type(allocation.get("department_id")) is not int:
+            return False
+        share = allocation.get("budget_allocation", 0)
+        if share is not None and type(share) not in (int, float):
+            return False
+    return True
+
+
+class RecordValidator:
+    """
+    @brief Compiled schema: extracts valid records and diagnoses the rest
+    """
+
+    def __init__(self, fields):
+        """
+        @brief Compile extraction for a schema
+
+        @param fields: Sequence of Field
+        """
+        self.fields = tuple(fields)
+        self.columns = [field.column for field in self.fields]
+
+        # Fields sharing a parent object are read by one itemgetter call;
+        # the calls are compiled into a single expression per schema
+        groups = {}
+        for field in self.fields:
+            groups.setdefault(field.path[:-1], []).append(field)
+        namespace = {}
+        parts = []
+        self._extracted_columns = []
+        for position, (parent, group) in enumerate(groups.items()):
+            keys = [field.path[-1] for field in group]
+            namespace[f"get_{position}"] = itemgetter(*keys)
+            node = "record" + "".join(f"[{key!r}]" for key in parent)
+            parts.append(f"(get_{position}({node}),)" if len(keys) == 1 else f"get_{position}({node})")
+            self._extracted_columns += [field.column for field in group]
+        self._extract = eval(compile(f"lambda record: {' + '.join(parts)}", "<record extractor>", "eval"), namespace)
+
+    def _diagnose(self, record):
+        """
+        @brief Field by field extraction of a record the fast path rejected
+
+        @return Tuple (row in extraction order, list of reasons)
+        """
+        if not isinstance(record, dict):
+            return (None,) * len(self._extracted_columns), [NOT_AN_OBJECT]
+
+        values = {}
+        reasons = []
+        for field in self.fields:
+            node = record
+            for key in field.path:
+                node = node.get(key, _MISSING) if isinstance(node, dict) else _MISSING
+                if node is _MISSING:
+                    break
+            if node is _MISSING:
+                if field.required:
+                    reasons.append(f"{field.name}: missing")
+                node = None
+            values[field.column] = node
+        return tuple(values[column] for column in self._extracted_columns), reasons
+
+    def _column_checks(self, field, values):
+        """
+        @brief Vectorized type and range checks of one extracted column
+        Per-value type checks only run for columns whose dtype is not
+        already conclusive (e.g. an int column holding a string).
+
+        @param field: Field of the column
+        @param values: Series of extracted values
+        @return Tuple (list of (invalid row mask, reason), converted Series)
+        """
+        missing = values.isna().to_numpy()
+        present = ~missing
+        checks = [(missing, f"{field.name}: missing")] if field.required else []
+        kind = values.dtype.kind
+
+        def type_check(is_valid):
+            checks.append((present & ~is_valid, f"{field.name}: expected {field.kind}"))
+
+        if field.kind in ("int", "number"):
+            if kind not in "iuf":
+                allowed = (int,) if field.kind == "int" else (int, float)
+                type_check(np.fromiter((type(value) in allowed for value in values), dtype=bool, count=len(values)))
+                values = values.where(~checks[-1][0])
+            numbers = pd.to_numeric(values, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+            # Int columns holding nulls arrive as floats
+            usable = np.isfinite(numbers)
+            if field.kind == "int":
+                usable &= np.floor(numbers) == numbers
+            type_check(usable | np.isnan(numbers))
+            if field.minimum is not None or field.maximum is not None:
+                in_range = np.ones(len(values), dtype=bool)
+                if field.minimum is not None:
+                    in_range &= ~(numbers < field.minimum)
+                if field.maximum is not None:
+                    in_range &= ~(numbers > field.maximum)
+                checks.append((~in_range, f"{field.name}: out of range {_range_text(field)}"))
+            return checks, values
+
+        if field.kind == "bool":
+            if kind != "b":
+                type_check(np.fromiter((type(value) is bool for value in values), dtype=bool, count=len(values)))
+            return checks, values
+
+        if field.kind == "str":
+            if pd.api.types.infer_dtype(values, skipna=True) not in ("string", "empty"):
+                type_check(np.fromiter((type(value) is str for value in values), dtype=bool, count=len(values)))
+            return checks, values
+
+        if field.kind == "date":
+            parsed = pd.to_datetime(values.where(values.map(type) == str), errors="coerce", format="ISO8601")
+            checks.append((present & parsed.isna().to_numpy(), f"{field.name}: expected ISO date"))
+            return checks, parsed
+
+        if field.kind == "str_list":
+            is_list = values.map(type).to_numpy() == list
+            lists = values[is_list]
+            if pd.api.types.infer_dtype([item for items in lists for item in items], skipna=False) not in ("string", "empty"):
+                is_list[np.flatnonzero(is_list)] = np.fromiter(
+                    (all(type(item) is str for item in items) for items in lists), dtype=bool, count=len(lists))
+            checks.append((present & ~is_list, f"{field.name}: expected list of strings"))
+            return checks, values
+
+        checks.append((present & ~np.fromiter((_is_allocation_list(value) for value in values), dtype=bool, count=len(values)),
+                       f"{field.name}: expected list of department allocations"))
+        return checks, values
+
+    def validate(self, records):
+        """
+        @brief Split records into a DataFrame of valid rows and quarantined records
+
+        @param records: List of raw records
+        @return Tuple (DataFrame of valid rows with schema columns,
+                       int array of valid record positions,
+                       list of (record position, reasons))
+        """
+        rows = []
+        reasons_by_position = {}
+        append = rows.append
+        extract = self._extract
+        # Millions of new row tuples would otherwise trigger repeated collections
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            for position, record in enumerate(records):
+                try:
+                    append(extract(record))
+                except (KeyError, TypeError, IndexError):
+                    row, reasons = self._diagnose(record)
+                    append(row)
+                    reasons_by_position[position] = reasons
+        finally:
+            if collecting:
+                gc.enable()
+
+        frame = pd.DataFrame.from_records(rows, columns=self._extracted_columns, nrows=len(rows))
+        frame = frame.reindex(columns=self.columns) if len(rows) else pd.DataFrame(columns=self.columns)
+
+        # Records that are not objects are reported once, without per-field reasons
+        unreadable = np.zeros(len(frame), dtype=bool)
+        unreadable[[position for position, reasons in reasons_by_position.items() if reasons == [NOT_AN_OBJECT]]] = True
+        for field in self.fields:
+            checks, frame[field.column] = self._column_checks(field, frame[field.column])
+            for bad, reason in checks:
+                for position in np.flatnonzero(bad & ~unreadable):
+                    reasons = reasons_by_position.setdefault(int(position), [])
+                    # One reason per field (a field found missing is not also reported as mistyped)
+                    if not any(existing.startswith(f"{field.name}:") for existing in reasons):
+                        reasons.append(reason)
+
+        quarantined = sorted((position, reasons) for position, reasons in reasons_by_position.items() if reasons)
+        invalid = np.zeros(len(frame), dtype=bool)
+        invalid[[position for position, _ in quarantined]] = True
+        valid_positions = np.flatnonzero(~invalid)
+        valid_frame = frame.iloc[valid_positions].reset_index(drop=True)
+        if quarantined:
+            self._reinfer_dtypes(valid_frame, rows, valid_positions)
+        return valid_frame, valid_positions, quarantined
+
+    def _reinfer_dtypes(self, frame, rows, valid_positions):
+        """
+        @brief Give columns the dtype they would have without the invalid records
+        Invalid values widen columns (ints holding a null become floats,
+        numbers next to a string become objects), so such columns are
+        rebuilt from the raw values of the valid rows.
+
+        @param frame: Valid rows (modified in place)
+        @param rows: Extracted row tuples of all records
+        @param valid_positions: Positions of the valid records
+        """
+        kinds = {field.column: field.kind for field in self.fields}
+        for index, column in enumerate(self._extracted_columns):
+            kind, dtype = kinds[column], frame[column].dtype
+            if kind == "int" and dtype.kind in "fO":
+                frame[column] = frame[column].astype(np.int64)
+            elif kind == "bool" and dtype.kind == "O":
+                frame[column] = frame[column].astype(bool)
+            elif (kind == "number" and dtype.kind in "fO") or (kind == "str" and dtype == object):
+                # Whether the valid numbers were all ints is only known from the raw values
+                frame[column] = pd.Series([rows[position][index] for position in valid_positions])
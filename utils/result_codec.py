@@ -0,0 +1,161 @@
+"""
+@brief Versioned binary serialization of analysis results
+Layout: magic, format version and manifest length (struct RESULT_HEADER),
+a UTF-8 JSON manifest describing the object tree, then the raw buffers
+of all numeric arrays, each 8-byte aligned. Decoding maps the arrays
+onto the payload without copying them. Only registered result types,
+numpy arrays and plain Python values are accepted, so payloads stay
+compact and never carry DataFrames.
+"""
+
+import dataclasses
+import json
+import struct
+
+import numpy as np
+
+
+RESULT_MAGIC = b"POAR"
+RESULT_FORMAT_VERSION = 1
+RESULT_HEADER = struct.Struct("<4sHI")
+BUFFER_ALIGNMENT = 8
+
+# Type name -> class; dataclasses are stored field by field, other
+# classes through their to_dict / from_dict pair
+_result_types = {}
+
+
+def register_result_type(result_class):
+    """
+    @brief Make a class serializable (usable as a class decorator)
+    """
+    _result_types[result_class.__name__] = result_class
+    return result_class
+
+
+class _Encoder:
+    """
+    @brief Builds the manifest and collects array buffers
+    """
+
+    def __init__(self):
+        self.arrays = []
+        self.buffers = []
+        self.size = 0
+
+    def array(self, values):
+        """
+        @brief Manifest reference of a numeric array
+        """
+        values = np.ascontiguousarray(values)
+        self.size += -self.size % BUFFER_ALIGNMENT
+        self.arrays.append({"dtype": values.dtype.str, "shape": list(values.shape), "offset": self.size})
+        self.buffers.append((self.size, values))
+        self.size += values.nbytes
+        return {"A": len(self.arrays) - 1}
+
+    def encode(self, value):
+        """
+        @brief Manifest node of a value
+        """
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, np.ndarray):
+            if value.dtype == object:
+                return {"O": [self.encode(item) for item in value.tolist()]}
+            return self.array(value)
+        if isinstance(value, list):
+            return {"L": [self.encode(item) for item in value]}
+        if isinstance(value, tuple):
+            return {"T": [self.encode(item) for item in value]}
+        if isinstance(value, dict):
+            return {"D": [[self.encode(key), self.encode(item)] for key, item in value.items()]}
+
+        type_name = type(value).__name__
+        if _result_types.get(type_name) is not type(value):
+            raise TypeError(f"Cannot serialize {type_name} in an analysis result")
+        if dataclasses.is_dataclass(value):
+            fields = {field.name: self.encode(getattr(value, field.name)) for field in dataclasses.fields(value)}
+            return {"C": type_name, "F": fields}
+        return {"C": type_name, "P": self.encode(value.to_dict())}
+
+
+def dumps_result(value, allocate=None):
+    """
+    @brief Serialize a result into bytes
+
+    @param value: Result object (registered types, arrays, plain values)
+    @param allocate: Optional callable returning a zero-filled writable buffer
+                     of the requested size (e.g. shared memory); the payload
+                     is written into it instead of a new bytes object
+    @return bytes, or the buffer returned by allocate
+    """
+    encoder = _Encoder()
+    root = encoder.encode(value)
+    manifest = json.dumps({"root": root, "arrays": encoder.arrays}, ensure_ascii=False,
+                          separators=(",", ":")).encode("utf-8")
+    header_size = RESULT_HEADER.size + len(manifest)
+    data_start = header_size + -header_size % BUFFER_ALIGNMENT
+
+    payload = bytearray(data_start + encoder.size) if allocate is None else allocate(data_start + encoder.size)
+    RESULT_HEADER.pack_into(payload, 0, RESULT_MAGIC, RESULT_FORMAT_VERSION, len(manifest))
+    payload[RESULT_HEADER.size:header_size] = manifest
+    payload_bytes = np.frombuffer(payload, dtype=np.uint8)
+    for offset, values in encoder.buffers:
+        start = data_start + offset
+        payload_bytes[start:start + values.nbytes] = values.reshape(-1).view(np.uint8)
+    return bytes(payload) if allocate is None else payload
+
+
+def loads_result(payload):
+    """
+    @brief Restore a result serialized by dumps_result
+    Arrays are read-only views on payload.
+
+    @param payload: bytes-like object
+    @return Result object
+    """
+    payload = memoryview(payload)
+    magic, version, manifest_size = RESULT_HEADER.unpack_from(payload, 0)
+    if magic != RESULT_MAGIC:
+        raise ValueError("Not an analysis result payload")
+    if version != RESULT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported analysis result format version {version} (expected {RESULT_FORMAT_VERSION})")
+
+    header_size = RESULT_HEADER.size + manifest_size
+    manifest = json.loads(bytes(payload[RESULT_HEADER.size:header_size]))
+    data_start = header_size + -header_size % BUFFER_ALIGNMENT
+
+    def array(reference):
+        spec = manifest["arrays"][reference]
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"]))
+        values = np.frombuffer(payload, dtype=dtype, count=count, offset=data_start + spec["offset"])
+        return values.reshape(spec["shape"])
+
+    def decode(node):
+        if not isinstance(node, dict):
+            return node
+        if "A" in node:
+            return array(node["A"])
+        if "O" in node:
+            values = np.empty(len(node["O"]), dtype=object)
+            values[:] = [decode(item) for item in node["O"]]
+            return values
+        if "L" in node:
+            return [decode(item) for item in node["L"]]
+        if "T" in node:
+            return tuple(decode(item) for item in node["T"])
+        if "D" in node:
+            return {decode(key): decode(item) for key, item in node["D"]}
+
+        result_class = _result_types.get(node["C"])
+        if result_class is None:
+            raise ValueError(f"Unknown analysis result type {node['C']}")
+        if "F" in node:
+            return result_class(**{name: decode(item) for name, item in node["F"].items()})
+        return result_class.from_dict(decode(node["P"]))
+
+    return decode(manifest["root"])
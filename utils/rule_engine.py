@@ -0,0 +1,155 @@
+"""
+@brief Declarative rules evaluated over a per-department metrics table
+A rule is a dict with an id, a category, a condition ("when") and a
+message. Conditions are small Python-like expressions over metric
+columns, e.g. "junior_ratio > 0.4 and senior_ratio < 0.2". Each one is
+compiled once into a function over NumPy column arrays, so evaluating a
+rule costs one vectorized expression for all departments together.
+"""
+
+import ast
+import operator
+import numpy as np
+import pandas as pd
+
+
+_COMPARISONS = {
+    ast.Lt: operator.lt, ast.LtE: operator.le,
+    ast.Gt: operator.gt, ast.GtE: operator.ge,
+    ast.Eq: operator.eq, ast.NotEq: operator.ne,
+}
+_ARITHMETIC = {
+    ast.Add: operator.add, ast.Sub: operator.sub,
+    ast.Mult: operator.mul, ast.Div: operator.truediv,
+}
+
+
+def _compile_node(node, columns, rule_id):
+    """
+    @brief Turn an expression node into a function of the column mapping
+    Only metric names, numbers, arithmetic, comparisons and and/or/not
+    are accepted; anything else is rejected when the rule is compiled.
+    """
+    if isinstance(node, ast.Expression):
+        return _compile_node(node.body, columns, rule_id)
+
+    if isinstance(node, ast.Name):
+        if node.id not in columns:
+            raise ValueError(f"Rule '{rule_id}': unknown metric '{node.id}'")
+        return lambda table, name=node.id: table[name]
+
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+        return lambda table, value=node.value: value
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        operand = _compile_node(node.operand, columns, rule_id)
+        return lambda table: ~np.asarray(operand(table), dtype=bool)
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        operand = _compile_node(node.operand, columns, rule_id)
+        return lambda table: -operand(table)
+
+    if isinstance(node, ast.BinOp) and type(node.op) in _ARITHMETIC:
+        left = _compile_node(node.left, columns, rule_id)
+        right = _compile_node(node.right, columns, rule_id)
+        function = _ARITHMETIC[type(node.op)]
+        return lambda table: function(left(table), right(table))
+
+    if isinstance(node, ast.BoolOp):
+        operands = [_compile_node(value, columns, rule_id) for value in node.values]
+        combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+        return lambda table: combine.reduce([np.asarray(operand(table), dtype=bool) for operand in operands])
+
+    if isinstance(node, ast.Compare) and all(type(op) in _COMPARISONS for op in node.ops):
+        operands = [_compile_node(value, columns, rule_id) for value in [node.left] + node.comparators]
+        functions = [_COMPARISONS[type(op)] for op in node.ops]
+
+        def compare(table):
+            values = [operand(table) for operand in operands]
+            result = functions[0](values[0], values[1])
+            for position in range(1, len(functions)):
+                result = result & functions[position](values[position], values[position + 1])
+            return result
+
+        return compare
+
+    raise ValueError(f"Rule '{rule_id}': unsupported expression '{ast.dump(node)}'")
+
+
+def compile_condition(expression, columns, rule_id="rule"):
+    """
+    @brief Compile a condition into a vectorized predicate
+
+    @param expression: Condition text, e.g. "average_performance < 85"
+    @param columns: Metric names available to the condition
+    @param rule_id: Rule id used in error messages
+    @return Function mapping {column: array} to a boolean array
+    """
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError as syntax_error:
+        raise ValueError(f"Rule '{rule_id}': invalid condition '{expression}'") from syntax_error
+    return _compile_node(tree, set(columns), rule_id)
+
+
+class RuleSet:
+    """
+    @brief Compiled rules for one metrics table layout
+    """
+
+    def __init__(self, rules, columns):
+        """
+        @brief Compile rule definitions
+
+        @param rules: Iterable of dicts with id, category, when and message
+        @param columns: Metric columns of the tables the rules will run on
+        """
+        self.rules = list(rules)
+        self.predicates = [compile_condition(rule["when"], columns, rule["id"]) for rule in self.rules]
+
+    def evaluate(self, metrics):
+        """
+        @brief Evaluate every rule for every department
+
+        @param metrics: DataFrame of metrics, one row per department
+        @return Boolean DataFrame (departments x rule ids)
+        """
+        table = {column: metrics[column].to_numpy() for column in metrics.columns}
+        fired = np.zeros((len(metrics), len(self.rules)), dtype=bool)
+        for position, predicate in enumerate(self.predicates):
+            fired[:, position] = np.broadcast_to(np.asarray(predicate(table), dtype=bool), len(metrics))
+        return pd.DataFrame(fired, index=metrics.index, columns=[rule["id"] for rule in self.rules])
+
+    def fired_rules(self, fired):
+        """
+        @brief Long table of fired rules
+
+        @param fired: Result of evaluate()
+        @return DataFrame (department index, rule_id, category)
+        """
+        rows, columns = np.nonzero(fired.to_numpy())
+        rule_ids = np.asarray([rule["id"] for rule in self.rules], dtype=object)
+        categories = np.asarray([rule["category"] for rule in self.rules], dtype=object)
+        return pd.DataFrame({
+            fired.index.name or "department_id": fired.index.to_numpy()[rows],
+            "rule_id": rule_ids[columns],
+            "category": categories[columns]
+        })
+
+    def messages(self, fired, metrics, department, category):
+        """
+        @brief Messages of the rules fired for one department
+        Messages may reference metrics as {metric} placeholders.
+
+        @param fired: Result of evaluate()
+        @param metrics: Metrics table passed to evaluate()
+        @param department: Department index value
+        @param category: Rule category to select
+        @return List of formatted messages in rule order
+        """
+        if department not in fired.index:
+            return []
+        row = fired.loc[department]
+        values = metrics.loc[department].to_dict()
+        return [rule["message"].format(**values) for rule in self.rules
+                if rule["category"] == category and row[rule["id"]]]
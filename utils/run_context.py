@@ -0,0 +1,64 @@
+"""
+@brief Run-scoped state for analysis runs
+Everything a run writes besides the PDF (log files, summary report,
+quarantine file) is resolved through its RunContext, so several
+orchestrators can run concurrently in one process without sharing
+loggers or overwriting each other's outputs. The default context keeps
+the command line layout under logs/.
+"""
+
+import os
+import uuid
+from datetime import datetime
+
+from config.settings import IngestionSettings, RunSettings
+from utils.logger import AnalysisLogger, analysis_logger
+
+
+class RunContext:
+    """
+    @brief Loggers and output paths of one analysis run
+    """
+
+    def __init__(self, run_id=None):
+        """
+        @brief Initialize run context
+
+        @param run_id: Identifier of the run (None for the shared command line layout)
+        """
+        self.run_id = run_id
+        if run_id is None:
+            self.directory = RunSettings.LOG_DIRECTORY
+            self.quarantine_path = IngestionSettings.QUARANTINE_FILE
+            self.loggers = analysis_logger
+        else:
+            self.directory = os.path.join(RunSettings.RUN_DIRECTORY, run_id)
+            self.quarantine_path = os.path.join(self.directory, os.path.basename(IngestionSettings.QUARANTINE_FILE))
+            self.loggers = AnalysisLogger(self.directory, run_id)
+        self.summary_path = os.path.join(self.directory, RunSettings.SUMMARY_FILE_NAME)
+        # Data file whose quarantine entries this run has written last
+        self.quarantine_source = None
+
+    @classmethod
+    def create(cls):
+        """
+        @brief Context of a new run with a unique identifier
+        """
+        return cls(f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}")
+
+    def get_logger(self, analysis_name):
+        """
+        @brief Logger of an analysis writing to this run's log directory
+        """
+        return self.loggers.get_analysis_logger(analysis_name)
+
+    def close(self):
+        """
+        @brief Release the run's log files
+        """
+        if self.run_id is not None:
+            self.loggers.close()
+
+
+# Context of runs started without one (command line)
+default_run_context = RunContext()
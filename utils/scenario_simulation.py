@@ -0,0 +1,167 @@
+"""
+@brief Monte Carlo what-if engine for department payroll and profit
+Simulates many one-year scenarios at once with NumPy. Each scenario draws
+a productivity uplift, an attrition rate, a salary indexation and a
+number of hires. Employees are aggregated into strata (e.g. positions)
+once, so a batch costs scenarios x strata operations regardless of
+headcount: leavers per stratum are drawn binomially and their payroll
+from the stratum salary moments (with finite population correction).
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# Parameters of simulate() that can be swept
+SCENARIO_PARAMETERS = (
+    "uplift_mean", "uplift_std", "attrition_mean", "attrition_std",
+    "indexation_mean", "indexation_std", "hires_mean"
+)
+# Scenarios drawn per batch (bounds memory for large scenario counts)
+SCENARIO_BATCH = 65536
+
+
+class ProductivityScenarioEngine:
+    """
+    @brief Vectorized scenario simulation over department employees
+    Model (12-month horizon, salaries are monthly):
+    - leavers quit mid-year on average and hires join mid-year;
+    - indexation applies to the whole resulting payroll;
+    - the uplift keeps output constant with fewer paid hours, so
+      required FOT = FOT / (1 + uplift) and the difference is savings;
+    - profit = baseline profit - (required FOT - baseline FOT).
+    """
+
+    def __init__(self, salaries, strata, baseline_profit=0.0, new_hire_salary=None, seed=None):
+        """
+        @brief Aggregate employee arrays into strata
+
+        @param salaries: Monthly salary per employee
+        @param strata: Stratum label per employee (e.g. position)
+        @param baseline_profit: Annual profit before any scenario effect
+        @param new_hire_salary: Monthly salary of a hire (median salary if None)
+        @param seed: Seed of the random generator (None for a fresh one)
+        """
+        salaries = np.asarray(salaries, dtype=np.float64)
+        codes, self.strata = pd.factorize(pd.Series(strata, dtype=object))
+
+        self.stratum_size = np.bincount(codes, minlength=len(self.strata)).astype(np.int64)
+        self.stratum_total = np.bincount(codes, weights=salaries, minlength=len(self.strata))
+        stratum_square = np.bincount(codes, weights=salaries ** 2, minlength=len(self.strata))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.stratum_mean = np.where(self.stratum_size > 0, self.stratum_total / self.stratum_size, 0.0)
+            self.stratum_variance = np.where(
+                self.stratum_size > 1,
+                (stratum_square - self.stratum_size * self.stratum_mean ** 2) / (self.stratum_size - 1),
+                0.0
+            ).clip(min=0.0)
+
+        self.monthly_payroll = float(salaries.sum())
+        self.baseline_fot = 12 * self.monthly_payroll
+        self.baseline_profit = float(baseline_profit)
+        self.new_hire_salary = float(np.median(salaries)) if new_hire_salary is None and len(salaries) else float(new_hire_salary or 0.0)
+        self.seed = seed
+
+    def _leaver_payroll(self, rng, attrition):
+        """
+        @brief Monthly payroll of leavers per scenario
+
+        @param rng: numpy Generator
+        @param attrition: Attrition rate per scenario (scenarios,)
+        @return Tuple (leaver count, leaver monthly payroll), both (scenarios,)
+        """
+        leavers = rng.binomial(self.stratum_size[None, :], attrition[:, None])
+        correction = np.where(self.stratum_size > 1,
+                              (self.stratum_size - leavers) / np.maximum(self.stratum_size - 1, 1), 0.0)
+        mean = leavers * self.stratum_mean
+        spread = np.sqrt(leavers * self.stratum_variance * correction)
+        payroll = np.clip(rng.normal(mean, spread), 0.0, self.stratum_total)
+        return leavers.sum(axis=1), payroll.sum(axis=1)
+
+    def simulate(self, scenario_count, uplift_mean, uplift_std, attrition_mean, attrition_std,
+                 indexation_mean, indexation_std, hires_mean, rng=None):
+        """
+        @brief Run scenarios in batches
+
+        @param scenario_count: Number of scenarios
+        @param uplift_mean: Mean productivity uplift (0.10 = +10%)
+        @param uplift_std: Standard deviation of the uplift
+        @param attrition_mean: Mean annual attrition rate
+        @param attrition_std: Standard deviation of the attrition rate
+        @param indexation_mean: Mean salary indexation
+        @param indexation_std: Standard deviation of the indexation
+        @param hires_mean: Expected number of hires (Poisson)
+        @param rng: Optional numpy Generator (seeded from engine seed if None)
+        @return DataFrame with one row per scenario
+        """
+        rng = rng or np.random.default_rng(self.seed)
+        batches = []
+        for first in range(0, scenario_count, SCENARIO_BATCH):
+            size = min(SCENARIO_BATCH, scenario_count - first)
+
+            uplift = np.clip(rng.normal(uplift_mean, uplift_std, size), 0.0, None)
+            attrition = np.clip(rng.normal(attrition_mean, attrition_std, size), 0.0, 1.0)
+            indexation = rng.normal(indexation_mean, indexation_std, size)
+            hires = rng.poisson(hires_mean, size)
+            leavers, leaver_payroll = self._leaver_payroll(rng, attrition)
+
+            fot = (1 + indexation) * (self.baseline_fot - 6 * leaver_payroll + 6 * hires * self.new_hire_salary)
+            required_fot = fot / (1 + uplift)
+            batches.append(pd.DataFrame({
+                "uplift": uplift,
+                "attrition": attrition,
+                "indexation": indexation,
+                "leavers": leavers,
+                "hires": hires,
+                "fot": fot,
+                "fot_savings": fot - required_fot,
+                "profit": self.baseline_profit - (required_fot - self.baseline_fot)
+            }))
+
+        return pd.concat(batches, ignore_index=True) if batches else pd.DataFrame()
+
+    @staticmethod
+    def summarize(scenarios, confidence=0.9, metrics=("fot", "fot_savings", "profit")):
+        """
+        @brief Mean, median and central confidence interval of scenario metrics
+
+        @param scenarios: DataFrame returned by simulate()
+        @param confidence: Interval coverage (0.9 -> 5th..95th percentile)
+        @param metrics: Columns to summarize
+        @return DataFrame indexed by metric
+        """
+        tail = (1 - confidence) / 2
+        values = scenarios[list(metrics)].to_numpy()
+        low, median, high = np.quantile(values, [tail, 0.5, 1 - tail], axis=0)
+        return pd.DataFrame({
+            "mean": values.mean(axis=0),
+            "ci_low": low,
+            "median": median,
+            "ci_high": high
+        }, index=list(metrics))
+
+    def sweep(self, parameter, values, scenario_count, confidence=0.9, metric="fot_savings", **assumptions):
+        """
+        @brief Summaries of one metric while varying one parameter
+        Every point reuses the same seed (common random numbers), so
+        differences between points are not sampling noise.
+
+        @param parameter: Name of a simulate() parameter (see SCENARIO_PARAMETERS)
+        @param values: Values of the parameter
+        @param scenario_count: Scenarios per point
+        @param confidence: Interval coverage
+        @param metric: Summarized metric
+        @param assumptions: Remaining simulate() parameters
+        @return DataFrame indexed by parameter value
+        """
+        if parameter not in SCENARIO_PARAMETERS:
+            raise ValueError(f"Unknown scenario parameter: {parameter}")
+
+        rows = []
+        for value in values:
+            point = dict(assumptions, **{parameter: value})
+            seed = self.seed if self.seed is not None else 0
+            scenarios = self.simulate(scenario_count, rng=np.random.default_rng(seed), **point)
+            rows.append(self.summarize(scenarios, confidence, (metric,)).iloc[0].rename(value))
+
+        return pd.DataFrame(rows).rename_axis(parameter)
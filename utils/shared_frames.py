@@ -0,0 +1,259 @@
+"""
+@brief Shared-memory handoff of validated company frames to worker processes
+The parent writes the DataFrames of a loaded document once into a
+multiprocessing.shared_memory block (result_codec layout): numeric,
+boolean and datetime columns as raw buffers, text columns dictionary
+encoded (codes plus a UTF-8 label pool), skill lists as CSR arrays.
+Workers receive only a SharedFramesDescriptor and attach read-only views;
+numeric columns of their DataFrames point into the block, so N workers
+share one copy of the data instead of unpickling N.
+
+The publishing process reference-counts a block: runs of the same
+unchanged file lease the same block, and it is unlinked when the last
+lease is released.
+"""
+
+import atexit
+import gc
+import threading
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from utils.columnar import DictionaryColumn
+from utils.data_loader import CompanyData, _file_key, forget_company_data, load_company_data, register_company_data
+from utils.result_codec import dumps_result, loads_result
+
+
+# File key -> SharedCompanyFrames published by this process
+_published = {}
+_published_lock = threading.Lock()
+
+# Block name -> (SharedMemory, file key, CompanyData) attached by this (worker) process
+_attached = {}
+
+
+@dataclass(slots=True, frozen=True)
+class SharedFramesDescriptor:
+    """
+    @brief Everything a worker needs to attach a published block
+    """
+
+    name: str
+    size: int
+    file_key: tuple
+
+
+def _encode_labels(labels):
+    """
+    @brief UTF-8 pool and offsets of a list of strings
+    """
+    encoded = [label.encode("utf-8") for label in labels]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(label) for label in encoded], out=offsets[1:])
+    return {"pool": np.frombuffer(b"".join(encoded), dtype=np.uint8), "offsets": offsets}
+
+
+def _decode_labels(node):
+    """
+    @brief Inverse of _encode_labels
+    """
+    pool = node["pool"].tobytes()
+    offsets = node["offsets"].tolist()
+    return [pool[start:end].decode("utf-8") for start, end in zip(offsets[:-1], offsets[1:])]
+
+
+def _is_string_lists(values):
+    """
+    @brief Whether an object column holds only lists of strings (e.g. skills)
+    """
+    return all(isinstance(items, list) and all(isinstance(item, str) for item in items) for items in values)
+
+
+def _encode_column(values):
+    """
+    @brief Manifest node of one frame column
+    Columns that are neither numeric, text nor string lists (e.g. project
+    allocations) are kept as plain values in the manifest.
+    """
+    if isinstance(values.dtype, np.dtype) and values.dtype != object:
+        return values.to_numpy(copy=False)
+    if isinstance(values.dtype, pd.StringDtype):
+        text = DictionaryColumn.encode(values)
+        return {"text": {"codes": text.codes, "labels": _encode_labels(text.labels), "dtype": text.dtype}}
+    if values.dtype == object and _is_string_lists(values):
+        codes, vocabulary = pd.factorize(pd.Series([item for items in values for item in items], dtype=object))
+        offsets = np.zeros(len(values) + 1, dtype=np.int64)
+        np.cumsum([len(items) for items in values], out=offsets[1:])
+        return {"lists": {"offsets": offsets, "codes": codes.astype(np.int32), "labels": _encode_labels(vocabulary)}}
+    return values.tolist()
+
+
+def _decode_column(node):
+    """
+    @brief Column values of a manifest node (numeric arrays stay views on the block)
+    """
+    if isinstance(node, (np.ndarray, list)):
+        return node
+    if "text" in node:
+        text = node["text"]
+        return DictionaryColumn(text["codes"], np.asarray(_decode_labels(text["labels"]), dtype=object),
+                                text["dtype"]).decode()
+    lists = node["lists"]
+    names = np.asarray(_decode_labels(lists["labels"]), dtype=object)[lists["codes"]]
+    offsets = lists["offsets"].tolist()
+    return [names[start:end].tolist() for start, end in zip(offsets[:-1], offsets[1:])]
+
+
+def _company_payload(company_data):
+    """
+    @brief Encodable form of a CompanyData
+    Employee records are only kept as their frame; the other sections of
+    the document are small and travel as plain values.
+    """
+    return {
+        "document": {name: content for name, content in company_data.data.items() if name != "employees"},
+        "frames": {
+            name: {"columns": list(frame.columns), "values": [_encode_column(frame[column]) for column in frame.columns],
+                   "rows": len(frame)}
+            for name, frame in company_data.frames.items()
+        }
+    }
+
+
+def _company_data_from_payload(payload):
+    """
+    @brief Rebuild CompanyData from a decoded payload without copying numeric columns
+    """
+    frames = {}
+    for name, frame in payload["frames"].items():
+        columns = {column: _decode_column(values) for column, values in zip(frame["columns"], frame["values"])}
+        frames[name] = pd.DataFrame(columns, index=pd.RangeIndex(frame["rows"]), columns=frame["columns"], copy=False)
+    return CompanyData(payload["document"], frames, [])
+
+
+def _open_block(name):
+    """
+    @brief Attach an existing block without taking ownership of it
+    """
+    try:
+        # Python 3.13+: leave the block's lifetime to the publishing process
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name)
+
+
+class SharedCompanyFrames:
+    """
+    @brief Shared-memory copy of a loaded document, owned by the publishing process
+    Obtained through share_company_data; release() (or leaving the with
+    block) gives the lease back.
+    """
+
+    def __init__(self, company_data, file_key):
+        """
+        @brief Write the document's frames into a new shared memory block
+
+        @param company_data: CompanyData to publish
+        @param file_key: Identity of the file it was loaded from
+        """
+        self.file_key = file_key
+        self.leases = 0
+        self._block = None
+
+        def allocate(size):
+            self._block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+            return self._block.buf[:size]
+
+        payload = dumps_result(_company_payload(company_data), allocate)
+        self.descriptor = SharedFramesDescriptor(self._block.name, len(payload), file_key)
+        payload.release()
+
+    @property
+    def size(self):
+        """
+        @brief Size of the shared payload in bytes
+        """
+        return self.descriptor.size
+
+    def release(self):
+        """
+        @brief Give back one lease; the block is unlinked with the last one
+        Workers attached to it keep their mappings until they exit.
+        """
+        with _published_lock:
+            self.leases -= 1
+            if self.leases:
+                return
+            if _published.get(self.file_key) is self:
+                del _published[self.file_key]
+        self._block.close()
+        self._block.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+def share_company_data(json_file_path, run_context=None):
+    """
+    @brief Lease on the shared copy of a data file's frames, publishing them on first use
+    Concurrent runs of the same unchanged file share one block.
+
+    @param json_file_path: Path to company data file (loaded through load_company_data)
+    @param run_context: RunContext receiving load logs and the quarantine file (default layout if None)
+    @return SharedCompanyFrames (release it when the workers are done)
+    """
+    file_key = _file_key(json_file_path)
+    company_data = load_company_data(json_file_path, run_context)
+    with _published_lock:
+        shared = _published.get(file_key)
+        if shared is None:
+            shared = _published[file_key] = SharedCompanyFrames(company_data, file_key)
+        shared.leases += 1
+    return shared
+
+
+def attach_company_data(descriptor, run_context=None):
+    """
+    @brief Attach a published block and make it the shared load of its file (worker side)
+    Analyzers created afterwards for the unchanged file get frames that are
+    read-only views on the block. The attachment is kept until the process
+    exits, so later tasks for the same block reuse it.
+
+    @param descriptor: SharedFramesDescriptor from the publishing process
+    @param run_context: RunContext of the worker's run (default layout if None)
+    @return CompanyData (employee records only as the frame, no quarantine entries)
+    """
+    attached = _attached.get(descriptor.name)
+    if attached is None:
+        if not _attached:
+            atexit.register(_detach_all)
+        block = _open_block(descriptor.name)
+        payload = loads_result(block.buf[:descriptor.size].toreadonly())
+        attached = _attached[descriptor.name] = (block, descriptor.file_key, _company_data_from_payload(payload))
+    register_company_data(descriptor.file_key, attached[2], run_context)
+    return attached[2]
+
+
+def _detach_all():
+    """
+    @brief Close the blocks attached by this process at exit
+    The frames viewing a block have to be gone before it can be closed.
+    """
+    blocks = [block for block, _, _ in _attached.values()]
+    file_keys = [file_key for _, file_key, _ in _attached.values()]
+    _attached.clear()
+    for file_key in file_keys:
+        forget_company_data(file_key)
+    gc.collect()
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            # Views still referenced elsewhere; the mapping goes with the process
+            pass
@@ -0,0 +1,177 @@
+"""
+@brief Departments x skills coverage matrix
+Counts, for every department and skill, how many employees have the
+skill. Built in one pass by sparse aggregation of the interned skill
+CSR arrays and stored in CSR form (department -> skill codes, counts),
+so only skills present in a department take space.
+"""
+
+import numpy as np
+import pandas as pd
+from utils.skill_similarity import normalize_skill
+
+
+class SkillCoverageMatrix:
+    """
+    @brief Sparse departments x skills matrix of employee counts
+    """
+
+    def __init__(self, department_ids, headcount, offsets, skill_codes, counts, skills):
+        """
+        @brief Initialize matrix from CSR arrays (use build() to aggregate)
+
+        @param department_ids: Sorted department ids (matrix rows)
+        @param headcount: Employees per department
+        @param offsets: int array (departments + 1) of row offsets
+        @param skill_codes: Skill code of every stored entry
+        @param counts: Employee count of every stored entry
+        @param skills: Skill display names (matrix columns)
+        """
+        self.department_ids = np.asarray(department_ids)
+        self.headcount = np.asarray(headcount, dtype=np.int64)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.skill_codes = np.asarray(skill_codes, dtype=np.int64)
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.skills = list(skills)
+        self.code_by_skill = {normalize_skill(skill): code for code, skill in enumerate(self.skills)}
+
+    @classmethod
+    def build(cls, employee_departments, skill_offsets, skill_codes, skills):
+        """
+        @brief Aggregate employee skill CSR arrays per department
+
+        @param employee_departments: Department id of every employee
+        @param skill_offsets: int array (employees + 1) of CSR offsets
+        @param skill_codes: Normalized skill code of every CSR entry
+        @param skills: Skill display names indexed by code
+        @return SkillCoverageMatrix
+        """
+        skill_count = max(len(skills), 1)
+        department_ids, department_of_employee, headcount = np.unique(
+            np.asarray(employee_departments), return_inverse=True, return_counts=True)
+        department_of_employee = department_of_employee.reshape(-1)
+
+        entry_employee = np.repeat(np.arange(len(department_of_employee)), np.diff(skill_offsets))
+        # An employee listing a skill twice is counted once
+        employee_skill = np.unique(entry_employee * skill_count + np.asarray(skill_codes, dtype=np.int64))
+        department_skill = department_of_employee[employee_skill // skill_count] * skill_count + employee_skill % skill_count
+        keys, counts = np.unique(department_skill, return_counts=True)
+
+        offsets = np.zeros(len(department_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys // skill_count, minlength=len(department_ids)), out=offsets[1:])
+        return cls(department_ids, headcount, offsets, keys % skill_count, counts, skills)
+
+    @property
+    def shape(self):
+        """
+        @brief (departments, skills)
+        """
+        return len(self.department_ids), len(self.skills)
+
+    @property
+    def nnz(self):
+        """
+        @brief Number of stored (department, skill) entries
+        """
+        return len(self.counts)
+
+    def _row(self, department_id):
+        """
+        @brief Matrix row of a department, or None if it has no employees
+        """
+        row = np.searchsorted(self.department_ids, department_id)
+        if row < len(self.department_ids) and self.department_ids[row] == department_id:
+            return row
+        return None
+
+    def department(self, department_id):
+        """
+        @brief Skill counts of one department, most common first
+
+        @param department_id: Department to query
+        @return Series skill -> employees (ties keep skill code order)
+        """
+        row = self._row(department_id)
+        if row is None:
+            return pd.Series(dtype=np.int64, name="employees")
+        entries = slice(self.offsets[row], self.offsets[row + 1])
+        codes, counts = self.skill_codes[entries], self.counts[entries]
+        order = np.lexsort((codes, -counts))
+        return pd.Series(counts[order], index=[self.skills[code] for code in codes[order]], name="employees")
+
+    def headcount_of(self, department_id):
+        """
+        @brief Number of employees in a department
+        """
+        row = self._row(department_id)
+        return 0 if row is None else int(self.headcount[row])
+
+    def critical_counts(self, critical_skills):
+        """
+        @brief Dense departments x critical skills block of employee counts
+        Critical skills unknown to the company count zero everywhere.
+
+        @param critical_skills: Skill names (case-insensitive)
+        @return DataFrame indexed by department_id
+        """
+        column_of_code = np.full(max(len(self.skills), 1), -1, dtype=np.int64)
+        for column, skill in enumerate(critical_skills):
+            code = self.code_by_skill.get(normalize_skill(skill))
+            if code is not None:
+                column_of_code[code] = column
+
+        block = np.zeros((len(self.department_ids), len(critical_skills)), dtype=np.int64)
+        columns = column_of_code[self.skill_codes]
+        stored = columns >= 0
+        rows = np.repeat(np.arange(len(self.department_ids)), np.diff(self.offsets))
+        block[rows[stored], columns[stored]] = self.counts[stored]
+        return pd.DataFrame(block, index=pd.Index(self.department_ids, name="department_id"),
+                            columns=list(critical_skills))
+
+    def deficits(self, critical_skills, min_employees):
+        """
+        @brief Critical skills held by fewer than min_employees in each department
+
+        @param critical_skills: Skill names (case-insensitive)
+        @param min_employees: Required number of employees per critical skill
+        @return DataFrame (department_id, skill, employees, shortfall)
+        """
+        block = self.critical_counts(critical_skills)
+        shortfall = np.maximum(min_employees - block.to_numpy(), 0)
+        rows, columns = np.nonzero(shortfall)
+        return pd.DataFrame({
+            "department_id": block.index.to_numpy()[rows],
+            "skill": np.asarray(block.columns, dtype=object)[columns],
+            "employees": block.to_numpy()[rows, columns],
+            "shortfall": shortfall[rows, columns]
+        })
+
+    def to_frame(self):
+        """
+        @brief Dense departments x skills DataFrame (for export/display)
+        """
+        dense = np.zeros(self.shape, dtype=np.int64)
+        rows = np.repeat(np.arange(len(self.department_ids)), np.diff(self.offsets))
+        dense[rows, self.skill_codes] = self.counts
+        return pd.DataFrame(dense, index=pd.Index(self.department_ids, name="department_id"), columns=self.skills)
+
+    def to_dict(self):
+        """
+        @brief Serialize matrix into its CSR arrays
+        """
+        return {
+            "department_ids": self.department_ids,
+            "headcount": self.headcount,
+            "offsets": self.offsets,
+            "skill_codes": self.skill_codes,
+            "counts": self.counts,
+            "skills": self.skills
+        }
+
+    @classmethod
+    def from_dict(cls, payload):
+        """
+        @brief Restore matrix produced by to_dict
+        """
+        return cls(payload["department_ids"], payload["headcount"], payload["offsets"],
+                   payload["skill_codes"], payload["counts"], payload["skills"])
@@ -0,0 +1,243 @@
+"""
+@brief Similar-employee search over skill sets
+Employees sharing an identical (normalized) skill set are collapsed into
+one distinct set. MinHash signatures are computed per distinct set and
+split into LSH bands; a query only scores the distinct sets sharing at
+least one band with it, using exact Jaccard on skill bitsets. The exact
+mode scores every distinct set and is used for validation.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# Mersenne prime for the universal hash family h(x) = (a * x + b) mod p
+HASH_PRIME = (1 << 31) - 1
+# Distinct sets whose signatures are computed at once
+SIGNATURE_CHUNK_SETS = 65536
+
+
+def normalize_skill(skill):
+    """
+    @brief Normalized skill name used for matching
+    """
+    return skill.strip().lower()
+
+
+def _first_spellings(codes, names):
+    """
+    @brief Display name per normalized code: the first raw spelling seen
+    """
+    _, first = np.unique(codes, return_index=True)
+    return [names[position] for position in first]
+
+
+def skill_lists_to_csr(skill_lists):
+    """
+    @brief Encode skill lists as CSR arrays over a normalized vocabulary
+    Names differing only in case or surrounding spaces share one code.
+
+    @param skill_lists: Sequence of skill lists (None allowed)
+    @return Tuple (offsets, codes, vocabulary of display names)
+    """
+    lengths = np.fromiter((len(skills) if isinstance(skills, (list, tuple)) else 0 for skills in skill_lists),
+                          dtype=np.int64, count=len(skill_lists))
+    offsets = np.zeros(len(skill_lists) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    flat = [skill.strip() for skills in skill_lists if isinstance(skills, (list, tuple)) for skill in skills]
+    codes, _ = pd.factorize(pd.Series([normalize_skill(skill) for skill in flat], dtype=object))
+    return offsets, codes.astype(np.int64), _first_spellings(codes, flat)
+
+
+def normalize_skill_codes(codes, dictionary):
+    """
+    @brief Map dictionary codes of raw skill names onto a normalized vocabulary
+    Used for dictionary-encoded data such as binary snapshots.
+
+    @param codes: int array of codes into dictionary
+    @param dictionary: Raw skill names
+    @return Tuple (normalized codes, vocabulary of display names)
+    """
+    names = [skill.strip() for skill in dictionary]
+    remap, _ = pd.factorize(pd.Series([normalize_skill(skill) for skill in names], dtype=object))
+    return remap.astype(np.int64)[np.asarray(codes, dtype=np.int64)], _first_spellings(remap, names)
+
+
+def _popcount(masks):
+    """
+    @brief Number of set bits per bitset row
+    """
+    as_bytes = np.ascontiguousarray(masks).view(np.uint8).reshape(len(masks), -1)
+    return np.unpackbits(as_bytes, axis=1).sum(axis=1, dtype=np.int64)
+
+
+def _unique_bitsets(bitsets):
+    """
+    @brief Distinct bitset rows and the distinct row of every input row
+    Single-word bitsets are deduplicated as plain integers, wider ones
+    through a void view; both are much faster than np.unique(axis=0).
+    """
+    if bitsets.shape[1] == 1:
+        unique, inverse = np.unique(bitsets[:, 0], return_inverse=True)
+        return unique[:, None], inverse.reshape(-1)
+
+    rows = np.ascontiguousarray(bitsets).view(np.dtype((np.void, bitsets.dtype.itemsize * bitsets.shape[1])))
+    unique, inverse = np.unique(rows.ravel(), return_inverse=True)
+    return unique.view(bitsets.dtype).reshape(-1, bitsets.shape[1]), inverse.reshape(-1)
+
+
+def _expand_csr(offsets, rows):
+    """
+    @brief Positions of the CSR entries of the given rows, row by row
+    """
+    starts = offsets[rows]
+    lengths = offsets[rows + 1] - starts
+    bounds = np.cumsum(lengths)
+    return np.arange(bounds[-1] if len(bounds) else 0) + np.repeat(starts - (bounds - lengths), lengths)
+
+
+class SkillSimilarityIndex:
+    """
+    @brief MinHash/LSH index of employee skill sets
+    """
+
+    def __init__(self, offsets, codes, vocabulary_size, num_perm=64, bands=16, seed=42):
+        """
+        @brief Build index from CSR skill data
+
+        @param offsets: int array (employees + 1) of CSR row offsets
+        @param codes: int array of skill codes (0 .. vocabulary_size - 1)
+        @param vocabulary_size: Number of distinct skills
+        @param num_perm: Number of MinHash functions
+        @param bands: Number of LSH bands (must divide num_perm)
+        @param seed: Seed for the hash functions
+        """
+        if num_perm % bands:
+            raise ValueError(f"bands ({bands}) must divide num_perm ({num_perm})")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.employee_count = len(offsets) - 1
+        words = max(1, (vocabulary_size + 63) // 64)
+
+        # Skill bitset per employee, then one entry per distinct bitset
+        codes = np.asarray(codes, dtype=np.int64)
+        employee_rows = np.repeat(np.arange(self.employee_count), np.diff(offsets))
+        employee_bits = np.zeros((self.employee_count, words), dtype=np.uint64)
+        np.bitwise_or.at(employee_bits, (employee_rows, codes // 64),
+                         np.left_shift(np.uint64(1), (codes % 64).astype(np.uint64)))
+        self.set_bits, self.set_of_employee = _unique_bitsets(employee_bits)
+        self.set_sizes = _popcount(self.set_bits)
+
+        # Employees grouped by distinct set (CSR: set -> employee rows)
+        self.employees_by_set = np.argsort(self.set_of_employee, kind="stable")
+        self.set_offsets = np.zeros(len(self.set_bits) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.set_of_employee, minlength=len(self.set_bits)), out=self.set_offsets[1:])
+
+        rng = np.random.default_rng(seed)
+        multipliers = rng.integers(1, HASH_PRIME, size=num_perm, dtype=np.uint64)
+        increments = rng.integers(0, HASH_PRIME, size=num_perm, dtype=np.uint64)
+        skill_ids = np.arange(vocabulary_size, dtype=np.uint64)
+        # (skills, num_perm): a set's rows are gathered contiguously and reduced along axis 0
+        self.skill_hashes = ((skill_ids[:, None] * multipliers[None, :] + increments[None, :]) % HASH_PRIME).astype(np.uint32)
+        self.band_multipliers = rng.integers(1, np.iinfo(np.int64).max, size=num_perm // bands, dtype=np.uint64) | np.uint64(1)
+
+        self.signatures = self._signatures()
+        self._build_buckets()
+
+    def _signatures(self):
+        """
+        @brief MinHash signature of every distinct set
+        Empty sets get the maximal value in every position.
+
+        @return uint32 array (distinct sets, num_perm)
+        """
+        set_count = len(self.set_bits)
+        signatures = np.full((set_count, self.num_perm), np.iinfo(np.uint32).max, dtype=np.uint32)
+        vocabulary_size = self.skill_hashes.shape[0]
+
+        for first in range(0, set_count, SIGNATURE_CHUNK_SETS):
+            chunk = self.set_bits[first:first + SIGNATURE_CHUNK_SETS]
+            as_bytes = np.ascontiguousarray(chunk).view(np.uint8).reshape(len(chunk), -1)
+            members = np.unpackbits(as_bytes, axis=1, bitorder="little")[:, :vocabulary_size].astype(bool)
+            chunk_signatures = signatures[first:first + len(chunk)]
+            for skill in np.flatnonzero(members.any(axis=0)):
+                rows = np.flatnonzero(members[:, skill])
+                chunk_signatures[rows] = np.minimum(chunk_signatures[rows], self.skill_hashes[skill])
+
+        return signatures
+
+    def _band_keys(self, signatures):
+        """
+        @brief One 64-bit key per band from the band's signature rows
+        """
+        rows_per_band = self.num_perm // self.bands
+        banded = signatures.astype(np.uint64).reshape(len(signatures), self.bands, rows_per_band)
+        return (banded * self.band_multipliers).sum(axis=2, dtype=np.uint64)
+
+    def _build_buckets(self):
+        """
+        @brief Sort distinct sets by band key, one sorted array per band
+        """
+        keys = self._band_keys(self.signatures)
+        self.bucket_order = np.argsort(keys, axis=0, kind="stable").T
+        self.bucket_keys = np.take_along_axis(keys, self.bucket_order.T, axis=0).T
+
+    @property
+    def distinct_sets(self):
+        """
+        @brief Number of distinct skill sets
+        """
+        return len(self.set_bits)
+
+    def _candidate_sets(self, query_set):
+        """
+        @brief Distinct sets sharing at least one LSH band with the query
+        """
+        query_keys = self._band_keys(self.signatures[query_set:query_set + 1])[0]
+        candidates = []
+        for band in range(self.bands):
+            keys = self.bucket_keys[band]
+            low = np.searchsorted(keys, query_keys[band], side="left")
+            high = np.searchsorted(keys, query_keys[band], side="right")
+            candidates.append(self.bucket_order[band][low:high])
+        return np.unique(np.concatenate(candidates))
+
+    def jaccard(self, query_set, sets):
+        """
+        @brief Exact Jaccard similarity between a distinct set and other sets
+        """
+        intersection = _popcount(self.set_bits[sets] & self.set_bits[query_set])
+        union = self.set_sizes[sets] + self.set_sizes[query_set] - intersection
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(union > 0, intersection / union, 0.0)
+
+    def query(self, employee_row, top_k=5, eligible=None, exact=False):
+        """
+        @brief Most similar employees to one employee
+
+        @param employee_row: Row of the query employee
+        @param top_k: Number of employees to return
+        @param eligible: Optional boolean mask of employees that may be returned
+        @param exact: Score every distinct set instead of LSH candidates
+        @return Tuple (employee rows, Jaccard similarities), best first
+                When LSH candidates yield fewer than top_k employees the
+                query is repeated in exact mode.
+        """
+        query_set = self.set_of_employee[employee_row]
+        sets = np.arange(self.distinct_sets) if exact else self._candidate_sets(query_set)
+        scores = self.jaccard(query_set, sets)
+        keep = scores > 0
+        sets, scores = sets[keep], scores[keep]
+        order = np.lexsort((sets, -scores))
+        sets, scores = sets[order], scores[order]
+
+        positions = _expand_csr(self.set_offsets, sets)
+        rows = self.employees_by_set[positions]
+        row_scores = np.repeat(scores, self.set_offsets[sets + 1] - self.set_offsets[sets])
+        selected = rows != employee_row
+        if eligible is not None:
+            selected &= eligible[rows]
+        if not exact and selected.sum() < top_k:
+            return self.query(employee_row, top_k, eligible, exact=True)
+        return rows[selected][:top_k], row_scores[selected][:top_k]
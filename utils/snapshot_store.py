@@ -0,0 +1,186 @@
+"""
+@brief Time-indexed store for a series of company.json snapshots
+Each record is kept as a list of versions valid over a range of snapshot
+indexes; a record that did not change between snapshots only extends the
+range of its current version instead of being stored again.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+EMPLOYEE_VERSION_COLUMNS = [
+    "employee_id", "department_id", "position", "salary", "hire_date",
+    "experience_years", "performance_score", "skills"
+]
+PROJECT_VERSION_COLUMNS = [
+    "project_id", "status", "budget", "profit", "roi_percentage", "department_ids"
+]
+DEPARTMENT_VERSION_COLUMNS = ["id", "name", "type", "budget"]
+
+
+def _employee_rows(employees):
+    """
+    @brief Hashable version rows of a validated employees frame
+    """
+    columns = [employees[column].tolist() for column in EMPLOYEE_VERSION_COLUMNS[:-1]]
+    skills = [tuple(employee_skills) for employee_skills in employees["skills"].tolist()]
+    return list(zip(*columns, skills))
+
+
+def _project_rows(projects):
+    """
+    @brief Hashable version rows of a validated projects frame
+    """
+    columns = [projects[column].tolist() for column in PROJECT_VERSION_COLUMNS[:-1]]
+    department_ids = [tuple(department["department_id"] for department in departments)
+                      for departments in projects["participating_departments"].tolist()]
+    return list(zip(*columns, department_ids))
+
+
+def _department_rows(departments):
+    """
+    @brief Hashable version rows of a validated departments frame
+    """
+    return list(zip(*(departments[column].tolist() for column in DEPARTMENT_VERSION_COLUMNS)))
+
+
+class VersionedSection:
+    """
+    @brief Versions of the records of one section (employees, projects, ...)
+    A version is valid from start_index to end_index inclusive.
+    """
+
+    def __init__(self, columns, row_builder):
+        """
+        @brief Initialize empty section
+
+        @param columns: Names of the fields produced by row_builder
+        @param row_builder: Function validated frame -> list of tuples, first item is the key
+        """
+        self.columns = columns
+        self.row_builder = row_builder
+        self.rows = []
+        self.start_index = []
+        self.end_index = []
+        self._open_versions = {}
+
+    def observe(self, frame, snapshot_index):
+        """
+        @brief Register records of one snapshot
+        Unchanged records seen in the previous snapshot extend their current
+        version; new or changed records open a new version.
+
+        @param frame: Validated DataFrame of the section
+        @param snapshot_index: Position of the snapshot in time order
+        """
+        for row in self.row_builder(frame):
+            key = row[0]
+            open_version = self._open_versions.get(key)
+            if open_version is not None:
+                version, previous_row = open_version
+                if previous_row == row and self.end_index[version] == snapshot_index - 1:
+                    self.end_index[version] = snapshot_index
+                    continue
+
+            self._open_versions[key] = (len(self.rows), row)
+            self.rows.append(row)
+            self.start_index.append(snapshot_index)
+            self.end_index.append(snapshot_index)
+
+    def to_frame(self):
+        """
+        @brief Versions as DataFrame with start_index/end_index columns
+        """
+        frame = pd.DataFrame(self.rows, columns=self.columns)
+        frame["start_index"] = np.asarray(self.start_index, dtype=np.int64)
+        frame["end_index"] = np.asarray(self.end_index, dtype=np.int64)
+        return frame
+
+
+class SnapshotStore:
+    """
+    @brief De-duplicated, time-indexed store of company snapshots
+    Snapshots must be ingested in generation_date order.
+    """
+
+    def __init__(self):
+        """
+        @brief Initialize empty store
+        """
+        self.snapshot_dates = []
+        self.sections = {
+            "employees": VersionedSection(EMPLOYEE_VERSION_COLUMNS, _employee_rows),
+            "projects": VersionedSection(PROJECT_VERSION_COLUMNS, _project_rows),
+            "departments": VersionedSection(DEPARTMENT_VERSION_COLUMNS, _department_rows),
+        }
+
+    @property
+    def snapshot_count(self):
+        """
+        @brief Number of ingested snapshots
+        """
+        return len(self.snapshot_dates)
+
+    def ingest(self, company_data):
+        """
+        @brief Add one validated company.json snapshot
+        Only the valid records are versioned; quarantined ones are left to the caller.
+
+        @param company_data: CompanyData of the snapshot (validate_company_data)
+        @return Index of the snapshot in the store
+        """
+        generation_date = pd.Timestamp(company_data.data['metadata']['generation_date'])
+        if self.snapshot_dates and generation_date <= self.snapshot_dates[-1]:
+            raise ValueError(f"Snapshots must be ingested in time order: {generation_date} after {self.snapshot_dates[-1]}")
+
+        snapshot_index = len(self.snapshot_dates)
+        self.snapshot_dates.append(generation_date)
+        for name, section in self.sections.items():
+            section.observe(company_data.frames[name], snapshot_index)
+        return snapshot_index
+
+    def version_count(self, name):
+        """
+        @brief Number of stored versions of a section
+        """
+        return len(self.sections[name].rows)
+
+    def versions(self, name):
+        """
+        @brief Versions of a section as DataFrame
+        """
+        return self.sections[name].to_frame()
+
+    def date_index(self):
+        """
+        @brief Snapshot dates as DatetimeIndex
+        """
+        return pd.DatetimeIndex(self.snapshot_dates, name="generation_date")
+
+
+def interval_sum(start_index, end_index, weights, periods, groups=None, group_count=1):
+    """
+    @brief Sum weights of versions valid at every snapshot
+    Uses difference arrays: +weight at start, -weight after end, then a
+    cumulative sum over time, so the cost is linear in versions + periods.
+
+    @param start_index: int array of first valid snapshot per version
+    @param end_index: int array of last valid snapshot per version
+    @param weights: Values to sum (scalar or array)
+    @param periods: Number of snapshots
+    @param groups: Optional int array of group codes per version
+    @param group_count: Number of groups when groups is given
+    @return Array (periods,) or (periods, group_count)
+    """
+    start_index = np.asarray(start_index, dtype=np.int64)
+    end_index = np.asarray(end_index, dtype=np.int64)
+    weights = np.broadcast_to(np.asarray(weights, dtype=np.float64), start_index.shape)
+    grouped = groups is not None
+    groups = np.asarray(groups, dtype=np.int64) if grouped else np.zeros_like(start_index)
+
+    size = (periods + 1) * group_count
+    difference = (np.bincount(start_index * group_count + groups, weights=weights, minlength=size)
+                  - np.bincount((end_index + 1) * group_count + groups, weights=weights, minlength=size))
+    totals = np.cumsum(difference.reshape(periods + 1, group_count), axis=0)[:periods]
+    return totals if grouped else totals[:, 0]
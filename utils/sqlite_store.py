@@ -0,0 +1,400 @@
+"""
+@brief SQLite storage engine for company data
+company.json is converted once into a local SQLite database with indexes
+on employees(department_id), employees(position), employees(hire_date),
+projects(status) and a skills link table. Analyzers read their frames
+from it and push filters and aggregates (high performers, top salaries,
+project status counts, average ROI, skill co-occurrence) down to SQL,
+so repeated runs and ad-hoc queries use the indexes instead of parsing
+JSON. record_index keeps the record order of the source file.
+"""
+
+import json
+import math
+import os
+import sqlite3
+import tempfile
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+from config.messages import ErrorMessages
+from utils.data_loader import SECTION_VALIDATORS, load_company_data
+
+
+SQLITE_HEADER = b"SQLite format 3\x00"
+STORE_FORMAT = "po-sqlite-store"
+STORE_VERSION = 1
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Authorizer actions a query may use; everything else (ATTACH, PRAGMA,
+# writes, transactions) is denied, since mode=ro only covers the main database
+READ_ONLY_ACTIONS = frozenset((sqlite3.SQLITE_READ, sqlite3.SQLITE_SELECT, sqlite3.SQLITE_FUNCTION, sqlite3.SQLITE_RECURSIVE))
+
+# Sections kept as tables; every other top-level section is stored as JSON
+RECORD_SECTIONS = ("departments", "employees", "projects")
+
+# Numeric columns are declared without a type so integers and reals keep their storage class
+SCHEMA = """
+CREATE TABLE store_info (format TEXT, version INTEGER, source TEXT);
+CREATE TABLE sections (name TEXT PRIMARY KEY, content TEXT NOT NULL);
+CREATE TABLE departments (
+    record_index INTEGER PRIMARY KEY, id INTEGER, name TEXT, type TEXT, budget
+);
+CREATE TABLE employees (
+    record_index INTEGER PRIMARY KEY, employee_id INTEGER, full_name TEXT, gender TEXT,
+    birth_date TEXT, email TEXT, phone TEXT, address TEXT, department_id INTEGER,
+    department_name TEXT, position TEXT, salary, hire_date TEXT, experience_years,
+    performance_score, is_team_lead INTEGER
+);
+CREATE TABLE employee_skills (
+    record_index INTEGER, skill_order INTEGER, skill TEXT, skill_key TEXT,
+    PRIMARY KEY (record_index, skill_order)
+) WITHOUT ROWID;
+CREATE TABLE projects (
+    record_index INTEGER PRIMARY KEY, project_id TEXT, name TEXT, description TEXT,
+    status TEXT, budget, profit, roi_percentage
+);
+CREATE TABLE project_departments (
+    project_index INTEGER, link_order INTEGER, department_id INTEGER, budget_allocation,
+    PRIMARY KEY (project_index, link_order)
+) WITHOUT ROWID;
+CREATE INDEX employees_department ON employees (department_id);
+CREATE INDEX employees_position ON employees (position);
+CREATE INDEX employees_hire_date ON employees (hire_date);
+CREATE INDEX employees_employee_id ON employees (employee_id);
+CREATE INDEX employee_skills_key ON employee_skills (skill_key, record_index);
+CREATE INDEX projects_status ON projects (status);
+CREATE INDEX project_departments_department ON project_departments (department_id, project_index);
+"""
+
+EMPLOYEE_COLUMNS = [
+    "employee_id", "full_name", "gender", "birth_date", "email", "phone", "address",
+    "department_id", "department_name", "position", "salary", "hire_date",
+    "experience_years", "performance_score", "skills", "is_team_lead"
+]
+DATE_COLUMNS = ("birth_date", "hire_date")
+DEPARTMENT_COLUMNS = ["id", "name", "type", "budget"]
+PROJECT_COLUMNS = ["project_id", "name", "description", "status", "budget", "profit", "roi_percentage"]
+
+# Record indexes of the projects a department (parameter) participates in
+DEPARTMENT_PROJECTS = "SELECT project_index FROM project_departments WHERE department_id = ?"
+
+
+def is_sqlite_store(path):
+    """
+    @brief Check whether path points to an SQLite database file
+    """
+    if not os.path.isfile(path):
+        return False
+    with open(path, "rb") as database_file:
+        return database_file.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+
+
+def _column_values(series):
+    """
+    @brief Python values of a column for binding (dates as ISO text, nulls as None)
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        series = series.dt.strftime(DATE_FORMAT)
+    return [None if value is None or value is pd.NA or (isinstance(value, float) and math.isnan(value)) else value
+            for value in series.tolist()]
+
+
+def _insert_frame(connection, table, frame, columns):
+    """
+    @brief Insert frame rows with record_index = row position
+    """
+    values = [_column_values(frame[column]) for column in columns]
+    placeholders = ", ".join("?" * (len(columns) + 1))
+    connection.executemany(
+        f"INSERT INTO {table} (record_index, {', '.join(columns)}) VALUES ({placeholders})",
+        zip(range(len(frame)), *values)
+    )
+
+
+def _read_only_authorizer(action, table, *_):
+    """
+    @brief sqlite3 authorizer letting through only reads
+    Table-valued functions (json_each) are set up with an UPDATE check on
+    sqlite_master; query_only keeps that from ever writing.
+    """
+    if action in READ_ONLY_ACTIONS or (action == sqlite3.SQLITE_UPDATE and table == "sqlite_master"):
+        return sqlite3.SQLITE_OK
+    return sqlite3.SQLITE_DENY
+
+
+def convert_to_sqlite_store(json_file_path, database_path):
+    """
+    @brief Convert company.json into an indexed SQLite database
+    Only valid records are stored; invalid ones are quarantined. The
+    database is built next to the target and moved over it when complete.
+
+    @param json_file_path: Source company data file
+    @param database_path: Database file to create (an existing one is replaced)
+    @return Path of the database
+    """
+    company_data = load_company_data(json_file_path)
+    frames = company_data.frames
+
+    directory = os.path.dirname(os.path.abspath(database_path))
+    descriptor, temporary_path = tempfile.mkstemp(prefix=f".{os.path.basename(database_path)}.", suffix=".tmp", dir=directory)
+    os.close(descriptor)
+    try:
+        connection = sqlite3.connect(temporary_path)
+        try:
+            connection.execute("PRAGMA journal_mode = OFF")
+            connection.execute("PRAGMA synchronous = OFF")
+            connection.executescript(SCHEMA)
+            connection.execute("INSERT INTO store_info VALUES (?, ?, ?)",
+                               (STORE_FORMAT, STORE_VERSION, os.path.basename(json_file_path)))
+            connection.executemany("INSERT INTO sections VALUES (?, ?)", [
+                (name, json.dumps(content, ensure_ascii=False))
+                for name, content in company_data.data.items() if name not in RECORD_SECTIONS
+            ])
+
+            _insert_frame(connection, "departments", frames["departments"], DEPARTMENT_COLUMNS)
+
+            employees = frames["employees"]
+            _insert_frame(connection, "employees", employees, [c for c in EMPLOYEE_COLUMNS if c != "skills"])
+            connection.executemany("INSERT INTO employee_skills VALUES (?, ?, ?, ?)", (
+                (record_index, skill_order, skill, skill.lower())
+                for record_index, skills in enumerate(employees["skills"].tolist())
+                for skill_order, skill in enumerate(skills or [])
+            ))
+
+            projects = frames["projects"]
+            _insert_frame(connection, "projects", projects, PROJECT_COLUMNS)
+            connection.executemany("INSERT INTO project_departments VALUES (?, ?, ?, ?)", (
+                (project_index, link_order, link["department_id"], link.get("budget_allocation") or 0)
+                for project_index, links in enumerate(projects["participating_departments"].tolist())
+                for link_order, link in enumerate(links)
+            ))
+
+            connection.commit()
+            connection.execute("ANALYZE")
+            connection.commit()
+        finally:
+            connection.close()
+        os.chmod(temporary_path, 0o644)
+        os.replace(temporary_path, database_path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+    return database_path
+
+
+class SQLiteStore:
+    """
+    @brief Read-only view of a company SQLite database
+    Builds the same DataFrames BaseAnalyzer builds from JSON records and
+    answers the analyzers' filters and aggregates in SQL.
+    """
+
+    def __init__(self, database_path):
+        """
+        @brief Open the database read-only
+
+        @param database_path: Database created by convert_to_sqlite_store
+        """
+        self.database_path = database_path
+        self.connection = sqlite3.connect(f"file:{quote(os.path.abspath(database_path))}?mode=ro", uri=True)
+        try:
+            store_format, store_version = self.connection.execute("SELECT format, version FROM store_info").fetchone()
+        except sqlite3.DatabaseError:
+            store_format = store_version = None
+        if store_format != STORE_FORMAT or store_version != STORE_VERSION:
+            self.connection.close()
+            raise ValueError(f"Unsupported SQLite store format in {database_path}")
+        self.connection.execute("PRAGMA query_only = ON")
+        self.connection.set_authorizer(_read_only_authorizer)
+        self._sections = {}
+
+    def close(self):
+        """
+        @brief Close the database connection
+        """
+        self.connection.close()
+
+    def query(self, sql, params=()):
+        """
+        @brief Run a read-only SQL query
+
+        @param sql: SELECT statement
+        @param params: Query parameters
+        @return DataFrame of the result rows
+        """
+        try:
+            cursor = self.connection.execute(sql, params)
+        except sqlite3.DatabaseError as query_error:
+            if str(query_error) == "not authorized":
+                raise ValueError(ErrorMessages.SQL_NOT_READ_ONLY.format(sql)) from query_error
+            raise
+        if cursor.description is None:
+            raise ValueError(ErrorMessages.SQL_NO_RESULT_SET.format(sql))
+        columns = [description[0] for description in cursor.description]
+        # Same conversion as pandas.read_sql_query
+        return pd.DataFrame.from_records(cursor.fetchall(), columns=columns, coerce_float=True)
+
+    def section(self, name):
+        """
+        @brief Decoded non-record section (metadata, equipment, ...), None if absent
+        """
+        if name not in self._sections:
+            row = self.connection.execute("SELECT content FROM sections WHERE name = ?", (name,)).fetchone()
+            self._sections[name] = json.loads(row[0]) if row else None
+        return self._sections[name]
+
+    @property
+    def metadata(self):
+        """
+        @brief metadata block of the source JSON
+        """
+        return self.section("metadata") or {}
+
+    def department_dataframe(self):
+        """
+        @brief All departments (id, name, type, budget)
+        """
+        return self.query(f"SELECT {', '.join(DEPARTMENT_COLUMNS)} FROM departments ORDER BY record_index")
+
+    def employee_dataframe(self, department_id=None, rows=None, columns=None):
+        """
+        @brief Employees, optionally filtered by department or row positions
+        The department filter runs on the department_id index.
+
+        @param department_id: Department to keep (None keeps all)
+        @param rows: Row positions to keep (overrides department_id)
+        @param columns: Columns to return (defaults to all, in BaseAnalyzer order)
+        @return DataFrame with the same columns as BaseAnalyzer's employee frame
+        """
+        if rows is not None:
+            rows = [int(row) for row in rows]
+            frame = self._employee_frame("record_index IN (SELECT value FROM json_each(?))", (json.dumps(rows),), columns,
+                                         keep_record_index=True)
+            # Rows come back in the requested order, as with DataFrame.iloc
+            return frame.set_index("record_index").loc[rows].reset_index(drop=True)
+        if department_id is not None:
+            return self._employee_frame("department_id = ?", (int(department_id),), columns)
+        return self._employee_frame("1", (), columns)
+
+    def _employee_frame(self, condition, params, columns=None, order="record_index", limit=None, keep_record_index=False):
+        """
+        @brief Employee rows matching a condition, with skill lists and typed dates
+        """
+        columns = list(columns or EMPLOYEE_COLUMNS)
+        selected = [column for column in columns if column != "skills"]
+        limit_clause = f" LIMIT {int(limit)}" if limit is not None else ""
+        frame = self.query(
+            f"SELECT record_index, {', '.join(selected)} FROM employees WHERE {condition} ORDER BY {order}{limit_clause}",
+            params
+        )
+        for column in DATE_COLUMNS:
+            if column in frame:
+                frame[column] = pd.to_datetime(frame[column], format="ISO8601")
+        if "is_team_lead" in frame:
+            frame["is_team_lead"] = frame["is_team_lead"].astype(bool)
+        if "skills" in columns:
+            skills = {record_index: [] for record_index in frame["record_index"].tolist()}
+            for record_index, skill in self.connection.execute(
+                    "SELECT record_index, skill FROM employee_skills WHERE record_index IN (SELECT value FROM json_each(?))"
+                    " ORDER BY record_index, skill_order", (json.dumps(list(skills)),)):
+                skills[record_index].append(skill)
+            frame["skills"] = [skills[record_index] for record_index in frame["record_index"].tolist()]
+        return frame[["record_index"] + columns] if keep_record_index else frame[columns]
+
+    def employee_skill_csr(self):
+        """
+        @brief Skills of all employees as CSR arrays
+
+        @return Tuple (offsets, dictionary codes, dictionary of skill names)
+        """
+        employee_count = self.connection.execute("SELECT COUNT(*) FROM employees").fetchone()[0]
+        links = self.query("SELECT record_index, skill FROM employee_skills ORDER BY record_index, skill_order")
+        offsets = np.zeros(employee_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(links["record_index"].to_numpy(dtype=np.int64), minlength=employee_count), out=offsets[1:])
+        codes, dictionary = pd.factorize(links["skill"].astype(object))
+        return offsets, codes.astype(np.int64), dictionary.tolist()
+
+    def project_dataframe(self):
+        """
+        @brief All projects (project_id, name, description, status, budget, profit, roi_percentage)
+        """
+        return self.query(f"SELECT {', '.join(PROJECT_COLUMNS)} FROM projects ORDER BY record_index")
+
+    def equipment_dataframe(self):
+        """
+        @brief All equipment, extracted from the stored section as on the JSON path
+        """
+        validator, _ = SECTION_VALIDATORS["equipment"]
+        frame, _, _ = validator.validate(self.section("equipment") or [])
+        return frame
+
+    def project_department_links(self):
+        """
+        @brief Project-department link table indexed by department_id
+        """
+        links = self.query(
+            "SELECT p.project_id, l.department_id, l.budget_allocation FROM project_departments l"
+            " JOIN projects p ON p.record_index = l.project_index ORDER BY l.department_id, l.project_index, l.link_order"
+        )
+        return links.set_index("department_id")
+
+    def high_performers(self, department_id, min_score, columns):
+        """
+        @brief Employees of a department with performance_score above min_score
+
+        @return DataFrame of the requested columns in record order
+        """
+        return self._employee_frame("department_id = ? AND performance_score > ?",
+                                    (int(department_id), min_score), columns)
+
+    def top_salaries(self, department_id, count, columns):
+        """
+        @brief Highest-paid employees of a department (earlier records first on ties)
+        """
+        return self._employee_frame("department_id = ?", (int(department_id),), columns,
+                                    order="salary DESC, record_index", limit=count)
+
+    def project_status_counts(self, department_id):
+        """
+        @brief Number of a department's projects per status, most frequent first
+
+        @return Series status -> count
+        """
+        counts = self.query(
+            f"SELECT status, COUNT(*) AS count FROM projects WHERE record_index IN ({DEPARTMENT_PROJECTS})"
+            " GROUP BY status ORDER BY count DESC, MIN(record_index)",
+            (int(department_id),)
+        )
+        return counts.set_index("status")["count"]
+
+    def average_roi(self, department_id):
+        """
+        @brief Mean roi_percentage of a department's projects (NaN without projects)
+        """
+        value = self.connection.execute(
+            f"SELECT AVG(roi_percentage) FROM projects WHERE record_index IN ({DEPARTMENT_PROJECTS})",
+            (int(department_id),)
+        ).fetchone()[0]
+        return float("nan") if value is None else value
+
+    def employees_with_skills(self, department_id, skills, columns):
+        """
+        @brief Employees of a department having all given skills (case-insensitive)
+        Answered from the skill_key index of the skills link table.
+
+        @param department_id: Department to search
+        @param skills: Iterable of skill names
+        @param columns: Columns to return
+        @return DataFrame in record order
+        """
+        keys = sorted({skill.lower() for skill in skills})
+        condition = (
+            "department_id = ? AND record_index IN ("
+            f"SELECT record_index FROM employee_skills WHERE skill_key IN ({', '.join('?' * len(keys))})"
+            " GROUP BY record_index HAVING COUNT(DISTINCT skill_key) = ?)"
+        )
+        return self._employee_frame(condition, (int(department_id), *keys, len(keys)), columns)
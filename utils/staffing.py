@@ -0,0 +1,264 @@
+"""
+@brief Team staffing solver over employee skill sets
+Finds the smallest or the cheapest group of candidates whose skills
+together cover a required skill set. Skills are encoded as bitsets over
+the required skills only, candidates with the same bitset collapse into
+the cheapest one, and dominated bitsets are dropped before searching.
+Small instances are solved exactly by dynamic programming over covered
+skill subsets; larger ones fall back to a bitset greedy cover.
+"""
+
+import numpy as np
+
+
+STAFFING_OBJECTIVES = ("size", "cost")
+
+# Candidates above this count skip the quadratic dominance pruning
+DOMINANCE_PRUNE_LIMIT = 4096
+
+
+class SkillIndex:
+    """
+    @brief Maps required skill names to bit positions
+    Matching is case-insensitive, like the Python + Docker search.
+    """
+
+    def __init__(self, required_skills):
+        """
+        @brief Initialize index for a required skill set
+
+        @param required_skills: Iterable of skill names
+        """
+        self.skills = []
+        self.bit_by_skill = {}
+        for skill in required_skills:
+            key = skill.strip().lower()
+            if key and key not in self.bit_by_skill:
+                self.bit_by_skill[key] = len(self.skills)
+                self.skills.append(skill.strip())
+
+    @property
+    def size(self):
+        """
+        @brief Number of required skills
+        """
+        return len(self.skills)
+
+    @property
+    def words(self):
+        """
+        @brief Number of 64-bit words per bitset
+        """
+        return max(1, (self.size + 63) // 64)
+
+    def full_mask(self):
+        """
+        @brief Bitset with every required skill set
+        """
+        return self.masks([self.skills])[0]
+
+    def masks(self, skill_lists):
+        """
+        @brief Encode skill lists as bitsets over the required skills
+        Skills that are not required are ignored.
+
+        @param skill_lists: Sequence of skill lists (None allowed)
+        @return uint64 array (candidates, words)
+        """
+        masks = np.zeros((len(skill_lists), self.words), dtype=np.uint64)
+        for row, skills in enumerate(skill_lists):
+            for skill in skills if isinstance(skills, (list, tuple)) else ():
+                bit = self.bit_by_skill.get(skill.lower())
+                if bit is not None:
+                    masks[row, bit // 64] |= np.uint64(1) << np.uint64(bit % 64)
+        return masks
+
+    def names(self, mask):
+        """
+        @brief Skill names of the bits set in a bitset
+        """
+        return [skill for bit, skill in enumerate(self.skills)
+                if int(mask[bit // 64]) >> (bit % 64) & 1]
+
+
+def popcount(masks):
+    """
+    @brief Number of set bits per bitset row
+
+    @param masks: uint64 array (rows, words)
+    @return int64 array (rows,)
+    """
+    as_bytes = np.ascontiguousarray(masks).view(np.uint8).reshape(len(masks), -1)
+    return np.unpackbits(as_bytes, axis=1).sum(axis=1, dtype=np.int64)
+
+
+def _collapse_candidates(masks, costs):
+    """
+    @brief Keep the cheapest candidate per distinct non-empty bitset
+
+    @return Tuple (unique masks, their costs, candidate row per mask)
+    """
+    non_empty = np.flatnonzero(masks.any(axis=1))
+    order = non_empty[np.argsort(costs[non_empty], kind="stable")]
+    _, first = np.unique(masks[order], axis=0, return_index=True)
+    rows = order[first]
+    return masks[rows], costs[rows], rows
+
+
+def _drop_dominated(masks, costs, rows):
+    """
+    @brief Drop bitsets covered by another bitset that is not more expensive
+    """
+    count = len(masks)
+    if count < 2 or count > DOMINANCE_PRUNE_LIMIT:
+        return masks, costs, rows
+
+    subset = np.all((masks[:, None, :] & ~masks[None, :, :]) == 0, axis=2)
+    cheaper = costs[None, :] <= costs[:, None]
+    np.fill_diagonal(subset, False)
+    dominated = (subset & cheaper).any(axis=1)
+
+    # Equal bitsets were collapsed already, so dominance is acyclic
+    keep = ~dominated
+    return masks[keep], costs[keep], rows[keep]
+
+
+def _exact_cover(masks, costs, skill_count, objective, max_cost):
+    """
+    @brief Exact search by DP over covered skill subsets
+    Layer k holds the minimal cost of covering each subset with k members.
+    An optimal team never needs more members than required skills.
+
+    @param masks: uint64 array (candidates, 1) of distinct bitsets
+    @param costs: float array of candidate costs
+    @param skill_count: Number of required skills
+    @param objective: "size" or "cost"
+    @param max_cost: Cost limit (np.inf if none)
+    @return List of selected positions or None if no team fits
+    """
+    state_count = 1 << skill_count
+    full_state = state_count - 1
+    candidate_states = masks[:, 0].astype(np.int64)
+
+    layer = np.full(state_count, np.inf)
+    layer[0] = 0.0
+    parents = []
+    best_size, best_cost = None, np.inf
+
+    for size in range(1, skill_count + 1):
+        reachable = np.flatnonzero(np.isfinite(layer))
+        if not len(reachable) or layer[reachable].min() >= best_cost:
+            break
+
+        next_layer = np.full(state_count, np.inf)
+        for position, candidate_state in enumerate(candidate_states):
+            values = layer[reachable] + costs[position]
+            values[values > max_cost] = np.inf
+            np.minimum.at(next_layer, reachable | candidate_state, values)
+
+        # Second pass records one member and source subset per reached subset
+        parent_candidate = np.full(state_count, -1, dtype=np.int64)
+        parent_state = np.full(state_count, -1, dtype=np.int64)
+        for position, candidate_state in enumerate(candidate_states):
+            targets = reachable | candidate_state
+            values = layer[reachable] + costs[position]
+            hits = (values == next_layer[targets]) & (parent_candidate[targets] < 0) & np.isfinite(values)
+            parent_candidate[targets[hits]] = position
+            parent_state[targets[hits]] = reachable[hits]
+        parents.append((parent_candidate, parent_state))
+
+        if next_layer[full_state] < best_cost:
+            best_size, best_cost = size, next_layer[full_state]
+            if objective == "size":
+                break
+        layer = next_layer
+
+    if best_size is None:
+        return None
+
+    selected = []
+    state = full_state
+    for size in range(best_size, 0, -1):
+        parent_candidate, parent_state = parents[size - 1]
+        selected.append(int(parent_candidate[state]))
+        state = int(parent_state[state])
+    return selected
+
+
+def _greedy_cover(masks, costs, full_mask, objective):
+    """
+    @brief Greedy set cover on bitsets
+    Picks the member adding most uncovered skills (per unit of cost for the
+    "cost" objective), then removes members made redundant by later picks.
+
+    @param masks: uint64 array (candidates, words)
+    @param costs: float array of candidate costs
+    @param full_mask: uint64 array (words,) of required skills
+    @param objective: "size" or "cost"
+    @return List of selected positions or None if skills cannot be covered
+    """
+    uncovered = full_mask.copy()
+    selected = []
+    while uncovered.any():
+        gains = popcount(masks & uncovered).astype(np.float64)
+        if gains.max() == 0:
+            return None
+        if objective == "cost":
+            with np.errstate(divide="ignore"):
+                scores = np.where(gains > 0, gains / np.maximum(costs, 1e-9), -np.inf)
+        else:
+            # Most new skills first, cheapest among equal gains
+            scores = gains - costs / (costs.max() + 1.0)
+        position = int(np.argmax(scores))
+        selected.append(position)
+        uncovered &= ~masks[position]
+
+    for position in sorted(selected, key=lambda member: -costs[member]):
+        rest = [member for member in selected if member != position]
+        covered = np.bitwise_or.reduce(masks[rest], axis=0) if rest else np.zeros_like(full_mask)
+        if not (full_mask & ~covered).any():
+            selected = rest
+    return selected
+
+
+def solve_staffing(skill_index, skill_lists, costs, objective="size", max_cost=None, exact_work_limit=100_000_000):
+    """
+    @brief Find a team covering all required skills
+
+    @param skill_index: SkillIndex of the required skills
+    @param skill_lists: Skill list per candidate
+    @param costs: Cost per candidate (salary)
+    @param objective: "size" (fewest members, cheapest among them) or "cost" (lowest cost sum)
+    @param max_cost: Optional limit for the cost sum of the team
+    @param exact_work_limit: Largest subsets x candidates x layers product solved exactly
+    @return Dictionary with selected candidate rows, missing skills and method
+    """
+    if objective not in STAFFING_OBJECTIVES:
+        raise ValueError(f"Unknown staffing objective: {objective}")
+
+    costs = np.asarray(costs, dtype=np.float64)
+    full_mask = skill_index.full_mask()
+    masks, unique_costs, rows = _collapse_candidates(skill_index.masks(skill_lists), costs)
+
+    covered = np.bitwise_or.reduce(masks, axis=0) if len(masks) else np.zeros_like(full_mask)
+    missing = skill_index.names(full_mask & ~covered)
+    result = {"rows": [], "missing_skills": missing, "method": None, "distinct_candidates": len(masks)}
+    if missing or skill_index.size == 0:
+        return result
+
+    masks, unique_costs, rows = _drop_dominated(masks, unique_costs, rows)
+    limit = np.inf if max_cost is None else float(max_cost)
+    work = (1 << skill_index.size) * len(masks) * skill_index.size if skill_index.words == 1 else np.inf
+
+    if work <= exact_work_limit:
+        result["method"] = "exact"
+        selected = _exact_cover(masks, unique_costs, skill_index.size, objective, limit)
+    else:
+        result["method"] = "greedy"
+        selected = _greedy_cover(masks, unique_costs, full_mask, objective)
+        if selected is not None and unique_costs[selected].sum() > limit:
+            selected = None
+
+    if selected is not None:
+        result["rows"] = sorted(int(rows[position]) for position in selected)
+    return result